@@ -17,8 +17,14 @@ import config
 
 API_URL = "http://127.0.0.1:8192/api"
 MAX_SEND_PACKETS_QUEUE_SIZE = 1000
+MAX_SEND_PACKETS_BATCH_SIZE = 100
 GET_DIFFERENCE_LIMIT = 10
 
+TG_PACKET_FRAMES_UPLOAD_FORMAT = "frames"
+TG_PACKET_FRAMES_MEDIA_TYPE = "application/octet-stream"
+# layer, auth_key length, session_id length, packet length
+TG_PACKET_FRAME_HEADER = struct.Struct("<IHHI")
+
 
 send_packets_http_client = AsyncClient(
     base_url = API_URL
@@ -163,6 +169,28 @@ async def custom_sender_recv_loop(self: MTProtoSender, send_packets_queue: SEND_
             self._log.exception('Unhandled error while processing msgs')  # type: ignore
 
 
+def _pack_tg_packet_frames(packets: list[tuple[bytes, bytes, bytes]]) -> bytes:
+    chunks: list[bytes] = []
+
+    previous_auth_key: bytes | None = None
+    previous_session_id: bytes | None = None
+
+    for auth_key, session_id, packet in packets:
+        # Empty auth_key/session_id make the server reuse the previous frame's ones
+        frame_auth_key = b"" if auth_key == previous_auth_key else auth_key
+        frame_session_id = b"" if session_id == previous_session_id else session_id
+
+        chunks.append(TG_PACKET_FRAME_HEADER.pack(LAYER, len(frame_auth_key), len(frame_session_id), len(packet)))
+        chunks.append(frame_auth_key)
+        chunks.append(frame_session_id)
+        chunks.append(packet)
+
+        previous_auth_key = auth_key
+        previous_session_id = session_id
+
+    return b"".join(chunks)
+
+
 async def send_packets_loop(send_packets_queue: SEND_PACKETS_QUEUE_T) -> None:
     while True:
         auth_key, session_id, packet = await send_packets_queue.get()
@@ -184,6 +212,34 @@ async def send_packets_loop(send_packets_queue: SEND_PACKETS_QUEUE_T) -> None:
             send_packets_queue.task_done()
 
 
+async def send_packet_frames_loop(send_packets_queue: SEND_PACKETS_QUEUE_T) -> None:
+    while True:
+        packets = [await send_packets_queue.get()]
+
+        while len(packets) < MAX_SEND_PACKETS_BATCH_SIZE and not send_packets_queue.empty():
+            packets.append(send_packets_queue.get_nowait())
+
+        try:
+            response = await send_packets_http_client.post(
+                "/upload_tg_packet_frames",
+                content = _pack_tg_packet_frames(packets),
+                headers = {
+                    "Content-Type": TG_PACKET_FRAMES_MEDIA_TYPE
+                }
+            )
+
+            for result in response.json()["results"]:
+                if not result["ok"]:
+                    print(f"Packet rejected: {result['description']}")
+
+        except Exception as ex:
+            print(f"Error sending {len(packets)} packets: {ex}")
+
+        finally:
+            for _ in packets:
+                send_packets_queue.task_done()
+
+
 async def setup_client_custom_sender(client: TelegramClient, filter_chat_ids: list[int] | None=None) -> None:
     if client.is_connected():
         raise RuntimeError("Client is already connected")
@@ -195,7 +251,11 @@ async def setup_client_custom_sender(client: TelegramClient, filter_chat_ids: li
 
     send_packets_queue = SEND_PACKETS_QUEUE_T(maxsize=MAX_SEND_PACKETS_QUEUE_SIZE)
 
-    asyncio.create_task(send_packets_loop(send_packets_queue))
+    if TG_PACKET_FRAMES_UPLOAD_FORMAT in response.get("supported_upload_formats", []):
+        asyncio.create_task(send_packet_frames_loop(send_packets_queue))
+
+    else:
+        asyncio.create_task(send_packets_loop(send_packets_queue))
 
     client._sender._recv_loop = partial(custom_sender_recv_loop, client._sender, send_packets_queue, filter_chat_ids)  # type: ignore
 
@@ -0,0 +1 @@
+from ...shared.tl import TLObject, TLRequest
@@ -0,0 +1,13 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.account import AcceptAuthorizationRequest, CancelPasswordEmailRequest, ChangeAuthorizationSettingsRequest, ChangePhoneRequest, CheckUsernameRequest, ClearRecentEmojiStatusesRequest, ConfirmPasswordEmailRequest, ConfirmPhoneRequest, CreateBusinessChatLinkRequest, CreateThemeRequest, DeclinePasswordResetRequest, DeleteAccountRequest, DeleteAutoSaveExceptionsRequest, DeleteBusinessChatLinkRequest, DeleteSecureValueRequest, DisablePeerConnectedBotRequest, EditBusinessChatLinkRequest, FinishTakeoutSessionRequest, GetAccountTTLRequest, GetAllSecureValuesRequest, GetAuthorizationFormRequest, GetAuthorizationsRequest, GetAutoDownloadSettingsRequest, GetAutoSaveSettingsRequest, GetBotBusinessConnectionRequest, GetBusinessChatLinksRequest, GetChannelDefaultEmojiStatusesRequest, GetChannelRestrictedStatusEmojisRequest, GetChatThemesRequest, GetCollectibleEmojiStatusesRequest, GetConnectedBotsRequest, GetContactSignUpNotificationRequest, GetContentSettingsRequest, GetDefaultBackgroundEmojisRequest, GetDefaultEmojiStatusesRequest, GetDefaultGroupPhotoEmojisRequest, GetDefaultProfilePhotoEmojisRequest, GetGlobalPrivacySettingsRequest, GetMultiWallPapersRequest, GetNotifyExceptionsRequest, GetNotifySettingsRequest, GetPasswordRequest, GetPasswordSettingsRequest, GetPrivacyRequest, GetReactionsNotifySettingsRequest, GetRecentEmojiStatusesRequest, GetSavedRingtonesRequest, GetSecureValueRequest, GetThemeRequest, GetThemesRequest, GetTmpPasswordRequest, GetWallPaperRequest, GetWallPapersRequest, GetWebAuthorizationsRequest, InitTakeoutSessionRequest, InstallThemeRequest, InstallWallPaperRequest, InvalidateSignInCodesRequest, RegisterDeviceRequest, ReorderUsernamesRequest, ReportPeerRequest, ReportProfilePhotoRequest, ResendPasswordEmailRequest, ResetAuthorizationRequest, ResetNotifySettingsRequest, ResetPasswordRequest, ResetWallPapersRequest, ResetWebAuthorizationRequest, ResetWebAuthorizationsRequest, ResolveBusinessChatLinkRequest, SaveAutoDownloadSettingsRequest, SaveAutoSaveSettingsRequest, SaveRingtoneRequest, SaveSecureValueRequest, SaveThemeRequest, SaveWallPaperRequest, SendChangePhoneCodeRequest, SendConfirmPhoneCodeRequest, SendVerifyEmailCodeRequest, SendVerifyPhoneCodeRequest, SetAccountTTLRequest, SetAuthorizationTTLRequest, SetContactSignUpNotificationRequest, SetContentSettingsRequest, SetGlobalPrivacySettingsRequest, SetPrivacyRequest, SetReactionsNotifySettingsRequest, ToggleConnectedBotPausedRequest, ToggleSponsoredMessagesRequest, ToggleUsernameRequest, UnregisterDeviceRequest, UpdateBirthdayRequest, UpdateBusinessAwayMessageRequest, UpdateBusinessGreetingMessageRequest, UpdateBusinessIntroRequest, UpdateBusinessLocationRequest, UpdateBusinessWorkHoursRequest, UpdateColorRequest, UpdateConnectedBotRequest, UpdateDeviceLockedRequest, UpdateEmojiStatusRequest, UpdateNotifySettingsRequest, UpdatePasswordSettingsRequest, UpdatePersonalChannelRequest, UpdateProfileRequest, UpdateStatusRequest, UpdateThemeRequest, UpdateUsernameRequest, UploadRingtoneRequest, UploadThemeRequest, UploadWallPaperRequest, VerifyEmailRequest, VerifyPhoneRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAccountDaysTTL, TypeAutoDownloadSettings, TypeAutoSaveSettings, TypeBaseTheme, TypeBirthday, TypeBusinessWorkHours, TypeCodeSettings, TypeEmailVerification, TypeEmailVerifyPurpose, TypeEmojiStatus, TypeGlobalPrivacySettings, TypeInputBusinessAwayMessage, TypeInputBusinessBotRecipients, TypeInputBusinessChatLink, TypeInputBusinessGreetingMessage, TypeInputBusinessIntro, TypeInputChannel, TypeInputCheckPasswordSRP, TypeInputDocument, TypeInputFile, TypeInputGeoPoint, TypeInputNotifyPeer, TypeInputPeer, TypeInputPeerNotifySettings, TypeInputPhoto, TypeInputPrivacyKey, TypeInputPrivacyRule, TypeInputSecureValue, TypeInputTheme, TypeInputThemeSettings, TypeInputUser, TypeInputWallPaper, TypeReactionsNotifySettings, TypeReportReason, TypeSecureCredentialsEncrypted, TypeSecureValueHash, TypeSecureValueType, TypeWallPaperSettings
+    from ...tl.types.account import TypePasswordInputSettings
+
+
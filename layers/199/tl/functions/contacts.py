@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.contacts import AcceptContactRequest, AddContactRequest, BlockFromRepliesRequest, BlockRequest, DeleteByPhonesRequest, DeleteContactsRequest, EditCloseFriendsRequest, ExportContactTokenRequest, GetBirthdaysRequest, GetBlockedRequest, GetContactIDsRequest, GetContactsRequest, GetLocatedRequest, GetSavedRequest, GetStatusesRequest, GetTopPeersRequest, ImportContactTokenRequest, ImportContactsRequest, ResetSavedRequest, ResetTopPeerRatingRequest, ResolvePhoneRequest, ResolveUsernameRequest, SearchRequest, SetBlockedRequest, ToggleTopPeersRequest, UnblockRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputContact, TypeInputGeoPoint, TypeInputPeer, TypeInputUser, TypeTopPeerCategory
+
+
@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.fragment import GetCollectibleInfoRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputCollectible
+
+
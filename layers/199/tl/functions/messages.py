@@ -0,0 +1,672 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.messages import AcceptEncryptionRequest, AcceptUrlAuthRequest, AddChatUserRequest, CheckChatInviteRequest, CheckHistoryImportPeerRequest, CheckHistoryImportRequest, CheckQuickReplyShortcutRequest, ClearAllDraftsRequest, ClearRecentReactionsRequest, ClearRecentStickersRequest, ClickSponsoredMessageRequest, CreateChatRequest, DeleteChatRequest, DeleteChatUserRequest, DeleteExportedChatInviteRequest, DeleteFactCheckRequest, DeleteHistoryRequest, DeleteMessagesRequest, DeletePhoneCallHistoryRequest, DeleteQuickReplyMessagesRequest, DeleteQuickReplyShortcutRequest, DeleteRevokedExportedChatInvitesRequest, DeleteSavedHistoryRequest, DeleteScheduledMessagesRequest, DiscardEncryptionRequest, EditChatAboutRequest, EditChatAdminRequest, EditChatDefaultBannedRightsRequest, EditChatPhotoRequest, EditChatTitleRequest, EditExportedChatInviteRequest, EditFactCheckRequest, EditInlineBotMessageRequest, EditMessageRequest, EditQuickReplyShortcutRequest, ExportChatInviteRequest, FaveStickerRequest, GetAdminsWithInvitesRequest, GetAllDraftsRequest, GetAllStickersRequest, GetArchivedStickersRequest, GetAttachMenuBotRequest, GetAttachMenuBotsRequest, GetAttachedStickersRequest, GetAvailableEffectsRequest, GetAvailableReactionsRequest, GetBotAppRequest, GetBotCallbackAnswerRequest, GetChatInviteImportersRequest, GetChatsRequest, GetCommonChatsRequest, GetCustomEmojiDocumentsRequest, GetDefaultHistoryTTLRequest, GetDefaultTagReactionsRequest, GetDhConfigRequest, GetDialogFiltersRequest, GetDialogUnreadMarksRequest, GetDialogsRequest, GetDiscussionMessageRequest, GetDocumentByHashRequest, GetEmojiGroupsRequest, GetEmojiKeywordsDifferenceRequest, GetEmojiKeywordsLanguagesRequest, GetEmojiKeywordsRequest, GetEmojiProfilePhotoGroupsRequest, GetEmojiStatusGroupsRequest, GetEmojiStickerGroupsRequest, GetEmojiStickersRequest, GetEmojiURLRequest, GetExportedChatInviteRequest, GetExportedChatInvitesRequest, GetExtendedMediaRequest, GetFactCheckRequest, GetFavedStickersRequest, GetFeaturedEmojiStickersRequest, GetFeaturedStickersRequest, GetFullChatRequest, GetGameHighScoresRequest, GetHistoryRequest, GetInlineBotResultsRequest, GetInlineGameHighScoresRequest, GetMaskStickersRequest, GetMessageEditDataRequest, GetMessageReactionsListRequest, GetMessageReadParticipantsRequest, GetMessagesReactionsRequest, GetMessagesRequest, GetMessagesViewsRequest, GetMyStickersRequest, GetOldFeaturedStickersRequest, GetOnlinesRequest, GetOutboxReadDateRequest, GetPaidReactionPrivacyRequest, GetPeerDialogsRequest, GetPeerSettingsRequest, GetPinnedDialogsRequest, GetPinnedSavedDialogsRequest, GetPollResultsRequest, GetPollVotesRequest, GetPreparedInlineMessageRequest, GetQuickRepliesRequest, GetQuickReplyMessagesRequest, GetRecentLocationsRequest, GetRecentReactionsRequest, GetRecentStickersRequest, GetRepliesRequest, GetSavedDialogsRequest, GetSavedGifsRequest, GetSavedHistoryRequest, GetSavedReactionTagsRequest, GetScheduledHistoryRequest, GetScheduledMessagesRequest, GetSearchCountersRequest, GetSearchResultsCalendarRequest, GetSearchResultsPositionsRequest, GetSplitRangesRequest, GetSponsoredMessagesRequest, GetStickerSetRequest, GetStickersRequest, GetSuggestedDialogFiltersRequest, GetTopReactionsRequest, GetUnreadMentionsRequest, GetUnreadReactionsRequest, GetWebPagePreviewRequest, GetWebPageRequest, HideAllChatJoinRequestsRequest, HideChatJoinRequestRequest, HidePeerSettingsBarRequest, ImportChatInviteRequest, InitHistoryImportRequest, InstallStickerSetRequest, MarkDialogUnreadRequest, MigrateChatRequest, ProlongWebViewRequest, RateTranscribedAudioRequest, ReadDiscussionRequest, ReadEncryptedHistoryRequest, ReadFeaturedStickersRequest, ReadHistoryRequest, ReadMentionsRequest, ReadMessageContentsRequest, ReadReactionsRequest, ReceivedMessagesRequest, ReceivedQueueRequest, ReorderPinnedDialogsRequest, ReorderPinnedSavedDialogsRequest, ReorderQuickRepliesRequest, ReorderStickerSetsRequest, ReportEncryptedSpamRequest, ReportMessagesDeliveryRequest, ReportReactionRequest, ReportRequest, ReportSpamRequest, ReportSponsoredMessageRequest, RequestAppWebViewRequest, RequestEncryptionRequest, RequestMainWebViewRequest, RequestSimpleWebViewRequest, RequestUrlAuthRequest, RequestWebViewRequest, SaveDefaultSendAsRequest, SaveDraftRequest, SaveGifRequest, SavePreparedInlineMessageRequest, SaveRecentStickerRequest, SearchCustomEmojiRequest, SearchEmojiStickerSetsRequest, SearchGlobalRequest, SearchRequest, SearchSentMediaRequest, SearchStickerSetsRequest, SearchStickersRequest, SendBotRequestedPeerRequest, SendEncryptedFileRequest, SendEncryptedRequest, SendEncryptedServiceRequest, SendPaidReactionRequest, SendQuickReplyMessagesRequest, SendReactionRequest, SendScheduledMessagesRequest, SendScreenshotNotificationRequest, SendVoteRequest, SendWebViewDataRequest, SendWebViewResultMessageRequest, SetBotCallbackAnswerRequest, SetBotPrecheckoutResultsRequest, SetBotShippingResultsRequest, SetChatAvailableReactionsRequest, SetChatThemeRequest, SetChatWallPaperRequest, SetDefaultHistoryTTLRequest, SetDefaultReactionRequest, SetEncryptedTypingRequest, SetGameScoreRequest, SetHistoryTTLRequest, SetInlineBotResultsRequest, SetInlineGameScoreRequest, SetTypingRequest, StartBotRequest, StartHistoryImportRequest, ToggleBotInAttachMenuRequest, ToggleDialogFilterTagsRequest, ToggleDialogPinRequest, ToggleNoForwardsRequest, TogglePaidReactionPrivacyRequest, TogglePeerTranslationsRequest, ToggleSavedDialogPinRequest, ToggleStickerSetsRequest, TranscribeAudioRequest, TranslateTextRequest, UninstallStickerSetRequest, UnpinAllMessagesRequest, UpdateDialogFilterRequest, UpdateDialogFiltersOrderRequest, UpdatePinnedMessageRequest, UpdateSavedReactionTagRequest, UploadEncryptedFileRequest, UploadImportedMediaRequest, UploadMediaRequest, ViewSponsoredMessageRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChatBannedRights, TypeChatReactions, TypeDataJSON, TypeDialogFilter, TypeInlineBotSwitchPM, TypeInlineBotWebView, TypeInlineQueryPeerType, TypeInputBotApp, TypeInputBotInlineMessageID, TypeInputBotInlineResult, TypeInputChatPhoto, TypeInputCheckPasswordSRP, TypeInputDialogPeer, TypeInputDocument, TypeInputEncryptedChat, TypeInputEncryptedFile, TypeInputFile, TypeInputGeoPoint, TypeInputMedia, TypeInputMessage, TypeInputPeer, TypeInputQuickReplyShortcut, TypeInputReplyTo, TypeInputSingleMedia, TypeInputStickerSet, TypeInputStickeredMedia, TypeInputUser, TypeInputWallPaper, TypeMessageEntity, TypeMessagesFilter, TypePaidReactionPrivacy, TypeReaction, TypeReplyMarkup, TypeSendMessageAction, TypeShippingOption, TypeStarsSubscriptionPricing, TypeTextWithEntities, TypeWallPaperSettings
+
+
+
+class ForwardMessagesRequest(TLRequest):
+    CONSTRUCTOR_ID = 0x6d74da08
+    SUBCLASS_OF_ID = 0x8af52aac
+
+    __slots__ = ('from_peer', 'id', 'to_peer', 'silent', 'background', 'with_my_score', 'drop_author', 'drop_media_captions', 'noforwards', 'allow_paid_floodskip', 'random_id', 'top_msg_id', 'schedule_date', 'send_as', 'quick_reply_shortcut', 'video_timestamp')
+
+    def __init__(self, from_peer: 'TypeInputPeer', id: List[int], to_peer: 'TypeInputPeer', silent: Optional[bool]=None, background: Optional[bool]=None, with_my_score: Optional[bool]=None, drop_author: Optional[bool]=None, drop_media_captions: Optional[bool]=None, noforwards: Optional[bool]=None, allow_paid_floodskip: Optional[bool]=None, random_id: List[int]=None, top_msg_id: Optional[int]=None, schedule_date: Optional[datetime]=None, send_as: Optional['TypeInputPeer']=None, quick_reply_shortcut: Optional['TypeInputQuickReplyShortcut']=None, video_timestamp: Optional[int]=None):
+        """
+        :returns Updates: Instance of either UpdatesTooLong, UpdateShortMessage, UpdateShortChatMessage, UpdateShort, UpdatesCombined, Updates, UpdateShortSentMessage.
+        """
+        self.from_peer = from_peer
+        self.id = id
+        self.to_peer = to_peer
+        self.silent = silent
+        self.background = background
+        self.with_my_score = with_my_score
+        self.drop_author = drop_author
+        self.drop_media_captions = drop_media_captions
+        self.noforwards = noforwards
+        self.allow_paid_floodskip = allow_paid_floodskip
+        self.random_id = random_id if random_id is not None else [int.from_bytes(os.urandom(8), 'big', signed=True) for _ in range(len(id))]
+        self.top_msg_id = top_msg_id
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+        self.video_timestamp = video_timestamp
+
+    async def resolve(self, client, utils):
+        self.from_peer = utils.get_input_peer(await client.get_input_entity(self.from_peer))
+        self.to_peer = utils.get_input_peer(await client.get_input_entity(self.to_peer))
+        if self.send_as:
+            self.send_as = utils.get_input_peer(await client.get_input_entity(self.send_as))
+
+    def to_dict(self):
+        return {
+            '_': 'ForwardMessagesRequest',
+            'from_peer': self.from_peer.to_dict() if isinstance(self.from_peer, TLObject) else self.from_peer,
+            'id': [] if self.id is None else self.id[:],
+            'to_peer': self.to_peer.to_dict() if isinstance(self.to_peer, TLObject) else self.to_peer,
+            'silent': self.silent,
+            'background': self.background,
+            'with_my_score': self.with_my_score,
+            'drop_author': self.drop_author,
+            'drop_media_captions': self.drop_media_captions,
+            'noforwards': self.noforwards,
+            'allow_paid_floodskip': self.allow_paid_floodskip,
+            'random_id': [] if self.random_id is None else self.random_id[:],
+            'top_msg_id': self.top_msg_id,
+            'schedule_date': self.schedule_date,
+            'send_as': self.send_as.to_dict() if isinstance(self.send_as, TLObject) else self.send_as,
+            'quick_reply_shortcut': self.quick_reply_shortcut.to_dict() if isinstance(self.quick_reply_shortcut, TLObject) else self.quick_reply_shortcut,
+            'video_timestamp': self.video_timestamp
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x08\xdatm',
+            struct.pack('<I', (0 if self.silent is None or self.silent is False else 32) | (0 if self.background is None or self.background is False else 64) | (0 if self.with_my_score is None or self.with_my_score is False else 256) | (0 if self.drop_author is None or self.drop_author is False else 2048) | (0 if self.drop_media_captions is None or self.drop_media_captions is False else 4096) | (0 if self.noforwards is None or self.noforwards is False else 16384) | (0 if self.allow_paid_floodskip is None or self.allow_paid_floodskip is False else 524288) | (0 if self.top_msg_id is None or self.top_msg_id is False else 512) | (0 if self.schedule_date is None or self.schedule_date is False else 1024) | (0 if self.send_as is None or self.send_as is False else 8192) | (0 if self.quick_reply_shortcut is None or self.quick_reply_shortcut is False else 131072) | (0 if self.video_timestamp is None or self.video_timestamp is False else 1048576)),
+            self.from_peer._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.id)),b''.join(struct.pack('<i', x) for x in self.id),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.random_id)),b''.join(struct.pack('<q', x) for x in self.random_id),
+            self.to_peer._bytes(),
+            b'' if self.top_msg_id is None or self.top_msg_id is False else (struct.pack('<i', self.top_msg_id)),
+            b'' if self.schedule_date is None or self.schedule_date is False else (self.serialize_datetime(self.schedule_date)),
+            b'' if self.send_as is None or self.send_as is False else (self.send_as._bytes()),
+            b'' if self.quick_reply_shortcut is None or self.quick_reply_shortcut is False else (self.quick_reply_shortcut._bytes()),
+            b'' if self.video_timestamp is None or self.video_timestamp is False else (struct.pack('<i', self.video_timestamp)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _silent = bool(flags & 32)
+        _background = bool(flags & 64)
+        _with_my_score = bool(flags & 256)
+        _drop_author = bool(flags & 2048)
+        _drop_media_captions = bool(flags & 4096)
+        _noforwards = bool(flags & 16384)
+        _allow_paid_floodskip = bool(flags & 524288)
+        _from_peer = reader.tgread_object()
+        reader.read_int()
+        _id = []
+        for _ in range(reader.read_int()):
+            _x = reader.read_int()
+            _id.append(_x)
+
+        reader.read_int()
+        _random_id = []
+        for _ in range(reader.read_int()):
+            _x = reader.read_long()
+            _random_id.append(_x)
+
+        _to_peer = reader.tgread_object()
+        if flags & 512:
+            _top_msg_id = reader.read_int()
+        else:
+            _top_msg_id = None
+        if flags & 1024:
+            _schedule_date = reader.tgread_date()
+        else:
+            _schedule_date = None
+        if flags & 8192:
+            _send_as = reader.tgread_object()
+        else:
+            _send_as = None
+        if flags & 131072:
+            _quick_reply_shortcut = reader.tgread_object()
+        else:
+            _quick_reply_shortcut = None
+        if flags & 1048576:
+            _video_timestamp = reader.read_int()
+        else:
+            _video_timestamp = None
+        return cls(from_peer=_from_peer, id=_id, to_peer=_to_peer, silent=_silent, background=_background, with_my_score=_with_my_score, drop_author=_drop_author, drop_media_captions=_drop_media_captions, noforwards=_noforwards, allow_paid_floodskip=_allow_paid_floodskip, random_id=_random_id, top_msg_id=_top_msg_id, schedule_date=_schedule_date, send_as=_send_as, quick_reply_shortcut=_quick_reply_shortcut, video_timestamp=_video_timestamp)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        reader.tgskip_object()
+        reader.seek(4)
+        reader.seek(reader.read_int() * 4)
+        reader.seek(4)
+        reader.seek(reader.read_int() * 8)
+        reader.tgskip_object()
+        if flags & 512:
+            reader.seek(4)
+        if flags & 1024:
+            reader.seek(4)
+        if flags & 8192:
+            reader.tgskip_object()
+        if flags & 131072:
+            reader.tgskip_object()
+        if flags & 1048576:
+            reader.seek(4)
+
+
+class SendInlineBotResultRequest(TLRequest):
+    CONSTRUCTOR_ID = 0x3ebee86a
+    SUBCLASS_OF_ID = 0x8af52aac
+
+    __slots__ = ('peer', 'query_id', 'id', 'silent', 'background', 'clear_draft', 'hide_via', 'reply_to', 'random_id', 'schedule_date', 'send_as', 'quick_reply_shortcut')
+
+    def __init__(self, peer: 'TypeInputPeer', query_id: int, id: str, silent: Optional[bool]=None, background: Optional[bool]=None, clear_draft: Optional[bool]=None, hide_via: Optional[bool]=None, reply_to: Optional['TypeInputReplyTo']=None, random_id: int=None, schedule_date: Optional[datetime]=None, send_as: Optional['TypeInputPeer']=None, quick_reply_shortcut: Optional['TypeInputQuickReplyShortcut']=None):
+        """
+        :returns Updates: Instance of either UpdatesTooLong, UpdateShortMessage, UpdateShortChatMessage, UpdateShort, UpdatesCombined, Updates, UpdateShortSentMessage.
+        """
+        self.peer = peer
+        self.query_id = query_id
+        self.id = id
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.hide_via = hide_via
+        self.reply_to = reply_to
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(8), 'big', signed=True)
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+
+    async def resolve(self, client, utils):
+        self.peer = utils.get_input_peer(await client.get_input_entity(self.peer))
+        if self.send_as:
+            self.send_as = utils.get_input_peer(await client.get_input_entity(self.send_as))
+
+    def to_dict(self):
+        return {
+            '_': 'SendInlineBotResultRequest',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'query_id': self.query_id,
+            'id': self.id,
+            'silent': self.silent,
+            'background': self.background,
+            'clear_draft': self.clear_draft,
+            'hide_via': self.hide_via,
+            'reply_to': self.reply_to.to_dict() if isinstance(self.reply_to, TLObject) else self.reply_to,
+            'random_id': self.random_id,
+            'schedule_date': self.schedule_date,
+            'send_as': self.send_as.to_dict() if isinstance(self.send_as, TLObject) else self.send_as,
+            'quick_reply_shortcut': self.quick_reply_shortcut.to_dict() if isinstance(self.quick_reply_shortcut, TLObject) else self.quick_reply_shortcut
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'j\xe8\xbe>',
+            struct.pack('<I', (0 if self.silent is None or self.silent is False else 32) | (0 if self.background is None or self.background is False else 64) | (0 if self.clear_draft is None or self.clear_draft is False else 128) | (0 if self.hide_via is None or self.hide_via is False else 2048) | (0 if self.reply_to is None or self.reply_to is False else 1) | (0 if self.schedule_date is None or self.schedule_date is False else 1024) | (0 if self.send_as is None or self.send_as is False else 8192) | (0 if self.quick_reply_shortcut is None or self.quick_reply_shortcut is False else 131072)),
+            self.peer._bytes(),
+            b'' if self.reply_to is None or self.reply_to is False else (self.reply_to._bytes()),
+            struct.pack('<q', self.random_id),
+            struct.pack('<q', self.query_id),
+            self.serialize_bytes(self.id),
+            b'' if self.schedule_date is None or self.schedule_date is False else (self.serialize_datetime(self.schedule_date)),
+            b'' if self.send_as is None or self.send_as is False else (self.send_as._bytes()),
+            b'' if self.quick_reply_shortcut is None or self.quick_reply_shortcut is False else (self.quick_reply_shortcut._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _silent = bool(flags & 32)
+        _background = bool(flags & 64)
+        _clear_draft = bool(flags & 128)
+        _hide_via = bool(flags & 2048)
+        _peer = reader.tgread_object()
+        if flags & 1:
+            _reply_to = reader.tgread_object()
+        else:
+            _reply_to = None
+        _random_id = reader.read_long()
+        _query_id = reader.read_long()
+        _id = reader.tgread_string()
+        if flags & 1024:
+            _schedule_date = reader.tgread_date()
+        else:
+            _schedule_date = None
+        if flags & 8192:
+            _send_as = reader.tgread_object()
+        else:
+            _send_as = None
+        if flags & 131072:
+            _quick_reply_shortcut = reader.tgread_object()
+        else:
+            _quick_reply_shortcut = None
+        return cls(peer=_peer, query_id=_query_id, id=_id, silent=_silent, background=_background, clear_draft=_clear_draft, hide_via=_hide_via, reply_to=_reply_to, random_id=_random_id, schedule_date=_schedule_date, send_as=_send_as, quick_reply_shortcut=_quick_reply_shortcut)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        reader.tgskip_object()
+        if flags & 1:
+            reader.tgskip_object()
+        reader.seek(16)
+        TLObject.skip_bytes(reader)
+        if flags & 1024:
+            reader.seek(4)
+        if flags & 8192:
+            reader.tgskip_object()
+        if flags & 131072:
+            reader.tgskip_object()
+
+
+class SendMediaRequest(TLRequest):
+    CONSTRUCTOR_ID = 0x7852834e
+    SUBCLASS_OF_ID = 0x8af52aac
+
+    __slots__ = ('peer', 'media', 'message', 'silent', 'background', 'clear_draft', 'noforwards', 'update_stickersets_order', 'invert_media', 'allow_paid_floodskip', 'reply_to', 'random_id', 'reply_markup', 'entities', 'schedule_date', 'send_as', 'quick_reply_shortcut', 'effect')
+
+    def __init__(self, peer: 'TypeInputPeer', media: 'TypeInputMedia', message: str, silent: Optional[bool]=None, background: Optional[bool]=None, clear_draft: Optional[bool]=None, noforwards: Optional[bool]=None, update_stickersets_order: Optional[bool]=None, invert_media: Optional[bool]=None, allow_paid_floodskip: Optional[bool]=None, reply_to: Optional['TypeInputReplyTo']=None, random_id: int=None, reply_markup: Optional['TypeReplyMarkup']=None, entities: Optional[List['TypeMessageEntity']]=None, schedule_date: Optional[datetime]=None, send_as: Optional['TypeInputPeer']=None, quick_reply_shortcut: Optional['TypeInputQuickReplyShortcut']=None, effect: Optional[int]=None):
+        """
+        :returns Updates: Instance of either UpdatesTooLong, UpdateShortMessage, UpdateShortChatMessage, UpdateShort, UpdatesCombined, Updates, UpdateShortSentMessage.
+        """
+        self.peer = peer
+        self.media = media
+        self.message = message
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.invert_media = invert_media
+        self.allow_paid_floodskip = allow_paid_floodskip
+        self.reply_to = reply_to
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(8), 'big', signed=True)
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+        self.effect = effect
+
+    async def resolve(self, client, utils):
+        self.peer = utils.get_input_peer(await client.get_input_entity(self.peer))
+        self.media = utils.get_input_media(self.media)
+        if self.send_as:
+            self.send_as = utils.get_input_peer(await client.get_input_entity(self.send_as))
+
+    def to_dict(self):
+        return {
+            '_': 'SendMediaRequest',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'media': self.media.to_dict() if isinstance(self.media, TLObject) else self.media,
+            'message': self.message,
+            'silent': self.silent,
+            'background': self.background,
+            'clear_draft': self.clear_draft,
+            'noforwards': self.noforwards,
+            'update_stickersets_order': self.update_stickersets_order,
+            'invert_media': self.invert_media,
+            'allow_paid_floodskip': self.allow_paid_floodskip,
+            'reply_to': self.reply_to.to_dict() if isinstance(self.reply_to, TLObject) else self.reply_to,
+            'random_id': self.random_id,
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'schedule_date': self.schedule_date,
+            'send_as': self.send_as.to_dict() if isinstance(self.send_as, TLObject) else self.send_as,
+            'quick_reply_shortcut': self.quick_reply_shortcut.to_dict() if isinstance(self.quick_reply_shortcut, TLObject) else self.quick_reply_shortcut,
+            'effect': self.effect
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'N\x83Rx',
+            struct.pack('<I', (0 if self.silent is None or self.silent is False else 32) | (0 if self.background is None or self.background is False else 64) | (0 if self.clear_draft is None or self.clear_draft is False else 128) | (0 if self.noforwards is None or self.noforwards is False else 16384) | (0 if self.update_stickersets_order is None or self.update_stickersets_order is False else 32768) | (0 if self.invert_media is None or self.invert_media is False else 65536) | (0 if self.allow_paid_floodskip is None or self.allow_paid_floodskip is False else 524288) | (0 if self.reply_to is None or self.reply_to is False else 1) | (0 if self.reply_markup is None or self.reply_markup is False else 4) | (0 if self.entities is None or self.entities is False else 8) | (0 if self.schedule_date is None or self.schedule_date is False else 1024) | (0 if self.send_as is None or self.send_as is False else 8192) | (0 if self.quick_reply_shortcut is None or self.quick_reply_shortcut is False else 131072) | (0 if self.effect is None or self.effect is False else 262144)),
+            self.peer._bytes(),
+            b'' if self.reply_to is None or self.reply_to is False else (self.reply_to._bytes()),
+            self.media._bytes(),
+            self.serialize_bytes(self.message),
+            struct.pack('<q', self.random_id),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.schedule_date is None or self.schedule_date is False else (self.serialize_datetime(self.schedule_date)),
+            b'' if self.send_as is None or self.send_as is False else (self.send_as._bytes()),
+            b'' if self.quick_reply_shortcut is None or self.quick_reply_shortcut is False else (self.quick_reply_shortcut._bytes()),
+            b'' if self.effect is None or self.effect is False else (struct.pack('<q', self.effect)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _silent = bool(flags & 32)
+        _background = bool(flags & 64)
+        _clear_draft = bool(flags & 128)
+        _noforwards = bool(flags & 16384)
+        _update_stickersets_order = bool(flags & 32768)
+        _invert_media = bool(flags & 65536)
+        _allow_paid_floodskip = bool(flags & 524288)
+        _peer = reader.tgread_object()
+        if flags & 1:
+            _reply_to = reader.tgread_object()
+        else:
+            _reply_to = None
+        _media = reader.tgread_object()
+        _message = reader.tgread_string()
+        _random_id = reader.read_long()
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        if flags & 8:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 1024:
+            _schedule_date = reader.tgread_date()
+        else:
+            _schedule_date = None
+        if flags & 8192:
+            _send_as = reader.tgread_object()
+        else:
+            _send_as = None
+        if flags & 131072:
+            _quick_reply_shortcut = reader.tgread_object()
+        else:
+            _quick_reply_shortcut = None
+        if flags & 262144:
+            _effect = reader.read_long()
+        else:
+            _effect = None
+        return cls(peer=_peer, media=_media, message=_message, silent=_silent, background=_background, clear_draft=_clear_draft, noforwards=_noforwards, update_stickersets_order=_update_stickersets_order, invert_media=_invert_media, allow_paid_floodskip=_allow_paid_floodskip, reply_to=_reply_to, random_id=_random_id, reply_markup=_reply_markup, entities=_entities, schedule_date=_schedule_date, send_as=_send_as, quick_reply_shortcut=_quick_reply_shortcut, effect=_effect)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        reader.tgskip_object()
+        if flags & 1:
+            reader.tgskip_object()
+        reader.tgskip_object()
+        TLObject.skip_bytes(reader)
+        reader.seek(8)
+        if flags & 4:
+            reader.tgskip_object()
+        if flags & 8:
+            reader.seek(4)
+            for _ in range(reader.read_int()):
+                reader.tgskip_object()
+        if flags & 1024:
+            reader.seek(4)
+        if flags & 8192:
+            reader.tgskip_object()
+        if flags & 131072:
+            reader.tgskip_object()
+        if flags & 262144:
+            reader.seek(8)
+
+
+class SendMessageRequest(TLRequest):
+    CONSTRUCTOR_ID = 0x983f9745
+    SUBCLASS_OF_ID = 0x8af52aac
+
+    __slots__ = ('peer', 'message', 'no_webpage', 'silent', 'background', 'clear_draft', 'noforwards', 'update_stickersets_order', 'invert_media', 'allow_paid_floodskip', 'reply_to', 'random_id', 'reply_markup', 'entities', 'schedule_date', 'send_as', 'quick_reply_shortcut', 'effect')
+
+    def __init__(self, peer: 'TypeInputPeer', message: str, no_webpage: Optional[bool]=None, silent: Optional[bool]=None, background: Optional[bool]=None, clear_draft: Optional[bool]=None, noforwards: Optional[bool]=None, update_stickersets_order: Optional[bool]=None, invert_media: Optional[bool]=None, allow_paid_floodskip: Optional[bool]=None, reply_to: Optional['TypeInputReplyTo']=None, random_id: int=None, reply_markup: Optional['TypeReplyMarkup']=None, entities: Optional[List['TypeMessageEntity']]=None, schedule_date: Optional[datetime]=None, send_as: Optional['TypeInputPeer']=None, quick_reply_shortcut: Optional['TypeInputQuickReplyShortcut']=None, effect: Optional[int]=None):
+        """
+        :returns Updates: Instance of either UpdatesTooLong, UpdateShortMessage, UpdateShortChatMessage, UpdateShort, UpdatesCombined, Updates, UpdateShortSentMessage.
+        """
+        self.peer = peer
+        self.message = message
+        self.no_webpage = no_webpage
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.invert_media = invert_media
+        self.allow_paid_floodskip = allow_paid_floodskip
+        self.reply_to = reply_to
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(8), 'big', signed=True)
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+        self.effect = effect
+
+    async def resolve(self, client, utils):
+        self.peer = utils.get_input_peer(await client.get_input_entity(self.peer))
+        if self.send_as:
+            self.send_as = utils.get_input_peer(await client.get_input_entity(self.send_as))
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageRequest',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'message': self.message,
+            'no_webpage': self.no_webpage,
+            'silent': self.silent,
+            'background': self.background,
+            'clear_draft': self.clear_draft,
+            'noforwards': self.noforwards,
+            'update_stickersets_order': self.update_stickersets_order,
+            'invert_media': self.invert_media,
+            'allow_paid_floodskip': self.allow_paid_floodskip,
+            'reply_to': self.reply_to.to_dict() if isinstance(self.reply_to, TLObject) else self.reply_to,
+            'random_id': self.random_id,
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'schedule_date': self.schedule_date,
+            'send_as': self.send_as.to_dict() if isinstance(self.send_as, TLObject) else self.send_as,
+            'quick_reply_shortcut': self.quick_reply_shortcut.to_dict() if isinstance(self.quick_reply_shortcut, TLObject) else self.quick_reply_shortcut,
+            'effect': self.effect
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'E\x97?\x98',
+            struct.pack('<I', (0 if self.no_webpage is None or self.no_webpage is False else 2) | (0 if self.silent is None or self.silent is False else 32) | (0 if self.background is None or self.background is False else 64) | (0 if self.clear_draft is None or self.clear_draft is False else 128) | (0 if self.noforwards is None or self.noforwards is False else 16384) | (0 if self.update_stickersets_order is None or self.update_stickersets_order is False else 32768) | (0 if self.invert_media is None or self.invert_media is False else 65536) | (0 if self.allow_paid_floodskip is None or self.allow_paid_floodskip is False else 524288) | (0 if self.reply_to is None or self.reply_to is False else 1) | (0 if self.reply_markup is None or self.reply_markup is False else 4) | (0 if self.entities is None or self.entities is False else 8) | (0 if self.schedule_date is None or self.schedule_date is False else 1024) | (0 if self.send_as is None or self.send_as is False else 8192) | (0 if self.quick_reply_shortcut is None or self.quick_reply_shortcut is False else 131072) | (0 if self.effect is None or self.effect is False else 262144)),
+            self.peer._bytes(),
+            b'' if self.reply_to is None or self.reply_to is False else (self.reply_to._bytes()),
+            self.serialize_bytes(self.message),
+            struct.pack('<q', self.random_id),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.schedule_date is None or self.schedule_date is False else (self.serialize_datetime(self.schedule_date)),
+            b'' if self.send_as is None or self.send_as is False else (self.send_as._bytes()),
+            b'' if self.quick_reply_shortcut is None or self.quick_reply_shortcut is False else (self.quick_reply_shortcut._bytes()),
+            b'' if self.effect is None or self.effect is False else (struct.pack('<q', self.effect)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _no_webpage = bool(flags & 2)
+        _silent = bool(flags & 32)
+        _background = bool(flags & 64)
+        _clear_draft = bool(flags & 128)
+        _noforwards = bool(flags & 16384)
+        _update_stickersets_order = bool(flags & 32768)
+        _invert_media = bool(flags & 65536)
+        _allow_paid_floodskip = bool(flags & 524288)
+        _peer = reader.tgread_object()
+        if flags & 1:
+            _reply_to = reader.tgread_object()
+        else:
+            _reply_to = None
+        _message = reader.tgread_string()
+        _random_id = reader.read_long()
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        if flags & 8:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 1024:
+            _schedule_date = reader.tgread_date()
+        else:
+            _schedule_date = None
+        if flags & 8192:
+            _send_as = reader.tgread_object()
+        else:
+            _send_as = None
+        if flags & 131072:
+            _quick_reply_shortcut = reader.tgread_object()
+        else:
+            _quick_reply_shortcut = None
+        if flags & 262144:
+            _effect = reader.read_long()
+        else:
+            _effect = None
+        return cls(peer=_peer, message=_message, no_webpage=_no_webpage, silent=_silent, background=_background, clear_draft=_clear_draft, noforwards=_noforwards, update_stickersets_order=_update_stickersets_order, invert_media=_invert_media, allow_paid_floodskip=_allow_paid_floodskip, reply_to=_reply_to, random_id=_random_id, reply_markup=_reply_markup, entities=_entities, schedule_date=_schedule_date, send_as=_send_as, quick_reply_shortcut=_quick_reply_shortcut, effect=_effect)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        reader.tgskip_object()
+        if flags & 1:
+            reader.tgskip_object()
+        TLObject.skip_bytes(reader)
+        reader.seek(8)
+        if flags & 4:
+            reader.tgskip_object()
+        if flags & 8:
+            reader.seek(4)
+            for _ in range(reader.read_int()):
+                reader.tgskip_object()
+        if flags & 1024:
+            reader.seek(4)
+        if flags & 8192:
+            reader.tgskip_object()
+        if flags & 131072:
+            reader.tgskip_object()
+        if flags & 262144:
+            reader.seek(8)
+
+
+class SendMultiMediaRequest(TLRequest):
+    CONSTRUCTOR_ID = 0x37b74355
+    SUBCLASS_OF_ID = 0x8af52aac
+
+    __slots__ = ('peer', 'multi_media', 'silent', 'background', 'clear_draft', 'noforwards', 'update_stickersets_order', 'invert_media', 'allow_paid_floodskip', 'reply_to', 'schedule_date', 'send_as', 'quick_reply_shortcut', 'effect')
+
+    def __init__(self, peer: 'TypeInputPeer', multi_media: List['TypeInputSingleMedia'], silent: Optional[bool]=None, background: Optional[bool]=None, clear_draft: Optional[bool]=None, noforwards: Optional[bool]=None, update_stickersets_order: Optional[bool]=None, invert_media: Optional[bool]=None, allow_paid_floodskip: Optional[bool]=None, reply_to: Optional['TypeInputReplyTo']=None, schedule_date: Optional[datetime]=None, send_as: Optional['TypeInputPeer']=None, quick_reply_shortcut: Optional['TypeInputQuickReplyShortcut']=None, effect: Optional[int]=None):
+        """
+        :returns Updates: Instance of either UpdatesTooLong, UpdateShortMessage, UpdateShortChatMessage, UpdateShort, UpdatesCombined, Updates, UpdateShortSentMessage.
+        """
+        self.peer = peer
+        self.multi_media = multi_media
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.invert_media = invert_media
+        self.allow_paid_floodskip = allow_paid_floodskip
+        self.reply_to = reply_to
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+        self.effect = effect
+
+    async def resolve(self, client, utils):
+        self.peer = utils.get_input_peer(await client.get_input_entity(self.peer))
+        if self.send_as:
+            self.send_as = utils.get_input_peer(await client.get_input_entity(self.send_as))
+
+    def to_dict(self):
+        return {
+            '_': 'SendMultiMediaRequest',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'multi_media': [] if self.multi_media is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.multi_media],
+            'silent': self.silent,
+            'background': self.background,
+            'clear_draft': self.clear_draft,
+            'noforwards': self.noforwards,
+            'update_stickersets_order': self.update_stickersets_order,
+            'invert_media': self.invert_media,
+            'allow_paid_floodskip': self.allow_paid_floodskip,
+            'reply_to': self.reply_to.to_dict() if isinstance(self.reply_to, TLObject) else self.reply_to,
+            'schedule_date': self.schedule_date,
+            'send_as': self.send_as.to_dict() if isinstance(self.send_as, TLObject) else self.send_as,
+            'quick_reply_shortcut': self.quick_reply_shortcut.to_dict() if isinstance(self.quick_reply_shortcut, TLObject) else self.quick_reply_shortcut,
+            'effect': self.effect
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'UC\xb77',
+            struct.pack('<I', (0 if self.silent is None or self.silent is False else 32) | (0 if self.background is None or self.background is False else 64) | (0 if self.clear_draft is None or self.clear_draft is False else 128) | (0 if self.noforwards is None or self.noforwards is False else 16384) | (0 if self.update_stickersets_order is None or self.update_stickersets_order is False else 32768) | (0 if self.invert_media is None or self.invert_media is False else 65536) | (0 if self.allow_paid_floodskip is None or self.allow_paid_floodskip is False else 524288) | (0 if self.reply_to is None or self.reply_to is False else 1) | (0 if self.schedule_date is None or self.schedule_date is False else 1024) | (0 if self.send_as is None or self.send_as is False else 8192) | (0 if self.quick_reply_shortcut is None or self.quick_reply_shortcut is False else 131072) | (0 if self.effect is None or self.effect is False else 262144)),
+            self.peer._bytes(),
+            b'' if self.reply_to is None or self.reply_to is False else (self.reply_to._bytes()),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.multi_media)),b''.join(x._bytes() for x in self.multi_media),
+            b'' if self.schedule_date is None or self.schedule_date is False else (self.serialize_datetime(self.schedule_date)),
+            b'' if self.send_as is None or self.send_as is False else (self.send_as._bytes()),
+            b'' if self.quick_reply_shortcut is None or self.quick_reply_shortcut is False else (self.quick_reply_shortcut._bytes()),
+            b'' if self.effect is None or self.effect is False else (struct.pack('<q', self.effect)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _silent = bool(flags & 32)
+        _background = bool(flags & 64)
+        _clear_draft = bool(flags & 128)
+        _noforwards = bool(flags & 16384)
+        _update_stickersets_order = bool(flags & 32768)
+        _invert_media = bool(flags & 65536)
+        _allow_paid_floodskip = bool(flags & 524288)
+        _peer = reader.tgread_object()
+        if flags & 1:
+            _reply_to = reader.tgread_object()
+        else:
+            _reply_to = None
+        reader.read_int()
+        _multi_media = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _multi_media.append(_x)
+
+        if flags & 1024:
+            _schedule_date = reader.tgread_date()
+        else:
+            _schedule_date = None
+        if flags & 8192:
+            _send_as = reader.tgread_object()
+        else:
+            _send_as = None
+        if flags & 131072:
+            _quick_reply_shortcut = reader.tgread_object()
+        else:
+            _quick_reply_shortcut = None
+        if flags & 262144:
+            _effect = reader.read_long()
+        else:
+            _effect = None
+        return cls(peer=_peer, multi_media=_multi_media, silent=_silent, background=_background, clear_draft=_clear_draft, noforwards=_noforwards, update_stickersets_order=_update_stickersets_order, invert_media=_invert_media, allow_paid_floodskip=_allow_paid_floodskip, reply_to=_reply_to, schedule_date=_schedule_date, send_as=_send_as, quick_reply_shortcut=_quick_reply_shortcut, effect=_effect)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        reader.tgskip_object()
+        if flags & 1:
+            reader.tgskip_object()
+        reader.seek(4)
+        for _ in range(reader.read_int()):
+            reader.tgskip_object()
+        if flags & 1024:
+            reader.seek(4)
+        if flags & 8192:
+            reader.tgskip_object()
+        if flags & 131072:
+            reader.tgskip_object()
+        if flags & 262144:
+            reader.seek(8)
+
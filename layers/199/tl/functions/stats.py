@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.stats import GetBroadcastRevenueStatsRequest, GetBroadcastRevenueTransactionsRequest, GetBroadcastRevenueWithdrawalUrlRequest, GetBroadcastStatsRequest, GetMegagroupStatsRequest, GetMessagePublicForwardsRequest, GetMessageStatsRequest, GetStoryPublicForwardsRequest, GetStoryStatsRequest, LoadAsyncGraphRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputChannel, TypeInputCheckPasswordSRP, TypeInputPeer
+
+
@@ -0,0 +1,60 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.users import GetFullUserRequest, GetUsersRequest, SetSecureValueErrorsRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputUser, TypeSecureValueError
+
+
+
+class GetIsPremiumRequiredToContactRequest(TLRequest):
+    CONSTRUCTOR_ID = 0xa622aa10
+    SUBCLASS_OF_ID = 0x15dfc3f1
+
+    __slots__ = ('id',)
+
+    def __init__(self, id: List['TypeInputUser']):
+        """
+        :returns Vector<Bool>: This type has no constructors.
+        """
+        self.id = id
+
+    async def resolve(self, client, utils):
+        _tmp = []
+        for _x in self.id:
+            _tmp.append(utils.get_input_user(await client.get_input_entity(_x)))
+
+        self.id = _tmp
+
+    def to_dict(self):
+        return {
+            '_': 'GetIsPremiumRequiredToContactRequest',
+            'id': [] if self.id is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.id]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x10\xaa"\xa6',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.id)),b''.join(x._bytes() for x in self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _id = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _id.append(_x)
+
+        return cls(id=_id)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        reader.seek(4)
+        for _ in range(reader.read_int()):
+            reader.tgskip_object()
+
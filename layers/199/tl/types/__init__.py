@@ -0,0 +1,2807 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+from . import account, auth, bots, channels, chatlists, contacts, fragment, help, messages, payments, phone, photos, premium, smsjobs, stats, stickers, storage, stories, updates, upload, users
+import os
+import struct
+from ....shared.tl.types import AccessPointRule, AccountDaysTTL, AttachMenuBot, AttachMenuBotIcon, AttachMenuBotIconColor, AttachMenuBots, AttachMenuBotsBot, AttachMenuBotsNotModified, AttachMenuPeerTypeBotPM, AttachMenuPeerTypeBroadcast, AttachMenuPeerTypeChat, AttachMenuPeerTypePM, AttachMenuPeerTypeSameBotPM, Authorization, AutoDownloadSettings, AutoSaveException, AutoSaveSettings, AvailableEffect, AvailableReaction, BadMsgNotification, BadServerSalt, BankCardOpenUrl, BaseThemeArctic, BaseThemeClassic, BaseThemeDay, BaseThemeNight, BaseThemeTinted, BindAuthKeyInner, Birthday, Boost, BotApp, BotAppNotModified, BotAppSettings, BotBusinessConnection, BotCommand, BotCommandScopeChatAdmins, BotCommandScopeChats, BotCommandScopeDefault, BotCommandScopePeer, BotCommandScopePeerAdmins, BotCommandScopePeerUser, BotCommandScopeUsers, BotInfo, BotInlineMediaResult, BotInlineMessageMediaAuto, BotInlineMessageMediaContact, BotInlineMessageMediaGeo, BotInlineMessageMediaInvoice, BotInlineMessageMediaVenue, BotInlineMessageMediaWebPage, BotInlineMessageText, BotInlineResult, BotMenuButton, BotMenuButtonCommands, BotMenuButtonDefault, BotPreviewMedia, BotVerification, BotVerifierSettings, BroadcastRevenueBalances, BroadcastRevenueTransactionProceeds, BroadcastRevenueTransactionRefund, BroadcastRevenueTransactionWithdrawal, BusinessAwayMessage, BusinessAwayMessageScheduleAlways, BusinessAwayMessageScheduleCustom, BusinessAwayMessageScheduleOutsideWorkHours, BusinessBotRecipients, BusinessChatLink, BusinessGreetingMessage, BusinessIntro, BusinessLocation, BusinessRecipients, BusinessWeeklyOpen, BusinessWorkHours, CdnConfig, CdnPublicKey, ChannelAdminLogEvent, ChannelAdminLogEventActionChangeAbout, ChannelAdminLogEventActionChangeAvailableReactions, ChannelAdminLogEventActionChangeEmojiStatus, ChannelAdminLogEventActionChangeEmojiStickerSet, ChannelAdminLogEventActionChangeHistoryTTL, ChannelAdminLogEventActionChangeLinkedChat, ChannelAdminLogEventActionChangeLocation, ChannelAdminLogEventActionChangePeerColor, ChannelAdminLogEventActionChangePhoto, ChannelAdminLogEventActionChangeProfilePeerColor, ChannelAdminLogEventActionChangeStickerSet, ChannelAdminLogEventActionChangeTitle, ChannelAdminLogEventActionChangeUsername, ChannelAdminLogEventActionChangeUsernames, ChannelAdminLogEventActionChangeWallpaper, ChannelAdminLogEventActionCreateTopic, ChannelAdminLogEventActionDefaultBannedRights, ChannelAdminLogEventActionDeleteMessage, ChannelAdminLogEventActionDeleteTopic, ChannelAdminLogEventActionDiscardGroupCall, ChannelAdminLogEventActionEditMessage, ChannelAdminLogEventActionEditTopic, ChannelAdminLogEventActionExportedInviteDelete, ChannelAdminLogEventActionExportedInviteEdit, ChannelAdminLogEventActionExportedInviteRevoke, ChannelAdminLogEventActionParticipantInvite, ChannelAdminLogEventActionParticipantJoin, ChannelAdminLogEventActionParticipantJoinByInvite, ChannelAdminLogEventActionParticipantJoinByRequest, ChannelAdminLogEventActionParticipantLeave, ChannelAdminLogEventActionParticipantMute, ChannelAdminLogEventActionParticipantSubExtend, ChannelAdminLogEventActionParticipantToggleAdmin, ChannelAdminLogEventActionParticipantToggleBan, ChannelAdminLogEventActionParticipantUnmute, ChannelAdminLogEventActionParticipantVolume, ChannelAdminLogEventActionPinTopic, ChannelAdminLogEventActionSendMessage, ChannelAdminLogEventActionStartGroupCall, ChannelAdminLogEventActionStopPoll, ChannelAdminLogEventActionToggleAntiSpam, ChannelAdminLogEventActionToggleForum, ChannelAdminLogEventActionToggleGroupCallSetting, ChannelAdminLogEventActionToggleInvites, ChannelAdminLogEventActionToggleNoForwards, ChannelAdminLogEventActionTogglePreHistoryHidden, ChannelAdminLogEventActionToggleSignatureProfiles, ChannelAdminLogEventActionToggleSignatures, ChannelAdminLogEventActionToggleSlowMode, ChannelAdminLogEventActionUpdatePinned, ChannelAdminLogEventsFilter, ChannelForbidden, ChannelLocation, ChannelLocationEmpty, ChannelMessagesFilter, ChannelMessagesFilterEmpty, ChannelParticipant, ChannelParticipantAdmin, ChannelParticipantBanned, ChannelParticipantCreator, ChannelParticipantLeft, ChannelParticipantSelf, ChannelParticipantsAdmins, ChannelParticipantsBanned, ChannelParticipantsBots, ChannelParticipantsContacts, ChannelParticipantsKicked, ChannelParticipantsMentions, ChannelParticipantsRecent, ChannelParticipantsSearch, Chat, ChatAdminRights, ChatAdminWithInvites, ChatBannedRights, ChatEmpty, ChatForbidden, ChatFull, ChatInvite, ChatInviteAlready, ChatInviteExported, ChatInviteImporter, ChatInvitePeek, ChatInvitePublicJoinRequests, ChatOnlines, ChatParticipant, ChatParticipantAdmin, ChatParticipantCreator, ChatParticipants, ChatParticipantsForbidden, ChatPhoto, ChatPhotoEmpty, ChatReactionsAll, ChatReactionsNone, ChatReactionsSome, ClientDHInnerData, CodeSettings, Config, ConnectedBot, ConnectedBotStarRef, Contact, ContactBirthday, ContactStatus, DataJSON, DcOption, DefaultHistoryTTL, DestroyAuthKeyFail, DestroyAuthKeyNone, DestroyAuthKeyOk, DestroySessionNone, DestroySessionOk, DhGenFail, DhGenOk, DhGenRetry, Dialog, DialogFilter, DialogFilterChatlist, DialogFilterDefault, DialogFilterSuggested, DialogFolder, DialogPeer, DialogPeerFolder, Document, DocumentAttributeAnimated, DocumentAttributeAudio, DocumentAttributeCustomEmoji, DocumentAttributeFilename, DocumentAttributeHasStickers, DocumentAttributeImageSize, DocumentAttributeSticker, DocumentAttributeVideo, DocumentEmpty, DraftMessage, DraftMessageEmpty, EmailVerificationApple, EmailVerificationCode, EmailVerificationGoogle, EmailVerifyPurposeLoginChange, EmailVerifyPurposeLoginSetup, EmailVerifyPurposePassport, EmojiGroup, EmojiGroupGreeting, EmojiGroupPremium, EmojiKeyword, EmojiKeywordDeleted, EmojiKeywordsDifference, EmojiLanguage, EmojiList, EmojiListNotModified, EmojiStatus, EmojiStatusCollectible, EmojiStatusEmpty, EmojiURL, EncryptedChat, EncryptedChatDiscarded, EncryptedChatEmpty, EncryptedChatRequested, EncryptedChatWaiting, EncryptedFile, EncryptedFileEmpty, EncryptedMessage, EncryptedMessageService, ExportedChatlistInvite, ExportedContactToken, ExportedMessageLink, ExportedStoryLink, FactCheck, FileHash, Folder, FolderPeer, ForumTopic, ForumTopicDeleted, FoundStory, FutureSalt, Game, GeoPoint, GeoPointAddress, GeoPointEmpty, GroupCall, GroupCallDiscarded, GroupCallParticipant, GroupCallParticipantVideo, GroupCallParticipantVideoSourceGroup, GroupCallStreamChannel, HighScore, HttpWait, ImportedContact, InlineBotSwitchPM, InlineBotWebView, InlineQueryPeerTypeBotPM, InlineQueryPeerTypeBroadcast, InlineQueryPeerTypeChat, InlineQueryPeerTypeMegagroup, InlineQueryPeerTypePM, InlineQueryPeerTypeSameBotPM, InputAppEvent, InputBotAppID, InputBotAppShortName, InputBotInlineMessageGame, InputBotInlineMessageID, InputBotInlineMessageID64, InputBotInlineMessageMediaAuto, InputBotInlineMessageMediaContact, InputBotInlineMessageMediaGeo, InputBotInlineMessageMediaInvoice, InputBotInlineMessageMediaVenue, InputBotInlineMessageMediaWebPage, InputBotInlineMessageText, InputBotInlineResult, InputBotInlineResultDocument, InputBotInlineResultGame, InputBotInlineResultPhoto, InputBusinessAwayMessage, InputBusinessBotRecipients, InputBusinessChatLink, InputBusinessGreetingMessage, InputBusinessIntro, InputBusinessRecipients, InputChannel, InputChannelEmpty, InputChannelFromMessage, InputChatPhoto, InputChatPhotoEmpty, InputChatUploadedPhoto, InputChatlistDialogFilter, InputCheckPasswordEmpty, InputCheckPasswordSRP, InputClientProxy, InputCollectiblePhone, InputCollectibleUsername, InputDialogPeer, InputDialogPeerFolder, InputDocument, InputDocumentEmpty, InputDocumentFileLocation, InputEmojiStatusCollectible, InputEncryptedChat, InputEncryptedFile, InputEncryptedFileBigUploaded, InputEncryptedFileEmpty, InputEncryptedFileLocation, InputEncryptedFileUploaded, InputFile, InputFileBig, InputFileLocation, InputFileStoryDocument, InputFolderPeer, InputGameID, InputGameShortName, InputGeoPoint, InputGeoPointEmpty, InputGroupCall, InputGroupCallStream, InputInvoiceChatInviteSubscription, InputInvoiceMessage, InputInvoicePremiumGiftCode, InputInvoiceSlug, InputInvoiceStarGift, InputInvoiceStarGiftTransfer, InputInvoiceStarGiftUpgrade, InputInvoiceStars, InputKeyboardButtonRequestPeer, InputKeyboardButtonUrlAuth, InputKeyboardButtonUserProfile, InputMediaAreaChannelPost, InputMediaAreaVenue, InputMediaContact, InputMediaDice, InputMediaDocument, InputMediaDocumentExternal, InputMediaEmpty, InputMediaGame, InputMediaGeoLive, InputMediaGeoPoint, InputMediaInvoice, InputMediaPaidMedia, InputMediaPhoto, InputMediaPhotoExternal, InputMediaPoll, InputMediaStory, InputMediaUploadedDocument, InputMediaUploadedPhoto, InputMediaVenue, InputMediaWebPage, InputMessageCallbackQuery, InputMessageEntityMentionName, InputMessageID, InputMessagePinned, InputMessageReplyTo, InputMessagesFilterChatPhotos, InputMessagesFilterContacts, InputMessagesFilterDocument, InputMessagesFilterEmpty, InputMessagesFilterGeo, InputMessagesFilterGif, InputMessagesFilterMusic, InputMessagesFilterMyMentions, InputMessagesFilterPhoneCalls, InputMessagesFilterPhotoVideo, InputMessagesFilterPhotos, InputMessagesFilterPinned, InputMessagesFilterRoundVideo, InputMessagesFilterRoundVoice, InputMessagesFilterUrl, InputMessagesFilterVideo, InputMessagesFilterVoice, InputNotifyBroadcasts, InputNotifyChats, InputNotifyForumTopic, InputNotifyPeer, InputNotifyUsers, InputPaymentCredentials, InputPaymentCredentialsApplePay, InputPaymentCredentialsGooglePay, InputPaymentCredentialsSaved, InputPeerChannel, InputPeerChannelFromMessage, InputPeerChat, InputPeerEmpty, InputPeerNotifySettings, InputPeerPhotoFileLocation, InputPeerSelf, InputPeerUser, InputPeerUserFromMessage, InputPhoneCall, InputPhoneContact, InputPhoto, InputPhotoEmpty, InputPhotoFileLocation, InputPhotoLegacyFileLocation, InputPrivacyKeyAbout, InputPrivacyKeyAddedByPhone, InputPrivacyKeyBirthday, InputPrivacyKeyChatInvite, InputPrivacyKeyForwards, InputPrivacyKeyPhoneCall, InputPrivacyKeyPhoneNumber, InputPrivacyKeyPhoneP2P, InputPrivacyKeyProfilePhoto, InputPrivacyKeyStarGiftsAutoSave, InputPrivacyKeyStatusTimestamp, InputPrivacyKeyVoiceMessages, InputPrivacyValueAllowAll, InputPrivacyValueAllowBots, InputPrivacyValueAllowChatParticipants, InputPrivacyValueAllowCloseFriends, InputPrivacyValueAllowContacts, InputPrivacyValueAllowPremium, InputPrivacyValueAllowUsers, InputPrivacyValueDisallowAll, InputPrivacyValueDisallowBots, InputPrivacyValueDisallowChatParticipants, InputPrivacyValueDisallowContacts, InputPrivacyValueDisallowUsers, InputQuickReplyShortcut, InputQuickReplyShortcutId, InputReplyToMessage, InputReplyToStory, InputReportReasonChildAbuse, InputReportReasonCopyright, InputReportReasonFake, InputReportReasonGeoIrrelevant, InputReportReasonIllegalDrugs, InputReportReasonOther, InputReportReasonPersonalDetails, InputReportReasonPornography, InputReportReasonSpam, InputReportReasonViolence, InputSavedStarGiftChat, InputSavedStarGiftUser, InputSecureFile, InputSecureFileLocation, InputSecureFileUploaded, InputSecureValue, InputSingleMedia, InputStarsTransaction, InputStickerSetAnimatedEmoji, InputStickerSetAnimatedEmojiAnimations, InputStickerSetDice, InputStickerSetEmojiChannelDefaultStatuses, InputStickerSetEmojiDefaultStatuses, InputStickerSetEmojiDefaultTopicIcons, InputStickerSetEmojiGenericAnimations, InputStickerSetEmpty, InputStickerSetID, InputStickerSetItem, InputStickerSetPremiumGifts, InputStickerSetShortName, InputStickerSetThumb, InputStickeredMediaDocument, InputStickeredMediaPhoto, InputStorePaymentGiftPremium, InputStorePaymentPremiumGiftCode, InputStorePaymentPremiumGiveaway, InputStorePaymentPremiumSubscription, InputStorePaymentStarsGift, InputStorePaymentStarsGiveaway, InputStorePaymentStarsTopup, InputTakeoutFileLocation, InputTheme, InputThemeSettings, InputThemeSlug, InputUser, InputUserEmpty, InputUserFromMessage, InputUserSelf, InputWallPaper, InputWallPaperNoFile, InputWallPaperSlug, InputWebDocument, InputWebFileAudioAlbumThumbLocation, InputWebFileGeoPointLocation, InputWebFileLocation, Invoice, IpPort, IpPortSecret, JsonArray, JsonBool, JsonNull, JsonNumber, JsonObject, JsonObjectValue, JsonString, KeyboardButton, KeyboardButtonBuy, KeyboardButtonCallback, KeyboardButtonCopy, KeyboardButtonGame, KeyboardButtonRequestGeoLocation, KeyboardButtonRequestPeer, KeyboardButtonRequestPhone, KeyboardButtonRequestPoll, KeyboardButtonRow, KeyboardButtonSimpleWebView, KeyboardButtonSwitchInline, KeyboardButtonUrl, KeyboardButtonUrlAuth, KeyboardButtonUserProfile, KeyboardButtonWebView, LabeledPrice, LangPackDifference, LangPackLanguage, LangPackString, LangPackStringDeleted, LangPackStringPluralized, MaskCoords, MediaAreaChannelPost, MediaAreaCoordinates, MediaAreaGeoPoint, MediaAreaStarGift, MediaAreaSuggestedReaction, MediaAreaUrl, MediaAreaVenue, MediaAreaWeather, MessageActionBoostApply, MessageActionBotAllowed, MessageActionChannelCreate, MessageActionChannelMigrateFrom, MessageActionChatAddUser, MessageActionChatCreate, MessageActionChatDeletePhoto, MessageActionChatDeleteUser, MessageActionChatEditPhoto, MessageActionChatEditTitle, MessageActionChatJoinedByLink, MessageActionChatJoinedByRequest, MessageActionChatMigrateTo, MessageActionContactSignUp, MessageActionCustomAction, MessageActionEmpty, MessageActionGameScore, MessageActionGeoProximityReached, MessageActionGiftPremium, MessageActionGiftStars, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionGroupCall, MessageActionGroupCallScheduled, MessageActionHistoryClear, MessageActionInviteToGroupCall, MessageActionPaymentRefunded, MessageActionPaymentSent, MessageActionPaymentSentMe, MessageActionPhoneCall, MessageActionPinMessage, MessageActionPrizeStars, MessageActionRequestedPeer, MessageActionRequestedPeerSentMe, MessageActionScreenshotTaken, MessageActionSecureValuesSent, MessageActionSecureValuesSentMe, MessageActionSetChatTheme, MessageActionSetChatWallPaper, MessageActionSetMessagesTTL, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionSuggestProfilePhoto, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionWebViewDataSent, MessageActionWebViewDataSentMe, MessageEmpty, MessageEntityBankCard, MessageEntityBlockquote, MessageEntityBold, MessageEntityBotCommand, MessageEntityCashtag, MessageEntityCode, MessageEntityCustomEmoji, MessageEntityEmail, MessageEntityHashtag, MessageEntityItalic, MessageEntityMention, MessageEntityMentionName, MessageEntityPhone, MessageEntityPre, MessageEntitySpoiler, MessageEntityStrike, MessageEntityTextUrl, MessageEntityUnderline, MessageEntityUnknown, MessageEntityUrl, MessageExtendedMedia, MessageExtendedMediaPreview, MessageFwdHeader, MessageMediaContact, MessageMediaDice, MessageMediaDocument, MessageMediaEmpty, MessageMediaGame, MessageMediaGeo, MessageMediaGeoLive, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaInvoice, MessageMediaPaidMedia, MessageMediaPhoto, MessageMediaPoll, MessageMediaStory, MessageMediaUnsupported, MessageMediaVenue, MessageMediaWebPage, MessagePeerReaction, MessagePeerVote, MessagePeerVoteInputOption, MessagePeerVoteMultiple, MessageRange, MessageReactions, MessageReactor, MessageReplies, MessageReplyHeader, MessageReplyStoryHeader, MessageReportOption, MessageService, MessageViews, MissingInvitee, MsgDetailedInfo, MsgNewDetailedInfo, MsgResendReq, MsgsAck, MsgsAllInfo, MsgsStateInfo, MsgsStateReq, MyBoost, NearestDc, NewSessionCreated, NotificationSoundDefault, NotificationSoundLocal, NotificationSoundNone, NotificationSoundRingtone, NotifyBroadcasts, NotifyChats, NotifyForumTopic, NotifyPeer, NotifyUsers, OutboxReadDate, PQInnerData, PQInnerDataDc, PQInnerDataTemp, PQInnerDataTempDc, Page, PageBlockAnchor, PageBlockAudio, PageBlockAuthorDate, PageBlockBlockquote, PageBlockChannel, PageBlockCollage, PageBlockCover, PageBlockDetails, PageBlockDivider, PageBlockEmbed, PageBlockEmbedPost, PageBlockFooter, PageBlockHeader, PageBlockKicker, PageBlockList, PageBlockMap, PageBlockOrderedList, PageBlockParagraph, PageBlockPhoto, PageBlockPreformatted, PageBlockPullquote, PageBlockRelatedArticles, PageBlockSlideshow, PageBlockSubheader, PageBlockSubtitle, PageBlockTable, PageBlockTitle, PageBlockUnsupported, PageBlockVideo, PageCaption, PageListItemBlocks, PageListItemText, PageListOrderedItemBlocks, PageListOrderedItemText, PageRelatedArticle, PageTableCell, PageTableRow, PaidReactionPrivacyAnonymous, PaidReactionPrivacyDefault, PaidReactionPrivacyPeer, PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow, PasswordKdfAlgoUnknown, PaymentCharge, PaymentFormMethod, PaymentRequestedInfo, PaymentSavedCredentialsCard, PeerBlocked, PeerChannel, PeerChat, PeerColor, PeerLocated, PeerNotifySettings, PeerSelfLocated, PeerStories, PeerUser, PhoneCall, PhoneCallAccepted, PhoneCallDiscardReasonAllowGroupCall, PhoneCallDiscardReasonBusy, PhoneCallDiscardReasonDisconnect, PhoneCallDiscardReasonHangup, PhoneCallDiscardReasonMissed, PhoneCallDiscarded, PhoneCallEmpty, PhoneCallProtocol, PhoneCallRequested, PhoneCallWaiting, PhoneConnection, PhoneConnectionWebrtc, Photo, PhotoCachedSize, PhotoEmpty, PhotoPathSize, PhotoSize, PhotoSizeEmpty, PhotoSizeProgressive, PhotoStrippedSize, Poll, PollAnswer, PollAnswerVoters, PollResults, Pong, PopularContact, PostAddress, PostInteractionCountersMessage, PostInteractionCountersStory, PremiumGiftCodeOption, PremiumSubscriptionOption, PrepaidGiveaway, PrepaidStarsGiveaway, PrivacyKeyAbout, PrivacyKeyAddedByPhone, PrivacyKeyBirthday, PrivacyKeyChatInvite, PrivacyKeyForwards, PrivacyKeyPhoneCall, PrivacyKeyPhoneNumber, PrivacyKeyPhoneP2P, PrivacyKeyProfilePhoto, PrivacyKeyStarGiftsAutoSave, PrivacyKeyStatusTimestamp, PrivacyKeyVoiceMessages, PrivacyValueAllowAll, PrivacyValueAllowBots, PrivacyValueAllowChatParticipants, PrivacyValueAllowCloseFriends, PrivacyValueAllowContacts, PrivacyValueAllowPremium, PrivacyValueAllowUsers, PrivacyValueDisallowAll, PrivacyValueDisallowBots, PrivacyValueDisallowChatParticipants, PrivacyValueDisallowContacts, PrivacyValueDisallowUsers, PublicForwardMessage, PublicForwardStory, QuickReply, ReactionCount, ReactionCustomEmoji, ReactionEmoji, ReactionEmpty, ReactionNotificationsFromAll, ReactionNotificationsFromContacts, ReactionPaid, ReactionsNotifySettings, ReadParticipantDate, ReceivedNotifyMessage, RecentMeUrlChat, RecentMeUrlChatInvite, RecentMeUrlStickerSet, RecentMeUrlUnknown, RecentMeUrlUser, ReplyInlineMarkup, ReplyKeyboardForceReply, ReplyKeyboardHide, ReplyKeyboardMarkup, ReportResultAddComment, ReportResultChooseOption, ReportResultReported, RequestPeerTypeBroadcast, RequestPeerTypeChat, RequestPeerTypeUser, RequestedPeerChannel, RequestedPeerChat, RequestedPeerUser, ResPQ, RestrictionReason, RpcAnswerDropped, RpcAnswerDroppedRunning, RpcAnswerUnknown, RpcError, SavedDialog, SavedPhoneContact, SavedReactionTag, SearchResultPosition, SearchResultsCalendarPeriod, SecureCredentialsEncrypted, SecureData, SecureFile, SecureFileEmpty, SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000, SecurePasswordKdfAlgoSHA512, SecurePasswordKdfAlgoUnknown, SecurePlainEmail, SecurePlainPhone, SecureRequiredType, SecureRequiredTypeOneOf, SecureSecretSettings, SecureValue, SecureValueError, SecureValueErrorData, SecureValueErrorFile, SecureValueErrorFiles, SecureValueErrorFrontSide, SecureValueErrorReverseSide, SecureValueErrorSelfie, SecureValueErrorTranslationFile, SecureValueErrorTranslationFiles, SecureValueHash, SecureValueTypeAddress, SecureValueTypeBankStatement, SecureValueTypeDriverLicense, SecureValueTypeEmail, SecureValueTypeIdentityCard, SecureValueTypeInternalPassport, SecureValueTypePassport, SecureValueTypePassportRegistration, SecureValueTypePersonalDetails, SecureValueTypePhone, SecureValueTypeRentalAgreement, SecureValueTypeTemporaryRegistration, SecureValueTypeUtilityBill, SendAsPeer, SendMessageCancelAction, SendMessageChooseContactAction, SendMessageChooseStickerAction, SendMessageEmojiInteraction, SendMessageEmojiInteractionSeen, SendMessageGamePlayAction, SendMessageGeoLocationAction, SendMessageHistoryImportAction, SendMessageRecordAudioAction, SendMessageRecordRoundAction, SendMessageRecordVideoAction, SendMessageTypingAction, SendMessageUploadAudioAction, SendMessageUploadDocumentAction, SendMessageUploadPhotoAction, SendMessageUploadRoundAction, SendMessageUploadVideoAction, ServerDHInnerData, ServerDHParamsFail, ServerDHParamsOk, ShippingOption, SmsJob, SpeakingInGroupCallAction, SponsoredMessage, SponsoredMessageReportOption, StarGift, StarGiftAttributeBackdrop, StarGiftAttributeModel, StarGiftAttributeOriginalDetails, StarGiftAttributePattern, StarGiftUnique, StarRefProgram, StarsAmount, StarsGiftOption, StarsGiveawayOption, StarsGiveawayWinnersOption, StarsRevenueStatus, StarsSubscription, StarsSubscriptionPricing, StarsTopupOption, StarsTransactionPeer, StarsTransactionPeerAPI, StarsTransactionPeerAds, StarsTransactionPeerAppStore, StarsTransactionPeerFragment, StarsTransactionPeerPlayMarket, StarsTransactionPeerPremiumBot, StarsTransactionPeerUnsupported, StatsAbsValueAndPrev, StatsDateRangeDays, StatsGraph, StatsGraphAsync, StatsGraphError, StatsGroupTopAdmin, StatsGroupTopInviter, StatsGroupTopPoster, StatsPercentValue, StatsURL, StickerKeyword, StickerPack, StickerSet, StickerSetCovered, StickerSetFullCovered, StickerSetMultiCovered, StickerSetNoCovered, StoriesStealthMode, StoryFwdHeader, StoryItem, StoryItemDeleted, StoryItemSkipped, StoryReaction, StoryReactionPublicForward, StoryReactionPublicRepost, StoryView, StoryViewPublicForward, StoryViewPublicRepost, StoryViews, TextAnchor, TextBold, TextConcat, TextEmail, TextEmpty, TextFixed, TextImage, TextItalic, TextMarked, TextPhone, TextPlain, TextStrike, TextSubscript, TextSuperscript, TextUnderline, TextUrl, TextWithEntities, Theme, ThemeSettings, Timezone, TlsBlockDomain, TlsBlockGrease, TlsBlockPublicKey, TlsBlockRandom, TlsBlockScope, TlsBlockString, TlsBlockZero, TlsClientHello, TopPeer, TopPeerCategoryBotsApp, TopPeerCategoryBotsInline, TopPeerCategoryBotsPM, TopPeerCategoryChannels, TopPeerCategoryCorrespondents, TopPeerCategoryForwardChats, TopPeerCategoryForwardUsers, TopPeerCategoryGroups, TopPeerCategoryPeers, TopPeerCategoryPhoneCalls, UpdateAttachMenuBots, UpdateAutoSaveSettings, UpdateBotBusinessConnect, UpdateBotCallbackQuery, UpdateBotChatBoost, UpdateBotChatInviteRequester, UpdateBotCommands, UpdateBotDeleteBusinessMessage, UpdateBotEditBusinessMessage, UpdateBotInlineQuery, UpdateBotInlineSend, UpdateBotMenuButton, UpdateBotMessageReaction, UpdateBotMessageReactions, UpdateBotNewBusinessMessage, UpdateBotPrecheckoutQuery, UpdateBotPurchasedPaidMedia, UpdateBotShippingQuery, UpdateBotStopped, UpdateBotWebhookJSON, UpdateBotWebhookJSONQuery, UpdateBroadcastRevenueTransactions, UpdateBusinessBotCallbackQuery, UpdateChannel, UpdateChannelAvailableMessages, UpdateChannelMessageForwards, UpdateChannelMessageViews, UpdateChannelParticipant, UpdateChannelPinnedTopic, UpdateChannelPinnedTopics, UpdateChannelReadMessagesContents, UpdateChannelTooLong, UpdateChannelUserTyping, UpdateChannelViewForumAsMessages, UpdateChannelWebPage, UpdateChat, UpdateChatDefaultBannedRights, UpdateChatParticipant, UpdateChatParticipantAdd, UpdateChatParticipantAdmin, UpdateChatParticipantDelete, UpdateChatParticipants, UpdateChatUserTyping, UpdateConfig, UpdateContactsReset, UpdateDcOptions, UpdateDeleteChannelMessages, UpdateDeleteMessages, UpdateDeleteQuickReply, UpdateDeleteQuickReplyMessages, UpdateDeleteScheduledMessages, UpdateDialogFilter, UpdateDialogFilterOrder, UpdateDialogFilters, UpdateDialogPinned, UpdateDialogUnreadMark, UpdateDraftMessage, UpdateEditChannelMessage, UpdateEditMessage, UpdateEncryptedChatTyping, UpdateEncryptedMessagesRead, UpdateEncryption, UpdateFavedStickers, UpdateFolderPeers, UpdateGeoLiveViewed, UpdateGroupCall, UpdateGroupCallConnection, UpdateGroupCallParticipants, UpdateInlineBotCallbackQuery, UpdateLangPack, UpdateLangPackTooLong, UpdateLoginToken, UpdateMessageExtendedMedia, UpdateMessageID, UpdateMessagePoll, UpdateMessagePollVote, UpdateMessageReactions, UpdateMoveStickerSetToTop, UpdateNewAuthorization, UpdateNewChannelMessage, UpdateNewEncryptedMessage, UpdateNewMessage, UpdateNewQuickReply, UpdateNewScheduledMessage, UpdateNewStickerSet, UpdateNewStoryReaction, UpdateNotifySettings, UpdatePaidReactionPrivacy, UpdatePeerBlocked, UpdatePeerHistoryTTL, UpdatePeerLocated, UpdatePeerSettings, UpdatePeerWallpaper, UpdatePendingJoinRequests, UpdatePhoneCall, UpdatePhoneCallSignalingData, UpdatePinnedChannelMessages, UpdatePinnedDialogs, UpdatePinnedMessages, UpdatePinnedSavedDialogs, UpdatePrivacy, UpdatePtsChanged, UpdateQuickReplies, UpdateQuickReplyMessage, UpdateReadChannelDiscussionInbox, UpdateReadChannelDiscussionOutbox, UpdateReadChannelInbox, UpdateReadChannelOutbox, UpdateReadFeaturedEmojiStickers, UpdateReadFeaturedStickers, UpdateReadHistoryInbox, UpdateReadHistoryOutbox, UpdateReadMessagesContents, UpdateReadStories, UpdateRecentEmojiStatuses, UpdateRecentReactions, UpdateRecentStickers, UpdateSavedDialogPinned, UpdateSavedGifs, UpdateSavedReactionTags, UpdateSavedRingtones, UpdateSentStoryReaction, UpdateServiceNotification, UpdateShort, UpdateShortChatMessage, UpdateShortMessage, UpdateShortSentMessage, UpdateSmsJob, UpdateStarsBalance, UpdateStarsRevenueStatus, UpdateStickerSets, UpdateStickerSetsOrder, UpdateStoriesStealthMode, UpdateStory, UpdateStoryID, UpdateTheme, UpdateTranscribedAudio, UpdateUser, UpdateUserEmojiStatus, UpdateUserName, UpdateUserPhone, UpdateUserStatus, UpdateUserTyping, UpdateWebPage, UpdateWebViewResultSent, Updates, UpdatesCombined, UpdatesTooLong, UrlAuthResultAccepted, UrlAuthResultDefault, UrlAuthResultRequest, UserEmpty, UserProfilePhoto, UserProfilePhotoEmpty, UserStatusEmpty, UserStatusLastMonth, UserStatusLastWeek, UserStatusOffline, UserStatusOnline, UserStatusRecently, Username, VideoSize, VideoSizeEmojiMarkup, VideoSizeStickerMarkup, WallPaper, WallPaperNoFile, WallPaperSettings, WebAuthorization, WebDocument, WebDocumentNoProxy, WebPage, WebPageAttributeStickerSet, WebPageAttributeStory, WebPageAttributeTheme, WebPageAttributeUniqueStarGift, WebPageEmpty, WebPageNotModified, WebPagePending, WebViewMessageSent, WebViewResultUrl
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import Typefuture_salt
+
+
+
+class Channel(TLObject):
+    CONSTRUCTOR_ID = 0xe00998b7
+    SUBCLASS_OF_ID = 0xc5af5d94
+
+    __slots__ = ('id', 'title', 'photo', 'date', 'creator', 'left', 'broadcast', 'verified', 'megagroup', 'restricted', 'signatures', 'min', 'scam', 'has_link', 'has_geo', 'slowmode_enabled', 'call_active', 'call_not_empty', 'fake', 'gigagroup', 'noforwards', 'join_to_send', 'join_request', 'forum', 'stories_hidden', 'stories_hidden_min', 'stories_unavailable', 'signature_profiles', 'access_hash', 'username', 'restriction_reason', 'admin_rights', 'banned_rights', 'default_banned_rights', 'participants_count', 'usernames', 'stories_max_id', 'color', 'profile_color', 'emoji_status', 'level', 'subscription_until_date', 'bot_verification_icon')
+
+    def __init__(self, id: int, title: str, photo: 'TypeChatPhoto', date: Optional[datetime], creator: Optional[bool]=None, left: Optional[bool]=None, broadcast: Optional[bool]=None, verified: Optional[bool]=None, megagroup: Optional[bool]=None, restricted: Optional[bool]=None, signatures: Optional[bool]=None, min: Optional[bool]=None, scam: Optional[bool]=None, has_link: Optional[bool]=None, has_geo: Optional[bool]=None, slowmode_enabled: Optional[bool]=None, call_active: Optional[bool]=None, call_not_empty: Optional[bool]=None, fake: Optional[bool]=None, gigagroup: Optional[bool]=None, noforwards: Optional[bool]=None, join_to_send: Optional[bool]=None, join_request: Optional[bool]=None, forum: Optional[bool]=None, stories_hidden: Optional[bool]=None, stories_hidden_min: Optional[bool]=None, stories_unavailable: Optional[bool]=None, signature_profiles: Optional[bool]=None, access_hash: Optional[int]=None, username: Optional[str]=None, restriction_reason: Optional[List['TypeRestrictionReason']]=None, admin_rights: Optional['TypeChatAdminRights']=None, banned_rights: Optional['TypeChatBannedRights']=None, default_banned_rights: Optional['TypeChatBannedRights']=None, participants_count: Optional[int]=None, usernames: Optional[List['TypeUsername']]=None, stories_max_id: Optional[int]=None, color: Optional['TypePeerColor']=None, profile_color: Optional['TypePeerColor']=None, emoji_status: Optional['TypeEmojiStatus']=None, level: Optional[int]=None, subscription_until_date: Optional[datetime]=None, bot_verification_icon: Optional[int]=None):
+        """
+        Constructor for Chat: Instance of either ChatEmpty, Chat, ChatForbidden, Channel, ChannelForbidden.
+        """
+        self.id = id
+        self.title = title
+        self.photo = photo
+        self.date = date
+        self.creator = creator
+        self.left = left
+        self.broadcast = broadcast
+        self.verified = verified
+        self.megagroup = megagroup
+        self.restricted = restricted
+        self.signatures = signatures
+        self.min = min
+        self.scam = scam
+        self.has_link = has_link
+        self.has_geo = has_geo
+        self.slowmode_enabled = slowmode_enabled
+        self.call_active = call_active
+        self.call_not_empty = call_not_empty
+        self.fake = fake
+        self.gigagroup = gigagroup
+        self.noforwards = noforwards
+        self.join_to_send = join_to_send
+        self.join_request = join_request
+        self.forum = forum
+        self.stories_hidden = stories_hidden
+        self.stories_hidden_min = stories_hidden_min
+        self.stories_unavailable = stories_unavailable
+        self.signature_profiles = signature_profiles
+        self.access_hash = access_hash
+        self.username = username
+        self.restriction_reason = restriction_reason
+        self.admin_rights = admin_rights
+        self.banned_rights = banned_rights
+        self.default_banned_rights = default_banned_rights
+        self.participants_count = participants_count
+        self.usernames = usernames
+        self.stories_max_id = stories_max_id
+        self.color = color
+        self.profile_color = profile_color
+        self.emoji_status = emoji_status
+        self.level = level
+        self.subscription_until_date = subscription_until_date
+        self.bot_verification_icon = bot_verification_icon
+
+    def to_dict(self):
+        return {
+            '_': 'Channel',
+            'id': self.id,
+            'title': self.title,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'date': self.date,
+            'creator': self.creator,
+            'left': self.left,
+            'broadcast': self.broadcast,
+            'verified': self.verified,
+            'megagroup': self.megagroup,
+            'restricted': self.restricted,
+            'signatures': self.signatures,
+            'min': self.min,
+            'scam': self.scam,
+            'has_link': self.has_link,
+            'has_geo': self.has_geo,
+            'slowmode_enabled': self.slowmode_enabled,
+            'call_active': self.call_active,
+            'call_not_empty': self.call_not_empty,
+            'fake': self.fake,
+            'gigagroup': self.gigagroup,
+            'noforwards': self.noforwards,
+            'join_to_send': self.join_to_send,
+            'join_request': self.join_request,
+            'forum': self.forum,
+            'stories_hidden': self.stories_hidden,
+            'stories_hidden_min': self.stories_hidden_min,
+            'stories_unavailable': self.stories_unavailable,
+            'signature_profiles': self.signature_profiles,
+            'access_hash': self.access_hash,
+            'username': self.username,
+            'restriction_reason': [] if self.restriction_reason is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.restriction_reason],
+            'admin_rights': self.admin_rights.to_dict() if isinstance(self.admin_rights, TLObject) else self.admin_rights,
+            'banned_rights': self.banned_rights.to_dict() if isinstance(self.banned_rights, TLObject) else self.banned_rights,
+            'default_banned_rights': self.default_banned_rights.to_dict() if isinstance(self.default_banned_rights, TLObject) else self.default_banned_rights,
+            'participants_count': self.participants_count,
+            'usernames': [] if self.usernames is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.usernames],
+            'stories_max_id': self.stories_max_id,
+            'color': self.color.to_dict() if isinstance(self.color, TLObject) else self.color,
+            'profile_color': self.profile_color.to_dict() if isinstance(self.profile_color, TLObject) else self.profile_color,
+            'emoji_status': self.emoji_status.to_dict() if isinstance(self.emoji_status, TLObject) else self.emoji_status,
+            'level': self.level,
+            'subscription_until_date': self.subscription_until_date,
+            'bot_verification_icon': self.bot_verification_icon
+        }
+
+    def _bytes(self):
+        assert ((self.restricted or self.restricted is not None) and (self.restriction_reason or self.restriction_reason is not None)) or ((self.restricted is None or self.restricted is False) and (self.restriction_reason is None or self.restriction_reason is False)), 'restricted, restriction_reason parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xb7\x98\t\xe0',
+            struct.pack('<I', (0 if self.creator is None or self.creator is False else 1) | (0 if self.left is None or self.left is False else 4) | (0 if self.broadcast is None or self.broadcast is False else 32) | (0 if self.verified is None or self.verified is False else 128) | (0 if self.megagroup is None or self.megagroup is False else 256) | (0 if self.restricted is None or self.restricted is False else 512) | (0 if self.signatures is None or self.signatures is False else 2048) | (0 if self.min is None or self.min is False else 4096) | (0 if self.scam is None or self.scam is False else 524288) | (0 if self.has_link is None or self.has_link is False else 1048576) | (0 if self.has_geo is None or self.has_geo is False else 2097152) | (0 if self.slowmode_enabled is None or self.slowmode_enabled is False else 4194304) | (0 if self.call_active is None or self.call_active is False else 8388608) | (0 if self.call_not_empty is None or self.call_not_empty is False else 16777216) | (0 if self.fake is None or self.fake is False else 33554432) | (0 if self.gigagroup is None or self.gigagroup is False else 67108864) | (0 if self.noforwards is None or self.noforwards is False else 134217728) | (0 if self.join_to_send is None or self.join_to_send is False else 268435456) | (0 if self.join_request is None or self.join_request is False else 536870912) | (0 if self.forum is None or self.forum is False else 1073741824) | (0 if self.access_hash is None or self.access_hash is False else 8192) | (0 if self.username is None or self.username is False else 64) | (0 if self.restriction_reason is None or self.restriction_reason is False else 512) | (0 if self.admin_rights is None or self.admin_rights is False else 16384) | (0 if self.banned_rights is None or self.banned_rights is False else 32768) | (0 if self.default_banned_rights is None or self.default_banned_rights is False else 262144) | (0 if self.participants_count is None or self.participants_count is False else 131072)),
+            struct.pack('<I', (0 if self.stories_hidden is None or self.stories_hidden is False else 2) | (0 if self.stories_hidden_min is None or self.stories_hidden_min is False else 4) | (0 if self.stories_unavailable is None or self.stories_unavailable is False else 8) | (0 if self.signature_profiles is None or self.signature_profiles is False else 4096) | (0 if self.usernames is None or self.usernames is False else 1) | (0 if self.stories_max_id is None or self.stories_max_id is False else 16) | (0 if self.color is None or self.color is False else 128) | (0 if self.profile_color is None or self.profile_color is False else 256) | (0 if self.emoji_status is None or self.emoji_status is False else 512) | (0 if self.level is None or self.level is False else 1024) | (0 if self.subscription_until_date is None or self.subscription_until_date is False else 2048) | (0 if self.bot_verification_icon is None or self.bot_verification_icon is False else 8192)),
+            struct.pack('<q', self.id),
+            b'' if self.access_hash is None or self.access_hash is False else (struct.pack('<q', self.access_hash)),
+            self.serialize_bytes(self.title),
+            b'' if self.username is None or self.username is False else (self.serialize_bytes(self.username)),
+            self.photo._bytes(),
+            self.serialize_datetime(self.date),
+            b'' if self.restriction_reason is None or self.restriction_reason is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.restriction_reason)),b''.join(x._bytes() for x in self.restriction_reason))),
+            b'' if self.admin_rights is None or self.admin_rights is False else (self.admin_rights._bytes()),
+            b'' if self.banned_rights is None or self.banned_rights is False else (self.banned_rights._bytes()),
+            b'' if self.default_banned_rights is None or self.default_banned_rights is False else (self.default_banned_rights._bytes()),
+            b'' if self.participants_count is None or self.participants_count is False else (struct.pack('<i', self.participants_count)),
+            b'' if self.usernames is None or self.usernames is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.usernames)),b''.join(x._bytes() for x in self.usernames))),
+            b'' if self.stories_max_id is None or self.stories_max_id is False else (struct.pack('<i', self.stories_max_id)),
+            b'' if self.color is None or self.color is False else (self.color._bytes()),
+            b'' if self.profile_color is None or self.profile_color is False else (self.profile_color._bytes()),
+            b'' if self.emoji_status is None or self.emoji_status is False else (self.emoji_status._bytes()),
+            b'' if self.level is None or self.level is False else (struct.pack('<i', self.level)),
+            b'' if self.subscription_until_date is None or self.subscription_until_date is False else (self.serialize_datetime(self.subscription_until_date)),
+            b'' if self.bot_verification_icon is None or self.bot_verification_icon is False else (struct.pack('<q', self.bot_verification_icon)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _creator = bool(flags & 1)
+        _left = bool(flags & 4)
+        _broadcast = bool(flags & 32)
+        _verified = bool(flags & 128)
+        _megagroup = bool(flags & 256)
+        _restricted = bool(flags & 512)
+        _signatures = bool(flags & 2048)
+        _min = bool(flags & 4096)
+        _scam = bool(flags & 524288)
+        _has_link = bool(flags & 1048576)
+        _has_geo = bool(flags & 2097152)
+        _slowmode_enabled = bool(flags & 4194304)
+        _call_active = bool(flags & 8388608)
+        _call_not_empty = bool(flags & 16777216)
+        _fake = bool(flags & 33554432)
+        _gigagroup = bool(flags & 67108864)
+        _noforwards = bool(flags & 134217728)
+        _join_to_send = bool(flags & 268435456)
+        _join_request = bool(flags & 536870912)
+        _forum = bool(flags & 1073741824)
+        flags2 = reader.read_int()
+
+        _stories_hidden = bool(flags2 & 2)
+        _stories_hidden_min = bool(flags2 & 4)
+        _stories_unavailable = bool(flags2 & 8)
+        _signature_profiles = bool(flags2 & 4096)
+        _id = reader.read_long()
+        if flags & 8192:
+            _access_hash = reader.read_long()
+        else:
+            _access_hash = None
+        _title = reader.tgread_string()
+        if flags & 64:
+            _username = reader.tgread_string()
+        else:
+            _username = None
+        _photo = reader.tgread_object()
+        _date = reader.tgread_date()
+        if flags & 512:
+            reader.read_int()
+            _restriction_reason = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _restriction_reason.append(_x)
+
+        else:
+            _restriction_reason = None
+        if flags & 16384:
+            _admin_rights = reader.tgread_object()
+        else:
+            _admin_rights = None
+        if flags & 32768:
+            _banned_rights = reader.tgread_object()
+        else:
+            _banned_rights = None
+        if flags & 262144:
+            _default_banned_rights = reader.tgread_object()
+        else:
+            _default_banned_rights = None
+        if flags & 131072:
+            _participants_count = reader.read_int()
+        else:
+            _participants_count = None
+        if flags2 & 1:
+            reader.read_int()
+            _usernames = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _usernames.append(_x)
+
+        else:
+            _usernames = None
+        if flags2 & 16:
+            _stories_max_id = reader.read_int()
+        else:
+            _stories_max_id = None
+        if flags2 & 128:
+            _color = reader.tgread_object()
+        else:
+            _color = None
+        if flags2 & 256:
+            _profile_color = reader.tgread_object()
+        else:
+            _profile_color = None
+        if flags2 & 512:
+            _emoji_status = reader.tgread_object()
+        else:
+            _emoji_status = None
+        if flags2 & 1024:
+            _level = reader.read_int()
+        else:
+            _level = None
+        if flags2 & 2048:
+            _subscription_until_date = reader.tgread_date()
+        else:
+            _subscription_until_date = None
+        if flags2 & 8192:
+            _bot_verification_icon = reader.read_long()
+        else:
+            _bot_verification_icon = None
+        return cls(id=_id, title=_title, photo=_photo, date=_date, creator=_creator, left=_left, broadcast=_broadcast, verified=_verified, megagroup=_megagroup, restricted=_restricted, signatures=_signatures, min=_min, scam=_scam, has_link=_has_link, has_geo=_has_geo, slowmode_enabled=_slowmode_enabled, call_active=_call_active, call_not_empty=_call_not_empty, fake=_fake, gigagroup=_gigagroup, noforwards=_noforwards, join_to_send=_join_to_send, join_request=_join_request, forum=_forum, stories_hidden=_stories_hidden, stories_hidden_min=_stories_hidden_min, stories_unavailable=_stories_unavailable, signature_profiles=_signature_profiles, access_hash=_access_hash, username=_username, restriction_reason=_restriction_reason, admin_rights=_admin_rights, banned_rights=_banned_rights, default_banned_rights=_default_banned_rights, participants_count=_participants_count, usernames=_usernames, stories_max_id=_stories_max_id, color=_color, profile_color=_profile_color, emoji_status=_emoji_status, level=_level, subscription_until_date=_subscription_until_date, bot_verification_icon=_bot_verification_icon)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        flags2 = reader.read_int()
+        reader.seek(8)
+        if flags & 8192:
+            reader.seek(8)
+        TLObject.skip_bytes(reader)
+        if flags & 64:
+            TLObject.skip_bytes(reader)
+        reader.tgskip_object()
+        reader.seek(4)
+        if flags & 512:
+            reader.seek(4)
+            for _ in range(reader.read_int()):
+                reader.tgskip_object()
+        if flags & 16384:
+            reader.tgskip_object()
+        if flags & 32768:
+            reader.tgskip_object()
+        if flags & 262144:
+            reader.tgskip_object()
+        if flags & 131072:
+            reader.seek(4)
+        if flags2 & 1:
+            reader.seek(4)
+            for _ in range(reader.read_int()):
+                reader.tgskip_object()
+        if flags2 & 16:
+            reader.seek(4)
+        if flags2 & 128:
+            reader.tgskip_object()
+        if flags2 & 256:
+            reader.tgskip_object()
+        if flags2 & 512:
+            reader.tgskip_object()
+        if flags2 & 1024:
+            reader.seek(4)
+        if flags2 & 2048:
+            reader.seek(4)
+        if flags2 & 8192:
+            reader.seek(8)
+
+
+class ChannelFull(TLObject):
+    CONSTRUCTOR_ID = 0x52d6806b
+    SUBCLASS_OF_ID = 0xd49a2697
+
+    __slots__ = ('id', 'about', 'read_inbox_max_id', 'read_outbox_max_id', 'unread_count', 'chat_photo', 'notify_settings', 'bot_info', 'pts', 'can_view_participants', 'can_set_username', 'can_set_stickers', 'hidden_prehistory', 'can_set_location', 'has_scheduled', 'can_view_stats', 'blocked', 'can_delete_channel', 'antispam', 'participants_hidden', 'translations_disabled', 'stories_pinned_available', 'view_forum_as_messages', 'restricted_sponsored', 'can_view_revenue', 'paid_media_allowed', 'can_view_stars_revenue', 'paid_reactions_available', 'stargifts_available', 'participants_count', 'admins_count', 'kicked_count', 'banned_count', 'online_count', 'exported_invite', 'migrated_from_chat_id', 'migrated_from_max_id', 'pinned_msg_id', 'stickerset', 'available_min_id', 'folder_id', 'linked_chat_id', 'location', 'slowmode_seconds', 'slowmode_next_send_date', 'stats_dc', 'call', 'ttl_period', 'pending_suggestions', 'groupcall_default_join_as', 'theme_emoticon', 'requests_pending', 'recent_requesters', 'default_send_as', 'available_reactions', 'reactions_limit', 'stories', 'wallpaper', 'boosts_applied', 'boosts_unrestrict', 'emojiset', 'bot_verification', 'stargifts_count')
+
+    def __init__(self, id: int, about: str, read_inbox_max_id: int, read_outbox_max_id: int, unread_count: int, chat_photo: 'TypePhoto', notify_settings: 'TypePeerNotifySettings', bot_info: List['TypeBotInfo'], pts: int, can_view_participants: Optional[bool]=None, can_set_username: Optional[bool]=None, can_set_stickers: Optional[bool]=None, hidden_prehistory: Optional[bool]=None, can_set_location: Optional[bool]=None, has_scheduled: Optional[bool]=None, can_view_stats: Optional[bool]=None, blocked: Optional[bool]=None, can_delete_channel: Optional[bool]=None, antispam: Optional[bool]=None, participants_hidden: Optional[bool]=None, translations_disabled: Optional[bool]=None, stories_pinned_available: Optional[bool]=None, view_forum_as_messages: Optional[bool]=None, restricted_sponsored: Optional[bool]=None, can_view_revenue: Optional[bool]=None, paid_media_allowed: Optional[bool]=None, can_view_stars_revenue: Optional[bool]=None, paid_reactions_available: Optional[bool]=None, stargifts_available: Optional[bool]=None, participants_count: Optional[int]=None, admins_count: Optional[int]=None, kicked_count: Optional[int]=None, banned_count: Optional[int]=None, online_count: Optional[int]=None, exported_invite: Optional['TypeExportedChatInvite']=None, migrated_from_chat_id: Optional[int]=None, migrated_from_max_id: Optional[int]=None, pinned_msg_id: Optional[int]=None, stickerset: Optional['TypeStickerSet']=None, available_min_id: Optional[int]=None, folder_id: Optional[int]=None, linked_chat_id: Optional[int]=None, location: Optional['TypeChannelLocation']=None, slowmode_seconds: Optional[int]=None, slowmode_next_send_date: Optional[datetime]=None, stats_dc: Optional[int]=None, call: Optional['TypeInputGroupCall']=None, ttl_period: Optional[int]=None, pending_suggestions: Optional[List[str]]=None, groupcall_default_join_as: Optional['TypePeer']=None, theme_emoticon: Optional[str]=None, requests_pending: Optional[int]=None, recent_requesters: Optional[List[int]]=None, default_send_as: Optional['TypePeer']=None, available_reactions: Optional['TypeChatReactions']=None, reactions_limit: Optional[int]=None, stories: Optional['TypePeerStories']=None, wallpaper: Optional['TypeWallPaper']=None, boosts_applied: Optional[int]=None, boosts_unrestrict: Optional[int]=None, emojiset: Optional['TypeStickerSet']=None, bot_verification: Optional['TypeBotVerification']=None, stargifts_count: Optional[int]=None):
+        """
+        Constructor for ChatFull: Instance of either ChatFull, ChannelFull.
+        """
+        self.id = id
+        self.about = about
+        self.read_inbox_max_id = read_inbox_max_id
+        self.read_outbox_max_id = read_outbox_max_id
+        self.unread_count = unread_count
+        self.chat_photo = chat_photo
+        self.notify_settings = notify_settings
+        self.bot_info = bot_info
+        self.pts = pts
+        self.can_view_participants = can_view_participants
+        self.can_set_username = can_set_username
+        self.can_set_stickers = can_set_stickers
+        self.hidden_prehistory = hidden_prehistory
+        self.can_set_location = can_set_location
+        self.has_scheduled = has_scheduled
+        self.can_view_stats = can_view_stats
+        self.blocked = blocked
+        self.can_delete_channel = can_delete_channel
+        self.antispam = antispam
+        self.participants_hidden = participants_hidden
+        self.translations_disabled = translations_disabled
+        self.stories_pinned_available = stories_pinned_available
+        self.view_forum_as_messages = view_forum_as_messages
+        self.restricted_sponsored = restricted_sponsored
+        self.can_view_revenue = can_view_revenue
+        self.paid_media_allowed = paid_media_allowed
+        self.can_view_stars_revenue = can_view_stars_revenue
+        self.paid_reactions_available = paid_reactions_available
+        self.stargifts_available = stargifts_available
+        self.participants_count = participants_count
+        self.admins_count = admins_count
+        self.kicked_count = kicked_count
+        self.banned_count = banned_count
+        self.online_count = online_count
+        self.exported_invite = exported_invite
+        self.migrated_from_chat_id = migrated_from_chat_id
+        self.migrated_from_max_id = migrated_from_max_id
+        self.pinned_msg_id = pinned_msg_id
+        self.stickerset = stickerset
+        self.available_min_id = available_min_id
+        self.folder_id = folder_id
+        self.linked_chat_id = linked_chat_id
+        self.location = location
+        self.slowmode_seconds = slowmode_seconds
+        self.slowmode_next_send_date = slowmode_next_send_date
+        self.stats_dc = stats_dc
+        self.call = call
+        self.ttl_period = ttl_period
+        self.pending_suggestions = pending_suggestions
+        self.groupcall_default_join_as = groupcall_default_join_as
+        self.theme_emoticon = theme_emoticon
+        self.requests_pending = requests_pending
+        self.recent_requesters = recent_requesters
+        self.default_send_as = default_send_as
+        self.available_reactions = available_reactions
+        self.reactions_limit = reactions_limit
+        self.stories = stories
+        self.wallpaper = wallpaper
+        self.boosts_applied = boosts_applied
+        self.boosts_unrestrict = boosts_unrestrict
+        self.emojiset = emojiset
+        self.bot_verification = bot_verification
+        self.stargifts_count = stargifts_count
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelFull',
+            'id': self.id,
+            'about': self.about,
+            'read_inbox_max_id': self.read_inbox_max_id,
+            'read_outbox_max_id': self.read_outbox_max_id,
+            'unread_count': self.unread_count,
+            'chat_photo': self.chat_photo.to_dict() if isinstance(self.chat_photo, TLObject) else self.chat_photo,
+            'notify_settings': self.notify_settings.to_dict() if isinstance(self.notify_settings, TLObject) else self.notify_settings,
+            'bot_info': [] if self.bot_info is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.bot_info],
+            'pts': self.pts,
+            'can_view_participants': self.can_view_participants,
+            'can_set_username': self.can_set_username,
+            'can_set_stickers': self.can_set_stickers,
+            'hidden_prehistory': self.hidden_prehistory,
+            'can_set_location': self.can_set_location,
+            'has_scheduled': self.has_scheduled,
+            'can_view_stats': self.can_view_stats,
+            'blocked': self.blocked,
+            'can_delete_channel': self.can_delete_channel,
+            'antispam': self.antispam,
+            'participants_hidden': self.participants_hidden,
+            'translations_disabled': self.translations_disabled,
+            'stories_pinned_available': self.stories_pinned_available,
+            'view_forum_as_messages': self.view_forum_as_messages,
+            'restricted_sponsored': self.restricted_sponsored,
+            'can_view_revenue': self.can_view_revenue,
+            'paid_media_allowed': self.paid_media_allowed,
+            'can_view_stars_revenue': self.can_view_stars_revenue,
+            'paid_reactions_available': self.paid_reactions_available,
+            'stargifts_available': self.stargifts_available,
+            'participants_count': self.participants_count,
+            'admins_count': self.admins_count,
+            'kicked_count': self.kicked_count,
+            'banned_count': self.banned_count,
+            'online_count': self.online_count,
+            'exported_invite': self.exported_invite.to_dict() if isinstance(self.exported_invite, TLObject) else self.exported_invite,
+            'migrated_from_chat_id': self.migrated_from_chat_id,
+            'migrated_from_max_id': self.migrated_from_max_id,
+            'pinned_msg_id': self.pinned_msg_id,
+            'stickerset': self.stickerset.to_dict() if isinstance(self.stickerset, TLObject) else self.stickerset,
+            'available_min_id': self.available_min_id,
+            'folder_id': self.folder_id,
+            'linked_chat_id': self.linked_chat_id,
+            'location': self.location.to_dict() if isinstance(self.location, TLObject) else self.location,
+            'slowmode_seconds': self.slowmode_seconds,
+            'slowmode_next_send_date': self.slowmode_next_send_date,
+            'stats_dc': self.stats_dc,
+            'call': self.call.to_dict() if isinstance(self.call, TLObject) else self.call,
+            'ttl_period': self.ttl_period,
+            'pending_suggestions': [] if self.pending_suggestions is None else self.pending_suggestions[:],
+            'groupcall_default_join_as': self.groupcall_default_join_as.to_dict() if isinstance(self.groupcall_default_join_as, TLObject) else self.groupcall_default_join_as,
+            'theme_emoticon': self.theme_emoticon,
+            'requests_pending': self.requests_pending,
+            'recent_requesters': [] if self.recent_requesters is None else self.recent_requesters[:],
+            'default_send_as': self.default_send_as.to_dict() if isinstance(self.default_send_as, TLObject) else self.default_send_as,
+            'available_reactions': self.available_reactions.to_dict() if isinstance(self.available_reactions, TLObject) else self.available_reactions,
+            'reactions_limit': self.reactions_limit,
+            'stories': self.stories.to_dict() if isinstance(self.stories, TLObject) else self.stories,
+            'wallpaper': self.wallpaper.to_dict() if isinstance(self.wallpaper, TLObject) else self.wallpaper,
+            'boosts_applied': self.boosts_applied,
+            'boosts_unrestrict': self.boosts_unrestrict,
+            'emojiset': self.emojiset.to_dict() if isinstance(self.emojiset, TLObject) else self.emojiset,
+            'bot_verification': self.bot_verification.to_dict() if isinstance(self.bot_verification, TLObject) else self.bot_verification,
+            'stargifts_count': self.stargifts_count
+        }
+
+    def _bytes(self):
+        assert ((self.kicked_count or self.kicked_count is not None) and (self.banned_count or self.banned_count is not None)) or ((self.kicked_count is None or self.kicked_count is False) and (self.banned_count is None or self.banned_count is False)), 'kicked_count, banned_count parameters must all be False-y (like None) or all me True-y'
+        assert ((self.migrated_from_chat_id or self.migrated_from_chat_id is not None) and (self.migrated_from_max_id or self.migrated_from_max_id is not None)) or ((self.migrated_from_chat_id is None or self.migrated_from_chat_id is False) and (self.migrated_from_max_id is None or self.migrated_from_max_id is False)), 'migrated_from_chat_id, migrated_from_max_id parameters must all be False-y (like None) or all me True-y'
+        assert ((self.requests_pending or self.requests_pending is not None) and (self.recent_requesters or self.recent_requesters is not None)) or ((self.requests_pending is None or self.requests_pending is False) and (self.recent_requesters is None or self.recent_requesters is False)), 'requests_pending, recent_requesters parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'k\x80\xd6R',
+            struct.pack('<I', (0 if self.can_view_participants is None or self.can_view_participants is False else 8) | (0 if self.can_set_username is None or self.can_set_username is False else 64) | (0 if self.can_set_stickers is None or self.can_set_stickers is False else 128) | (0 if self.hidden_prehistory is None or self.hidden_prehistory is False else 1024) | (0 if self.can_set_location is None or self.can_set_location is False else 65536) | (0 if self.has_scheduled is None or self.has_scheduled is False else 524288) | (0 if self.can_view_stats is None or self.can_view_stats is False else 1048576) | (0 if self.blocked is None or self.blocked is False else 4194304) | (0 if self.participants_count is None or self.participants_count is False else 1) | (0 if self.admins_count is None or self.admins_count is False else 2) | (0 if self.kicked_count is None or self.kicked_count is False else 4) | (0 if self.banned_count is None or self.banned_count is False else 4) | (0 if self.online_count is None or self.online_count is False else 8192) | (0 if self.exported_invite is None or self.exported_invite is False else 8388608) | (0 if self.migrated_from_chat_id is None or self.migrated_from_chat_id is False else 16) | (0 if self.migrated_from_max_id is None or self.migrated_from_max_id is False else 16) | (0 if self.pinned_msg_id is None or self.pinned_msg_id is False else 32) | (0 if self.stickerset is None or self.stickerset is False else 256) | (0 if self.available_min_id is None or self.available_min_id is False else 512) | (0 if self.folder_id is None or self.folder_id is False else 2048) | (0 if self.linked_chat_id is None or self.linked_chat_id is False else 16384) | (0 if self.location is None or self.location is False else 32768) | (0 if self.slowmode_seconds is None or self.slowmode_seconds is False else 131072) | (0 if self.slowmode_next_send_date is None or self.slowmode_next_send_date is False else 262144) | (0 if self.stats_dc is None or self.stats_dc is False else 4096) | (0 if self.call is None or self.call is False else 2097152) | (0 if self.ttl_period is None or self.ttl_period is False else 16777216) | (0 if self.pending_suggestions is None or self.pending_suggestions is False else 33554432) | (0 if self.groupcall_default_join_as is None or self.groupcall_default_join_as is False else 67108864) | (0 if self.theme_emoticon is None or self.theme_emoticon is False else 134217728) | (0 if self.requests_pending is None or self.requests_pending is False else 268435456) | (0 if self.recent_requesters is None or self.recent_requesters is False else 268435456) | (0 if self.default_send_as is None or self.default_send_as is False else 536870912) | (0 if self.available_reactions is None or self.available_reactions is False else 1073741824)),
+            struct.pack('<I', (0 if self.can_delete_channel is None or self.can_delete_channel is False else 1) | (0 if self.antispam is None or self.antispam is False else 2) | (0 if self.participants_hidden is None or self.participants_hidden is False else 4) | (0 if self.translations_disabled is None or self.translations_disabled is False else 8) | (0 if self.stories_pinned_available is None or self.stories_pinned_available is False else 32) | (0 if self.view_forum_as_messages is None or self.view_forum_as_messages is False else 64) | (0 if self.restricted_sponsored is None or self.restricted_sponsored is False else 2048) | (0 if self.can_view_revenue is None or self.can_view_revenue is False else 4096) | (0 if self.paid_media_allowed is None or self.paid_media_allowed is False else 16384) | (0 if self.can_view_stars_revenue is None or self.can_view_stars_revenue is False else 32768) | (0 if self.paid_reactions_available is None or self.paid_reactions_available is False else 65536) | (0 if self.stargifts_available is None or self.stargifts_available is False else 524288) | (0 if self.reactions_limit is None or self.reactions_limit is False else 8192) | (0 if self.stories is None or self.stories is False else 16) | (0 if self.wallpaper is None or self.wallpaper is False else 128) | (0 if self.boosts_applied is None or self.boosts_applied is False else 256) | (0 if self.boosts_unrestrict is None or self.boosts_unrestrict is False else 512) | (0 if self.emojiset is None or self.emojiset is False else 1024) | (0 if self.bot_verification is None or self.bot_verification is False else 131072) | (0 if self.stargifts_count is None or self.stargifts_count is False else 262144)),
+            struct.pack('<q', self.id),
+            self.serialize_bytes(self.about),
+            b'' if self.participants_count is None or self.participants_count is False else (struct.pack('<i', self.participants_count)),
+            b'' if self.admins_count is None or self.admins_count is False else (struct.pack('<i', self.admins_count)),
+            b'' if self.kicked_count is None or self.kicked_count is False else (struct.pack('<i', self.kicked_count)),
+            b'' if self.banned_count is None or self.banned_count is False else (struct.pack('<i', self.banned_count)),
+            b'' if self.online_count is None or self.online_count is False else (struct.pack('<i', self.online_count)),
+            struct.pack('<i', self.read_inbox_max_id),
+            struct.pack('<i', self.read_outbox_max_id),
+            struct.pack('<i', self.unread_count),
+            self.chat_photo._bytes(),
+            self.notify_settings._bytes(),
+            b'' if self.exported_invite is None or self.exported_invite is False else (self.exported_invite._bytes()),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.bot_info)),b''.join(x._bytes() for x in self.bot_info),
+            b'' if self.migrated_from_chat_id is None or self.migrated_from_chat_id is False else (struct.pack('<q', self.migrated_from_chat_id)),
+            b'' if self.migrated_from_max_id is None or self.migrated_from_max_id is False else (struct.pack('<i', self.migrated_from_max_id)),
+            b'' if self.pinned_msg_id is None or self.pinned_msg_id is False else (struct.pack('<i', self.pinned_msg_id)),
+            b'' if self.stickerset is None or self.stickerset is False else (self.stickerset._bytes()),
+            b'' if self.available_min_id is None or self.available_min_id is False else (struct.pack('<i', self.available_min_id)),
+            b'' if self.folder_id is None or self.folder_id is False else (struct.pack('<i', self.folder_id)),
+            b'' if self.linked_chat_id is None or self.linked_chat_id is False else (struct.pack('<q', self.linked_chat_id)),
+            b'' if self.location is None or self.location is False else (self.location._bytes()),
+            b'' if self.slowmode_seconds is None or self.slowmode_seconds is False else (struct.pack('<i', self.slowmode_seconds)),
+            b'' if self.slowmode_next_send_date is None or self.slowmode_next_send_date is False else (self.serialize_datetime(self.slowmode_next_send_date)),
+            b'' if self.stats_dc is None or self.stats_dc is False else (struct.pack('<i', self.stats_dc)),
+            struct.pack('<i', self.pts),
+            b'' if self.call is None or self.call is False else (self.call._bytes()),
+            b'' if self.ttl_period is None or self.ttl_period is False else (struct.pack('<i', self.ttl_period)),
+            b'' if self.pending_suggestions is None or self.pending_suggestions is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.pending_suggestions)),b''.join(self.serialize_bytes(x) for x in self.pending_suggestions))),
+            b'' if self.groupcall_default_join_as is None or self.groupcall_default_join_as is False else (self.groupcall_default_join_as._bytes()),
+            b'' if self.theme_emoticon is None or self.theme_emoticon is False else (self.serialize_bytes(self.theme_emoticon)),
+            b'' if self.requests_pending is None or self.requests_pending is False else (struct.pack('<i', self.requests_pending)),
+            b'' if self.recent_requesters is None or self.recent_requesters is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.recent_requesters)),b''.join(struct.pack('<q', x) for x in self.recent_requesters))),
+            b'' if self.default_send_as is None or self.default_send_as is False else (self.default_send_as._bytes()),
+            b'' if self.available_reactions is None or self.available_reactions is False else (self.available_reactions._bytes()),
+            b'' if self.reactions_limit is None or self.reactions_limit is False else (struct.pack('<i', self.reactions_limit)),
+            b'' if self.stories is None or self.stories is False else (self.stories._bytes()),
+            b'' if self.wallpaper is None or self.wallpaper is False else (self.wallpaper._bytes()),
+            b'' if self.boosts_applied is None or self.boosts_applied is False else (struct.pack('<i', self.boosts_applied)),
+            b'' if self.boosts_unrestrict is None or self.boosts_unrestrict is False else (struct.pack('<i', self.boosts_unrestrict)),
+            b'' if self.emojiset is None or self.emojiset is False else (self.emojiset._bytes()),
+            b'' if self.bot_verification is None or self.bot_verification is False else (self.bot_verification._bytes()),
+            b'' if self.stargifts_count is None or self.stargifts_count is False else (struct.pack('<i', self.stargifts_count)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _can_view_participants = bool(flags & 8)
+        _can_set_username = bool(flags & 64)
+        _can_set_stickers = bool(flags & 128)
+        _hidden_prehistory = bool(flags & 1024)
+        _can_set_location = bool(flags & 65536)
+        _has_scheduled = bool(flags & 524288)
+        _can_view_stats = bool(flags & 1048576)
+        _blocked = bool(flags & 4194304)
+        flags2 = reader.read_int()
+
+        _can_delete_channel = bool(flags2 & 1)
+        _antispam = bool(flags2 & 2)
+        _participants_hidden = bool(flags2 & 4)
+        _translations_disabled = bool(flags2 & 8)
+        _stories_pinned_available = bool(flags2 & 32)
+        _view_forum_as_messages = bool(flags2 & 64)
+        _restricted_sponsored = bool(flags2 & 2048)
+        _can_view_revenue = bool(flags2 & 4096)
+        _paid_media_allowed = bool(flags2 & 16384)
+        _can_view_stars_revenue = bool(flags2 & 32768)
+        _paid_reactions_available = bool(flags2 & 65536)
+        _stargifts_available = bool(flags2 & 524288)
+        _id = reader.read_long()
+        _about = reader.tgread_string()
+        if flags & 1:
+            _participants_count = reader.read_int()
+        else:
+            _participants_count = None
+        if flags & 2:
+            _admins_count = reader.read_int()
+        else:
+            _admins_count = None
+        if flags & 4:
+            _kicked_count = reader.read_int()
+        else:
+            _kicked_count = None
+        if flags & 4:
+            _banned_count = reader.read_int()
+        else:
+            _banned_count = None
+        if flags & 8192:
+            _online_count = reader.read_int()
+        else:
+            _online_count = None
+        _read_inbox_max_id = reader.read_int()
+        _read_outbox_max_id = reader.read_int()
+        _unread_count = reader.read_int()
+        _chat_photo = reader.tgread_object()
+        _notify_settings = reader.tgread_object()
+        if flags & 8388608:
+            _exported_invite = reader.tgread_object()
+        else:
+            _exported_invite = None
+        reader.read_int()
+        _bot_info = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _bot_info.append(_x)
+
+        if flags & 16:
+            _migrated_from_chat_id = reader.read_long()
+        else:
+            _migrated_from_chat_id = None
+        if flags & 16:
+            _migrated_from_max_id = reader.read_int()
+        else:
+            _migrated_from_max_id = None
+        if flags & 32:
+            _pinned_msg_id = reader.read_int()
+        else:
+            _pinned_msg_id = None
+        if flags & 256:
+            _stickerset = reader.tgread_object()
+        else:
+            _stickerset = None
+        if flags & 512:
+            _available_min_id = reader.read_int()
+        else:
+            _available_min_id = None
+        if flags & 2048:
+            _folder_id = reader.read_int()
+        else:
+            _folder_id = None
+        if flags & 16384:
+            _linked_chat_id = reader.read_long()
+        else:
+            _linked_chat_id = None
+        if flags & 32768:
+            _location = reader.tgread_object()
+        else:
+            _location = None
+        if flags & 131072:
+            _slowmode_seconds = reader.read_int()
+        else:
+            _slowmode_seconds = None
+        if flags & 262144:
+            _slowmode_next_send_date = reader.tgread_date()
+        else:
+            _slowmode_next_send_date = None
+        if flags & 4096:
+            _stats_dc = reader.read_int()
+        else:
+            _stats_dc = None
+        _pts = reader.read_int()
+        if flags & 2097152:
+            _call = reader.tgread_object()
+        else:
+            _call = None
+        if flags & 16777216:
+            _ttl_period = reader.read_int()
+        else:
+            _ttl_period = None
+        if flags & 33554432:
+            reader.read_int()
+            _pending_suggestions = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_string()
+                _pending_suggestions.append(_x)
+
+        else:
+            _pending_suggestions = None
+        if flags & 67108864:
+            _groupcall_default_join_as = reader.tgread_object()
+        else:
+            _groupcall_default_join_as = None
+        if flags & 134217728:
+            _theme_emoticon = reader.tgread_string()
+        else:
+            _theme_emoticon = None
+        if flags & 268435456:
+            _requests_pending = reader.read_int()
+        else:
+            _requests_pending = None
+        if flags & 268435456:
+            reader.read_int()
+            _recent_requesters = []
+            for _ in range(reader.read_int()):
+                _x = reader.read_long()
+                _recent_requesters.append(_x)
+
+        else:
+            _recent_requesters = None
+        if flags & 536870912:
+            _default_send_as = reader.tgread_object()
+        else:
+            _default_send_as = None
+        if flags & 1073741824:
+            _available_reactions = reader.tgread_object()
+        else:
+            _available_reactions = None
+        if flags2 & 8192:
+            _reactions_limit = reader.read_int()
+        else:
+            _reactions_limit = None
+        if flags2 & 16:
+            _stories = reader.tgread_object()
+        else:
+            _stories = None
+        if flags2 & 128:
+            _wallpaper = reader.tgread_object()
+        else:
+            _wallpaper = None
+        if flags2 & 256:
+            _boosts_applied = reader.read_int()
+        else:
+            _boosts_applied = None
+        if flags2 & 512:
+            _boosts_unrestrict = reader.read_int()
+        else:
+            _boosts_unrestrict = None
+        if flags2 & 1024:
+            _emojiset = reader.tgread_object()
+        else:
+            _emojiset = None
+        if flags2 & 131072:
+            _bot_verification = reader.tgread_object()
+        else:
+            _bot_verification = None
+        if flags2 & 262144:
+            _stargifts_count = reader.read_int()
+        else:
+            _stargifts_count = None
+        return cls(id=_id, about=_about, read_inbox_max_id=_read_inbox_max_id, read_outbox_max_id=_read_outbox_max_id, unread_count=_unread_count, chat_photo=_chat_photo, notify_settings=_notify_settings, bot_info=_bot_info, pts=_pts, can_view_participants=_can_view_participants, can_set_username=_can_set_username, can_set_stickers=_can_set_stickers, hidden_prehistory=_hidden_prehistory, can_set_location=_can_set_location, has_scheduled=_has_scheduled, can_view_stats=_can_view_stats, blocked=_blocked, can_delete_channel=_can_delete_channel, antispam=_antispam, participants_hidden=_participants_hidden, translations_disabled=_translations_disabled, stories_pinned_available=_stories_pinned_available, view_forum_as_messages=_view_forum_as_messages, restricted_sponsored=_restricted_sponsored, can_view_revenue=_can_view_revenue, paid_media_allowed=_paid_media_allowed, can_view_stars_revenue=_can_view_stars_revenue, paid_reactions_available=_paid_reactions_available, stargifts_available=_stargifts_available, participants_count=_participants_count, admins_count=_admins_count, kicked_count=_kicked_count, banned_count=_banned_count, online_count=_online_count, exported_invite=_exported_invite, migrated_from_chat_id=_migrated_from_chat_id, migrated_from_max_id=_migrated_from_max_id, pinned_msg_id=_pinned_msg_id, stickerset=_stickerset, available_min_id=_available_min_id, folder_id=_folder_id, linked_chat_id=_linked_chat_id, location=_location, slowmode_seconds=_slowmode_seconds, slowmode_next_send_date=_slowmode_next_send_date, stats_dc=_stats_dc, call=_call, ttl_period=_ttl_period, pending_suggestions=_pending_suggestions, groupcall_default_join_as=_groupcall_default_join_as, theme_emoticon=_theme_emoticon, requests_pending=_requests_pending, recent_requesters=_recent_requesters, default_send_as=_default_send_as, available_reactions=_available_reactions, reactions_limit=_reactions_limit, stories=_stories, wallpaper=_wallpaper, boosts_applied=_boosts_applied, boosts_unrestrict=_boosts_unrestrict, emojiset=_emojiset, bot_verification=_bot_verification, stargifts_count=_stargifts_count)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        flags2 = reader.read_int()
+        reader.seek(8)
+        TLObject.skip_bytes(reader)
+        if flags & 1:
+            reader.seek(4)
+        if flags & 2:
+            reader.seek(4)
+        if flags & 4:
+            reader.seek(4)
+        if flags & 4:
+            reader.seek(4)
+        if flags & 8192:
+            reader.seek(4)
+        reader.seek(12)
+        reader.tgskip_object()
+        reader.tgskip_object()
+        if flags & 8388608:
+            reader.tgskip_object()
+        reader.seek(4)
+        for _ in range(reader.read_int()):
+            reader.tgskip_object()
+        if flags & 16:
+            reader.seek(8)
+        if flags & 16:
+            reader.seek(4)
+        if flags & 32:
+            reader.seek(4)
+        if flags & 256:
+            reader.tgskip_object()
+        if flags & 512:
+            reader.seek(4)
+        if flags & 2048:
+            reader.seek(4)
+        if flags & 16384:
+            reader.seek(8)
+        if flags & 32768:
+            reader.tgskip_object()
+        if flags & 131072:
+            reader.seek(4)
+        if flags & 262144:
+            reader.seek(4)
+        if flags & 4096:
+            reader.seek(4)
+        reader.seek(4)
+        if flags & 2097152:
+            reader.tgskip_object()
+        if flags & 16777216:
+            reader.seek(4)
+        if flags & 33554432:
+            reader.seek(4)
+            for _ in range(reader.read_int()):
+                TLObject.skip_bytes(reader)
+        if flags & 67108864:
+            reader.tgskip_object()
+        if flags & 134217728:
+            TLObject.skip_bytes(reader)
+        if flags & 268435456:
+            reader.seek(4)
+        if flags & 268435456:
+            reader.seek(4)
+            reader.seek(reader.read_int() * 8)
+        if flags & 536870912:
+            reader.tgskip_object()
+        if flags & 1073741824:
+            reader.tgskip_object()
+        if flags2 & 8192:
+            reader.seek(4)
+        if flags2 & 16:
+            reader.tgskip_object()
+        if flags2 & 128:
+            reader.tgskip_object()
+        if flags2 & 256:
+            reader.seek(4)
+        if flags2 & 512:
+            reader.seek(4)
+        if flags2 & 1024:
+            reader.tgskip_object()
+        if flags2 & 131072:
+            reader.tgskip_object()
+        if flags2 & 262144:
+            reader.seek(4)
+
+
+class FutureSalts(TLObject):
+    CONSTRUCTOR_ID = 0xae500895
+    SUBCLASS_OF_ID = 0x1090f517
+
+    __slots__ = ('req_msg_id', 'now', 'salts')
+
+    def __init__(self, req_msg_id: int, now: int, salts: List['Typefuture_salt']):
+        """
+        Constructor for FutureSalts: Instance of FutureSalts.
+        """
+        self.req_msg_id = req_msg_id
+        self.now = now
+        self.salts = salts
+
+    def to_dict(self):
+        return {
+            '_': 'FutureSalts',
+            'req_msg_id': self.req_msg_id,
+            'now': self.now,
+            'salts': [] if self.salts is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.salts]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x95\x08P\xae',
+            struct.pack('<q', self.req_msg_id),
+            struct.pack('<i', self.now),
+            struct.pack('<i', len(self.salts)),b''.join(x._bytes()[4:] for x in self.salts),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _req_msg_id = reader.read_long()
+        _now = reader.read_int()
+        _salts = []
+        for _ in range(reader.read_int()):
+            from . import FutureSalt
+            _x = FutureSalt.from_reader(reader)
+            _salts.append(_x)
+
+        return cls(req_msg_id=_req_msg_id, now=_now, salts=_salts)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        reader.seek(12)
+        for _ in range(reader.read_int()):
+            from . import FutureSalt
+            FutureSalt.skip_reader(reader)
+
+
+class GlobalPrivacySettings(TLObject):
+    CONSTRUCTOR_ID = 0x734c4ccb
+    SUBCLASS_OF_ID = 0xc90e5770
+
+    __slots__ = ('archive_and_mute_new_noncontact_peers', 'keep_archived_unmuted', 'keep_archived_folders', 'hide_read_marks', 'new_noncontact_peers_require_premium')
+
+    def __init__(self, archive_and_mute_new_noncontact_peers: Optional[bool]=None, keep_archived_unmuted: Optional[bool]=None, keep_archived_folders: Optional[bool]=None, hide_read_marks: Optional[bool]=None, new_noncontact_peers_require_premium: Optional[bool]=None):
+        """
+        Constructor for GlobalPrivacySettings: Instance of GlobalPrivacySettings.
+        """
+        self.archive_and_mute_new_noncontact_peers = archive_and_mute_new_noncontact_peers
+        self.keep_archived_unmuted = keep_archived_unmuted
+        self.keep_archived_folders = keep_archived_folders
+        self.hide_read_marks = hide_read_marks
+        self.new_noncontact_peers_require_premium = new_noncontact_peers_require_premium
+
+    def to_dict(self):
+        return {
+            '_': 'GlobalPrivacySettings',
+            'archive_and_mute_new_noncontact_peers': self.archive_and_mute_new_noncontact_peers,
+            'keep_archived_unmuted': self.keep_archived_unmuted,
+            'keep_archived_folders': self.keep_archived_folders,
+            'hide_read_marks': self.hide_read_marks,
+            'new_noncontact_peers_require_premium': self.new_noncontact_peers_require_premium
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcbLLs',
+            struct.pack('<I', (0 if self.archive_and_mute_new_noncontact_peers is None or self.archive_and_mute_new_noncontact_peers is False else 1) | (0 if self.keep_archived_unmuted is None or self.keep_archived_unmuted is False else 2) | (0 if self.keep_archived_folders is None or self.keep_archived_folders is False else 4) | (0 if self.hide_read_marks is None or self.hide_read_marks is False else 8) | (0 if self.new_noncontact_peers_require_premium is None or self.new_noncontact_peers_require_premium is False else 16)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _archive_and_mute_new_noncontact_peers = bool(flags & 1)
+        _keep_archived_unmuted = bool(flags & 2)
+        _keep_archived_folders = bool(flags & 4)
+        _hide_read_marks = bool(flags & 8)
+        _new_noncontact_peers_require_premium = bool(flags & 16)
+        return cls(archive_and_mute_new_noncontact_peers=_archive_and_mute_new_noncontact_peers, keep_archived_unmuted=_keep_archived_unmuted, keep_archived_folders=_keep_archived_folders, hide_read_marks=_hide_read_marks, new_noncontact_peers_require_premium=_new_noncontact_peers_require_premium)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+
+
+class Message(TLObject):
+    CONSTRUCTOR_ID = 0x96fdbbe9
+    SUBCLASS_OF_ID = 0x790009e3
+
+    __slots__ = ('id', 'peer_id', 'date', 'message', 'out', 'mentioned', 'media_unread', 'silent', 'post', 'from_scheduled', 'legacy', 'edit_hide', 'pinned', 'noforwards', 'invert_media', 'offline', 'video_processing_pending', 'from_id', 'from_boosts_applied', 'saved_peer_id', 'fwd_from', 'via_bot_id', 'via_business_bot_id', 'reply_to', 'media', 'reply_markup', 'entities', 'views', 'forwards', 'replies', 'edit_date', 'post_author', 'grouped_id', 'reactions', 'restriction_reason', 'ttl_period', 'quick_reply_shortcut_id', 'effect', 'factcheck', 'report_delivery_until_date')
+
+    def __init__(self, id: int, peer_id: 'TypePeer', date: Optional[datetime], message: str, out: Optional[bool]=None, mentioned: Optional[bool]=None, media_unread: Optional[bool]=None, silent: Optional[bool]=None, post: Optional[bool]=None, from_scheduled: Optional[bool]=None, legacy: Optional[bool]=None, edit_hide: Optional[bool]=None, pinned: Optional[bool]=None, noforwards: Optional[bool]=None, invert_media: Optional[bool]=None, offline: Optional[bool]=None, video_processing_pending: Optional[bool]=None, from_id: Optional['TypePeer']=None, from_boosts_applied: Optional[int]=None, saved_peer_id: Optional['TypePeer']=None, fwd_from: Optional['TypeMessageFwdHeader']=None, via_bot_id: Optional[int]=None, via_business_bot_id: Optional[int]=None, reply_to: Optional['TypeMessageReplyHeader']=None, media: Optional['TypeMessageMedia']=None, reply_markup: Optional['TypeReplyMarkup']=None, entities: Optional[List['TypeMessageEntity']]=None, views: Optional[int]=None, forwards: Optional[int]=None, replies: Optional['TypeMessageReplies']=None, edit_date: Optional[datetime]=None, post_author: Optional[str]=None, grouped_id: Optional[int]=None, reactions: Optional['TypeMessageReactions']=None, restriction_reason: Optional[List['TypeRestrictionReason']]=None, ttl_period: Optional[int]=None, quick_reply_shortcut_id: Optional[int]=None, effect: Optional[int]=None, factcheck: Optional['TypeFactCheck']=None, report_delivery_until_date: Optional[datetime]=None):
+        """
+        Constructor for Message: Instance of either MessageEmpty, Message, MessageService.
+        """
+        self.id = id
+        self.peer_id = peer_id
+        self.date = date
+        self.message = message
+        self.out = out
+        self.mentioned = mentioned
+        self.media_unread = media_unread
+        self.silent = silent
+        self.post = post
+        self.from_scheduled = from_scheduled
+        self.legacy = legacy
+        self.edit_hide = edit_hide
+        self.pinned = pinned
+        self.noforwards = noforwards
+        self.invert_media = invert_media
+        self.offline = offline
+        self.video_processing_pending = video_processing_pending
+        self.from_id = from_id
+        self.from_boosts_applied = from_boosts_applied
+        self.saved_peer_id = saved_peer_id
+        self.fwd_from = fwd_from
+        self.via_bot_id = via_bot_id
+        self.via_business_bot_id = via_business_bot_id
+        self.reply_to = reply_to
+        self.media = media
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.views = views
+        self.forwards = forwards
+        self.replies = replies
+        self.edit_date = edit_date
+        self.post_author = post_author
+        self.grouped_id = grouped_id
+        self.reactions = reactions
+        self.restriction_reason = restriction_reason
+        self.ttl_period = ttl_period
+        self.quick_reply_shortcut_id = quick_reply_shortcut_id
+        self.effect = effect
+        self.factcheck = factcheck
+        self.report_delivery_until_date = report_delivery_until_date
+
+    def to_dict(self):
+        return {
+            '_': 'Message',
+            'id': self.id,
+            'peer_id': self.peer_id.to_dict() if isinstance(self.peer_id, TLObject) else self.peer_id,
+            'date': self.date,
+            'message': self.message,
+            'out': self.out,
+            'mentioned': self.mentioned,
+            'media_unread': self.media_unread,
+            'silent': self.silent,
+            'post': self.post,
+            'from_scheduled': self.from_scheduled,
+            'legacy': self.legacy,
+            'edit_hide': self.edit_hide,
+            'pinned': self.pinned,
+            'noforwards': self.noforwards,
+            'invert_media': self.invert_media,
+            'offline': self.offline,
+            'video_processing_pending': self.video_processing_pending,
+            'from_id': self.from_id.to_dict() if isinstance(self.from_id, TLObject) else self.from_id,
+            'from_boosts_applied': self.from_boosts_applied,
+            'saved_peer_id': self.saved_peer_id.to_dict() if isinstance(self.saved_peer_id, TLObject) else self.saved_peer_id,
+            'fwd_from': self.fwd_from.to_dict() if isinstance(self.fwd_from, TLObject) else self.fwd_from,
+            'via_bot_id': self.via_bot_id,
+            'via_business_bot_id': self.via_business_bot_id,
+            'reply_to': self.reply_to.to_dict() if isinstance(self.reply_to, TLObject) else self.reply_to,
+            'media': self.media.to_dict() if isinstance(self.media, TLObject) else self.media,
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'views': self.views,
+            'forwards': self.forwards,
+            'replies': self.replies.to_dict() if isinstance(self.replies, TLObject) else self.replies,
+            'edit_date': self.edit_date,
+            'post_author': self.post_author,
+            'grouped_id': self.grouped_id,
+            'reactions': self.reactions.to_dict() if isinstance(self.reactions, TLObject) else self.reactions,
+            'restriction_reason': [] if self.restriction_reason is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.restriction_reason],
+            'ttl_period': self.ttl_period,
+            'quick_reply_shortcut_id': self.quick_reply_shortcut_id,
+            'effect': self.effect,
+            'factcheck': self.factcheck.to_dict() if isinstance(self.factcheck, TLObject) else self.factcheck,
+            'report_delivery_until_date': self.report_delivery_until_date
+        }
+
+    def _bytes(self):
+        assert ((self.views or self.views is not None) and (self.forwards or self.forwards is not None)) or ((self.views is None or self.views is False) and (self.forwards is None or self.forwards is False)), 'views, forwards parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xe9\xbb\xfd\x96',
+            struct.pack('<I', (0 if self.out is None or self.out is False else 2) | (0 if self.mentioned is None or self.mentioned is False else 16) | (0 if self.media_unread is None or self.media_unread is False else 32) | (0 if self.silent is None or self.silent is False else 8192) | (0 if self.post is None or self.post is False else 16384) | (0 if self.from_scheduled is None or self.from_scheduled is False else 262144) | (0 if self.legacy is None or self.legacy is False else 524288) | (0 if self.edit_hide is None or self.edit_hide is False else 2097152) | (0 if self.pinned is None or self.pinned is False else 16777216) | (0 if self.noforwards is None or self.noforwards is False else 67108864) | (0 if self.invert_media is None or self.invert_media is False else 134217728) | (0 if self.from_id is None or self.from_id is False else 256) | (0 if self.from_boosts_applied is None or self.from_boosts_applied is False else 536870912) | (0 if self.saved_peer_id is None or self.saved_peer_id is False else 268435456) | (0 if self.fwd_from is None or self.fwd_from is False else 4) | (0 if self.via_bot_id is None or self.via_bot_id is False else 2048) | (0 if self.reply_to is None or self.reply_to is False else 8) | (0 if self.media is None or self.media is False else 512) | (0 if self.reply_markup is None or self.reply_markup is False else 64) | (0 if self.entities is None or self.entities is False else 128) | (0 if self.views is None or self.views is False else 1024) | (0 if self.forwards is None or self.forwards is False else 1024) | (0 if self.replies is None or self.replies is False else 8388608) | (0 if self.edit_date is None or self.edit_date is False else 32768) | (0 if self.post_author is None or self.post_author is False else 65536) | (0 if self.grouped_id is None or self.grouped_id is False else 131072) | (0 if self.reactions is None or self.reactions is False else 1048576) | (0 if self.restriction_reason is None or self.restriction_reason is False else 4194304) | (0 if self.ttl_period is None or self.ttl_period is False else 33554432) | (0 if self.quick_reply_shortcut_id is None or self.quick_reply_shortcut_id is False else 1073741824)),
+            struct.pack('<I', (0 if self.offline is None or self.offline is False else 2) | (0 if self.video_processing_pending is None or self.video_processing_pending is False else 16) | (0 if self.via_business_bot_id is None or self.via_business_bot_id is False else 1) | (0 if self.effect is None or self.effect is False else 4) | (0 if self.factcheck is None or self.factcheck is False else 8) | (0 if self.report_delivery_until_date is None or self.report_delivery_until_date is False else 32)),
+            struct.pack('<i', self.id),
+            b'' if self.from_id is None or self.from_id is False else (self.from_id._bytes()),
+            b'' if self.from_boosts_applied is None or self.from_boosts_applied is False else (struct.pack('<i', self.from_boosts_applied)),
+            self.peer_id._bytes(),
+            b'' if self.saved_peer_id is None or self.saved_peer_id is False else (self.saved_peer_id._bytes()),
+            b'' if self.fwd_from is None or self.fwd_from is False else (self.fwd_from._bytes()),
+            b'' if self.via_bot_id is None or self.via_bot_id is False else (struct.pack('<q', self.via_bot_id)),
+            b'' if self.via_business_bot_id is None or self.via_business_bot_id is False else (struct.pack('<q', self.via_business_bot_id)),
+            b'' if self.reply_to is None or self.reply_to is False else (self.reply_to._bytes()),
+            self.serialize_datetime(self.date),
+            self.serialize_bytes(self.message),
+            b'' if self.media is None or self.media is False else (self.media._bytes()),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.views is None or self.views is False else (struct.pack('<i', self.views)),
+            b'' if self.forwards is None or self.forwards is False else (struct.pack('<i', self.forwards)),
+            b'' if self.replies is None or self.replies is False else (self.replies._bytes()),
+            b'' if self.edit_date is None or self.edit_date is False else (self.serialize_datetime(self.edit_date)),
+            b'' if self.post_author is None or self.post_author is False else (self.serialize_bytes(self.post_author)),
+            b'' if self.grouped_id is None or self.grouped_id is False else (struct.pack('<q', self.grouped_id)),
+            b'' if self.reactions is None or self.reactions is False else (self.reactions._bytes()),
+            b'' if self.restriction_reason is None or self.restriction_reason is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.restriction_reason)),b''.join(x._bytes() for x in self.restriction_reason))),
+            b'' if self.ttl_period is None or self.ttl_period is False else (struct.pack('<i', self.ttl_period)),
+            b'' if self.quick_reply_shortcut_id is None or self.quick_reply_shortcut_id is False else (struct.pack('<i', self.quick_reply_shortcut_id)),
+            b'' if self.effect is None or self.effect is False else (struct.pack('<q', self.effect)),
+            b'' if self.factcheck is None or self.factcheck is False else (self.factcheck._bytes()),
+            b'' if self.report_delivery_until_date is None or self.report_delivery_until_date is False else (self.serialize_datetime(self.report_delivery_until_date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _out = bool(flags & 2)
+        _mentioned = bool(flags & 16)
+        _media_unread = bool(flags & 32)
+        _silent = bool(flags & 8192)
+        _post = bool(flags & 16384)
+        _from_scheduled = bool(flags & 262144)
+        _legacy = bool(flags & 524288)
+        _edit_hide = bool(flags & 2097152)
+        _pinned = bool(flags & 16777216)
+        _noforwards = bool(flags & 67108864)
+        _invert_media = bool(flags & 134217728)
+        flags2 = reader.read_int()
+
+        _offline = bool(flags2 & 2)
+        _video_processing_pending = bool(flags2 & 16)
+        _id = reader.read_int()
+        if flags & 256:
+            _from_id = reader.tgread_object()
+        else:
+            _from_id = None
+        if flags & 536870912:
+            _from_boosts_applied = reader.read_int()
+        else:
+            _from_boosts_applied = None
+        _peer_id = reader.tgread_object()
+        if flags & 268435456:
+            _saved_peer_id = reader.tgread_object()
+        else:
+            _saved_peer_id = None
+        if flags & 4:
+            _fwd_from = reader.tgread_object()
+        else:
+            _fwd_from = None
+        if flags & 2048:
+            _via_bot_id = reader.read_long()
+        else:
+            _via_bot_id = None
+        if flags2 & 1:
+            _via_business_bot_id = reader.read_long()
+        else:
+            _via_business_bot_id = None
+        if flags & 8:
+            _reply_to = reader.tgread_object()
+        else:
+            _reply_to = None
+        _date = reader.tgread_date()
+        _message = reader.tgread_string()
+        if flags & 512:
+            _media = reader.tgread_object()
+        else:
+            _media = None
+        if flags & 64:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        if flags & 128:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 1024:
+            _views = reader.read_int()
+        else:
+            _views = None
+        if flags & 1024:
+            _forwards = reader.read_int()
+        else:
+            _forwards = None
+        if flags & 8388608:
+            _replies = reader.tgread_object()
+        else:
+            _replies = None
+        if flags & 32768:
+            _edit_date = reader.tgread_date()
+        else:
+            _edit_date = None
+        if flags & 65536:
+            _post_author = reader.tgread_string()
+        else:
+            _post_author = None
+        if flags & 131072:
+            _grouped_id = reader.read_long()
+        else:
+            _grouped_id = None
+        if flags & 1048576:
+            _reactions = reader.tgread_object()
+        else:
+            _reactions = None
+        if flags & 4194304:
+            reader.read_int()
+            _restriction_reason = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _restriction_reason.append(_x)
+
+        else:
+            _restriction_reason = None
+        if flags & 33554432:
+            _ttl_period = reader.read_int()
+        else:
+            _ttl_period = None
+        if flags & 1073741824:
+            _quick_reply_shortcut_id = reader.read_int()
+        else:
+            _quick_reply_shortcut_id = None
+        if flags2 & 4:
+            _effect = reader.read_long()
+        else:
+            _effect = None
+        if flags2 & 8:
+            _factcheck = reader.tgread_object()
+        else:
+            _factcheck = None
+        if flags2 & 32:
+            _report_delivery_until_date = reader.tgread_date()
+        else:
+            _report_delivery_until_date = None
+        return cls(id=_id, peer_id=_peer_id, date=_date, message=_message, out=_out, mentioned=_mentioned, media_unread=_media_unread, silent=_silent, post=_post, from_scheduled=_from_scheduled, legacy=_legacy, edit_hide=_edit_hide, pinned=_pinned, noforwards=_noforwards, invert_media=_invert_media, offline=_offline, video_processing_pending=_video_processing_pending, from_id=_from_id, from_boosts_applied=_from_boosts_applied, saved_peer_id=_saved_peer_id, fwd_from=_fwd_from, via_bot_id=_via_bot_id, via_business_bot_id=_via_business_bot_id, reply_to=_reply_to, media=_media, reply_markup=_reply_markup, entities=_entities, views=_views, forwards=_forwards, replies=_replies, edit_date=_edit_date, post_author=_post_author, grouped_id=_grouped_id, reactions=_reactions, restriction_reason=_restriction_reason, ttl_period=_ttl_period, quick_reply_shortcut_id=_quick_reply_shortcut_id, effect=_effect, factcheck=_factcheck, report_delivery_until_date=_report_delivery_until_date)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        flags2 = reader.read_int()
+        reader.seek(4)
+        if flags & 256:
+            reader.tgskip_object()
+        if flags & 536870912:
+            reader.seek(4)
+        reader.tgskip_object()
+        if flags & 268435456:
+            reader.tgskip_object()
+        if flags & 4:
+            reader.tgskip_object()
+        if flags & 2048:
+            reader.seek(8)
+        if flags2 & 1:
+            reader.seek(8)
+        if flags & 8:
+            reader.tgskip_object()
+        reader.seek(4)
+        TLObject.skip_bytes(reader)
+        if flags & 512:
+            reader.tgskip_object()
+        if flags & 64:
+            reader.tgskip_object()
+        if flags & 128:
+            reader.seek(4)
+            for _ in range(reader.read_int()):
+                reader.tgskip_object()
+        if flags & 1024:
+            reader.seek(4)
+        if flags & 1024:
+            reader.seek(4)
+        if flags & 8388608:
+            reader.tgskip_object()
+        if flags & 32768:
+            reader.seek(4)
+        if flags & 65536:
+            TLObject.skip_bytes(reader)
+        if flags & 131072:
+            reader.seek(8)
+        if flags & 1048576:
+            reader.tgskip_object()
+        if flags & 4194304:
+            reader.seek(4)
+            for _ in range(reader.read_int()):
+                reader.tgskip_object()
+        if flags & 33554432:
+            reader.seek(4)
+        if flags & 1073741824:
+            reader.seek(4)
+        if flags2 & 4:
+            reader.seek(8)
+        if flags2 & 8:
+            reader.tgskip_object()
+        if flags2 & 32:
+            reader.seek(4)
+
+
+class MessageActionGiftCode(TLObject):
+    CONSTRUCTOR_ID = 0x56d03994
+    SUBCLASS_OF_ID = 0x8680d126
+
+    __slots__ = ('months', 'slug', 'via_giveaway', 'unclaimed', 'boost_peer', 'currency', 'amount', 'crypto_currency', 'crypto_amount', 'message')
+
+    def __init__(self, months: int, slug: str, via_giveaway: Optional[bool]=None, unclaimed: Optional[bool]=None, boost_peer: Optional['TypePeer']=None, currency: Optional[str]=None, amount: Optional[int]=None, crypto_currency: Optional[str]=None, crypto_amount: Optional[int]=None, message: Optional['TypeTextWithEntities']=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique.
+        """
+        self.months = months
+        self.slug = slug
+        self.via_giveaway = via_giveaway
+        self.unclaimed = unclaimed
+        self.boost_peer = boost_peer
+        self.currency = currency
+        self.amount = amount
+        self.crypto_currency = crypto_currency
+        self.crypto_amount = crypto_amount
+        self.message = message
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionGiftCode',
+            'months': self.months,
+            'slug': self.slug,
+            'via_giveaway': self.via_giveaway,
+            'unclaimed': self.unclaimed,
+            'boost_peer': self.boost_peer.to_dict() if isinstance(self.boost_peer, TLObject) else self.boost_peer,
+            'currency': self.currency,
+            'amount': self.amount,
+            'crypto_currency': self.crypto_currency,
+            'crypto_amount': self.crypto_amount,
+            'message': self.message.to_dict() if isinstance(self.message, TLObject) else self.message
+        }
+
+    def _bytes(self):
+        assert ((self.unclaimed or self.unclaimed is not None) and (self.currency or self.currency is not None) and (self.amount or self.amount is not None)) or ((self.unclaimed is None or self.unclaimed is False) and (self.currency is None or self.currency is False) and (self.amount is None or self.amount is False)), 'unclaimed, currency, amount parameters must all be False-y (like None) or all me True-y'
+        assert ((self.crypto_currency or self.crypto_currency is not None) and (self.crypto_amount or self.crypto_amount is not None)) or ((self.crypto_currency is None or self.crypto_currency is False) and (self.crypto_amount is None or self.crypto_amount is False)), 'crypto_currency, crypto_amount parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\x949\xd0V',
+            struct.pack('<I', (0 if self.via_giveaway is None or self.via_giveaway is False else 1) | (0 if self.unclaimed is None or self.unclaimed is False else 4) | (0 if self.boost_peer is None or self.boost_peer is False else 2) | (0 if self.currency is None or self.currency is False else 4) | (0 if self.amount is None or self.amount is False else 4) | (0 if self.crypto_currency is None or self.crypto_currency is False else 8) | (0 if self.crypto_amount is None or self.crypto_amount is False else 8) | (0 if self.message is None or self.message is False else 16)),
+            b'' if self.boost_peer is None or self.boost_peer is False else (self.boost_peer._bytes()),
+            struct.pack('<i', self.months),
+            self.serialize_bytes(self.slug),
+            b'' if self.currency is None or self.currency is False else (self.serialize_bytes(self.currency)),
+            b'' if self.amount is None or self.amount is False else (struct.pack('<q', self.amount)),
+            b'' if self.crypto_currency is None or self.crypto_currency is False else (self.serialize_bytes(self.crypto_currency)),
+            b'' if self.crypto_amount is None or self.crypto_amount is False else (struct.pack('<q', self.crypto_amount)),
+            b'' if self.message is None or self.message is False else (self.message._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _via_giveaway = bool(flags & 1)
+        _unclaimed = bool(flags & 4)
+        if flags & 2:
+            _boost_peer = reader.tgread_object()
+        else:
+            _boost_peer = None
+        _months = reader.read_int()
+        _slug = reader.tgread_string()
+        if flags & 4:
+            _currency = reader.tgread_string()
+        else:
+            _currency = None
+        if flags & 4:
+            _amount = reader.read_long()
+        else:
+            _amount = None
+        if flags & 8:
+            _crypto_currency = reader.tgread_string()
+        else:
+            _crypto_currency = None
+        if flags & 8:
+            _crypto_amount = reader.read_long()
+        else:
+            _crypto_amount = None
+        if flags & 16:
+            _message = reader.tgread_object()
+        else:
+            _message = None
+        return cls(months=_months, slug=_slug, via_giveaway=_via_giveaway, unclaimed=_unclaimed, boost_peer=_boost_peer, currency=_currency, amount=_amount, crypto_currency=_crypto_currency, crypto_amount=_crypto_amount, message=_message)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        if flags & 2:
+            reader.tgskip_object()
+        reader.seek(4)
+        TLObject.skip_bytes(reader)
+        if flags & 4:
+            TLObject.skip_bytes(reader)
+        if flags & 4:
+            reader.seek(8)
+        if flags & 8:
+            TLObject.skip_bytes(reader)
+        if flags & 8:
+            reader.seek(8)
+        if flags & 16:
+            reader.tgskip_object()
+
+
+class PeerSettings(TLObject):
+    CONSTRUCTOR_ID = 0xacd66c5e
+    SUBCLASS_OF_ID = 0xf6a79f84
+
+    __slots__ = ('report_spam', 'add_contact', 'block_contact', 'share_contact', 'need_contacts_exception', 'report_geo', 'autoarchived', 'invite_members', 'request_chat_broadcast', 'business_bot_paused', 'business_bot_can_reply', 'geo_distance', 'request_chat_title', 'request_chat_date', 'business_bot_id', 'business_bot_manage_url')
+
+    def __init__(self, report_spam: Optional[bool]=None, add_contact: Optional[bool]=None, block_contact: Optional[bool]=None, share_contact: Optional[bool]=None, need_contacts_exception: Optional[bool]=None, report_geo: Optional[bool]=None, autoarchived: Optional[bool]=None, invite_members: Optional[bool]=None, request_chat_broadcast: Optional[bool]=None, business_bot_paused: Optional[bool]=None, business_bot_can_reply: Optional[bool]=None, geo_distance: Optional[int]=None, request_chat_title: Optional[str]=None, request_chat_date: Optional[datetime]=None, business_bot_id: Optional[int]=None, business_bot_manage_url: Optional[str]=None):
+        """
+        Constructor for PeerSettings: Instance of PeerSettings.
+        """
+        self.report_spam = report_spam
+        self.add_contact = add_contact
+        self.block_contact = block_contact
+        self.share_contact = share_contact
+        self.need_contacts_exception = need_contacts_exception
+        self.report_geo = report_geo
+        self.autoarchived = autoarchived
+        self.invite_members = invite_members
+        self.request_chat_broadcast = request_chat_broadcast
+        self.business_bot_paused = business_bot_paused
+        self.business_bot_can_reply = business_bot_can_reply
+        self.geo_distance = geo_distance
+        self.request_chat_title = request_chat_title
+        self.request_chat_date = request_chat_date
+        self.business_bot_id = business_bot_id
+        self.business_bot_manage_url = business_bot_manage_url
+
+    def to_dict(self):
+        return {
+            '_': 'PeerSettings',
+            'report_spam': self.report_spam,
+            'add_contact': self.add_contact,
+            'block_contact': self.block_contact,
+            'share_contact': self.share_contact,
+            'need_contacts_exception': self.need_contacts_exception,
+            'report_geo': self.report_geo,
+            'autoarchived': self.autoarchived,
+            'invite_members': self.invite_members,
+            'request_chat_broadcast': self.request_chat_broadcast,
+            'business_bot_paused': self.business_bot_paused,
+            'business_bot_can_reply': self.business_bot_can_reply,
+            'geo_distance': self.geo_distance,
+            'request_chat_title': self.request_chat_title,
+            'request_chat_date': self.request_chat_date,
+            'business_bot_id': self.business_bot_id,
+            'business_bot_manage_url': self.business_bot_manage_url
+        }
+
+    def _bytes(self):
+        assert ((self.request_chat_title or self.request_chat_title is not None) and (self.request_chat_date or self.request_chat_date is not None)) or ((self.request_chat_title is None or self.request_chat_title is False) and (self.request_chat_date is None or self.request_chat_date is False)), 'request_chat_title, request_chat_date parameters must all be False-y (like None) or all me True-y'
+        assert ((self.business_bot_id or self.business_bot_id is not None) and (self.business_bot_manage_url or self.business_bot_manage_url is not None)) or ((self.business_bot_id is None or self.business_bot_id is False) and (self.business_bot_manage_url is None or self.business_bot_manage_url is False)), 'business_bot_id, business_bot_manage_url parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'^l\xd6\xac',
+            struct.pack('<I', (0 if self.report_spam is None or self.report_spam is False else 1) | (0 if self.add_contact is None or self.add_contact is False else 2) | (0 if self.block_contact is None or self.block_contact is False else 4) | (0 if self.share_contact is None or self.share_contact is False else 8) | (0 if self.need_contacts_exception is None or self.need_contacts_exception is False else 16) | (0 if self.report_geo is None or self.report_geo is False else 32) | (0 if self.autoarchived is None or self.autoarchived is False else 128) | (0 if self.invite_members is None or self.invite_members is False else 256) | (0 if self.request_chat_broadcast is None or self.request_chat_broadcast is False else 1024) | (0 if self.business_bot_paused is None or self.business_bot_paused is False else 2048) | (0 if self.business_bot_can_reply is None or self.business_bot_can_reply is False else 4096) | (0 if self.geo_distance is None or self.geo_distance is False else 64) | (0 if self.request_chat_title is None or self.request_chat_title is False else 512) | (0 if self.request_chat_date is None or self.request_chat_date is False else 512) | (0 if self.business_bot_id is None or self.business_bot_id is False else 8192) | (0 if self.business_bot_manage_url is None or self.business_bot_manage_url is False else 8192)),
+            b'' if self.geo_distance is None or self.geo_distance is False else (struct.pack('<i', self.geo_distance)),
+            b'' if self.request_chat_title is None or self.request_chat_title is False else (self.serialize_bytes(self.request_chat_title)),
+            b'' if self.request_chat_date is None or self.request_chat_date is False else (self.serialize_datetime(self.request_chat_date)),
+            b'' if self.business_bot_id is None or self.business_bot_id is False else (struct.pack('<q', self.business_bot_id)),
+            b'' if self.business_bot_manage_url is None or self.business_bot_manage_url is False else (self.serialize_bytes(self.business_bot_manage_url)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _report_spam = bool(flags & 1)
+        _add_contact = bool(flags & 2)
+        _block_contact = bool(flags & 4)
+        _share_contact = bool(flags & 8)
+        _need_contacts_exception = bool(flags & 16)
+        _report_geo = bool(flags & 32)
+        _autoarchived = bool(flags & 128)
+        _invite_members = bool(flags & 256)
+        _request_chat_broadcast = bool(flags & 1024)
+        _business_bot_paused = bool(flags & 2048)
+        _business_bot_can_reply = bool(flags & 4096)
+        if flags & 64:
+            _geo_distance = reader.read_int()
+        else:
+            _geo_distance = None
+        if flags & 512:
+            _request_chat_title = reader.tgread_string()
+        else:
+            _request_chat_title = None
+        if flags & 512:
+            _request_chat_date = reader.tgread_date()
+        else:
+            _request_chat_date = None
+        if flags & 8192:
+            _business_bot_id = reader.read_long()
+        else:
+            _business_bot_id = None
+        if flags & 8192:
+            _business_bot_manage_url = reader.tgread_string()
+        else:
+            _business_bot_manage_url = None
+        return cls(report_spam=_report_spam, add_contact=_add_contact, block_contact=_block_contact, share_contact=_share_contact, need_contacts_exception=_need_contacts_exception, report_geo=_report_geo, autoarchived=_autoarchived, invite_members=_invite_members, request_chat_broadcast=_request_chat_broadcast, business_bot_paused=_business_bot_paused, business_bot_can_reply=_business_bot_can_reply, geo_distance=_geo_distance, request_chat_title=_request_chat_title, request_chat_date=_request_chat_date, business_bot_id=_business_bot_id, business_bot_manage_url=_business_bot_manage_url)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        if flags & 64:
+            reader.seek(4)
+        if flags & 512:
+            TLObject.skip_bytes(reader)
+        if flags & 512:
+            reader.seek(4)
+        if flags & 8192:
+            reader.seek(8)
+        if flags & 8192:
+            TLObject.skip_bytes(reader)
+
+
+class PremiumGiftOption(TLObject):
+    CONSTRUCTOR_ID = 0x74c34319
+    SUBCLASS_OF_ID = 0x5182b03e
+
+    __slots__ = ('months', 'currency', 'amount', 'bot_url', 'store_product')
+
+    def __init__(self, months: int, currency: str, amount: int, bot_url: str, store_product: Optional[str]=None):
+        """
+        Constructor for PremiumGiftOption: Instance of PremiumGiftOption.
+        """
+        self.months = months
+        self.currency = currency
+        self.amount = amount
+        self.bot_url = bot_url
+        self.store_product = store_product
+
+    def to_dict(self):
+        return {
+            '_': 'PremiumGiftOption',
+            'months': self.months,
+            'currency': self.currency,
+            'amount': self.amount,
+            'bot_url': self.bot_url,
+            'store_product': self.store_product
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x19C\xc3t',
+            struct.pack('<I', (0 if self.store_product is None or self.store_product is False else 1)),
+            struct.pack('<i', self.months),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.amount),
+            self.serialize_bytes(self.bot_url),
+            b'' if self.store_product is None or self.store_product is False else (self.serialize_bytes(self.store_product)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _months = reader.read_int()
+        _currency = reader.tgread_string()
+        _amount = reader.read_long()
+        _bot_url = reader.tgread_string()
+        if flags & 1:
+            _store_product = reader.tgread_string()
+        else:
+            _store_product = None
+        return cls(months=_months, currency=_currency, amount=_amount, bot_url=_bot_url, store_product=_store_product)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        reader.seek(4)
+        TLObject.skip_bytes(reader)
+        reader.seek(8)
+        TLObject.skip_bytes(reader)
+        if flags & 1:
+            TLObject.skip_bytes(reader)
+
+
+class SavedStarGift(TLObject):
+    CONSTRUCTOR_ID = 0x6056dba5
+    SUBCLASS_OF_ID = 0x8e2b3c14
+
+    __slots__ = ('date', 'gift', 'name_hidden', 'unsaved', 'refunded', 'can_upgrade', 'from_id', 'message', 'msg_id', 'saved_id', 'convert_stars', 'upgrade_stars', 'can_export_at', 'transfer_stars')
+
+    def __init__(self, date: Optional[datetime], gift: 'TypeStarGift', name_hidden: Optional[bool]=None, unsaved: Optional[bool]=None, refunded: Optional[bool]=None, can_upgrade: Optional[bool]=None, from_id: Optional['TypePeer']=None, message: Optional['TypeTextWithEntities']=None, msg_id: Optional[int]=None, saved_id: Optional[int]=None, convert_stars: Optional[int]=None, upgrade_stars: Optional[int]=None, can_export_at: Optional[int]=None, transfer_stars: Optional[int]=None):
+        """
+        Constructor for SavedStarGift: Instance of SavedStarGift.
+        """
+        self.date = date
+        self.gift = gift
+        self.name_hidden = name_hidden
+        self.unsaved = unsaved
+        self.refunded = refunded
+        self.can_upgrade = can_upgrade
+        self.from_id = from_id
+        self.message = message
+        self.msg_id = msg_id
+        self.saved_id = saved_id
+        self.convert_stars = convert_stars
+        self.upgrade_stars = upgrade_stars
+        self.can_export_at = can_export_at
+        self.transfer_stars = transfer_stars
+
+    def to_dict(self):
+        return {
+            '_': 'SavedStarGift',
+            'date': self.date,
+            'gift': self.gift.to_dict() if isinstance(self.gift, TLObject) else self.gift,
+            'name_hidden': self.name_hidden,
+            'unsaved': self.unsaved,
+            'refunded': self.refunded,
+            'can_upgrade': self.can_upgrade,
+            'from_id': self.from_id.to_dict() if isinstance(self.from_id, TLObject) else self.from_id,
+            'message': self.message.to_dict() if isinstance(self.message, TLObject) else self.message,
+            'msg_id': self.msg_id,
+            'saved_id': self.saved_id,
+            'convert_stars': self.convert_stars,
+            'upgrade_stars': self.upgrade_stars,
+            'can_export_at': self.can_export_at,
+            'transfer_stars': self.transfer_stars
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa5\xdbV`',
+            struct.pack('<I', (0 if self.name_hidden is None or self.name_hidden is False else 1) | (0 if self.unsaved is None or self.unsaved is False else 32) | (0 if self.refunded is None or self.refunded is False else 512) | (0 if self.can_upgrade is None or self.can_upgrade is False else 1024) | (0 if self.from_id is None or self.from_id is False else 2) | (0 if self.message is None or self.message is False else 4) | (0 if self.msg_id is None or self.msg_id is False else 8) | (0 if self.saved_id is None or self.saved_id is False else 2048) | (0 if self.convert_stars is None or self.convert_stars is False else 16) | (0 if self.upgrade_stars is None or self.upgrade_stars is False else 64) | (0 if self.can_export_at is None or self.can_export_at is False else 128) | (0 if self.transfer_stars is None or self.transfer_stars is False else 256)),
+            b'' if self.from_id is None or self.from_id is False else (self.from_id._bytes()),
+            self.serialize_datetime(self.date),
+            self.gift._bytes(),
+            b'' if self.message is None or self.message is False else (self.message._bytes()),
+            b'' if self.msg_id is None or self.msg_id is False else (struct.pack('<i', self.msg_id)),
+            b'' if self.saved_id is None or self.saved_id is False else (struct.pack('<q', self.saved_id)),
+            b'' if self.convert_stars is None or self.convert_stars is False else (struct.pack('<q', self.convert_stars)),
+            b'' if self.upgrade_stars is None or self.upgrade_stars is False else (struct.pack('<q', self.upgrade_stars)),
+            b'' if self.can_export_at is None or self.can_export_at is False else (struct.pack('<i', self.can_export_at)),
+            b'' if self.transfer_stars is None or self.transfer_stars is False else (struct.pack('<q', self.transfer_stars)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _name_hidden = bool(flags & 1)
+        _unsaved = bool(flags & 32)
+        _refunded = bool(flags & 512)
+        _can_upgrade = bool(flags & 1024)
+        if flags & 2:
+            _from_id = reader.tgread_object()
+        else:
+            _from_id = None
+        _date = reader.tgread_date()
+        _gift = reader.tgread_object()
+        if flags & 4:
+            _message = reader.tgread_object()
+        else:
+            _message = None
+        if flags & 8:
+            _msg_id = reader.read_int()
+        else:
+            _msg_id = None
+        if flags & 2048:
+            _saved_id = reader.read_long()
+        else:
+            _saved_id = None
+        if flags & 16:
+            _convert_stars = reader.read_long()
+        else:
+            _convert_stars = None
+        if flags & 64:
+            _upgrade_stars = reader.read_long()
+        else:
+            _upgrade_stars = None
+        if flags & 128:
+            _can_export_at = reader.read_int()
+        else:
+            _can_export_at = None
+        if flags & 256:
+            _transfer_stars = reader.read_long()
+        else:
+            _transfer_stars = None
+        return cls(date=_date, gift=_gift, name_hidden=_name_hidden, unsaved=_unsaved, refunded=_refunded, can_upgrade=_can_upgrade, from_id=_from_id, message=_message, msg_id=_msg_id, saved_id=_saved_id, convert_stars=_convert_stars, upgrade_stars=_upgrade_stars, can_export_at=_can_export_at, transfer_stars=_transfer_stars)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        if flags & 2:
+            reader.tgskip_object()
+        reader.seek(4)
+        reader.tgskip_object()
+        if flags & 4:
+            reader.tgskip_object()
+        if flags & 8:
+            reader.seek(4)
+        if flags & 2048:
+            reader.seek(8)
+        if flags & 16:
+            reader.seek(8)
+        if flags & 64:
+            reader.seek(8)
+        if flags & 128:
+            reader.seek(4)
+        if flags & 256:
+            reader.seek(8)
+
+
+class StarsTransaction(TLObject):
+    CONSTRUCTOR_ID = 0x64dfc926
+    SUBCLASS_OF_ID = 0x86884772
+
+    __slots__ = ('id', 'stars', 'date', 'peer', 'refund', 'pending', 'failed', 'gift', 'reaction', 'stargift_upgrade', 'title', 'description', 'photo', 'transaction_date', 'transaction_url', 'bot_payload', 'msg_id', 'extended_media', 'subscription_period', 'giveaway_post_id', 'stargift', 'floodskip_number', 'starref_commission_permille', 'starref_peer', 'starref_amount')
+
+    def __init__(self, id: str, stars: 'TypeStarsAmount', date: Optional[datetime], peer: 'TypeStarsTransactionPeer', refund: Optional[bool]=None, pending: Optional[bool]=None, failed: Optional[bool]=None, gift: Optional[bool]=None, reaction: Optional[bool]=None, stargift_upgrade: Optional[bool]=None, title: Optional[str]=None, description: Optional[str]=None, photo: Optional['TypeWebDocument']=None, transaction_date: Optional[datetime]=None, transaction_url: Optional[str]=None, bot_payload: Optional[bytes]=None, msg_id: Optional[int]=None, extended_media: Optional[List['TypeMessageMedia']]=None, subscription_period: Optional[int]=None, giveaway_post_id: Optional[int]=None, stargift: Optional['TypeStarGift']=None, floodskip_number: Optional[int]=None, starref_commission_permille: Optional[int]=None, starref_peer: Optional['TypePeer']=None, starref_amount: Optional['TypeStarsAmount']=None):
+        """
+        Constructor for StarsTransaction: Instance of StarsTransaction.
+        """
+        self.id = id
+        self.stars = stars
+        self.date = date
+        self.peer = peer
+        self.refund = refund
+        self.pending = pending
+        self.failed = failed
+        self.gift = gift
+        self.reaction = reaction
+        self.stargift_upgrade = stargift_upgrade
+        self.title = title
+        self.description = description
+        self.photo = photo
+        self.transaction_date = transaction_date
+        self.transaction_url = transaction_url
+        self.bot_payload = bot_payload
+        self.msg_id = msg_id
+        self.extended_media = extended_media
+        self.subscription_period = subscription_period
+        self.giveaway_post_id = giveaway_post_id
+        self.stargift = stargift
+        self.floodskip_number = floodskip_number
+        self.starref_commission_permille = starref_commission_permille
+        self.starref_peer = starref_peer
+        self.starref_amount = starref_amount
+
+    def to_dict(self):
+        return {
+            '_': 'StarsTransaction',
+            'id': self.id,
+            'stars': self.stars.to_dict() if isinstance(self.stars, TLObject) else self.stars,
+            'date': self.date,
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'refund': self.refund,
+            'pending': self.pending,
+            'failed': self.failed,
+            'gift': self.gift,
+            'reaction': self.reaction,
+            'stargift_upgrade': self.stargift_upgrade,
+            'title': self.title,
+            'description': self.description,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'transaction_date': self.transaction_date,
+            'transaction_url': self.transaction_url,
+            'bot_payload': self.bot_payload,
+            'msg_id': self.msg_id,
+            'extended_media': [] if self.extended_media is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.extended_media],
+            'subscription_period': self.subscription_period,
+            'giveaway_post_id': self.giveaway_post_id,
+            'stargift': self.stargift.to_dict() if isinstance(self.stargift, TLObject) else self.stargift,
+            'floodskip_number': self.floodskip_number,
+            'starref_commission_permille': self.starref_commission_permille,
+            'starref_peer': self.starref_peer.to_dict() if isinstance(self.starref_peer, TLObject) else self.starref_peer,
+            'starref_amount': self.starref_amount.to_dict() if isinstance(self.starref_amount, TLObject) else self.starref_amount
+        }
+
+    def _bytes(self):
+        assert ((self.transaction_date or self.transaction_date is not None) and (self.transaction_url or self.transaction_url is not None)) or ((self.transaction_date is None or self.transaction_date is False) and (self.transaction_url is None or self.transaction_url is False)), 'transaction_date, transaction_url parameters must all be False-y (like None) or all me True-y'
+        assert ((self.starref_peer or self.starref_peer is not None) and (self.starref_amount or self.starref_amount is not None)) or ((self.starref_peer is None or self.starref_peer is False) and (self.starref_amount is None or self.starref_amount is False)), 'starref_peer, starref_amount parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'&\xc9\xdfd',
+            struct.pack('<I', (0 if self.refund is None or self.refund is False else 8) | (0 if self.pending is None or self.pending is False else 16) | (0 if self.failed is None or self.failed is False else 64) | (0 if self.gift is None or self.gift is False else 1024) | (0 if self.reaction is None or self.reaction is False else 2048) | (0 if self.stargift_upgrade is None or self.stargift_upgrade is False else 262144) | (0 if self.title is None or self.title is False else 1) | (0 if self.description is None or self.description is False else 2) | (0 if self.photo is None or self.photo is False else 4) | (0 if self.transaction_date is None or self.transaction_date is False else 32) | (0 if self.transaction_url is None or self.transaction_url is False else 32) | (0 if self.bot_payload is None or self.bot_payload is False else 128) | (0 if self.msg_id is None or self.msg_id is False else 256) | (0 if self.extended_media is None or self.extended_media is False else 512) | (0 if self.subscription_period is None or self.subscription_period is False else 4096) | (0 if self.giveaway_post_id is None or self.giveaway_post_id is False else 8192) | (0 if self.stargift is None or self.stargift is False else 16384) | (0 if self.floodskip_number is None or self.floodskip_number is False else 32768) | (0 if self.starref_commission_permille is None or self.starref_commission_permille is False else 65536) | (0 if self.starref_peer is None or self.starref_peer is False else 131072) | (0 if self.starref_amount is None or self.starref_amount is False else 131072)),
+            self.serialize_bytes(self.id),
+            self.stars._bytes(),
+            self.serialize_datetime(self.date),
+            self.peer._bytes(),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.description is None or self.description is False else (self.serialize_bytes(self.description)),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            b'' if self.transaction_date is None or self.transaction_date is False else (self.serialize_datetime(self.transaction_date)),
+            b'' if self.transaction_url is None or self.transaction_url is False else (self.serialize_bytes(self.transaction_url)),
+            b'' if self.bot_payload is None or self.bot_payload is False else (self.serialize_bytes(self.bot_payload)),
+            b'' if self.msg_id is None or self.msg_id is False else (struct.pack('<i', self.msg_id)),
+            b'' if self.extended_media is None or self.extended_media is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.extended_media)),b''.join(x._bytes() for x in self.extended_media))),
+            b'' if self.subscription_period is None or self.subscription_period is False else (struct.pack('<i', self.subscription_period)),
+            b'' if self.giveaway_post_id is None or self.giveaway_post_id is False else (struct.pack('<i', self.giveaway_post_id)),
+            b'' if self.stargift is None or self.stargift is False else (self.stargift._bytes()),
+            b'' if self.floodskip_number is None or self.floodskip_number is False else (struct.pack('<i', self.floodskip_number)),
+            b'' if self.starref_commission_permille is None or self.starref_commission_permille is False else (struct.pack('<i', self.starref_commission_permille)),
+            b'' if self.starref_peer is None or self.starref_peer is False else (self.starref_peer._bytes()),
+            b'' if self.starref_amount is None or self.starref_amount is False else (self.starref_amount._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _refund = bool(flags & 8)
+        _pending = bool(flags & 16)
+        _failed = bool(flags & 64)
+        _gift = bool(flags & 1024)
+        _reaction = bool(flags & 2048)
+        _stargift_upgrade = bool(flags & 262144)
+        _id = reader.tgread_string()
+        _stars = reader.tgread_object()
+        _date = reader.tgread_date()
+        _peer = reader.tgread_object()
+        if flags & 1:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 2:
+            _description = reader.tgread_string()
+        else:
+            _description = None
+        if flags & 4:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        if flags & 32:
+            _transaction_date = reader.tgread_date()
+        else:
+            _transaction_date = None
+        if flags & 32:
+            _transaction_url = reader.tgread_string()
+        else:
+            _transaction_url = None
+        if flags & 128:
+            _bot_payload = reader.tgread_bytes()
+        else:
+            _bot_payload = None
+        if flags & 256:
+            _msg_id = reader.read_int()
+        else:
+            _msg_id = None
+        if flags & 512:
+            reader.read_int()
+            _extended_media = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _extended_media.append(_x)
+
+        else:
+            _extended_media = None
+        if flags & 4096:
+            _subscription_period = reader.read_int()
+        else:
+            _subscription_period = None
+        if flags & 8192:
+            _giveaway_post_id = reader.read_int()
+        else:
+            _giveaway_post_id = None
+        if flags & 16384:
+            _stargift = reader.tgread_object()
+        else:
+            _stargift = None
+        if flags & 32768:
+            _floodskip_number = reader.read_int()
+        else:
+            _floodskip_number = None
+        if flags & 65536:
+            _starref_commission_permille = reader.read_int()
+        else:
+            _starref_commission_permille = None
+        if flags & 131072:
+            _starref_peer = reader.tgread_object()
+        else:
+            _starref_peer = None
+        if flags & 131072:
+            _starref_amount = reader.tgread_object()
+        else:
+            _starref_amount = None
+        return cls(id=_id, stars=_stars, date=_date, peer=_peer, refund=_refund, pending=_pending, failed=_failed, gift=_gift, reaction=_reaction, stargift_upgrade=_stargift_upgrade, title=_title, description=_description, photo=_photo, transaction_date=_transaction_date, transaction_url=_transaction_url, bot_payload=_bot_payload, msg_id=_msg_id, extended_media=_extended_media, subscription_period=_subscription_period, giveaway_post_id=_giveaway_post_id, stargift=_stargift, floodskip_number=_floodskip_number, starref_commission_permille=_starref_commission_permille, starref_peer=_starref_peer, starref_amount=_starref_amount)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        TLObject.skip_bytes(reader)
+        reader.tgskip_object()
+        reader.seek(4)
+        reader.tgskip_object()
+        if flags & 1:
+            TLObject.skip_bytes(reader)
+        if flags & 2:
+            TLObject.skip_bytes(reader)
+        if flags & 4:
+            reader.tgskip_object()
+        if flags & 32:
+            reader.seek(4)
+        if flags & 32:
+            TLObject.skip_bytes(reader)
+        if flags & 128:
+            TLObject.skip_bytes(reader)
+        if flags & 256:
+            reader.seek(4)
+        if flags & 512:
+            reader.seek(4)
+            for _ in range(reader.read_int()):
+                reader.tgskip_object()
+        if flags & 4096:
+            reader.seek(4)
+        if flags & 8192:
+            reader.seek(4)
+        if flags & 16384:
+            reader.tgskip_object()
+        if flags & 32768:
+            reader.seek(4)
+        if flags & 65536:
+            reader.seek(4)
+        if flags & 131072:
+            reader.tgskip_object()
+        if flags & 131072:
+            reader.tgskip_object()
+
+
+class User(TLObject):
+    CONSTRUCTOR_ID = 0x4b46c37e
+    SUBCLASS_OF_ID = 0x2da17977
+
+    __slots__ = ('id', 'is_self', 'contact', 'mutual_contact', 'deleted', 'bot', 'bot_chat_history', 'bot_nochats', 'verified', 'restricted', 'min', 'bot_inline_geo', 'support', 'scam', 'apply_min_photo', 'fake', 'bot_attach_menu', 'premium', 'attach_menu_enabled', 'bot_can_edit', 'close_friend', 'stories_hidden', 'stories_unavailable', 'contact_require_premium', 'bot_business', 'bot_has_main_app', 'access_hash', 'first_name', 'last_name', 'username', 'phone', 'photo', 'status', 'bot_info_version', 'restriction_reason', 'bot_inline_placeholder', 'lang_code', 'emoji_status', 'usernames', 'stories_max_id', 'color', 'profile_color', 'bot_active_users', 'bot_verification_icon')
+
+    def __init__(self, id: int, is_self: Optional[bool]=None, contact: Optional[bool]=None, mutual_contact: Optional[bool]=None, deleted: Optional[bool]=None, bot: Optional[bool]=None, bot_chat_history: Optional[bool]=None, bot_nochats: Optional[bool]=None, verified: Optional[bool]=None, restricted: Optional[bool]=None, min: Optional[bool]=None, bot_inline_geo: Optional[bool]=None, support: Optional[bool]=None, scam: Optional[bool]=None, apply_min_photo: Optional[bool]=None, fake: Optional[bool]=None, bot_attach_menu: Optional[bool]=None, premium: Optional[bool]=None, attach_menu_enabled: Optional[bool]=None, bot_can_edit: Optional[bool]=None, close_friend: Optional[bool]=None, stories_hidden: Optional[bool]=None, stories_unavailable: Optional[bool]=None, contact_require_premium: Optional[bool]=None, bot_business: Optional[bool]=None, bot_has_main_app: Optional[bool]=None, access_hash: Optional[int]=None, first_name: Optional[str]=None, last_name: Optional[str]=None, username: Optional[str]=None, phone: Optional[str]=None, photo: Optional['TypeUserProfilePhoto']=None, status: Optional['TypeUserStatus']=None, bot_info_version: Optional[int]=None, restriction_reason: Optional[List['TypeRestrictionReason']]=None, bot_inline_placeholder: Optional[str]=None, lang_code: Optional[str]=None, emoji_status: Optional['TypeEmojiStatus']=None, usernames: Optional[List['TypeUsername']]=None, stories_max_id: Optional[int]=None, color: Optional['TypePeerColor']=None, profile_color: Optional['TypePeerColor']=None, bot_active_users: Optional[int]=None, bot_verification_icon: Optional[int]=None):
+        """
+        Constructor for User: Instance of either UserEmpty, User.
+        """
+        self.id = id
+        self.is_self = is_self
+        self.contact = contact
+        self.mutual_contact = mutual_contact
+        self.deleted = deleted
+        self.bot = bot
+        self.bot_chat_history = bot_chat_history
+        self.bot_nochats = bot_nochats
+        self.verified = verified
+        self.restricted = restricted
+        self.min = min
+        self.bot_inline_geo = bot_inline_geo
+        self.support = support
+        self.scam = scam
+        self.apply_min_photo = apply_min_photo
+        self.fake = fake
+        self.bot_attach_menu = bot_attach_menu
+        self.premium = premium
+        self.attach_menu_enabled = attach_menu_enabled
+        self.bot_can_edit = bot_can_edit
+        self.close_friend = close_friend
+        self.stories_hidden = stories_hidden
+        self.stories_unavailable = stories_unavailable
+        self.contact_require_premium = contact_require_premium
+        self.bot_business = bot_business
+        self.bot_has_main_app = bot_has_main_app
+        self.access_hash = access_hash
+        self.first_name = first_name
+        self.last_name = last_name
+        self.username = username
+        self.phone = phone
+        self.photo = photo
+        self.status = status
+        self.bot_info_version = bot_info_version
+        self.restriction_reason = restriction_reason
+        self.bot_inline_placeholder = bot_inline_placeholder
+        self.lang_code = lang_code
+        self.emoji_status = emoji_status
+        self.usernames = usernames
+        self.stories_max_id = stories_max_id
+        self.color = color
+        self.profile_color = profile_color
+        self.bot_active_users = bot_active_users
+        self.bot_verification_icon = bot_verification_icon
+
+    def to_dict(self):
+        return {
+            '_': 'User',
+            'id': self.id,
+            'is_self': self.is_self,
+            'contact': self.contact,
+            'mutual_contact': self.mutual_contact,
+            'deleted': self.deleted,
+            'bot': self.bot,
+            'bot_chat_history': self.bot_chat_history,
+            'bot_nochats': self.bot_nochats,
+            'verified': self.verified,
+            'restricted': self.restricted,
+            'min': self.min,
+            'bot_inline_geo': self.bot_inline_geo,
+            'support': self.support,
+            'scam': self.scam,
+            'apply_min_photo': self.apply_min_photo,
+            'fake': self.fake,
+            'bot_attach_menu': self.bot_attach_menu,
+            'premium': self.premium,
+            'attach_menu_enabled': self.attach_menu_enabled,
+            'bot_can_edit': self.bot_can_edit,
+            'close_friend': self.close_friend,
+            'stories_hidden': self.stories_hidden,
+            'stories_unavailable': self.stories_unavailable,
+            'contact_require_premium': self.contact_require_premium,
+            'bot_business': self.bot_business,
+            'bot_has_main_app': self.bot_has_main_app,
+            'access_hash': self.access_hash,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'username': self.username,
+            'phone': self.phone,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'status': self.status.to_dict() if isinstance(self.status, TLObject) else self.status,
+            'bot_info_version': self.bot_info_version,
+            'restriction_reason': [] if self.restriction_reason is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.restriction_reason],
+            'bot_inline_placeholder': self.bot_inline_placeholder,
+            'lang_code': self.lang_code,
+            'emoji_status': self.emoji_status.to_dict() if isinstance(self.emoji_status, TLObject) else self.emoji_status,
+            'usernames': [] if self.usernames is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.usernames],
+            'stories_max_id': self.stories_max_id,
+            'color': self.color.to_dict() if isinstance(self.color, TLObject) else self.color,
+            'profile_color': self.profile_color.to_dict() if isinstance(self.profile_color, TLObject) else self.profile_color,
+            'bot_active_users': self.bot_active_users,
+            'bot_verification_icon': self.bot_verification_icon
+        }
+
+    def _bytes(self):
+        assert ((self.bot or self.bot is not None) and (self.bot_info_version or self.bot_info_version is not None)) or ((self.bot is None or self.bot is False) and (self.bot_info_version is None or self.bot_info_version is False)), 'bot, bot_info_version parameters must all be False-y (like None) or all me True-y'
+        assert ((self.restricted or self.restricted is not None) and (self.restriction_reason or self.restriction_reason is not None)) or ((self.restricted is None or self.restricted is False) and (self.restriction_reason is None or self.restriction_reason is False)), 'restricted, restriction_reason parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'~\xc3FK',
+            struct.pack('<I', (0 if self.is_self is None or self.is_self is False else 1024) | (0 if self.contact is None or self.contact is False else 2048) | (0 if self.mutual_contact is None or self.mutual_contact is False else 4096) | (0 if self.deleted is None or self.deleted is False else 8192) | (0 if self.bot is None or self.bot is False else 16384) | (0 if self.bot_chat_history is None or self.bot_chat_history is False else 32768) | (0 if self.bot_nochats is None or self.bot_nochats is False else 65536) | (0 if self.verified is None or self.verified is False else 131072) | (0 if self.restricted is None or self.restricted is False else 262144) | (0 if self.min is None or self.min is False else 1048576) | (0 if self.bot_inline_geo is None or self.bot_inline_geo is False else 2097152) | (0 if self.support is None or self.support is False else 8388608) | (0 if self.scam is None or self.scam is False else 16777216) | (0 if self.apply_min_photo is None or self.apply_min_photo is False else 33554432) | (0 if self.fake is None or self.fake is False else 67108864) | (0 if self.bot_attach_menu is None or self.bot_attach_menu is False else 134217728) | (0 if self.premium is None or self.premium is False else 268435456) | (0 if self.attach_menu_enabled is None or self.attach_menu_enabled is False else 536870912) | (0 if self.access_hash is None or self.access_hash is False else 1) | (0 if self.first_name is None or self.first_name is False else 2) | (0 if self.last_name is None or self.last_name is False else 4) | (0 if self.username is None or self.username is False else 8) | (0 if self.phone is None or self.phone is False else 16) | (0 if self.photo is None or self.photo is False else 32) | (0 if self.status is None or self.status is False else 64) | (0 if self.bot_info_version is None or self.bot_info_version is False else 16384) | (0 if self.restriction_reason is None or self.restriction_reason is False else 262144) | (0 if self.bot_inline_placeholder is None or self.bot_inline_placeholder is False else 524288) | (0 if self.lang_code is None or self.lang_code is False else 4194304) | (0 if self.emoji_status is None or self.emoji_status is False else 1073741824)),
+            struct.pack('<I', (0 if self.bot_can_edit is None or self.bot_can_edit is False else 2) | (0 if self.close_friend is None or self.close_friend is False else 4) | (0 if self.stories_hidden is None or self.stories_hidden is False else 8) | (0 if self.stories_unavailable is None or self.stories_unavailable is False else 16) | (0 if self.contact_require_premium is None or self.contact_require_premium is False else 1024) | (0 if self.bot_business is None or self.bot_business is False else 2048) | (0 if self.bot_has_main_app is None or self.bot_has_main_app is False else 8192) | (0 if self.usernames is None or self.usernames is False else 1) | (0 if self.stories_max_id is None or self.stories_max_id is False else 32) | (0 if self.color is None or self.color is False else 256) | (0 if self.profile_color is None or self.profile_color is False else 512) | (0 if self.bot_active_users is None or self.bot_active_users is False else 4096) | (0 if self.bot_verification_icon is None or self.bot_verification_icon is False else 16384)),
+            struct.pack('<q', self.id),
+            b'' if self.access_hash is None or self.access_hash is False else (struct.pack('<q', self.access_hash)),
+            b'' if self.first_name is None or self.first_name is False else (self.serialize_bytes(self.first_name)),
+            b'' if self.last_name is None or self.last_name is False else (self.serialize_bytes(self.last_name)),
+            b'' if self.username is None or self.username is False else (self.serialize_bytes(self.username)),
+            b'' if self.phone is None or self.phone is False else (self.serialize_bytes(self.phone)),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            b'' if self.status is None or self.status is False else (self.status._bytes()),
+            b'' if self.bot_info_version is None or self.bot_info_version is False else (struct.pack('<i', self.bot_info_version)),
+            b'' if self.restriction_reason is None or self.restriction_reason is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.restriction_reason)),b''.join(x._bytes() for x in self.restriction_reason))),
+            b'' if self.bot_inline_placeholder is None or self.bot_inline_placeholder is False else (self.serialize_bytes(self.bot_inline_placeholder)),
+            b'' if self.lang_code is None or self.lang_code is False else (self.serialize_bytes(self.lang_code)),
+            b'' if self.emoji_status is None or self.emoji_status is False else (self.emoji_status._bytes()),
+            b'' if self.usernames is None or self.usernames is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.usernames)),b''.join(x._bytes() for x in self.usernames))),
+            b'' if self.stories_max_id is None or self.stories_max_id is False else (struct.pack('<i', self.stories_max_id)),
+            b'' if self.color is None or self.color is False else (self.color._bytes()),
+            b'' if self.profile_color is None or self.profile_color is False else (self.profile_color._bytes()),
+            b'' if self.bot_active_users is None or self.bot_active_users is False else (struct.pack('<i', self.bot_active_users)),
+            b'' if self.bot_verification_icon is None or self.bot_verification_icon is False else (struct.pack('<q', self.bot_verification_icon)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _is_self = bool(flags & 1024)
+        _contact = bool(flags & 2048)
+        _mutual_contact = bool(flags & 4096)
+        _deleted = bool(flags & 8192)
+        _bot = bool(flags & 16384)
+        _bot_chat_history = bool(flags & 32768)
+        _bot_nochats = bool(flags & 65536)
+        _verified = bool(flags & 131072)
+        _restricted = bool(flags & 262144)
+        _min = bool(flags & 1048576)
+        _bot_inline_geo = bool(flags & 2097152)
+        _support = bool(flags & 8388608)
+        _scam = bool(flags & 16777216)
+        _apply_min_photo = bool(flags & 33554432)
+        _fake = bool(flags & 67108864)
+        _bot_attach_menu = bool(flags & 134217728)
+        _premium = bool(flags & 268435456)
+        _attach_menu_enabled = bool(flags & 536870912)
+        flags2 = reader.read_int()
+
+        _bot_can_edit = bool(flags2 & 2)
+        _close_friend = bool(flags2 & 4)
+        _stories_hidden = bool(flags2 & 8)
+        _stories_unavailable = bool(flags2 & 16)
+        _contact_require_premium = bool(flags2 & 1024)
+        _bot_business = bool(flags2 & 2048)
+        _bot_has_main_app = bool(flags2 & 8192)
+        _id = reader.read_long()
+        if flags & 1:
+            _access_hash = reader.read_long()
+        else:
+            _access_hash = None
+        if flags & 2:
+            _first_name = reader.tgread_string()
+        else:
+            _first_name = None
+        if flags & 4:
+            _last_name = reader.tgread_string()
+        else:
+            _last_name = None
+        if flags & 8:
+            _username = reader.tgread_string()
+        else:
+            _username = None
+        if flags & 16:
+            _phone = reader.tgread_string()
+        else:
+            _phone = None
+        if flags & 32:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        if flags & 64:
+            _status = reader.tgread_object()
+        else:
+            _status = None
+        if flags & 16384:
+            _bot_info_version = reader.read_int()
+        else:
+            _bot_info_version = None
+        if flags & 262144:
+            reader.read_int()
+            _restriction_reason = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _restriction_reason.append(_x)
+
+        else:
+            _restriction_reason = None
+        if flags & 524288:
+            _bot_inline_placeholder = reader.tgread_string()
+        else:
+            _bot_inline_placeholder = None
+        if flags & 4194304:
+            _lang_code = reader.tgread_string()
+        else:
+            _lang_code = None
+        if flags & 1073741824:
+            _emoji_status = reader.tgread_object()
+        else:
+            _emoji_status = None
+        if flags2 & 1:
+            reader.read_int()
+            _usernames = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _usernames.append(_x)
+
+        else:
+            _usernames = None
+        if flags2 & 32:
+            _stories_max_id = reader.read_int()
+        else:
+            _stories_max_id = None
+        if flags2 & 256:
+            _color = reader.tgread_object()
+        else:
+            _color = None
+        if flags2 & 512:
+            _profile_color = reader.tgread_object()
+        else:
+            _profile_color = None
+        if flags2 & 4096:
+            _bot_active_users = reader.read_int()
+        else:
+            _bot_active_users = None
+        if flags2 & 16384:
+            _bot_verification_icon = reader.read_long()
+        else:
+            _bot_verification_icon = None
+        return cls(id=_id, is_self=_is_self, contact=_contact, mutual_contact=_mutual_contact, deleted=_deleted, bot=_bot, bot_chat_history=_bot_chat_history, bot_nochats=_bot_nochats, verified=_verified, restricted=_restricted, min=_min, bot_inline_geo=_bot_inline_geo, support=_support, scam=_scam, apply_min_photo=_apply_min_photo, fake=_fake, bot_attach_menu=_bot_attach_menu, premium=_premium, attach_menu_enabled=_attach_menu_enabled, bot_can_edit=_bot_can_edit, close_friend=_close_friend, stories_hidden=_stories_hidden, stories_unavailable=_stories_unavailable, contact_require_premium=_contact_require_premium, bot_business=_bot_business, bot_has_main_app=_bot_has_main_app, access_hash=_access_hash, first_name=_first_name, last_name=_last_name, username=_username, phone=_phone, photo=_photo, status=_status, bot_info_version=_bot_info_version, restriction_reason=_restriction_reason, bot_inline_placeholder=_bot_inline_placeholder, lang_code=_lang_code, emoji_status=_emoji_status, usernames=_usernames, stories_max_id=_stories_max_id, color=_color, profile_color=_profile_color, bot_active_users=_bot_active_users, bot_verification_icon=_bot_verification_icon)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        flags2 = reader.read_int()
+        reader.seek(8)
+        if flags & 1:
+            reader.seek(8)
+        if flags & 2:
+            TLObject.skip_bytes(reader)
+        if flags & 4:
+            TLObject.skip_bytes(reader)
+        if flags & 8:
+            TLObject.skip_bytes(reader)
+        if flags & 16:
+            TLObject.skip_bytes(reader)
+        if flags & 32:
+            reader.tgskip_object()
+        if flags & 64:
+            reader.tgskip_object()
+        if flags & 16384:
+            reader.seek(4)
+        if flags & 262144:
+            reader.seek(4)
+            for _ in range(reader.read_int()):
+                reader.tgskip_object()
+        if flags & 524288:
+            TLObject.skip_bytes(reader)
+        if flags & 4194304:
+            TLObject.skip_bytes(reader)
+        if flags & 1073741824:
+            reader.tgskip_object()
+        if flags2 & 1:
+            reader.seek(4)
+            for _ in range(reader.read_int()):
+                reader.tgskip_object()
+        if flags2 & 32:
+            reader.seek(4)
+        if flags2 & 256:
+            reader.tgskip_object()
+        if flags2 & 512:
+            reader.tgskip_object()
+        if flags2 & 4096:
+            reader.seek(4)
+        if flags2 & 16384:
+            reader.seek(8)
+
+
+class UserFull(TLObject):
+    CONSTRUCTOR_ID = 0x4d975bbc
+    SUBCLASS_OF_ID = 0x1f4661b9
+
+    __slots__ = ('id', 'settings', 'notify_settings', 'common_chats_count', 'blocked', 'phone_calls_available', 'phone_calls_private', 'can_pin_message', 'has_scheduled', 'video_calls_available', 'voice_messages_forbidden', 'translations_disabled', 'stories_pinned_available', 'blocked_my_stories_from', 'wallpaper_overridden', 'contact_require_premium', 'read_dates_private', 'sponsored_enabled', 'can_view_revenue', 'bot_can_manage_emoji_status', 'about', 'personal_photo', 'profile_photo', 'fallback_photo', 'bot_info', 'pinned_msg_id', 'folder_id', 'ttl_period', 'theme_emoticon', 'private_forward_name', 'bot_group_admin_rights', 'bot_broadcast_admin_rights', 'premium_gifts', 'wallpaper', 'stories', 'business_work_hours', 'business_location', 'business_greeting_message', 'business_away_message', 'business_intro', 'birthday', 'personal_channel_id', 'personal_channel_message', 'stargifts_count', 'starref_program', 'bot_verification')
+
+    def __init__(self, id: int, settings: 'TypePeerSettings', notify_settings: 'TypePeerNotifySettings', common_chats_count: int, blocked: Optional[bool]=None, phone_calls_available: Optional[bool]=None, phone_calls_private: Optional[bool]=None, can_pin_message: Optional[bool]=None, has_scheduled: Optional[bool]=None, video_calls_available: Optional[bool]=None, voice_messages_forbidden: Optional[bool]=None, translations_disabled: Optional[bool]=None, stories_pinned_available: Optional[bool]=None, blocked_my_stories_from: Optional[bool]=None, wallpaper_overridden: Optional[bool]=None, contact_require_premium: Optional[bool]=None, read_dates_private: Optional[bool]=None, sponsored_enabled: Optional[bool]=None, can_view_revenue: Optional[bool]=None, bot_can_manage_emoji_status: Optional[bool]=None, about: Optional[str]=None, personal_photo: Optional['TypePhoto']=None, profile_photo: Optional['TypePhoto']=None, fallback_photo: Optional['TypePhoto']=None, bot_info: Optional['TypeBotInfo']=None, pinned_msg_id: Optional[int]=None, folder_id: Optional[int]=None, ttl_period: Optional[int]=None, theme_emoticon: Optional[str]=None, private_forward_name: Optional[str]=None, bot_group_admin_rights: Optional['TypeChatAdminRights']=None, bot_broadcast_admin_rights: Optional['TypeChatAdminRights']=None, premium_gifts: Optional[List['TypePremiumGiftOption']]=None, wallpaper: Optional['TypeWallPaper']=None, stories: Optional['TypePeerStories']=None, business_work_hours: Optional['TypeBusinessWorkHours']=None, business_location: Optional['TypeBusinessLocation']=None, business_greeting_message: Optional['TypeBusinessGreetingMessage']=None, business_away_message: Optional['TypeBusinessAwayMessage']=None, business_intro: Optional['TypeBusinessIntro']=None, birthday: Optional['TypeBirthday']=None, personal_channel_id: Optional[int]=None, personal_channel_message: Optional[int]=None, stargifts_count: Optional[int]=None, starref_program: Optional['TypeStarRefProgram']=None, bot_verification: Optional['TypeBotVerification']=None):
+        """
+        Constructor for UserFull: Instance of UserFull.
+        """
+        self.id = id
+        self.settings = settings
+        self.notify_settings = notify_settings
+        self.common_chats_count = common_chats_count
+        self.blocked = blocked
+        self.phone_calls_available = phone_calls_available
+        self.phone_calls_private = phone_calls_private
+        self.can_pin_message = can_pin_message
+        self.has_scheduled = has_scheduled
+        self.video_calls_available = video_calls_available
+        self.voice_messages_forbidden = voice_messages_forbidden
+        self.translations_disabled = translations_disabled
+        self.stories_pinned_available = stories_pinned_available
+        self.blocked_my_stories_from = blocked_my_stories_from
+        self.wallpaper_overridden = wallpaper_overridden
+        self.contact_require_premium = contact_require_premium
+        self.read_dates_private = read_dates_private
+        self.sponsored_enabled = sponsored_enabled
+        self.can_view_revenue = can_view_revenue
+        self.bot_can_manage_emoji_status = bot_can_manage_emoji_status
+        self.about = about
+        self.personal_photo = personal_photo
+        self.profile_photo = profile_photo
+        self.fallback_photo = fallback_photo
+        self.bot_info = bot_info
+        self.pinned_msg_id = pinned_msg_id
+        self.folder_id = folder_id
+        self.ttl_period = ttl_period
+        self.theme_emoticon = theme_emoticon
+        self.private_forward_name = private_forward_name
+        self.bot_group_admin_rights = bot_group_admin_rights
+        self.bot_broadcast_admin_rights = bot_broadcast_admin_rights
+        self.premium_gifts = premium_gifts
+        self.wallpaper = wallpaper
+        self.stories = stories
+        self.business_work_hours = business_work_hours
+        self.business_location = business_location
+        self.business_greeting_message = business_greeting_message
+        self.business_away_message = business_away_message
+        self.business_intro = business_intro
+        self.birthday = birthday
+        self.personal_channel_id = personal_channel_id
+        self.personal_channel_message = personal_channel_message
+        self.stargifts_count = stargifts_count
+        self.starref_program = starref_program
+        self.bot_verification = bot_verification
+
+    def to_dict(self):
+        return {
+            '_': 'UserFull',
+            'id': self.id,
+            'settings': self.settings.to_dict() if isinstance(self.settings, TLObject) else self.settings,
+            'notify_settings': self.notify_settings.to_dict() if isinstance(self.notify_settings, TLObject) else self.notify_settings,
+            'common_chats_count': self.common_chats_count,
+            'blocked': self.blocked,
+            'phone_calls_available': self.phone_calls_available,
+            'phone_calls_private': self.phone_calls_private,
+            'can_pin_message': self.can_pin_message,
+            'has_scheduled': self.has_scheduled,
+            'video_calls_available': self.video_calls_available,
+            'voice_messages_forbidden': self.voice_messages_forbidden,
+            'translations_disabled': self.translations_disabled,
+            'stories_pinned_available': self.stories_pinned_available,
+            'blocked_my_stories_from': self.blocked_my_stories_from,
+            'wallpaper_overridden': self.wallpaper_overridden,
+            'contact_require_premium': self.contact_require_premium,
+            'read_dates_private': self.read_dates_private,
+            'sponsored_enabled': self.sponsored_enabled,
+            'can_view_revenue': self.can_view_revenue,
+            'bot_can_manage_emoji_status': self.bot_can_manage_emoji_status,
+            'about': self.about,
+            'personal_photo': self.personal_photo.to_dict() if isinstance(self.personal_photo, TLObject) else self.personal_photo,
+            'profile_photo': self.profile_photo.to_dict() if isinstance(self.profile_photo, TLObject) else self.profile_photo,
+            'fallback_photo': self.fallback_photo.to_dict() if isinstance(self.fallback_photo, TLObject) else self.fallback_photo,
+            'bot_info': self.bot_info.to_dict() if isinstance(self.bot_info, TLObject) else self.bot_info,
+            'pinned_msg_id': self.pinned_msg_id,
+            'folder_id': self.folder_id,
+            'ttl_period': self.ttl_period,
+            'theme_emoticon': self.theme_emoticon,
+            'private_forward_name': self.private_forward_name,
+            'bot_group_admin_rights': self.bot_group_admin_rights.to_dict() if isinstance(self.bot_group_admin_rights, TLObject) else self.bot_group_admin_rights,
+            'bot_broadcast_admin_rights': self.bot_broadcast_admin_rights.to_dict() if isinstance(self.bot_broadcast_admin_rights, TLObject) else self.bot_broadcast_admin_rights,
+            'premium_gifts': [] if self.premium_gifts is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.premium_gifts],
+            'wallpaper': self.wallpaper.to_dict() if isinstance(self.wallpaper, TLObject) else self.wallpaper,
+            'stories': self.stories.to_dict() if isinstance(self.stories, TLObject) else self.stories,
+            'business_work_hours': self.business_work_hours.to_dict() if isinstance(self.business_work_hours, TLObject) else self.business_work_hours,
+            'business_location': self.business_location.to_dict() if isinstance(self.business_location, TLObject) else self.business_location,
+            'business_greeting_message': self.business_greeting_message.to_dict() if isinstance(self.business_greeting_message, TLObject) else self.business_greeting_message,
+            'business_away_message': self.business_away_message.to_dict() if isinstance(self.business_away_message, TLObject) else self.business_away_message,
+            'business_intro': self.business_intro.to_dict() if isinstance(self.business_intro, TLObject) else self.business_intro,
+            'birthday': self.birthday.to_dict() if isinstance(self.birthday, TLObject) else self.birthday,
+            'personal_channel_id': self.personal_channel_id,
+            'personal_channel_message': self.personal_channel_message,
+            'stargifts_count': self.stargifts_count,
+            'starref_program': self.starref_program.to_dict() if isinstance(self.starref_program, TLObject) else self.starref_program,
+            'bot_verification': self.bot_verification.to_dict() if isinstance(self.bot_verification, TLObject) else self.bot_verification
+        }
+
+    def _bytes(self):
+        assert ((self.personal_channel_id or self.personal_channel_id is not None) and (self.personal_channel_message or self.personal_channel_message is not None)) or ((self.personal_channel_id is None or self.personal_channel_id is False) and (self.personal_channel_message is None or self.personal_channel_message is False)), 'personal_channel_id, personal_channel_message parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xbc[\x97M',
+            struct.pack('<I', (0 if self.blocked is None or self.blocked is False else 1) | (0 if self.phone_calls_available is None or self.phone_calls_available is False else 16) | (0 if self.phone_calls_private is None or self.phone_calls_private is False else 32) | (0 if self.can_pin_message is None or self.can_pin_message is False else 128) | (0 if self.has_scheduled is None or self.has_scheduled is False else 4096) | (0 if self.video_calls_available is None or self.video_calls_available is False else 8192) | (0 if self.voice_messages_forbidden is None or self.voice_messages_forbidden is False else 1048576) | (0 if self.translations_disabled is None or self.translations_disabled is False else 8388608) | (0 if self.stories_pinned_available is None or self.stories_pinned_available is False else 67108864) | (0 if self.blocked_my_stories_from is None or self.blocked_my_stories_from is False else 134217728) | (0 if self.wallpaper_overridden is None or self.wallpaper_overridden is False else 268435456) | (0 if self.contact_require_premium is None or self.contact_require_premium is False else 536870912) | (0 if self.read_dates_private is None or self.read_dates_private is False else 1073741824) | (0 if self.about is None or self.about is False else 2) | (0 if self.personal_photo is None or self.personal_photo is False else 2097152) | (0 if self.profile_photo is None or self.profile_photo is False else 4) | (0 if self.fallback_photo is None or self.fallback_photo is False else 4194304) | (0 if self.bot_info is None or self.bot_info is False else 8) | (0 if self.pinned_msg_id is None or self.pinned_msg_id is False else 64) | (0 if self.folder_id is None or self.folder_id is False else 2048) | (0 if self.ttl_period is None or self.ttl_period is False else 16384) | (0 if self.theme_emoticon is None or self.theme_emoticon is False else 32768) | (0 if self.private_forward_name is None or self.private_forward_name is False else 65536) | (0 if self.bot_group_admin_rights is None or self.bot_group_admin_rights is False else 131072) | (0 if self.bot_broadcast_admin_rights is None or self.bot_broadcast_admin_rights is False else 262144) | (0 if self.premium_gifts is None or self.premium_gifts is False else 524288) | (0 if self.wallpaper is None or self.wallpaper is False else 16777216) | (0 if self.stories is None or self.stories is False else 33554432)),
+            struct.pack('<I', (0 if self.sponsored_enabled is None or self.sponsored_enabled is False else 128) | (0 if self.can_view_revenue is None or self.can_view_revenue is False else 512) | (0 if self.bot_can_manage_emoji_status is None or self.bot_can_manage_emoji_status is False else 1024) | (0 if self.business_work_hours is None or self.business_work_hours is False else 1) | (0 if self.business_location is None or self.business_location is False else 2) | (0 if self.business_greeting_message is None or self.business_greeting_message is False else 4) | (0 if self.business_away_message is None or self.business_away_message is False else 8) | (0 if self.business_intro is None or self.business_intro is False else 16) | (0 if self.birthday is None or self.birthday is False else 32) | (0 if self.personal_channel_id is None or self.personal_channel_id is False else 64) | (0 if self.personal_channel_message is None or self.personal_channel_message is False else 64) | (0 if self.stargifts_count is None or self.stargifts_count is False else 256) | (0 if self.starref_program is None or self.starref_program is False else 2048) | (0 if self.bot_verification is None or self.bot_verification is False else 4096)),
+            struct.pack('<q', self.id),
+            b'' if self.about is None or self.about is False else (self.serialize_bytes(self.about)),
+            self.settings._bytes(),
+            b'' if self.personal_photo is None or self.personal_photo is False else (self.personal_photo._bytes()),
+            b'' if self.profile_photo is None or self.profile_photo is False else (self.profile_photo._bytes()),
+            b'' if self.fallback_photo is None or self.fallback_photo is False else (self.fallback_photo._bytes()),
+            self.notify_settings._bytes(),
+            b'' if self.bot_info is None or self.bot_info is False else (self.bot_info._bytes()),
+            b'' if self.pinned_msg_id is None or self.pinned_msg_id is False else (struct.pack('<i', self.pinned_msg_id)),
+            struct.pack('<i', self.common_chats_count),
+            b'' if self.folder_id is None or self.folder_id is False else (struct.pack('<i', self.folder_id)),
+            b'' if self.ttl_period is None or self.ttl_period is False else (struct.pack('<i', self.ttl_period)),
+            b'' if self.theme_emoticon is None or self.theme_emoticon is False else (self.serialize_bytes(self.theme_emoticon)),
+            b'' if self.private_forward_name is None or self.private_forward_name is False else (self.serialize_bytes(self.private_forward_name)),
+            b'' if self.bot_group_admin_rights is None or self.bot_group_admin_rights is False else (self.bot_group_admin_rights._bytes()),
+            b'' if self.bot_broadcast_admin_rights is None or self.bot_broadcast_admin_rights is False else (self.bot_broadcast_admin_rights._bytes()),
+            b'' if self.premium_gifts is None or self.premium_gifts is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.premium_gifts)),b''.join(x._bytes() for x in self.premium_gifts))),
+            b'' if self.wallpaper is None or self.wallpaper is False else (self.wallpaper._bytes()),
+            b'' if self.stories is None or self.stories is False else (self.stories._bytes()),
+            b'' if self.business_work_hours is None or self.business_work_hours is False else (self.business_work_hours._bytes()),
+            b'' if self.business_location is None or self.business_location is False else (self.business_location._bytes()),
+            b'' if self.business_greeting_message is None or self.business_greeting_message is False else (self.business_greeting_message._bytes()),
+            b'' if self.business_away_message is None or self.business_away_message is False else (self.business_away_message._bytes()),
+            b'' if self.business_intro is None or self.business_intro is False else (self.business_intro._bytes()),
+            b'' if self.birthday is None or self.birthday is False else (self.birthday._bytes()),
+            b'' if self.personal_channel_id is None or self.personal_channel_id is False else (struct.pack('<q', self.personal_channel_id)),
+            b'' if self.personal_channel_message is None or self.personal_channel_message is False else (struct.pack('<i', self.personal_channel_message)),
+            b'' if self.stargifts_count is None or self.stargifts_count is False else (struct.pack('<i', self.stargifts_count)),
+            b'' if self.starref_program is None or self.starref_program is False else (self.starref_program._bytes()),
+            b'' if self.bot_verification is None or self.bot_verification is False else (self.bot_verification._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _blocked = bool(flags & 1)
+        _phone_calls_available = bool(flags & 16)
+        _phone_calls_private = bool(flags & 32)
+        _can_pin_message = bool(flags & 128)
+        _has_scheduled = bool(flags & 4096)
+        _video_calls_available = bool(flags & 8192)
+        _voice_messages_forbidden = bool(flags & 1048576)
+        _translations_disabled = bool(flags & 8388608)
+        _stories_pinned_available = bool(flags & 67108864)
+        _blocked_my_stories_from = bool(flags & 134217728)
+        _wallpaper_overridden = bool(flags & 268435456)
+        _contact_require_premium = bool(flags & 536870912)
+        _read_dates_private = bool(flags & 1073741824)
+        flags2 = reader.read_int()
+
+        _sponsored_enabled = bool(flags2 & 128)
+        _can_view_revenue = bool(flags2 & 512)
+        _bot_can_manage_emoji_status = bool(flags2 & 1024)
+        _id = reader.read_long()
+        if flags & 2:
+            _about = reader.tgread_string()
+        else:
+            _about = None
+        _settings = reader.tgread_object()
+        if flags & 2097152:
+            _personal_photo = reader.tgread_object()
+        else:
+            _personal_photo = None
+        if flags & 4:
+            _profile_photo = reader.tgread_object()
+        else:
+            _profile_photo = None
+        if flags & 4194304:
+            _fallback_photo = reader.tgread_object()
+        else:
+            _fallback_photo = None
+        _notify_settings = reader.tgread_object()
+        if flags & 8:
+            _bot_info = reader.tgread_object()
+        else:
+            _bot_info = None
+        if flags & 64:
+            _pinned_msg_id = reader.read_int()
+        else:
+            _pinned_msg_id = None
+        _common_chats_count = reader.read_int()
+        if flags & 2048:
+            _folder_id = reader.read_int()
+        else:
+            _folder_id = None
+        if flags & 16384:
+            _ttl_period = reader.read_int()
+        else:
+            _ttl_period = None
+        if flags & 32768:
+            _theme_emoticon = reader.tgread_string()
+        else:
+            _theme_emoticon = None
+        if flags & 65536:
+            _private_forward_name = reader.tgread_string()
+        else:
+            _private_forward_name = None
+        if flags & 131072:
+            _bot_group_admin_rights = reader.tgread_object()
+        else:
+            _bot_group_admin_rights = None
+        if flags & 262144:
+            _bot_broadcast_admin_rights = reader.tgread_object()
+        else:
+            _bot_broadcast_admin_rights = None
+        if flags & 524288:
+            reader.read_int()
+            _premium_gifts = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _premium_gifts.append(_x)
+
+        else:
+            _premium_gifts = None
+        if flags & 16777216:
+            _wallpaper = reader.tgread_object()
+        else:
+            _wallpaper = None
+        if flags & 33554432:
+            _stories = reader.tgread_object()
+        else:
+            _stories = None
+        if flags2 & 1:
+            _business_work_hours = reader.tgread_object()
+        else:
+            _business_work_hours = None
+        if flags2 & 2:
+            _business_location = reader.tgread_object()
+        else:
+            _business_location = None
+        if flags2 & 4:
+            _business_greeting_message = reader.tgread_object()
+        else:
+            _business_greeting_message = None
+        if flags2 & 8:
+            _business_away_message = reader.tgread_object()
+        else:
+            _business_away_message = None
+        if flags2 & 16:
+            _business_intro = reader.tgread_object()
+        else:
+            _business_intro = None
+        if flags2 & 32:
+            _birthday = reader.tgread_object()
+        else:
+            _birthday = None
+        if flags2 & 64:
+            _personal_channel_id = reader.read_long()
+        else:
+            _personal_channel_id = None
+        if flags2 & 64:
+            _personal_channel_message = reader.read_int()
+        else:
+            _personal_channel_message = None
+        if flags2 & 256:
+            _stargifts_count = reader.read_int()
+        else:
+            _stargifts_count = None
+        if flags2 & 2048:
+            _starref_program = reader.tgread_object()
+        else:
+            _starref_program = None
+        if flags2 & 4096:
+            _bot_verification = reader.tgread_object()
+        else:
+            _bot_verification = None
+        return cls(id=_id, settings=_settings, notify_settings=_notify_settings, common_chats_count=_common_chats_count, blocked=_blocked, phone_calls_available=_phone_calls_available, phone_calls_private=_phone_calls_private, can_pin_message=_can_pin_message, has_scheduled=_has_scheduled, video_calls_available=_video_calls_available, voice_messages_forbidden=_voice_messages_forbidden, translations_disabled=_translations_disabled, stories_pinned_available=_stories_pinned_available, blocked_my_stories_from=_blocked_my_stories_from, wallpaper_overridden=_wallpaper_overridden, contact_require_premium=_contact_require_premium, read_dates_private=_read_dates_private, sponsored_enabled=_sponsored_enabled, can_view_revenue=_can_view_revenue, bot_can_manage_emoji_status=_bot_can_manage_emoji_status, about=_about, personal_photo=_personal_photo, profile_photo=_profile_photo, fallback_photo=_fallback_photo, bot_info=_bot_info, pinned_msg_id=_pinned_msg_id, folder_id=_folder_id, ttl_period=_ttl_period, theme_emoticon=_theme_emoticon, private_forward_name=_private_forward_name, bot_group_admin_rights=_bot_group_admin_rights, bot_broadcast_admin_rights=_bot_broadcast_admin_rights, premium_gifts=_premium_gifts, wallpaper=_wallpaper, stories=_stories, business_work_hours=_business_work_hours, business_location=_business_location, business_greeting_message=_business_greeting_message, business_away_message=_business_away_message, business_intro=_business_intro, birthday=_birthday, personal_channel_id=_personal_channel_id, personal_channel_message=_personal_channel_message, stargifts_count=_stargifts_count, starref_program=_starref_program, bot_verification=_bot_verification)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        flags2 = reader.read_int()
+        reader.seek(8)
+        if flags & 2:
+            TLObject.skip_bytes(reader)
+        reader.tgskip_object()
+        if flags & 2097152:
+            reader.tgskip_object()
+        if flags & 4:
+            reader.tgskip_object()
+        if flags & 4194304:
+            reader.tgskip_object()
+        reader.tgskip_object()
+        if flags & 8:
+            reader.tgskip_object()
+        if flags & 64:
+            reader.seek(4)
+        reader.seek(4)
+        if flags & 2048:
+            reader.seek(4)
+        if flags & 16384:
+            reader.seek(4)
+        if flags & 32768:
+            TLObject.skip_bytes(reader)
+        if flags & 65536:
+            TLObject.skip_bytes(reader)
+        if flags & 131072:
+            reader.tgskip_object()
+        if flags & 262144:
+            reader.tgskip_object()
+        if flags & 524288:
+            reader.seek(4)
+            for _ in range(reader.read_int()):
+                reader.tgskip_object()
+        if flags & 16777216:
+            reader.tgskip_object()
+        if flags & 33554432:
+            reader.tgskip_object()
+        if flags2 & 1:
+            reader.tgskip_object()
+        if flags2 & 2:
+            reader.tgskip_object()
+        if flags2 & 4:
+            reader.tgskip_object()
+        if flags2 & 8:
+            reader.tgskip_object()
+        if flags2 & 16:
+            reader.tgskip_object()
+        if flags2 & 32:
+            reader.tgskip_object()
+        if flags2 & 64:
+            reader.seek(8)
+        if flags2 & 64:
+            reader.seek(4)
+        if flags2 & 256:
+            reader.seek(4)
+        if flags2 & 2048:
+            reader.tgskip_object()
+        if flags2 & 4096:
+            reader.tgskip_object()
+
+TypeAccessPointRule = AccessPointRule
+TypeAccountDaysTTL = AccountDaysTTL
+TypeAttachMenuBot = AttachMenuBot
+TypeAttachMenuBotIcon = AttachMenuBotIcon
+TypeAttachMenuBotIconColor = AttachMenuBotIconColor
+TypeAttachMenuBots = Union[AttachMenuBotsNotModified,AttachMenuBots]
+TypeAttachMenuBotsBot = AttachMenuBotsBot
+TypeAttachMenuPeerType = Union[AttachMenuPeerTypeSameBotPM,AttachMenuPeerTypeBotPM,AttachMenuPeerTypePM,AttachMenuPeerTypeChat,AttachMenuPeerTypeBroadcast]
+TypeAuthorization = Authorization
+TypeAutoDownloadSettings = AutoDownloadSettings
+TypeAutoSaveException = AutoSaveException
+TypeAutoSaveSettings = AutoSaveSettings
+TypeAvailableEffect = AvailableEffect
+TypeAvailableReaction = AvailableReaction
+TypeBadMsgNotification = Union[BadMsgNotification,BadServerSalt]
+TypeBankCardOpenUrl = BankCardOpenUrl
+TypeBaseTheme = Union[BaseThemeClassic,BaseThemeDay,BaseThemeNight,BaseThemeTinted,BaseThemeArctic]
+TypeBindAuthKeyInner = BindAuthKeyInner
+TypeBirthday = Birthday
+TypeBoost = Boost
+TypeBotApp = Union[BotAppNotModified,BotApp]
+TypeBotAppSettings = BotAppSettings
+TypeBotBusinessConnection = BotBusinessConnection
+TypeBotCommand = BotCommand
+TypeBotCommandScope = Union[BotCommandScopeDefault,BotCommandScopeUsers,BotCommandScopeChats,BotCommandScopeChatAdmins,BotCommandScopePeer,BotCommandScopePeerAdmins,BotCommandScopePeerUser]
+TypeBotInfo = BotInfo
+TypeBotInlineResult = Union[BotInlineResult,BotInlineMediaResult]
+TypeBotInlineMessage = Union[BotInlineMessageMediaAuto,BotInlineMessageText,BotInlineMessageMediaGeo,BotInlineMessageMediaVenue,BotInlineMessageMediaContact,BotInlineMessageMediaInvoice,BotInlineMessageMediaWebPage]
+TypeBotMenuButton = Union[BotMenuButtonDefault,BotMenuButtonCommands,BotMenuButton]
+TypeBotPreviewMedia = BotPreviewMedia
+TypeBotVerification = BotVerification
+TypeBotVerifierSettings = BotVerifierSettings
+TypeBroadcastRevenueBalances = BroadcastRevenueBalances
+TypeBroadcastRevenueTransaction = Union[BroadcastRevenueTransactionProceeds,BroadcastRevenueTransactionWithdrawal,BroadcastRevenueTransactionRefund]
+TypeBusinessAwayMessage = BusinessAwayMessage
+TypeBusinessAwayMessageSchedule = Union[BusinessAwayMessageScheduleAlways,BusinessAwayMessageScheduleOutsideWorkHours,BusinessAwayMessageScheduleCustom]
+TypeBusinessBotRecipients = BusinessBotRecipients
+TypeBusinessChatLink = BusinessChatLink
+TypeBusinessGreetingMessage = BusinessGreetingMessage
+TypeBusinessIntro = BusinessIntro
+TypeBusinessLocation = BusinessLocation
+TypeBusinessRecipients = BusinessRecipients
+TypeBusinessWeeklyOpen = BusinessWeeklyOpen
+TypeBusinessWorkHours = BusinessWorkHours
+TypeCdnConfig = CdnConfig
+TypeCdnPublicKey = CdnPublicKey
+TypeChat = Union[ChatEmpty,Chat,ChatForbidden,Channel,ChannelForbidden]
+TypeChannelAdminLogEvent = ChannelAdminLogEvent
+TypeChannelAdminLogEventAction = Union[ChannelAdminLogEventActionChangeTitle,ChannelAdminLogEventActionChangeAbout,ChannelAdminLogEventActionChangeUsername,ChannelAdminLogEventActionChangePhoto,ChannelAdminLogEventActionToggleInvites,ChannelAdminLogEventActionToggleSignatures,ChannelAdminLogEventActionUpdatePinned,ChannelAdminLogEventActionEditMessage,ChannelAdminLogEventActionDeleteMessage,ChannelAdminLogEventActionParticipantJoin,ChannelAdminLogEventActionParticipantLeave,ChannelAdminLogEventActionParticipantInvite,ChannelAdminLogEventActionParticipantToggleBan,ChannelAdminLogEventActionParticipantToggleAdmin,ChannelAdminLogEventActionChangeStickerSet,ChannelAdminLogEventActionTogglePreHistoryHidden,ChannelAdminLogEventActionDefaultBannedRights,ChannelAdminLogEventActionStopPoll,ChannelAdminLogEventActionChangeLinkedChat,ChannelAdminLogEventActionChangeLocation,ChannelAdminLogEventActionToggleSlowMode,ChannelAdminLogEventActionStartGroupCall,ChannelAdminLogEventActionDiscardGroupCall,ChannelAdminLogEventActionParticipantMute,ChannelAdminLogEventActionParticipantUnmute,ChannelAdminLogEventActionToggleGroupCallSetting,ChannelAdminLogEventActionParticipantJoinByInvite,ChannelAdminLogEventActionExportedInviteDelete,ChannelAdminLogEventActionExportedInviteRevoke,ChannelAdminLogEventActionExportedInviteEdit,ChannelAdminLogEventActionParticipantVolume,ChannelAdminLogEventActionChangeHistoryTTL,ChannelAdminLogEventActionParticipantJoinByRequest,ChannelAdminLogEventActionToggleNoForwards,ChannelAdminLogEventActionSendMessage,ChannelAdminLogEventActionChangeAvailableReactions,ChannelAdminLogEventActionChangeUsernames,ChannelAdminLogEventActionToggleForum,ChannelAdminLogEventActionCreateTopic,ChannelAdminLogEventActionEditTopic,ChannelAdminLogEventActionDeleteTopic,ChannelAdminLogEventActionPinTopic,ChannelAdminLogEventActionToggleAntiSpam,ChannelAdminLogEventActionChangePeerColor,ChannelAdminLogEventActionChangeProfilePeerColor,ChannelAdminLogEventActionChangeWallpaper,ChannelAdminLogEventActionChangeEmojiStatus,ChannelAdminLogEventActionChangeEmojiStickerSet,ChannelAdminLogEventActionToggleSignatureProfiles,ChannelAdminLogEventActionParticipantSubExtend]
+TypeChannelAdminLogEventsFilter = ChannelAdminLogEventsFilter
+TypeChatFull = Union[ChatFull,ChannelFull]
+TypeChannelLocation = Union[ChannelLocationEmpty,ChannelLocation]
+TypeChannelMessagesFilter = Union[ChannelMessagesFilterEmpty,ChannelMessagesFilter]
+TypeChannelParticipant = Union[ChannelParticipant,ChannelParticipantSelf,ChannelParticipantCreator,ChannelParticipantAdmin,ChannelParticipantBanned,ChannelParticipantLeft]
+TypeChannelParticipantsFilter = Union[ChannelParticipantsRecent,ChannelParticipantsAdmins,ChannelParticipantsKicked,ChannelParticipantsBots,ChannelParticipantsBanned,ChannelParticipantsSearch,ChannelParticipantsContacts,ChannelParticipantsMentions]
+TypeChatAdminRights = ChatAdminRights
+TypeChatAdminWithInvites = ChatAdminWithInvites
+TypeChatBannedRights = ChatBannedRights
+TypeChatInvite = Union[ChatInviteAlready,ChatInvite,ChatInvitePeek]
+TypeExportedChatInvite = Union[ChatInviteExported,ChatInvitePublicJoinRequests]
+TypeChatInviteImporter = ChatInviteImporter
+TypeChatOnlines = ChatOnlines
+TypeChatParticipant = Union[ChatParticipant,ChatParticipantCreator,ChatParticipantAdmin]
+TypeChatParticipants = Union[ChatParticipantsForbidden,ChatParticipants]
+TypeChatPhoto = Union[ChatPhotoEmpty,ChatPhoto]
+TypeChatReactions = Union[ChatReactionsNone,ChatReactionsAll,ChatReactionsSome]
+TypeClient_DH_Inner_Data = ClientDHInnerData
+TypeCodeSettings = CodeSettings
+TypeConfig = Config
+TypeConnectedBot = ConnectedBot
+TypeConnectedBotStarRef = ConnectedBotStarRef
+TypeContact = Contact
+TypeContactBirthday = ContactBirthday
+TypeContactStatus = ContactStatus
+TypeDataJSON = DataJSON
+TypeDcOption = DcOption
+TypeDefaultHistoryTTL = DefaultHistoryTTL
+TypeDestroyAuthKeyRes = Union[DestroyAuthKeyOk,DestroyAuthKeyNone,DestroyAuthKeyFail]
+TypeDestroySessionRes = Union[DestroySessionOk,DestroySessionNone]
+TypeSet_client_DH_params_answer = Union[DhGenOk,DhGenRetry,DhGenFail]
+TypeDialog = Union[Dialog,DialogFolder]
+TypeDialogFilter = Union[DialogFilter,DialogFilterDefault,DialogFilterChatlist]
+TypeDialogFilterSuggested = DialogFilterSuggested
+TypeDialogPeer = Union[DialogPeer,DialogPeerFolder]
+TypeDocument = Union[DocumentEmpty,Document]
+TypeDocumentAttribute = Union[DocumentAttributeImageSize,DocumentAttributeAnimated,DocumentAttributeSticker,DocumentAttributeVideo,DocumentAttributeAudio,DocumentAttributeFilename,DocumentAttributeHasStickers,DocumentAttributeCustomEmoji]
+TypeDraftMessage = Union[DraftMessageEmpty,DraftMessage]
+TypeEmailVerification = Union[EmailVerificationCode,EmailVerificationGoogle,EmailVerificationApple]
+TypeEmailVerifyPurpose = Union[EmailVerifyPurposeLoginSetup,EmailVerifyPurposeLoginChange,EmailVerifyPurposePassport]
+TypeEmojiGroup = Union[EmojiGroup,EmojiGroupGreeting,EmojiGroupPremium]
+TypeEmojiKeyword = Union[EmojiKeyword,EmojiKeywordDeleted]
+TypeEmojiKeywordsDifference = EmojiKeywordsDifference
+TypeEmojiLanguage = EmojiLanguage
+TypeEmojiList = Union[EmojiListNotModified,EmojiList]
+TypeEmojiStatus = Union[EmojiStatusEmpty,EmojiStatus,EmojiStatusCollectible,InputEmojiStatusCollectible]
+TypeEmojiURL = EmojiURL
+TypeEncryptedChat = Union[EncryptedChatEmpty,EncryptedChatWaiting,EncryptedChatRequested,EncryptedChat,EncryptedChatDiscarded]
+TypeEncryptedFile = Union[EncryptedFileEmpty,EncryptedFile]
+TypeEncryptedMessage = Union[EncryptedMessage,EncryptedMessageService]
+TypeExportedChatlistInvite = ExportedChatlistInvite
+TypeExportedContactToken = ExportedContactToken
+TypeExportedMessageLink = ExportedMessageLink
+TypeExportedStoryLink = ExportedStoryLink
+TypeFactCheck = FactCheck
+TypeFileHash = FileHash
+TypeFolder = Folder
+TypeFolderPeer = FolderPeer
+TypeForumTopic = Union[ForumTopicDeleted,ForumTopic]
+TypeFoundStory = FoundStory
+TypeFutureSalt = FutureSalt
+TypeFutureSalts = FutureSalts
+TypeGame = Game
+TypeGeoPoint = Union[GeoPointEmpty,GeoPoint]
+TypeGeoPointAddress = GeoPointAddress
+TypeGlobalPrivacySettings = GlobalPrivacySettings
+TypeGroupCall = Union[GroupCallDiscarded,GroupCall]
+TypeGroupCallParticipant = GroupCallParticipant
+TypeGroupCallParticipantVideo = GroupCallParticipantVideo
+TypeGroupCallParticipantVideoSourceGroup = GroupCallParticipantVideoSourceGroup
+TypeGroupCallStreamChannel = GroupCallStreamChannel
+TypeHighScore = HighScore
+TypeHttpWait = HttpWait
+TypeImportedContact = ImportedContact
+TypeInlineBotSwitchPM = InlineBotSwitchPM
+TypeInlineBotWebView = InlineBotWebView
+TypeInlineQueryPeerType = Union[InlineQueryPeerTypeSameBotPM,InlineQueryPeerTypePM,InlineQueryPeerTypeChat,InlineQueryPeerTypeMegagroup,InlineQueryPeerTypeBroadcast,InlineQueryPeerTypeBotPM]
+TypeInputAppEvent = InputAppEvent
+TypeInputBotApp = Union[InputBotAppID,InputBotAppShortName]
+TypeInputBotInlineMessage = Union[InputBotInlineMessageMediaAuto,InputBotInlineMessageText,InputBotInlineMessageMediaGeo,InputBotInlineMessageMediaVenue,InputBotInlineMessageMediaContact,InputBotInlineMessageGame,InputBotInlineMessageMediaInvoice,InputBotInlineMessageMediaWebPage]
+TypeInputBotInlineMessageID = Union[InputBotInlineMessageID,InputBotInlineMessageID64]
+TypeInputBotInlineResult = Union[InputBotInlineResult,InputBotInlineResultPhoto,InputBotInlineResultDocument,InputBotInlineResultGame]
+TypeInputBusinessAwayMessage = InputBusinessAwayMessage
+TypeInputBusinessBotRecipients = InputBusinessBotRecipients
+TypeInputBusinessChatLink = InputBusinessChatLink
+TypeInputBusinessGreetingMessage = InputBusinessGreetingMessage
+TypeInputBusinessIntro = InputBusinessIntro
+TypeInputBusinessRecipients = InputBusinessRecipients
+TypeInputChannel = Union[InputChannelEmpty,InputChannel,InputChannelFromMessage]
+TypeInputChatPhoto = Union[InputChatPhotoEmpty,InputChatUploadedPhoto,InputChatPhoto]
+TypeInputChatlist = InputChatlistDialogFilter
+TypeInputCheckPasswordSRP = Union[InputCheckPasswordEmpty,InputCheckPasswordSRP]
+TypeInputClientProxy = InputClientProxy
+TypeInputCollectible = Union[InputCollectibleUsername,InputCollectiblePhone]
+TypeInputDialogPeer = Union[InputDialogPeer,InputDialogPeerFolder]
+TypeInputDocument = Union[InputDocumentEmpty,InputDocument]
+TypeInputFileLocation = Union[InputFileLocation,InputEncryptedFileLocation,InputDocumentFileLocation,InputSecureFileLocation,InputTakeoutFileLocation,InputPhotoFileLocation,InputPhotoLegacyFileLocation,InputPeerPhotoFileLocation,InputStickerSetThumb,InputGroupCallStream]
+TypeInputEncryptedChat = InputEncryptedChat
+TypeInputEncryptedFile = Union[InputEncryptedFileEmpty,InputEncryptedFileUploaded,InputEncryptedFile,InputEncryptedFileBigUploaded]
+TypeInputFile = Union[InputFile,InputFileBig,InputFileStoryDocument]
+TypeInputFolderPeer = InputFolderPeer
+TypeInputGame = Union[InputGameID,InputGameShortName]
+TypeInputGeoPoint = Union[InputGeoPointEmpty,InputGeoPoint]
+TypeInputGroupCall = InputGroupCall
+TypeInputInvoice = Union[InputInvoiceMessage,InputInvoiceSlug,InputInvoicePremiumGiftCode,InputInvoiceStars,InputInvoiceChatInviteSubscription,InputInvoiceStarGift,InputInvoiceStarGiftUpgrade,InputInvoiceStarGiftTransfer]
+TypeKeyboardButton = Union[KeyboardButton,KeyboardButtonUrl,KeyboardButtonCallback,KeyboardButtonRequestPhone,KeyboardButtonRequestGeoLocation,KeyboardButtonSwitchInline,KeyboardButtonGame,KeyboardButtonBuy,KeyboardButtonUrlAuth,InputKeyboardButtonUrlAuth,KeyboardButtonRequestPoll,InputKeyboardButtonUserProfile,KeyboardButtonUserProfile,KeyboardButtonWebView,KeyboardButtonSimpleWebView,KeyboardButtonRequestPeer,InputKeyboardButtonRequestPeer,KeyboardButtonCopy]
+TypeMediaArea = Union[MediaAreaVenue,InputMediaAreaVenue,MediaAreaGeoPoint,MediaAreaSuggestedReaction,MediaAreaChannelPost,InputMediaAreaChannelPost,MediaAreaUrl,MediaAreaWeather,MediaAreaStarGift]
+TypeInputMedia = Union[InputMediaEmpty,InputMediaUploadedPhoto,InputMediaPhoto,InputMediaGeoPoint,InputMediaContact,InputMediaUploadedDocument,InputMediaDocument,InputMediaVenue,InputMediaPhotoExternal,InputMediaDocumentExternal,InputMediaGame,InputMediaInvoice,InputMediaGeoLive,InputMediaPoll,InputMediaDice,InputMediaStory,InputMediaWebPage,InputMediaPaidMedia]
+TypeInputMessage = Union[InputMessageID,InputMessageReplyTo,InputMessagePinned,InputMessageCallbackQuery]
+TypeMessageEntity = Union[MessageEntityUnknown,MessageEntityMention,MessageEntityHashtag,MessageEntityBotCommand,MessageEntityUrl,MessageEntityEmail,MessageEntityBold,MessageEntityItalic,MessageEntityCode,MessageEntityPre,MessageEntityTextUrl,MessageEntityMentionName,InputMessageEntityMentionName,MessageEntityPhone,MessageEntityCashtag,MessageEntityUnderline,MessageEntityStrike,MessageEntityBankCard,MessageEntitySpoiler,MessageEntityCustomEmoji,MessageEntityBlockquote]
+TypeMessagesFilter = Union[InputMessagesFilterEmpty,InputMessagesFilterPhotos,InputMessagesFilterVideo,InputMessagesFilterPhotoVideo,InputMessagesFilterDocument,InputMessagesFilterUrl,InputMessagesFilterGif,InputMessagesFilterVoice,InputMessagesFilterMusic,InputMessagesFilterChatPhotos,InputMessagesFilterPhoneCalls,InputMessagesFilterRoundVoice,InputMessagesFilterRoundVideo,InputMessagesFilterMyMentions,InputMessagesFilterGeo,InputMessagesFilterContacts,InputMessagesFilterPinned]
+TypeInputNotifyPeer = Union[InputNotifyPeer,InputNotifyUsers,InputNotifyChats,InputNotifyBroadcasts,InputNotifyForumTopic]
+TypeInputPaymentCredentials = Union[InputPaymentCredentialsSaved,InputPaymentCredentials,InputPaymentCredentialsApplePay,InputPaymentCredentialsGooglePay]
+TypeInputPeer = Union[InputPeerEmpty,InputPeerSelf,InputPeerChat,InputPeerUser,InputPeerChannel,InputPeerUserFromMessage,InputPeerChannelFromMessage]
+TypeInputPeerNotifySettings = InputPeerNotifySettings
+TypeInputPhoneCall = InputPhoneCall
+TypeInputContact = InputPhoneContact
+TypeInputPhoto = Union[InputPhotoEmpty,InputPhoto]
+TypeInputPrivacyKey = Union[InputPrivacyKeyStatusTimestamp,InputPrivacyKeyChatInvite,InputPrivacyKeyPhoneCall,InputPrivacyKeyPhoneP2P,InputPrivacyKeyForwards,InputPrivacyKeyProfilePhoto,InputPrivacyKeyPhoneNumber,InputPrivacyKeyAddedByPhone,InputPrivacyKeyVoiceMessages,InputPrivacyKeyAbout,InputPrivacyKeyBirthday,InputPrivacyKeyStarGiftsAutoSave]
+TypeInputPrivacyRule = Union[InputPrivacyValueAllowContacts,InputPrivacyValueAllowAll,InputPrivacyValueAllowUsers,InputPrivacyValueDisallowContacts,InputPrivacyValueDisallowAll,InputPrivacyValueDisallowUsers,InputPrivacyValueAllowChatParticipants,InputPrivacyValueDisallowChatParticipants,InputPrivacyValueAllowCloseFriends,InputPrivacyValueAllowPremium,InputPrivacyValueAllowBots,InputPrivacyValueDisallowBots]
+TypeInputQuickReplyShortcut = Union[InputQuickReplyShortcut,InputQuickReplyShortcutId]
+TypeInputReplyTo = Union[InputReplyToMessage,InputReplyToStory]
+TypeReportReason = Union[InputReportReasonSpam,InputReportReasonViolence,InputReportReasonPornography,InputReportReasonChildAbuse,InputReportReasonOther,InputReportReasonCopyright,InputReportReasonGeoIrrelevant,InputReportReasonFake,InputReportReasonIllegalDrugs,InputReportReasonPersonalDetails]
+TypeInputSavedStarGift = Union[InputSavedStarGiftUser,InputSavedStarGiftChat]
+TypeInputSecureFile = Union[InputSecureFileUploaded,InputSecureFile]
+TypeInputSecureValue = InputSecureValue
+TypeInputSingleMedia = InputSingleMedia
+TypeInputStarsTransaction = InputStarsTransaction
+TypeInputStickerSet = Union[InputStickerSetEmpty,InputStickerSetID,InputStickerSetShortName,InputStickerSetAnimatedEmoji,InputStickerSetDice,InputStickerSetAnimatedEmojiAnimations,InputStickerSetPremiumGifts,InputStickerSetEmojiGenericAnimations,InputStickerSetEmojiDefaultStatuses,InputStickerSetEmojiDefaultTopicIcons,InputStickerSetEmojiChannelDefaultStatuses]
+TypeInputStickerSetItem = InputStickerSetItem
+TypeInputStickeredMedia = Union[InputStickeredMediaPhoto,InputStickeredMediaDocument]
+TypeInputStorePaymentPurpose = Union[InputStorePaymentPremiumSubscription,InputStorePaymentGiftPremium,InputStorePaymentPremiumGiftCode,InputStorePaymentPremiumGiveaway,InputStorePaymentStarsTopup,InputStorePaymentStarsGift,InputStorePaymentStarsGiveaway]
+TypeInputTheme = Union[InputTheme,InputThemeSlug]
+TypeInputThemeSettings = InputThemeSettings
+TypeInputUser = Union[InputUserEmpty,InputUserSelf,InputUser,InputUserFromMessage]
+TypeInputWallPaper = Union[InputWallPaper,InputWallPaperSlug,InputWallPaperNoFile]
+TypeInputWebDocument = InputWebDocument
+TypeInputWebFileLocation = Union[InputWebFileLocation,InputWebFileGeoPointLocation,InputWebFileAudioAlbumThumbLocation]
+TypeInvoice = Invoice
+TypeIpPort = Union[IpPort,IpPortSecret]
+TypeJSONValue = Union[JsonNull,JsonBool,JsonNumber,JsonString,JsonArray,JsonObject]
+TypeJSONObjectValue = JsonObjectValue
+TypeKeyboardButtonRow = KeyboardButtonRow
+TypeLabeledPrice = LabeledPrice
+TypeLangPackDifference = LangPackDifference
+TypeLangPackLanguage = LangPackLanguage
+TypeLangPackString = Union[LangPackString,LangPackStringPluralized,LangPackStringDeleted]
+TypeMaskCoords = MaskCoords
+TypeMediaAreaCoordinates = MediaAreaCoordinates
+TypeMessage = Union[MessageEmpty,Message,MessageService]
+TypeMessageAction = Union[MessageActionEmpty,MessageActionChatCreate,MessageActionChatEditTitle,MessageActionChatEditPhoto,MessageActionChatDeletePhoto,MessageActionChatAddUser,MessageActionChatDeleteUser,MessageActionChatJoinedByLink,MessageActionChannelCreate,MessageActionChatMigrateTo,MessageActionChannelMigrateFrom,MessageActionPinMessage,MessageActionHistoryClear,MessageActionGameScore,MessageActionPaymentSentMe,MessageActionPaymentSent,MessageActionPhoneCall,MessageActionScreenshotTaken,MessageActionCustomAction,MessageActionBotAllowed,MessageActionSecureValuesSentMe,MessageActionSecureValuesSent,MessageActionContactSignUp,MessageActionGeoProximityReached,MessageActionGroupCall,MessageActionInviteToGroupCall,MessageActionSetMessagesTTL,MessageActionGroupCallScheduled,MessageActionSetChatTheme,MessageActionChatJoinedByRequest,MessageActionWebViewDataSentMe,MessageActionWebViewDataSent,MessageActionGiftPremium,MessageActionTopicCreate,MessageActionTopicEdit,MessageActionSuggestProfilePhoto,MessageActionRequestedPeer,MessageActionSetChatWallPaper,MessageActionGiftCode,MessageActionGiveawayLaunch,MessageActionGiveawayResults,MessageActionBoostApply,MessageActionRequestedPeerSentMe,MessageActionPaymentRefunded,MessageActionGiftStars,MessageActionPrizeStars,MessageActionStarGift,MessageActionStarGiftUnique]
+TypeMessageExtendedMedia = Union[MessageExtendedMediaPreview,MessageExtendedMedia]
+TypeMessageFwdHeader = MessageFwdHeader
+TypeMessageMedia = Union[MessageMediaEmpty,MessageMediaPhoto,MessageMediaGeo,MessageMediaContact,MessageMediaUnsupported,MessageMediaDocument,MessageMediaWebPage,MessageMediaVenue,MessageMediaGame,MessageMediaInvoice,MessageMediaGeoLive,MessageMediaPoll,MessageMediaDice,MessageMediaStory,MessageMediaGiveaway,MessageMediaGiveawayResults,MessageMediaPaidMedia]
+TypeMessagePeerReaction = MessagePeerReaction
+TypeMessagePeerVote = Union[MessagePeerVote,MessagePeerVoteInputOption,MessagePeerVoteMultiple]
+TypeMessageRange = MessageRange
+TypeMessageReactions = MessageReactions
+TypeMessageReactor = MessageReactor
+TypeMessageReplies = MessageReplies
+TypeMessageReplyHeader = Union[MessageReplyHeader,MessageReplyStoryHeader]
+TypeMessageReportOption = MessageReportOption
+TypeMessageViews = MessageViews
+TypeMissingInvitee = MissingInvitee
+TypeMsgDetailedInfo = Union[MsgDetailedInfo,MsgNewDetailedInfo]
+TypeMsgResendReq = MsgResendReq
+TypeMsgsAck = MsgsAck
+TypeMsgsAllInfo = MsgsAllInfo
+TypeMsgsStateInfo = MsgsStateInfo
+TypeMsgsStateReq = MsgsStateReq
+TypeMyBoost = MyBoost
+TypeNearestDc = NearestDc
+TypeNewSession = NewSessionCreated
+TypeNotificationSound = Union[NotificationSoundDefault,NotificationSoundNone,NotificationSoundLocal,NotificationSoundRingtone]
+TypeNotifyPeer = Union[NotifyPeer,NotifyUsers,NotifyChats,NotifyBroadcasts,NotifyForumTopic]
+TypeOutboxReadDate = OutboxReadDate
+TypeP_Q_inner_data = Union[PQInnerData,PQInnerDataDc,PQInnerDataTemp,PQInnerDataTempDc]
+TypePage = Page
+TypePageBlock = Union[PageBlockUnsupported,PageBlockTitle,PageBlockSubtitle,PageBlockAuthorDate,PageBlockHeader,PageBlockSubheader,PageBlockParagraph,PageBlockPreformatted,PageBlockFooter,PageBlockDivider,PageBlockAnchor,PageBlockList,PageBlockBlockquote,PageBlockPullquote,PageBlockPhoto,PageBlockVideo,PageBlockCover,PageBlockEmbed,PageBlockEmbedPost,PageBlockCollage,PageBlockSlideshow,PageBlockChannel,PageBlockAudio,PageBlockKicker,PageBlockTable,PageBlockOrderedList,PageBlockDetails,PageBlockRelatedArticles,PageBlockMap]
+TypePageCaption = PageCaption
+TypePageListItem = Union[PageListItemText,PageListItemBlocks]
+TypePageListOrderedItem = Union[PageListOrderedItemText,PageListOrderedItemBlocks]
+TypePageRelatedArticle = PageRelatedArticle
+TypePageTableCell = PageTableCell
+TypePageTableRow = PageTableRow
+TypePaidReactionPrivacy = Union[PaidReactionPrivacyDefault,PaidReactionPrivacyAnonymous,PaidReactionPrivacyPeer]
+TypePasswordKdfAlgo = Union[PasswordKdfAlgoUnknown,PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow]
+TypePaymentCharge = PaymentCharge
+TypePaymentFormMethod = PaymentFormMethod
+TypePaymentRequestedInfo = PaymentRequestedInfo
+TypePaymentSavedCredentials = PaymentSavedCredentialsCard
+TypePeerBlocked = PeerBlocked
+TypePeer = Union[PeerUser,PeerChat,PeerChannel]
+TypePeerColor = PeerColor
+TypePeerLocated = Union[PeerLocated,PeerSelfLocated]
+TypePeerNotifySettings = PeerNotifySettings
+TypePeerSettings = PeerSettings
+TypePeerStories = PeerStories
+TypePhoneCall = Union[PhoneCallEmpty,PhoneCallWaiting,PhoneCallRequested,PhoneCallAccepted,PhoneCall,PhoneCallDiscarded]
+TypePhoneCallDiscardReason = Union[PhoneCallDiscardReasonMissed,PhoneCallDiscardReasonDisconnect,PhoneCallDiscardReasonHangup,PhoneCallDiscardReasonBusy,PhoneCallDiscardReasonAllowGroupCall]
+TypePhoneCallProtocol = PhoneCallProtocol
+TypePhoneConnection = Union[PhoneConnection,PhoneConnectionWebrtc]
+TypePhoto = Union[PhotoEmpty,Photo]
+TypePhotoSize = Union[PhotoSizeEmpty,PhotoSize,PhotoCachedSize,PhotoStrippedSize,PhotoSizeProgressive,PhotoPathSize]
+TypePoll = Poll
+TypePollAnswer = PollAnswer
+TypePollAnswerVoters = PollAnswerVoters
+TypePollResults = PollResults
+TypePong = Pong
+TypePopularContact = PopularContact
+TypePostAddress = PostAddress
+TypePostInteractionCounters = Union[PostInteractionCountersMessage,PostInteractionCountersStory]
+TypePremiumGiftCodeOption = PremiumGiftCodeOption
+TypePremiumGiftOption = PremiumGiftOption
+TypePremiumSubscriptionOption = PremiumSubscriptionOption
+TypePrepaidGiveaway = Union[PrepaidGiveaway,PrepaidStarsGiveaway]
+TypePrivacyKey = Union[PrivacyKeyStatusTimestamp,PrivacyKeyChatInvite,PrivacyKeyPhoneCall,PrivacyKeyPhoneP2P,PrivacyKeyForwards,PrivacyKeyProfilePhoto,PrivacyKeyPhoneNumber,PrivacyKeyAddedByPhone,PrivacyKeyVoiceMessages,PrivacyKeyAbout,PrivacyKeyBirthday,PrivacyKeyStarGiftsAutoSave]
+TypePrivacyRule = Union[PrivacyValueAllowContacts,PrivacyValueAllowAll,PrivacyValueAllowUsers,PrivacyValueDisallowContacts,PrivacyValueDisallowAll,PrivacyValueDisallowUsers,PrivacyValueAllowChatParticipants,PrivacyValueDisallowChatParticipants,PrivacyValueAllowCloseFriends,PrivacyValueAllowPremium,PrivacyValueAllowBots,PrivacyValueDisallowBots]
+TypePublicForward = Union[PublicForwardMessage,PublicForwardStory]
+TypeQuickReply = QuickReply
+TypeReactionCount = ReactionCount
+TypeReaction = Union[ReactionEmpty,ReactionEmoji,ReactionCustomEmoji,ReactionPaid]
+TypeReactionNotificationsFrom = Union[ReactionNotificationsFromContacts,ReactionNotificationsFromAll]
+TypeReactionsNotifySettings = ReactionsNotifySettings
+TypeReadParticipantDate = ReadParticipantDate
+TypeReceivedNotifyMessage = ReceivedNotifyMessage
+TypeRecentMeUrl = Union[RecentMeUrlUnknown,RecentMeUrlUser,RecentMeUrlChat,RecentMeUrlChatInvite,RecentMeUrlStickerSet]
+TypeReplyMarkup = Union[ReplyKeyboardHide,ReplyKeyboardForceReply,ReplyKeyboardMarkup,ReplyInlineMarkup]
+TypeReportResult = Union[ReportResultChooseOption,ReportResultAddComment,ReportResultReported]
+TypeRequestPeerType = Union[RequestPeerTypeUser,RequestPeerTypeChat,RequestPeerTypeBroadcast]
+TypeRequestedPeer = Union[RequestedPeerUser,RequestedPeerChat,RequestedPeerChannel]
+TypeResPQ = ResPQ
+TypeRestrictionReason = RestrictionReason
+TypeRpcDropAnswer = Union[RpcAnswerUnknown,RpcAnswerDroppedRunning,RpcAnswerDropped]
+TypeRpcError = RpcError
+TypeSavedDialog = SavedDialog
+TypeSavedContact = SavedPhoneContact
+TypeSavedReactionTag = SavedReactionTag
+TypeSavedStarGift = SavedStarGift
+TypeSearchResultsPosition = SearchResultPosition
+TypeSearchResultsCalendarPeriod = SearchResultsCalendarPeriod
+TypeSecureCredentialsEncrypted = SecureCredentialsEncrypted
+TypeSecureData = SecureData
+TypeSecureFile = Union[SecureFileEmpty,SecureFile]
+TypeSecurePasswordKdfAlgo = Union[SecurePasswordKdfAlgoUnknown,SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000,SecurePasswordKdfAlgoSHA512]
+TypeSecurePlainData = Union[SecurePlainPhone,SecurePlainEmail]
+TypeSecureRequiredType = Union[SecureRequiredType,SecureRequiredTypeOneOf]
+TypeSecureSecretSettings = SecureSecretSettings
+TypeSecureValue = SecureValue
+TypeSecureValueError = Union[SecureValueErrorData,SecureValueErrorFrontSide,SecureValueErrorReverseSide,SecureValueErrorSelfie,SecureValueErrorFile,SecureValueErrorFiles,SecureValueError,SecureValueErrorTranslationFile,SecureValueErrorTranslationFiles]
+TypeSecureValueHash = SecureValueHash
+TypeSecureValueType = Union[SecureValueTypePersonalDetails,SecureValueTypePassport,SecureValueTypeDriverLicense,SecureValueTypeIdentityCard,SecureValueTypeInternalPassport,SecureValueTypeAddress,SecureValueTypeUtilityBill,SecureValueTypeBankStatement,SecureValueTypeRentalAgreement,SecureValueTypePassportRegistration,SecureValueTypeTemporaryRegistration,SecureValueTypePhone,SecureValueTypeEmail]
+TypeSendAsPeer = SendAsPeer
+TypeSendMessageAction = Union[SendMessageTypingAction,SendMessageCancelAction,SendMessageRecordVideoAction,SendMessageUploadVideoAction,SendMessageRecordAudioAction,SendMessageUploadAudioAction,SendMessageUploadPhotoAction,SendMessageUploadDocumentAction,SendMessageGeoLocationAction,SendMessageChooseContactAction,SendMessageGamePlayAction,SendMessageRecordRoundAction,SendMessageUploadRoundAction,SpeakingInGroupCallAction,SendMessageHistoryImportAction,SendMessageChooseStickerAction,SendMessageEmojiInteraction,SendMessageEmojiInteractionSeen]
+TypeServer_DH_inner_data = ServerDHInnerData
+TypeServer_DH_Params = Union[ServerDHParamsFail,ServerDHParamsOk]
+TypeShippingOption = ShippingOption
+TypeSmsJob = SmsJob
+TypeSponsoredMessage = SponsoredMessage
+TypeSponsoredMessageReportOption = SponsoredMessageReportOption
+TypeStarGift = Union[StarGift,StarGiftUnique]
+TypeStarGiftAttribute = Union[StarGiftAttributeModel,StarGiftAttributePattern,StarGiftAttributeBackdrop,StarGiftAttributeOriginalDetails]
+TypeStarRefProgram = StarRefProgram
+TypeStarsAmount = StarsAmount
+TypeStarsGiftOption = StarsGiftOption
+TypeStarsGiveawayOption = StarsGiveawayOption
+TypeStarsGiveawayWinnersOption = StarsGiveawayWinnersOption
+TypeStarsRevenueStatus = StarsRevenueStatus
+TypeStarsSubscription = StarsSubscription
+TypeStarsSubscriptionPricing = StarsSubscriptionPricing
+TypeStarsTopupOption = StarsTopupOption
+TypeStarsTransaction = StarsTransaction
+TypeStarsTransactionPeer = Union[StarsTransactionPeerUnsupported,StarsTransactionPeerAppStore,StarsTransactionPeerPlayMarket,StarsTransactionPeerPremiumBot,StarsTransactionPeerFragment,StarsTransactionPeer,StarsTransactionPeerAds,StarsTransactionPeerAPI]
+TypeStatsAbsValueAndPrev = StatsAbsValueAndPrev
+TypeStatsDateRangeDays = StatsDateRangeDays
+TypeStatsGraph = Union[StatsGraphAsync,StatsGraphError,StatsGraph]
+TypeStatsGroupTopAdmin = StatsGroupTopAdmin
+TypeStatsGroupTopInviter = StatsGroupTopInviter
+TypeStatsGroupTopPoster = StatsGroupTopPoster
+TypeStatsPercentValue = StatsPercentValue
+TypeStatsURL = StatsURL
+TypeStickerKeyword = StickerKeyword
+TypeStickerPack = StickerPack
+TypeStickerSet = StickerSet
+TypeStickerSetCovered = Union[StickerSetCovered,StickerSetMultiCovered,StickerSetFullCovered,StickerSetNoCovered]
+TypeStoriesStealthMode = StoriesStealthMode
+TypeStoryFwdHeader = StoryFwdHeader
+TypeStoryItem = Union[StoryItemDeleted,StoryItemSkipped,StoryItem]
+TypeStoryReaction = Union[StoryReaction,StoryReactionPublicForward,StoryReactionPublicRepost]
+TypeStoryView = Union[StoryView,StoryViewPublicForward,StoryViewPublicRepost]
+TypeStoryViews = StoryViews
+TypeRichText = Union[TextEmpty,TextPlain,TextBold,TextItalic,TextUnderline,TextStrike,TextFixed,TextUrl,TextEmail,TextConcat,TextSubscript,TextSuperscript,TextMarked,TextPhone,TextImage,TextAnchor]
+TypeTextWithEntities = TextWithEntities
+TypeTheme = Theme
+TypeThemeSettings = ThemeSettings
+TypeTimezone = Timezone
+TypeTlsBlock = Union[TlsBlockString,TlsBlockRandom,TlsBlockZero,TlsBlockDomain,TlsBlockGrease,TlsBlockPublicKey,TlsBlockScope]
+TypeTlsClientHello = TlsClientHello
+TypeTopPeer = TopPeer
+TypeTopPeerCategory = Union[TopPeerCategoryBotsPM,TopPeerCategoryBotsInline,TopPeerCategoryCorrespondents,TopPeerCategoryGroups,TopPeerCategoryChannels,TopPeerCategoryPhoneCalls,TopPeerCategoryForwardUsers,TopPeerCategoryForwardChats,TopPeerCategoryBotsApp]
+TypeTopPeerCategoryPeers = TopPeerCategoryPeers
+TypeUpdate = Union[UpdateNewMessage,UpdateMessageID,UpdateDeleteMessages,UpdateUserTyping,UpdateChatUserTyping,UpdateChatParticipants,UpdateUserStatus,UpdateUserName,UpdateNewAuthorization,UpdateNewEncryptedMessage,UpdateEncryptedChatTyping,UpdateEncryption,UpdateEncryptedMessagesRead,UpdateChatParticipantAdd,UpdateChatParticipantDelete,UpdateDcOptions,UpdateNotifySettings,UpdateServiceNotification,UpdatePrivacy,UpdateUserPhone,UpdateReadHistoryInbox,UpdateReadHistoryOutbox,UpdateWebPage,UpdateReadMessagesContents,UpdateChannelTooLong,UpdateChannel,UpdateNewChannelMessage,UpdateReadChannelInbox,UpdateDeleteChannelMessages,UpdateChannelMessageViews,UpdateChatParticipantAdmin,UpdateNewStickerSet,UpdateStickerSetsOrder,UpdateStickerSets,UpdateSavedGifs,UpdateBotInlineQuery,UpdateBotInlineSend,UpdateEditChannelMessage,UpdateBotCallbackQuery,UpdateEditMessage,UpdateInlineBotCallbackQuery,UpdateReadChannelOutbox,UpdateDraftMessage,UpdateReadFeaturedStickers,UpdateRecentStickers,UpdateConfig,UpdatePtsChanged,UpdateChannelWebPage,UpdateDialogPinned,UpdatePinnedDialogs,UpdateBotWebhookJSON,UpdateBotWebhookJSONQuery,UpdateBotShippingQuery,UpdateBotPrecheckoutQuery,UpdatePhoneCall,UpdateLangPackTooLong,UpdateLangPack,UpdateFavedStickers,UpdateChannelReadMessagesContents,UpdateContactsReset,UpdateChannelAvailableMessages,UpdateDialogUnreadMark,UpdateMessagePoll,UpdateChatDefaultBannedRights,UpdateFolderPeers,UpdatePeerSettings,UpdatePeerLocated,UpdateNewScheduledMessage,UpdateDeleteScheduledMessages,UpdateTheme,UpdateGeoLiveViewed,UpdateLoginToken,UpdateMessagePollVote,UpdateDialogFilter,UpdateDialogFilterOrder,UpdateDialogFilters,UpdatePhoneCallSignalingData,UpdateChannelMessageForwards,UpdateReadChannelDiscussionInbox,UpdateReadChannelDiscussionOutbox,UpdatePeerBlocked,UpdateChannelUserTyping,UpdatePinnedMessages,UpdatePinnedChannelMessages,UpdateChat,UpdateGroupCallParticipants,UpdateGroupCall,UpdatePeerHistoryTTL,UpdateChatParticipant,UpdateChannelParticipant,UpdateBotStopped,UpdateGroupCallConnection,UpdateBotCommands,UpdatePendingJoinRequests,UpdateBotChatInviteRequester,UpdateMessageReactions,UpdateAttachMenuBots,UpdateWebViewResultSent,UpdateBotMenuButton,UpdateSavedRingtones,UpdateTranscribedAudio,UpdateReadFeaturedEmojiStickers,UpdateUserEmojiStatus,UpdateRecentEmojiStatuses,UpdateRecentReactions,UpdateMoveStickerSetToTop,UpdateMessageExtendedMedia,UpdateChannelPinnedTopic,UpdateChannelPinnedTopics,UpdateUser,UpdateAutoSaveSettings,UpdateStory,UpdateReadStories,UpdateStoryID,UpdateStoriesStealthMode,UpdateSentStoryReaction,UpdateBotChatBoost,UpdateChannelViewForumAsMessages,UpdatePeerWallpaper,UpdateBotMessageReaction,UpdateBotMessageReactions,UpdateSavedDialogPinned,UpdatePinnedSavedDialogs,UpdateSavedReactionTags,UpdateSmsJob,UpdateQuickReplies,UpdateNewQuickReply,UpdateDeleteQuickReply,UpdateQuickReplyMessage,UpdateDeleteQuickReplyMessages,UpdateBotBusinessConnect,UpdateBotNewBusinessMessage,UpdateBotEditBusinessMessage,UpdateBotDeleteBusinessMessage,UpdateNewStoryReaction,UpdateBroadcastRevenueTransactions,UpdateStarsBalance,UpdateBusinessBotCallbackQuery,UpdateStarsRevenueStatus,UpdateBotPurchasedPaidMedia,UpdatePaidReactionPrivacy]
+TypeUpdates = Union[UpdatesTooLong,UpdateShortMessage,UpdateShortChatMessage,UpdateShort,UpdatesCombined,Updates,UpdateShortSentMessage]
+TypeUrlAuthResult = Union[UrlAuthResultRequest,UrlAuthResultAccepted,UrlAuthResultDefault]
+TypeUser = Union[UserEmpty,User]
+TypeUserFull = UserFull
+TypeUserProfilePhoto = Union[UserProfilePhotoEmpty,UserProfilePhoto]
+TypeUserStatus = Union[UserStatusEmpty,UserStatusOnline,UserStatusOffline,UserStatusRecently,UserStatusLastWeek,UserStatusLastMonth]
+TypeUsername = Username
+TypeVideoSize = Union[VideoSize,VideoSizeEmojiMarkup,VideoSizeStickerMarkup]
+TypeWallPaper = Union[WallPaper,WallPaperNoFile]
+TypeWallPaperSettings = WallPaperSettings
+TypeWebAuthorization = WebAuthorization
+TypeWebDocument = Union[WebDocument,WebDocumentNoProxy]
+TypeWebPage = Union[WebPageEmpty,WebPagePending,WebPage,WebPageNotModified]
+TypeWebPageAttribute = Union[WebPageAttributeTheme,WebPageAttributeStory,WebPageAttributeStickerSet,WebPageAttributeUniqueStarGift]
+TypeWebViewMessageSent = WebViewMessageSent
+TypeWebViewResult = WebViewResultUrl
@@ -0,0 +1,11 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.types.channels import AdminLogResults, ChannelParticipant, ChannelParticipants, ChannelParticipantsNotModified, SendAsPeers, SponsoredMessageReportResultAdsHidden, SponsoredMessageReportResultChooseOption, SponsoredMessageReportResultReported
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChannelAdminLogEvent, TypeChannelParticipant, TypeChat, TypeSendAsPeer, TypeSponsoredMessageReportOption, TypeUser
+
+
@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.types.help import AppConfig, AppConfigNotModified, AppUpdate, ConfigSimple, CountriesList, CountriesListNotModified, Country, CountryCode, DeepLinkInfo, DeepLinkInfoEmpty, InviteText, NoAppUpdate, PassportConfig, PassportConfigNotModified, PeerColorOption, PeerColorProfileSet, PeerColorSet, PeerColors, PeerColorsNotModified, PremiumPromo, PromoData, PromoDataEmpty, RecentMeUrls, Support, SupportName, TermsOfService, TermsOfServiceUpdate, TermsOfServiceUpdateEmpty, TimezonesList, TimezonesListNotModified, UserInfo, UserInfoEmpty
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAccessPointRule, TypeChat, TypeDataJSON, TypeDocument, TypeJSONValue, TypeMessageEntity, TypePeer, TypePremiumSubscriptionOption, TypeRecentMeUrl, TypeTimezone, TypeUser
+    from ...tl.types.help import TypeCountry, TypeCountryCode, TypePeerColorOption, TypePeerColorSet, TypeTermsOfService
+
+
@@ -0,0 +1,11 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.types.payments import BankCardData, CheckedGiftCode, ConnectedStarRefBots, ExportedInvoice, GiveawayInfo, GiveawayInfoResults, PaymentForm, PaymentFormStarGift, PaymentFormStars, PaymentReceipt, PaymentReceiptStars, PaymentResult, PaymentVerificationNeeded, SavedInfo, SavedStarGifts, StarGiftUpgradePreview, StarGiftWithdrawalUrl, StarGifts, StarGiftsNotModified, StarsRevenueAdsAccountUrl, StarsRevenueStats, StarsRevenueWithdrawalUrl, StarsStatus, SuggestedStarRefBots, UniqueStarGift, ValidatedRequestedInfo
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBankCardOpenUrl, TypeChat, TypeConnectedBotStarRef, TypeDataJSON, TypeInvoice, TypePaymentFormMethod, TypePaymentRequestedInfo, TypePaymentSavedCredentials, TypePeer, TypeSavedStarGift, TypeShippingOption, TypeStarGift, TypeStarGiftAttribute, TypeStarRefProgram, TypeStarsAmount, TypeStarsRevenueStatus, TypeStarsSubscription, TypeStarsTransaction, TypeStatsGraph, TypeUpdates, TypeUser, TypeWebDocument
+
+
@@ -0,0 +1,8 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.types.smsjobs import EligibleToJoin, Status
+from datetime import datetime
+
@@ -0,0 +1,8 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.types.storage import FileGif, FileJpeg, FileMov, FileMp3, FileMp4, FilePartial, FilePdf, FilePng, FileUnknown, FileWebp
+from datetime import datetime
+
@@ -0,0 +1,13 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.auth import AcceptLoginTokenRequest, BindTempAuthKeyRequest, CancelCodeRequest, CheckPasswordRequest, CheckRecoveryPasswordRequest, DropTempAuthKeysRequest, ExportAuthorizationRequest, ExportLoginTokenRequest, ImportAuthorizationRequest, ImportBotAuthorizationRequest, ImportLoginTokenRequest, ImportWebTokenAuthorizationRequest, LogOutRequest, RecoverPasswordRequest, ReportMissingCodeRequest, RequestFirebaseSmsRequest, RequestPasswordRecoveryRequest, ResendCodeRequest, ResetAuthorizationsRequest, ResetLoginEmailRequest, SendCodeRequest, SignInRequest, SignUpRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeCodeSettings, TypeEmailVerification, TypeInputCheckPasswordSRP
+    from ...tl.types.account import TypePasswordInputSettings
+
+
@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.bots import AddPreviewMediaRequest, AllowSendMessageRequest, AnswerWebhookJSONQueryRequest, CanSendMessageRequest, CheckDownloadFileParamsRequest, DeletePreviewMediaRequest, EditPreviewMediaRequest, GetAdminedBotsRequest, GetBotCommandsRequest, GetBotInfoRequest, GetBotMenuButtonRequest, GetBotRecommendationsRequest, GetPopularAppBotsRequest, GetPreviewInfoRequest, GetPreviewMediasRequest, InvokeWebViewCustomMethodRequest, ReorderPreviewMediasRequest, ReorderUsernamesRequest, ResetBotCommandsRequest, SendCustomRequestRequest, SetBotBroadcastDefaultAdminRightsRequest, SetBotCommandsRequest, SetBotGroupDefaultAdminRightsRequest, SetBotInfoRequest, SetBotMenuButtonRequest, SetCustomVerificationRequest, ToggleUserEmojiStatusPermissionRequest, ToggleUsernameRequest, UpdateStarRefProgramRequest, UpdateUserEmojiStatusRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBotCommand, TypeBotCommandScope, TypeBotMenuButton, TypeChatAdminRights, TypeDataJSON, TypeEmojiStatus, TypeInputMedia, TypeInputPeer, TypeInputUser
+
+
@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.channels import CheckUsernameRequest, ConvertToGigagroupRequest, CreateChannelRequest, CreateForumTopicRequest, DeactivateAllUsernamesRequest, DeleteChannelRequest, DeleteHistoryRequest, DeleteMessagesRequest, DeleteParticipantHistoryRequest, DeleteTopicHistoryRequest, EditAdminRequest, EditBannedRequest, EditCreatorRequest, EditForumTopicRequest, EditLocationRequest, EditPhotoRequest, EditTitleRequest, ExportMessageLinkRequest, GetAdminLogRequest, GetAdminedPublicChannelsRequest, GetChannelRecommendationsRequest, GetChannelsRequest, GetForumTopicsByIDRequest, GetForumTopicsRequest, GetFullChannelRequest, GetGroupsForDiscussionRequest, GetInactiveChannelsRequest, GetLeftChannelsRequest, GetMessagesRequest, GetParticipantRequest, GetParticipantsRequest, GetSendAsRequest, InviteToChannelRequest, JoinChannelRequest, LeaveChannelRequest, ReadHistoryRequest, ReadMessageContentsRequest, ReorderPinnedForumTopicsRequest, ReorderUsernamesRequest, ReportAntiSpamFalsePositiveRequest, ReportSpamRequest, RestrictSponsoredMessagesRequest, SearchPostsRequest, SetBoostsToUnblockRestrictionsRequest, SetDiscussionGroupRequest, SetEmojiStickersRequest, SetStickersRequest, ToggleAntiSpamRequest, ToggleForumRequest, ToggleJoinRequestRequest, ToggleJoinToSendRequest, ToggleParticipantsHiddenRequest, TogglePreHistoryHiddenRequest, ToggleSignaturesRequest, ToggleSlowModeRequest, ToggleUsernameRequest, ToggleViewForumAsMessagesRequest, UpdateColorRequest, UpdateEmojiStatusRequest, UpdatePaidMessagesPriceRequest, UpdatePinnedForumTopicRequest, UpdateUsernameRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChannelAdminLogEventsFilter, TypeChannelParticipantsFilter, TypeChatAdminRights, TypeChatBannedRights, TypeEmojiStatus, TypeInputChannel, TypeInputChatPhoto, TypeInputCheckPasswordSRP, TypeInputGeoPoint, TypeInputMessage, TypeInputPeer, TypeInputStickerSet, TypeInputUser
+
+
@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.help import AcceptTermsOfServiceRequest, DismissSuggestionRequest, EditUserInfoRequest, GetAppConfigRequest, GetAppUpdateRequest, GetCdnConfigRequest, GetConfigRequest, GetCountriesListRequest, GetDeepLinkInfoRequest, GetInviteTextRequest, GetNearestDcRequest, GetPassportConfigRequest, GetPeerColorsRequest, GetPeerProfileColorsRequest, GetPremiumPromoRequest, GetPromoDataRequest, GetRecentMeUrlsRequest, GetSupportNameRequest, GetSupportRequest, GetTermsOfServiceUpdateRequest, GetTimezonesListRequest, GetUserInfoRequest, HidePromoDataRequest, SaveAppLogRequest, SetBotUpdatesStatusRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDataJSON, TypeInputAppEvent, TypeInputPeer, TypeInputUser, TypeMessageEntity
+
+
@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.messages import AcceptEncryptionRequest, AcceptUrlAuthRequest, AddChatUserRequest, CheckChatInviteRequest, CheckHistoryImportPeerRequest, CheckHistoryImportRequest, CheckQuickReplyShortcutRequest, ClearAllDraftsRequest, ClearRecentReactionsRequest, ClearRecentStickersRequest, ClickSponsoredMessageRequest, CreateChatRequest, DeleteChatRequest, DeleteChatUserRequest, DeleteExportedChatInviteRequest, DeleteFactCheckRequest, DeleteHistoryRequest, DeleteMessagesRequest, DeletePhoneCallHistoryRequest, DeleteQuickReplyMessagesRequest, DeleteQuickReplyShortcutRequest, DeleteRevokedExportedChatInvitesRequest, DeleteSavedHistoryRequest, DeleteScheduledMessagesRequest, DiscardEncryptionRequest, EditChatAboutRequest, EditChatAdminRequest, EditChatDefaultBannedRightsRequest, EditChatPhotoRequest, EditChatTitleRequest, EditExportedChatInviteRequest, EditFactCheckRequest, EditInlineBotMessageRequest, EditMessageRequest, EditQuickReplyShortcutRequest, ExportChatInviteRequest, FaveStickerRequest, ForwardMessagesRequest, GetAdminsWithInvitesRequest, GetAllDraftsRequest, GetAllStickersRequest, GetArchivedStickersRequest, GetAttachMenuBotRequest, GetAttachMenuBotsRequest, GetAttachedStickersRequest, GetAvailableEffectsRequest, GetAvailableReactionsRequest, GetBotAppRequest, GetBotCallbackAnswerRequest, GetChatInviteImportersRequest, GetChatsRequest, GetCommonChatsRequest, GetCustomEmojiDocumentsRequest, GetDefaultHistoryTTLRequest, GetDefaultTagReactionsRequest, GetDhConfigRequest, GetDialogFiltersRequest, GetDialogUnreadMarksRequest, GetDialogsRequest, GetDiscussionMessageRequest, GetDocumentByHashRequest, GetEmojiGroupsRequest, GetEmojiKeywordsDifferenceRequest, GetEmojiKeywordsLanguagesRequest, GetEmojiKeywordsRequest, GetEmojiProfilePhotoGroupsRequest, GetEmojiStatusGroupsRequest, GetEmojiStickerGroupsRequest, GetEmojiStickersRequest, GetEmojiURLRequest, GetExportedChatInviteRequest, GetExportedChatInvitesRequest, GetExtendedMediaRequest, GetFactCheckRequest, GetFavedStickersRequest, GetFeaturedEmojiStickersRequest, GetFeaturedStickersRequest, GetFullChatRequest, GetGameHighScoresRequest, GetHistoryRequest, GetInlineBotResultsRequest, GetInlineGameHighScoresRequest, GetMaskStickersRequest, GetMessageEditDataRequest, GetMessageReactionsListRequest, GetMessageReadParticipantsRequest, GetMessagesReactionsRequest, GetMessagesRequest, GetMessagesViewsRequest, GetMyStickersRequest, GetOldFeaturedStickersRequest, GetOnlinesRequest, GetOutboxReadDateRequest, GetPaidReactionPrivacyRequest, GetPeerDialogsRequest, GetPeerSettingsRequest, GetPinnedDialogsRequest, GetPinnedSavedDialogsRequest, GetPollResultsRequest, GetPollVotesRequest, GetPreparedInlineMessageRequest, GetQuickRepliesRequest, GetQuickReplyMessagesRequest, GetRecentLocationsRequest, GetRecentReactionsRequest, GetRecentStickersRequest, GetRepliesRequest, GetSavedDialogsRequest, GetSavedGifsRequest, GetSavedHistoryRequest, GetSavedReactionTagsRequest, GetScheduledHistoryRequest, GetScheduledMessagesRequest, GetSearchCountersRequest, GetSearchResultsCalendarRequest, GetSearchResultsPositionsRequest, GetSplitRangesRequest, GetSponsoredMessagesRequest, GetStickerSetRequest, GetStickersRequest, GetSuggestedDialogFiltersRequest, GetTopReactionsRequest, GetUnreadMentionsRequest, GetUnreadReactionsRequest, GetWebPagePreviewRequest, GetWebPageRequest, HideAllChatJoinRequestsRequest, HideChatJoinRequestRequest, HidePeerSettingsBarRequest, ImportChatInviteRequest, InitHistoryImportRequest, InstallStickerSetRequest, MarkDialogUnreadRequest, MigrateChatRequest, ProlongWebViewRequest, RateTranscribedAudioRequest, ReadDiscussionRequest, ReadEncryptedHistoryRequest, ReadFeaturedStickersRequest, ReadHistoryRequest, ReadMentionsRequest, ReadMessageContentsRequest, ReadReactionsRequest, ReceivedMessagesRequest, ReceivedQueueRequest, ReorderPinnedDialogsRequest, ReorderPinnedSavedDialogsRequest, ReorderQuickRepliesRequest, ReorderStickerSetsRequest, ReportEncryptedSpamRequest, ReportMessagesDeliveryRequest, ReportReactionRequest, ReportRequest, ReportSpamRequest, ReportSponsoredMessageRequest, RequestAppWebViewRequest, RequestEncryptionRequest, RequestMainWebViewRequest, RequestSimpleWebViewRequest, RequestUrlAuthRequest, RequestWebViewRequest, SaveDefaultSendAsRequest, SaveDraftRequest, SaveGifRequest, SavePreparedInlineMessageRequest, SaveRecentStickerRequest, SearchCustomEmojiRequest, SearchEmojiStickerSetsRequest, SearchGlobalRequest, SearchRequest, SearchSentMediaRequest, SearchStickerSetsRequest, SearchStickersRequest, SendBotRequestedPeerRequest, SendEncryptedFileRequest, SendEncryptedRequest, SendEncryptedServiceRequest, SendInlineBotResultRequest, SendMediaRequest, SendMessageRequest, SendMultiMediaRequest, SendPaidReactionRequest, SendQuickReplyMessagesRequest, SendReactionRequest, SendScheduledMessagesRequest, SendScreenshotNotificationRequest, SendVoteRequest, SendWebViewDataRequest, SendWebViewResultMessageRequest, SetBotCallbackAnswerRequest, SetBotPrecheckoutResultsRequest, SetBotShippingResultsRequest, SetChatAvailableReactionsRequest, SetChatThemeRequest, SetChatWallPaperRequest, SetDefaultHistoryTTLRequest, SetDefaultReactionRequest, SetEncryptedTypingRequest, SetGameScoreRequest, SetHistoryTTLRequest, SetInlineBotResultsRequest, SetInlineGameScoreRequest, SetTypingRequest, StartBotRequest, StartHistoryImportRequest, ToggleBotInAttachMenuRequest, ToggleDialogFilterTagsRequest, ToggleDialogPinRequest, ToggleNoForwardsRequest, TogglePaidReactionPrivacyRequest, TogglePeerTranslationsRequest, ToggleSavedDialogPinRequest, ToggleStickerSetsRequest, TranscribeAudioRequest, TranslateTextRequest, UninstallStickerSetRequest, UnpinAllMessagesRequest, UpdateDialogFilterRequest, UpdateDialogFiltersOrderRequest, UpdatePinnedMessageRequest, UpdateSavedReactionTagRequest, UploadEncryptedFileRequest, UploadImportedMediaRequest, UploadMediaRequest, ViewSponsoredMessageRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChatBannedRights, TypeChatReactions, TypeDataJSON, TypeDialogFilter, TypeInlineBotSwitchPM, TypeInlineBotWebView, TypeInlineQueryPeerType, TypeInputBotApp, TypeInputBotInlineMessageID, TypeInputBotInlineResult, TypeInputChatPhoto, TypeInputCheckPasswordSRP, TypeInputDialogPeer, TypeInputDocument, TypeInputEncryptedChat, TypeInputEncryptedFile, TypeInputFile, TypeInputGeoPoint, TypeInputMedia, TypeInputMessage, TypeInputPeer, TypeInputQuickReplyShortcut, TypeInputReplyTo, TypeInputSingleMedia, TypeInputStickerSet, TypeInputStickeredMedia, TypeInputUser, TypeInputWallPaper, TypeMessageEntity, TypeMessagesFilter, TypePaidReactionPrivacy, TypeReaction, TypeReplyMarkup, TypeSendMessageAction, TypeShippingOption, TypeStarsSubscriptionPricing, TypeTextWithEntities, TypeWallPaperSettings
+
+
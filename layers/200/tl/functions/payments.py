@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.payments import ApplyGiftCodeRequest, AssignAppStoreTransactionRequest, AssignPlayMarketTransactionRequest, BotCancelStarsSubscriptionRequest, CanPurchasePremiumRequest, ChangeStarsSubscriptionRequest, CheckGiftCodeRequest, ClearSavedInfoRequest, ConnectStarRefBotRequest, ConvertStarGiftRequest, EditConnectedStarRefBotRequest, ExportInvoiceRequest, FulfillStarsSubscriptionRequest, GetBankCardDataRequest, GetConnectedStarRefBotRequest, GetConnectedStarRefBotsRequest, GetGiveawayInfoRequest, GetPaymentFormRequest, GetPaymentReceiptRequest, GetPremiumGiftCodeOptionsRequest, GetSavedInfoRequest, GetSavedStarGiftRequest, GetSavedStarGiftsRequest, GetStarGiftUpgradePreviewRequest, GetStarGiftWithdrawalUrlRequest, GetStarGiftsRequest, GetStarsGiftOptionsRequest, GetStarsGiveawayOptionsRequest, GetStarsRevenueAdsAccountUrlRequest, GetStarsRevenueStatsRequest, GetStarsRevenueWithdrawalUrlRequest, GetStarsStatusRequest, GetStarsSubscriptionsRequest, GetStarsTopupOptionsRequest, GetStarsTransactionsByIDRequest, GetStarsTransactionsRequest, GetSuggestedStarRefBotsRequest, GetUniqueStarGiftRequest, LaunchPrepaidGiveawayRequest, RefundStarsChargeRequest, SaveStarGiftRequest, SendPaymentFormRequest, SendStarsFormRequest, ToggleChatStarGiftNotificationsRequest, ToggleStarGiftsPinnedToTopRequest, TransferStarGiftRequest, UpgradeStarGiftRequest, ValidateRequestedInfoRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDataJSON, TypeInputCheckPasswordSRP, TypeInputInvoice, TypeInputMedia, TypeInputPaymentCredentials, TypeInputPeer, TypeInputSavedStarGift, TypeInputStarsTransaction, TypeInputStorePaymentPurpose, TypeInputUser, TypePaymentRequestedInfo
+
+
@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.phone import AcceptCallRequest, CheckGroupCallRequest, ConfirmCallRequest, CreateConferenceCallRequest, CreateGroupCallRequest, DiscardCallRequest, DiscardGroupCallRequest, EditGroupCallParticipantRequest, EditGroupCallTitleRequest, ExportGroupCallInviteRequest, GetCallConfigRequest, GetGroupCallJoinAsRequest, GetGroupCallRequest, GetGroupCallStreamChannelsRequest, GetGroupCallStreamRtmpUrlRequest, GetGroupParticipantsRequest, InviteToGroupCallRequest, JoinGroupCallPresentationRequest, JoinGroupCallRequest, LeaveGroupCallPresentationRequest, LeaveGroupCallRequest, ReceivedCallRequest, RequestCallRequest, SaveCallDebugRequest, SaveCallLogRequest, SaveDefaultGroupCallJoinAsRequest, SendSignalingDataRequest, SetCallRatingRequest, StartScheduledGroupCallRequest, ToggleGroupCallRecordRequest, ToggleGroupCallSettingsRequest, ToggleGroupCallStartSubscriptionRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDataJSON, TypeInputFile, TypeInputGroupCall, TypeInputPeer, TypeInputPhoneCall, TypeInputUser, TypePhoneCallDiscardReason, TypePhoneCallProtocol
+
+
@@ -0,0 +1,38 @@
+import inspect
+
+from .. import types, alltlobjects
+from ..custom.message import Message as _Message
+
+
+# Fields of every message constructor are set by the custom __init__
+_MESSAGE_ATTRIBUTES = (
+    *list(inspect.signature(_Message.__init__).parameters)[1:],
+    *_Message.STATE_ATTRIBUTES
+)
+
+
+def _get_slots(tlobject_class):
+    return tuple(
+        name
+        for name in _MESSAGE_ATTRIBUTES
+        if name not in tlobject_class.__slots__
+    )
+
+
+class MessageEmpty(_Message, types.MessageEmpty):
+    __slots__ = _get_slots(types.MessageEmpty)
+
+types.MessageEmpty = MessageEmpty
+alltlobjects.tlobjects[MessageEmpty.CONSTRUCTOR_ID] = MessageEmpty
+
+class MessageService(_Message, types.MessageService):
+    __slots__ = _get_slots(types.MessageService)
+
+types.MessageService = MessageService
+alltlobjects.tlobjects[MessageService.CONSTRUCTOR_ID] = MessageService
+
+class Message(_Message, types.Message):
+    __slots__ = _get_slots(types.Message)
+
+types.Message = Message
+alltlobjects.tlobjects[Message.CONSTRUCTOR_ID] = Message
@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.types.account import AuthorizationForm, Authorizations, AutoDownloadSettings, AutoSaveSettings, BusinessChatLinks, ConnectedBots, ContentSettings, EmailVerified, EmailVerifiedLogin, EmojiStatuses, EmojiStatusesNotModified, PaidMessagesRevenue, Password, PasswordInputSettings, PasswordSettings, PrivacyRules, ResetPasswordFailedWait, ResetPasswordOk, ResetPasswordRequestedWait, ResolvedBusinessChatLinks, SavedRingtone, SavedRingtoneConverted, SavedRingtones, SavedRingtonesNotModified, SentEmailCode, Takeout, Themes, ThemesNotModified, TmpPassword, WallPapers, WallPapersNotModified, WebAuthorizations
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAuthorization, TypeAutoDownloadSettings, TypeAutoSaveException, TypeAutoSaveSettings, TypeBusinessChatLink, TypeChat, TypeConnectedBot, TypeDocument, TypeEmojiStatus, TypeMessageEntity, TypePasswordKdfAlgo, TypePeer, TypePrivacyRule, TypeSecurePasswordKdfAlgo, TypeSecureRequiredType, TypeSecureSecretSettings, TypeSecureValue, TypeSecureValueError, TypeTheme, TypeUser, TypeWallPaper, TypeWebAuthorization
+    from ...tl.types.auth import TypeSentCode
+
+
@@ -0,0 +1,13 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.types.auth import Authorization, AuthorizationSignUpRequired, CodeTypeCall, CodeTypeFlashCall, CodeTypeFragmentSms, CodeTypeMissedCall, CodeTypeSms, ExportedAuthorization, LoggedOut, LoginToken, LoginTokenMigrateTo, LoginTokenSuccess, PasswordRecovery, SentCode, SentCodeSuccess, SentCodeTypeApp, SentCodeTypeCall, SentCodeTypeEmailCode, SentCodeTypeFirebaseSms, SentCodeTypeFlashCall, SentCodeTypeFragmentSms, SentCodeTypeMissedCall, SentCodeTypeSetUpEmailRequired, SentCodeTypeSms, SentCodeTypeSmsPhrase, SentCodeTypeSmsWord
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeUser
+    from ...tl.types.help import TypeTermsOfService
+    from ...tl.types.auth import TypeAuthorization, TypeCodeType, TypeSentCodeType
+
+
@@ -0,0 +1,11 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.types.contacts import Blocked, BlockedSlice, ContactBirthdays, Contacts, ContactsNotModified, Found, ImportedContacts, ResolvedPeer, TopPeers, TopPeersDisabled, TopPeersNotModified
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeContact, TypeContactBirthday, TypeImportedContact, TypePeer, TypePeerBlocked, TypePopularContact, TypeTopPeerCategoryPeers, TypeUser
+
+
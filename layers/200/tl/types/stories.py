@@ -0,0 +1,11 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.types.stories import AllStories, AllStoriesNotModified, FoundStories, PeerStories, Stories, StoryReactionsList, StoryViews, StoryViewsList
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeFoundStory, TypePeerStories, TypeStoriesStealthMode, TypeStoryItem, TypeStoryReaction, TypeStoryView, TypeStoryViews, TypeUser
+
+
@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.types.updates import ChannelDifference, ChannelDifferenceEmpty, ChannelDifferenceTooLong, Difference, DifferenceEmpty, DifferenceSlice, DifferenceTooLong, State
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeDialog, TypeEncryptedMessage, TypeMessage, TypeUpdate, TypeUser
+    from ...tl.types.updates import TypeState
+
+
@@ -0,0 +1,14 @@
+from .adminlogevent import AdminLogEvent
+from .draft import Draft
+from .dialog import Dialog
+from .inputsizedfile import InputSizedFile
+from .messagebutton import MessageButton
+from .forward import Forward
+from .message import Message
+from .button import Button
+from .inlinebuilder import InlineBuilder
+from .inlineresult import InlineResult
+from .inlineresults import InlineResults
+from .conversation import Conversation
+from .qrlogin import QRLogin
+from .participantpermissions import ParticipantPermissions
@@ -0,0 +1,13 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+from . import account, auth, bots, channels, chatlists, contacts, folders, fragment, help, langpack, messages, payments, phone, photos, premium, smsjobs, stats, stickers, stories, updates, upload, users
+import os
+import struct
+from ....shared.tl.functions import DestroyAuthKeyRequest, DestroySessionRequest, GetFutureSaltsRequest, InitConnectionRequest, InvokeAfterMsgRequest, InvokeAfterMsgsRequest, InvokeWithApnsSecretRequest, InvokeWithBusinessConnectionRequest, InvokeWithGooglePlayIntegrityRequest, InvokeWithLayerRequest, InvokeWithMessagesRangeRequest, InvokeWithReCaptchaRequest, InvokeWithTakeoutRequest, InvokeWithoutUpdatesRequest, PingDelayDisconnectRequest, PingRequest, ReqDHParamsRequest, ReqPqMultiRequest, ReqPqRequest, RpcDropAnswerRequest, SetClientDHParamsRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputClientProxy, TypeJSONValue, TypeMessageRange, TypeType, TypeX
+
+
@@ -0,0 +1,71 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.account import AcceptAuthorizationRequest, AddNoPaidMessagesExceptionRequest, CancelPasswordEmailRequest, ChangeAuthorizationSettingsRequest, ChangePhoneRequest, CheckUsernameRequest, ClearRecentEmojiStatusesRequest, ConfirmPasswordEmailRequest, ConfirmPhoneRequest, CreateBusinessChatLinkRequest, CreateThemeRequest, DeclinePasswordResetRequest, DeleteAccountRequest, DeleteAutoSaveExceptionsRequest, DeleteBusinessChatLinkRequest, DeleteSecureValueRequest, DisablePeerConnectedBotRequest, EditBusinessChatLinkRequest, FinishTakeoutSessionRequest, GetAccountTTLRequest, GetAllSecureValuesRequest, GetAuthorizationFormRequest, GetAuthorizationsRequest, GetAutoDownloadSettingsRequest, GetAutoSaveSettingsRequest, GetBotBusinessConnectionRequest, GetBusinessChatLinksRequest, GetChannelDefaultEmojiStatusesRequest, GetChannelRestrictedStatusEmojisRequest, GetChatThemesRequest, GetCollectibleEmojiStatusesRequest, GetConnectedBotsRequest, GetContactSignUpNotificationRequest, GetContentSettingsRequest, GetDefaultBackgroundEmojisRequest, GetDefaultEmojiStatusesRequest, GetDefaultGroupPhotoEmojisRequest, GetDefaultProfilePhotoEmojisRequest, GetGlobalPrivacySettingsRequest, GetMultiWallPapersRequest, GetNotifyExceptionsRequest, GetNotifySettingsRequest, GetPaidMessagesRevenueRequest, GetPasswordRequest, GetPasswordSettingsRequest, GetPrivacyRequest, GetReactionsNotifySettingsRequest, GetRecentEmojiStatusesRequest, GetSavedRingtonesRequest, GetSecureValueRequest, GetThemeRequest, GetThemesRequest, GetTmpPasswordRequest, GetWallPaperRequest, GetWallPapersRequest, GetWebAuthorizationsRequest, InitTakeoutSessionRequest, InstallThemeRequest, InstallWallPaperRequest, InvalidateSignInCodesRequest, RegisterDeviceRequest, ReorderUsernamesRequest, ReportPeerRequest, ReportProfilePhotoRequest, ResendPasswordEmailRequest, ResetAuthorizationRequest, ResetNotifySettingsRequest, ResetPasswordRequest, ResetWallPapersRequest, ResetWebAuthorizationRequest, ResetWebAuthorizationsRequest, ResolveBusinessChatLinkRequest, SaveAutoDownloadSettingsRequest, SaveAutoSaveSettingsRequest, SaveRingtoneRequest, SaveSecureValueRequest, SaveThemeRequest, SaveWallPaperRequest, SendChangePhoneCodeRequest, SendConfirmPhoneCodeRequest, SendVerifyEmailCodeRequest, SendVerifyPhoneCodeRequest, SetAccountTTLRequest, SetAuthorizationTTLRequest, SetContactSignUpNotificationRequest, SetContentSettingsRequest, SetGlobalPrivacySettingsRequest, SetPrivacyRequest, SetReactionsNotifySettingsRequest, ToggleConnectedBotPausedRequest, ToggleSponsoredMessagesRequest, ToggleUsernameRequest, UnregisterDeviceRequest, UpdateBirthdayRequest, UpdateBusinessAwayMessageRequest, UpdateBusinessGreetingMessageRequest, UpdateBusinessIntroRequest, UpdateBusinessLocationRequest, UpdateBusinessWorkHoursRequest, UpdateColorRequest, UpdateDeviceLockedRequest, UpdateEmojiStatusRequest, UpdateNotifySettingsRequest, UpdatePasswordSettingsRequest, UpdatePersonalChannelRequest, UpdateProfileRequest, UpdateStatusRequest, UpdateThemeRequest, UpdateUsernameRequest, UploadRingtoneRequest, UploadThemeRequest, UploadWallPaperRequest, VerifyEmailRequest, VerifyPhoneRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAccountDaysTTL, TypeAutoDownloadSettings, TypeAutoSaveSettings, TypeBaseTheme, TypeBirthday, TypeBusinessBotRights, TypeBusinessWorkHours, TypeCodeSettings, TypeEmailVerification, TypeEmailVerifyPurpose, TypeEmojiStatus, TypeGlobalPrivacySettings, TypeInputBusinessAwayMessage, TypeInputBusinessBotRecipients, TypeInputBusinessChatLink, TypeInputBusinessGreetingMessage, TypeInputBusinessIntro, TypeInputChannel, TypeInputCheckPasswordSRP, TypeInputDocument, TypeInputFile, TypeInputGeoPoint, TypeInputNotifyPeer, TypeInputPeer, TypeInputPeerNotifySettings, TypeInputPhoto, TypeInputPrivacyKey, TypeInputPrivacyRule, TypeInputSecureValue, TypeInputTheme, TypeInputThemeSettings, TypeInputUser, TypeInputWallPaper, TypeReactionsNotifySettings, TypeReportReason, TypeSecureCredentialsEncrypted, TypeSecureValueHash, TypeSecureValueType, TypeWallPaperSettings
+    from ...tl.types.account import TypePasswordInputSettings
+
+
+
+class UpdateConnectedBotRequest(TLRequest):
+    CONSTRUCTOR_ID = 0x66a08c7e
+    SUBCLASS_OF_ID = 0x8af52aac
+
+    __slots__ = ('bot', 'recipients', 'deleted', 'rights')
+
+    def __init__(self, bot: 'TypeInputUser', recipients: 'TypeInputBusinessBotRecipients', deleted: Optional[bool]=None, rights: Optional['TypeBusinessBotRights']=None):
+        """
+        :returns Updates: Instance of either UpdatesTooLong, UpdateShortMessage, UpdateShortChatMessage, UpdateShort, UpdatesCombined, Updates, UpdateShortSentMessage.
+        """
+        self.bot = bot
+        self.recipients = recipients
+        self.deleted = deleted
+        self.rights = rights
+
+    async def resolve(self, client, utils):
+        self.bot = utils.get_input_user(await client.get_input_entity(self.bot))
+
+    def to_dict(self):
+        return {
+            '_': 'UpdateConnectedBotRequest',
+            'bot': self.bot.to_dict() if isinstance(self.bot, TLObject) else self.bot,
+            'recipients': self.recipients.to_dict() if isinstance(self.recipients, TLObject) else self.recipients,
+            'deleted': self.deleted,
+            'rights': self.rights.to_dict() if isinstance(self.rights, TLObject) else self.rights
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'~\x8c\xa0f',
+            struct.pack('<I', (0 if self.deleted is None or self.deleted is False else 2) | (0 if self.rights is None or self.rights is False else 1)),
+            b'' if self.rights is None or self.rights is False else (self.rights._bytes()),
+            self.bot._bytes(),
+            self.recipients._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _deleted = bool(flags & 2)
+        if flags & 1:
+            _rights = reader.tgread_object()
+        else:
+            _rights = None
+        _bot = reader.tgread_object()
+        _recipients = reader.tgread_object()
+        return cls(bot=_bot, recipients=_recipients, deleted=_deleted, rights=_rights)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        if flags & 1:
+            reader.tgskip_object()
+        reader.tgskip_object()
+        reader.tgskip_object()
+
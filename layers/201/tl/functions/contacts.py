@@ -0,0 +1,46 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.contacts import AcceptContactRequest, AddContactRequest, BlockFromRepliesRequest, BlockRequest, DeleteByPhonesRequest, DeleteContactsRequest, EditCloseFriendsRequest, ExportContactTokenRequest, GetBirthdaysRequest, GetBlockedRequest, GetContactIDsRequest, GetContactsRequest, GetLocatedRequest, GetSavedRequest, GetStatusesRequest, GetTopPeersRequest, ImportContactTokenRequest, ImportContactsRequest, ResetSavedRequest, ResetTopPeerRatingRequest, ResolvePhoneRequest, ResolveUsernameRequest, SearchRequest, SetBlockedRequest, ToggleTopPeersRequest, UnblockRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputContact, TypeInputGeoPoint, TypeInputPeer, TypeInputUser, TypeTopPeerCategory
+
+
+
+class GetSponsoredPeersRequest(TLRequest):
+    CONSTRUCTOR_ID = 0xb6c8c393
+    SUBCLASS_OF_ID = 0xb45d5ccc
+
+    __slots__ = ('q',)
+
+    def __init__(self, q: str):
+        """
+        :returns contacts.SponsoredPeers: Instance of either SponsoredPeersEmpty, SponsoredPeers.
+        """
+        self.q = q
+
+    def to_dict(self):
+        return {
+            '_': 'GetSponsoredPeersRequest',
+            'q': self.q
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x93\xc3\xc8\xb6',
+            self.serialize_bytes(self.q),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _q = reader.tgread_string()
+        return cls(q=_q)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        TLObject.skip_bytes(reader)
+
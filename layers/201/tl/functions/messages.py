@@ -0,0 +1,129 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.messages import AcceptEncryptionRequest, AcceptUrlAuthRequest, AddChatUserRequest, CheckChatInviteRequest, CheckHistoryImportPeerRequest, CheckHistoryImportRequest, CheckQuickReplyShortcutRequest, ClearAllDraftsRequest, ClearRecentReactionsRequest, ClearRecentStickersRequest, CreateChatRequest, DeleteChatRequest, DeleteChatUserRequest, DeleteExportedChatInviteRequest, DeleteFactCheckRequest, DeleteHistoryRequest, DeleteMessagesRequest, DeletePhoneCallHistoryRequest, DeleteQuickReplyMessagesRequest, DeleteQuickReplyShortcutRequest, DeleteRevokedExportedChatInvitesRequest, DeleteSavedHistoryRequest, DeleteScheduledMessagesRequest, DiscardEncryptionRequest, EditChatAboutRequest, EditChatAdminRequest, EditChatDefaultBannedRightsRequest, EditChatPhotoRequest, EditChatTitleRequest, EditExportedChatInviteRequest, EditFactCheckRequest, EditInlineBotMessageRequest, EditMessageRequest, EditQuickReplyShortcutRequest, ExportChatInviteRequest, FaveStickerRequest, ForwardMessagesRequest, GetAdminsWithInvitesRequest, GetAllDraftsRequest, GetAllStickersRequest, GetArchivedStickersRequest, GetAttachMenuBotRequest, GetAttachMenuBotsRequest, GetAttachedStickersRequest, GetAvailableEffectsRequest, GetAvailableReactionsRequest, GetBotAppRequest, GetBotCallbackAnswerRequest, GetChatInviteImportersRequest, GetChatsRequest, GetCommonChatsRequest, GetCustomEmojiDocumentsRequest, GetDefaultHistoryTTLRequest, GetDefaultTagReactionsRequest, GetDhConfigRequest, GetDialogFiltersRequest, GetDialogUnreadMarksRequest, GetDialogsRequest, GetDiscussionMessageRequest, GetDocumentByHashRequest, GetEmojiGroupsRequest, GetEmojiKeywordsDifferenceRequest, GetEmojiKeywordsLanguagesRequest, GetEmojiKeywordsRequest, GetEmojiProfilePhotoGroupsRequest, GetEmojiStatusGroupsRequest, GetEmojiStickerGroupsRequest, GetEmojiStickersRequest, GetEmojiURLRequest, GetExportedChatInviteRequest, GetExportedChatInvitesRequest, GetExtendedMediaRequest, GetFactCheckRequest, GetFavedStickersRequest, GetFeaturedEmojiStickersRequest, GetFeaturedStickersRequest, GetFullChatRequest, GetGameHighScoresRequest, GetHistoryRequest, GetInlineBotResultsRequest, GetInlineGameHighScoresRequest, GetMaskStickersRequest, GetMessageEditDataRequest, GetMessageReactionsListRequest, GetMessageReadParticipantsRequest, GetMessagesReactionsRequest, GetMessagesRequest, GetMessagesViewsRequest, GetMyStickersRequest, GetOldFeaturedStickersRequest, GetOnlinesRequest, GetOutboxReadDateRequest, GetPaidReactionPrivacyRequest, GetPeerDialogsRequest, GetPeerSettingsRequest, GetPinnedDialogsRequest, GetPinnedSavedDialogsRequest, GetPollResultsRequest, GetPollVotesRequest, GetPreparedInlineMessageRequest, GetQuickRepliesRequest, GetQuickReplyMessagesRequest, GetRecentLocationsRequest, GetRecentReactionsRequest, GetRecentStickersRequest, GetRepliesRequest, GetSavedDialogsRequest, GetSavedGifsRequest, GetSavedHistoryRequest, GetSavedReactionTagsRequest, GetScheduledHistoryRequest, GetScheduledMessagesRequest, GetSearchCountersRequest, GetSearchResultsCalendarRequest, GetSearchResultsPositionsRequest, GetSplitRangesRequest, GetSponsoredMessagesRequest, GetStickerSetRequest, GetStickersRequest, GetSuggestedDialogFiltersRequest, GetTopReactionsRequest, GetUnreadMentionsRequest, GetUnreadReactionsRequest, GetWebPagePreviewRequest, GetWebPageRequest, HideAllChatJoinRequestsRequest, HideChatJoinRequestRequest, HidePeerSettingsBarRequest, ImportChatInviteRequest, InitHistoryImportRequest, InstallStickerSetRequest, MarkDialogUnreadRequest, MigrateChatRequest, ProlongWebViewRequest, RateTranscribedAudioRequest, ReadDiscussionRequest, ReadEncryptedHistoryRequest, ReadFeaturedStickersRequest, ReadHistoryRequest, ReadMentionsRequest, ReadMessageContentsRequest, ReadReactionsRequest, ReceivedMessagesRequest, ReceivedQueueRequest, ReorderPinnedDialogsRequest, ReorderPinnedSavedDialogsRequest, ReorderQuickRepliesRequest, ReorderStickerSetsRequest, ReportEncryptedSpamRequest, ReportMessagesDeliveryRequest, ReportReactionRequest, ReportRequest, ReportSpamRequest, RequestAppWebViewRequest, RequestEncryptionRequest, RequestMainWebViewRequest, RequestSimpleWebViewRequest, RequestUrlAuthRequest, RequestWebViewRequest, SaveDefaultSendAsRequest, SaveDraftRequest, SaveGifRequest, SavePreparedInlineMessageRequest, SaveRecentStickerRequest, SearchCustomEmojiRequest, SearchEmojiStickerSetsRequest, SearchGlobalRequest, SearchRequest, SearchSentMediaRequest, SearchStickerSetsRequest, SearchStickersRequest, SendBotRequestedPeerRequest, SendEncryptedFileRequest, SendEncryptedRequest, SendEncryptedServiceRequest, SendInlineBotResultRequest, SendMediaRequest, SendMessageRequest, SendMultiMediaRequest, SendPaidReactionRequest, SendQuickReplyMessagesRequest, SendReactionRequest, SendScheduledMessagesRequest, SendScreenshotNotificationRequest, SendVoteRequest, SendWebViewDataRequest, SendWebViewResultMessageRequest, SetBotCallbackAnswerRequest, SetBotPrecheckoutResultsRequest, SetBotShippingResultsRequest, SetChatAvailableReactionsRequest, SetChatThemeRequest, SetChatWallPaperRequest, SetDefaultHistoryTTLRequest, SetDefaultReactionRequest, SetEncryptedTypingRequest, SetGameScoreRequest, SetHistoryTTLRequest, SetInlineBotResultsRequest, SetInlineGameScoreRequest, SetTypingRequest, StartBotRequest, StartHistoryImportRequest, ToggleBotInAttachMenuRequest, ToggleDialogFilterTagsRequest, ToggleDialogPinRequest, ToggleNoForwardsRequest, TogglePaidReactionPrivacyRequest, TogglePeerTranslationsRequest, ToggleSavedDialogPinRequest, ToggleStickerSetsRequest, TranscribeAudioRequest, TranslateTextRequest, UninstallStickerSetRequest, UnpinAllMessagesRequest, UpdateDialogFilterRequest, UpdateDialogFiltersOrderRequest, UpdatePinnedMessageRequest, UpdateSavedReactionTagRequest, UploadEncryptedFileRequest, UploadImportedMediaRequest, UploadMediaRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChatBannedRights, TypeChatReactions, TypeDataJSON, TypeDialogFilter, TypeInlineBotSwitchPM, TypeInlineBotWebView, TypeInlineQueryPeerType, TypeInputBotApp, TypeInputBotInlineMessageID, TypeInputBotInlineResult, TypeInputChatPhoto, TypeInputCheckPasswordSRP, TypeInputDialogPeer, TypeInputDocument, TypeInputEncryptedChat, TypeInputEncryptedFile, TypeInputFile, TypeInputGeoPoint, TypeInputMedia, TypeInputMessage, TypeInputPeer, TypeInputQuickReplyShortcut, TypeInputReplyTo, TypeInputSingleMedia, TypeInputStickerSet, TypeInputStickeredMedia, TypeInputUser, TypeInputWallPaper, TypeMessageEntity, TypeMessagesFilter, TypePaidReactionPrivacy, TypeReaction, TypeReplyMarkup, TypeSendMessageAction, TypeShippingOption, TypeStarsSubscriptionPricing, TypeTextWithEntities, TypeWallPaperSettings
+
+
+
+class ClickSponsoredMessageRequest(TLRequest):
+    CONSTRUCTOR_ID = 0x8235057e
+    SUBCLASS_OF_ID = 0xf5b399ac
+
+    __slots__ = ('media', 'fullscreen', 'random_id')
+
+    def __init__(self, media: Optional[bool]=None, fullscreen: Optional[bool]=None, random_id: bytes=None):
+        """
+        :returns Bool: This type has no constructors.
+        """
+        self.media = media
+        self.fullscreen = fullscreen
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(4), 'big', signed=True)
+
+    def to_dict(self):
+        return {
+            '_': 'ClickSponsoredMessageRequest',
+            'media': self.media,
+            'fullscreen': self.fullscreen,
+            'random_id': self.random_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'~\x055\x82',
+            struct.pack('<I', (0 if self.media is None or self.media is False else 1) | (0 if self.fullscreen is None or self.fullscreen is False else 2)),
+            self.serialize_bytes(self.random_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _media = bool(flags & 1)
+        _fullscreen = bool(flags & 2)
+        _random_id = reader.tgread_bytes()
+        return cls(media=_media, fullscreen=_fullscreen, random_id=_random_id)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        TLObject.skip_bytes(reader)
+
+
+class ReportSponsoredMessageRequest(TLRequest):
+    CONSTRUCTOR_ID = 0x12cbf0c4
+    SUBCLASS_OF_ID = 0x26231822
+
+    __slots__ = ('option', 'random_id')
+
+    def __init__(self, option: bytes, random_id: bytes=None):
+        """
+        :returns channels.SponsoredMessageReportResult: Instance of either SponsoredMessageReportResultChooseOption, SponsoredMessageReportResultAdsHidden, SponsoredMessageReportResultReported.
+        """
+        self.option = option
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(4), 'big', signed=True)
+
+    def to_dict(self):
+        return {
+            '_': 'ReportSponsoredMessageRequest',
+            'option': self.option,
+            'random_id': self.random_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc4\xf0\xcb\x12',
+            self.serialize_bytes(self.random_id),
+            self.serialize_bytes(self.option),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _random_id = reader.tgread_bytes()
+        _option = reader.tgread_bytes()
+        return cls(option=_option, random_id=_random_id)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        TLObject.skip_bytes(reader)
+        TLObject.skip_bytes(reader)
+
+
+class ViewSponsoredMessageRequest(TLRequest):
+    CONSTRUCTOR_ID = 0x269e3643
+    SUBCLASS_OF_ID = 0xf5b399ac
+
+    __slots__ = ('random_id',)
+
+    def __init__(self, random_id: bytes=None):
+        """
+        :returns Bool: This type has no constructors.
+        """
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(4), 'big', signed=True)
+
+    def to_dict(self):
+        return {
+            '_': 'ViewSponsoredMessageRequest',
+            'random_id': self.random_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'C6\x9e&',
+            self.serialize_bytes(self.random_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _random_id = reader.tgread_bytes()
+        return cls(random_id=_random_id)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        TLObject.skip_bytes(reader)
+
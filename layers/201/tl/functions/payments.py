@@ -0,0 +1,46 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.payments import ApplyGiftCodeRequest, AssignAppStoreTransactionRequest, AssignPlayMarketTransactionRequest, BotCancelStarsSubscriptionRequest, ChangeStarsSubscriptionRequest, CheckGiftCodeRequest, ClearSavedInfoRequest, ConnectStarRefBotRequest, ConvertStarGiftRequest, EditConnectedStarRefBotRequest, ExportInvoiceRequest, FulfillStarsSubscriptionRequest, GetBankCardDataRequest, GetConnectedStarRefBotRequest, GetConnectedStarRefBotsRequest, GetGiveawayInfoRequest, GetPaymentFormRequest, GetPaymentReceiptRequest, GetPremiumGiftCodeOptionsRequest, GetSavedInfoRequest, GetSavedStarGiftRequest, GetSavedStarGiftsRequest, GetStarGiftUpgradePreviewRequest, GetStarGiftWithdrawalUrlRequest, GetStarGiftsRequest, GetStarsGiftOptionsRequest, GetStarsGiveawayOptionsRequest, GetStarsRevenueAdsAccountUrlRequest, GetStarsRevenueStatsRequest, GetStarsRevenueWithdrawalUrlRequest, GetStarsStatusRequest, GetStarsSubscriptionsRequest, GetStarsTopupOptionsRequest, GetStarsTransactionsByIDRequest, GetStarsTransactionsRequest, GetSuggestedStarRefBotsRequest, GetUniqueStarGiftRequest, LaunchPrepaidGiveawayRequest, RefundStarsChargeRequest, SaveStarGiftRequest, SendPaymentFormRequest, SendStarsFormRequest, ToggleChatStarGiftNotificationsRequest, ToggleStarGiftsPinnedToTopRequest, TransferStarGiftRequest, UpgradeStarGiftRequest, ValidateRequestedInfoRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDataJSON, TypeInputCheckPasswordSRP, TypeInputInvoice, TypeInputMedia, TypeInputPaymentCredentials, TypeInputPeer, TypeInputSavedStarGift, TypeInputStarsTransaction, TypeInputStorePaymentPurpose, TypeInputUser, TypePaymentRequestedInfo
+
+
+
+class CanPurchaseStoreRequest(TLRequest):
+    CONSTRUCTOR_ID = 0x4fdc5ea7
+    SUBCLASS_OF_ID = 0xf5b399ac
+
+    __slots__ = ('purpose',)
+
+    def __init__(self, purpose: 'TypeInputStorePaymentPurpose'):
+        """
+        :returns Bool: This type has no constructors.
+        """
+        self.purpose = purpose
+
+    def to_dict(self):
+        return {
+            '_': 'CanPurchaseStoreRequest',
+            'purpose': self.purpose.to_dict() if isinstance(self.purpose, TLObject) else self.purpose
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa7^\xdcO',
+            self.purpose._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _purpose = reader.tgread_object()
+        return cls(purpose=_purpose)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        reader.tgskip_object()
+
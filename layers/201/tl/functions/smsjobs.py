@@ -0,0 +1,9 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.smsjobs import FinishJobRequest, GetSmsJobRequest, GetStatusRequest, IsEligibleToJoinRequest, JoinRequest, LeaveRequest, UpdateSettingsRequest
+from datetime import datetime
+
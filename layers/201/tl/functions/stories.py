@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from ...tl import TLRequest
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.functions.stories import ActivateStealthModeRequest, CanSendStoryRequest, DeleteStoriesRequest, EditStoryRequest, ExportStoryLinkRequest, GetAllReadPeerStoriesRequest, GetAllStoriesRequest, GetChatsToSendRequest, GetPeerMaxIDsRequest, GetPeerStoriesRequest, GetPinnedStoriesRequest, GetStoriesArchiveRequest, GetStoriesByIDRequest, GetStoriesViewsRequest, GetStoryReactionsListRequest, GetStoryViewsListRequest, IncrementStoryViewsRequest, ReadStoriesRequest, ReportRequest, SearchPostsRequest, SendReactionRequest, SendStoryRequest, ToggleAllStoriesHiddenRequest, TogglePeerStoriesHiddenRequest, TogglePinnedRequest, TogglePinnedToTopRequest
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputMedia, TypeInputPeer, TypeInputPrivacyRule, TypeMediaArea, TypeMessageEntity, TypeReaction
+
+
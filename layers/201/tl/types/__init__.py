@@ -0,0 +1,1308 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+from . import account, auth, bots, channels, chatlists, contacts, fragment, help, messages, payments, phone, photos, premium, smsjobs, stats, stickers, storage, stories, updates, upload, users
+import os
+import struct
+from ....shared.tl.types import AccessPointRule, AccountDaysTTL, AttachMenuBot, AttachMenuBotIcon, AttachMenuBotIconColor, AttachMenuBots, AttachMenuBotsBot, AttachMenuBotsNotModified, AttachMenuPeerTypeBotPM, AttachMenuPeerTypeBroadcast, AttachMenuPeerTypeChat, AttachMenuPeerTypePM, AttachMenuPeerTypeSameBotPM, Authorization, AutoDownloadSettings, AutoSaveException, AutoSaveSettings, AvailableEffect, AvailableReaction, BadMsgNotification, BadServerSalt, BankCardOpenUrl, BaseThemeArctic, BaseThemeClassic, BaseThemeDay, BaseThemeNight, BaseThemeTinted, BindAuthKeyInner, Birthday, Boost, BotApp, BotAppNotModified, BotAppSettings, BotCommand, BotCommandScopeChatAdmins, BotCommandScopeChats, BotCommandScopeDefault, BotCommandScopePeer, BotCommandScopePeerAdmins, BotCommandScopePeerUser, BotCommandScopeUsers, BotInfo, BotInlineMediaResult, BotInlineMessageMediaAuto, BotInlineMessageMediaContact, BotInlineMessageMediaGeo, BotInlineMessageMediaInvoice, BotInlineMessageMediaVenue, BotInlineMessageMediaWebPage, BotInlineMessageText, BotInlineResult, BotMenuButton, BotMenuButtonCommands, BotMenuButtonDefault, BotPreviewMedia, BotVerification, BotVerifierSettings, BroadcastRevenueBalances, BroadcastRevenueTransactionProceeds, BroadcastRevenueTransactionRefund, BroadcastRevenueTransactionWithdrawal, BusinessAwayMessage, BusinessAwayMessageScheduleAlways, BusinessAwayMessageScheduleCustom, BusinessAwayMessageScheduleOutsideWorkHours, BusinessBotRecipients, BusinessChatLink, BusinessGreetingMessage, BusinessIntro, BusinessLocation, BusinessRecipients, BusinessWeeklyOpen, BusinessWorkHours, CdnConfig, CdnPublicKey, Channel, ChannelAdminLogEvent, ChannelAdminLogEventActionChangeAbout, ChannelAdminLogEventActionChangeAvailableReactions, ChannelAdminLogEventActionChangeEmojiStatus, ChannelAdminLogEventActionChangeEmojiStickerSet, ChannelAdminLogEventActionChangeHistoryTTL, ChannelAdminLogEventActionChangeLinkedChat, ChannelAdminLogEventActionChangeLocation, ChannelAdminLogEventActionChangePeerColor, ChannelAdminLogEventActionChangePhoto, ChannelAdminLogEventActionChangeProfilePeerColor, ChannelAdminLogEventActionChangeStickerSet, ChannelAdminLogEventActionChangeTitle, ChannelAdminLogEventActionChangeUsername, ChannelAdminLogEventActionChangeUsernames, ChannelAdminLogEventActionChangeWallpaper, ChannelAdminLogEventActionCreateTopic, ChannelAdminLogEventActionDefaultBannedRights, ChannelAdminLogEventActionDeleteMessage, ChannelAdminLogEventActionDeleteTopic, ChannelAdminLogEventActionDiscardGroupCall, ChannelAdminLogEventActionEditMessage, ChannelAdminLogEventActionEditTopic, ChannelAdminLogEventActionExportedInviteDelete, ChannelAdminLogEventActionExportedInviteEdit, ChannelAdminLogEventActionExportedInviteRevoke, ChannelAdminLogEventActionParticipantInvite, ChannelAdminLogEventActionParticipantJoin, ChannelAdminLogEventActionParticipantJoinByInvite, ChannelAdminLogEventActionParticipantJoinByRequest, ChannelAdminLogEventActionParticipantLeave, ChannelAdminLogEventActionParticipantMute, ChannelAdminLogEventActionParticipantSubExtend, ChannelAdminLogEventActionParticipantToggleAdmin, ChannelAdminLogEventActionParticipantToggleBan, ChannelAdminLogEventActionParticipantUnmute, ChannelAdminLogEventActionParticipantVolume, ChannelAdminLogEventActionPinTopic, ChannelAdminLogEventActionSendMessage, ChannelAdminLogEventActionStartGroupCall, ChannelAdminLogEventActionStopPoll, ChannelAdminLogEventActionToggleAntiSpam, ChannelAdminLogEventActionToggleForum, ChannelAdminLogEventActionToggleGroupCallSetting, ChannelAdminLogEventActionToggleInvites, ChannelAdminLogEventActionToggleNoForwards, ChannelAdminLogEventActionTogglePreHistoryHidden, ChannelAdminLogEventActionToggleSignatureProfiles, ChannelAdminLogEventActionToggleSignatures, ChannelAdminLogEventActionToggleSlowMode, ChannelAdminLogEventActionUpdatePinned, ChannelAdminLogEventsFilter, ChannelForbidden, ChannelFull, ChannelLocation, ChannelLocationEmpty, ChannelMessagesFilter, ChannelMessagesFilterEmpty, ChannelParticipant, ChannelParticipantAdmin, ChannelParticipantBanned, ChannelParticipantCreator, ChannelParticipantLeft, ChannelParticipantSelf, ChannelParticipantsAdmins, ChannelParticipantsBanned, ChannelParticipantsBots, ChannelParticipantsContacts, ChannelParticipantsKicked, ChannelParticipantsMentions, ChannelParticipantsRecent, ChannelParticipantsSearch, Chat, ChatAdminRights, ChatAdminWithInvites, ChatBannedRights, ChatEmpty, ChatForbidden, ChatFull, ChatInvite, ChatInviteAlready, ChatInviteExported, ChatInviteImporter, ChatInvitePeek, ChatInvitePublicJoinRequests, ChatOnlines, ChatParticipant, ChatParticipantAdmin, ChatParticipantCreator, ChatParticipants, ChatParticipantsForbidden, ChatPhoto, ChatPhotoEmpty, ChatReactionsAll, ChatReactionsNone, ChatReactionsSome, ClientDHInnerData, CodeSettings, Config, ConnectedBotStarRef, Contact, ContactBirthday, ContactStatus, DataJSON, DcOption, DefaultHistoryTTL, DestroyAuthKeyFail, DestroyAuthKeyNone, DestroyAuthKeyOk, DestroySessionNone, DestroySessionOk, DhGenFail, DhGenOk, DhGenRetry, Dialog, DialogFilter, DialogFilterChatlist, DialogFilterDefault, DialogFilterSuggested, DialogFolder, DialogPeer, DialogPeerFolder, Document, DocumentAttributeAnimated, DocumentAttributeAudio, DocumentAttributeCustomEmoji, DocumentAttributeFilename, DocumentAttributeHasStickers, DocumentAttributeImageSize, DocumentAttributeSticker, DocumentAttributeVideo, DocumentEmpty, DraftMessage, DraftMessageEmpty, EmailVerificationApple, EmailVerificationCode, EmailVerificationGoogle, EmailVerifyPurposeLoginChange, EmailVerifyPurposeLoginSetup, EmailVerifyPurposePassport, EmojiGroup, EmojiGroupGreeting, EmojiGroupPremium, EmojiKeyword, EmojiKeywordDeleted, EmojiKeywordsDifference, EmojiLanguage, EmojiList, EmojiListNotModified, EmojiStatus, EmojiStatusCollectible, EmojiStatusEmpty, EmojiURL, EncryptedChat, EncryptedChatDiscarded, EncryptedChatEmpty, EncryptedChatRequested, EncryptedChatWaiting, EncryptedFile, EncryptedFileEmpty, EncryptedMessage, EncryptedMessageService, ExportedChatlistInvite, ExportedContactToken, ExportedMessageLink, ExportedStoryLink, FactCheck, FileHash, Folder, FolderPeer, ForumTopic, ForumTopicDeleted, FoundStory, FutureSalt, Game, GeoPoint, GeoPointAddress, GeoPointEmpty, GroupCall, GroupCallDiscarded, GroupCallParticipant, GroupCallParticipantVideo, GroupCallParticipantVideoSourceGroup, GroupCallStreamChannel, HighScore, HttpWait, ImportedContact, InlineBotSwitchPM, InlineBotWebView, InlineQueryPeerTypeBotPM, InlineQueryPeerTypeBroadcast, InlineQueryPeerTypeChat, InlineQueryPeerTypeMegagroup, InlineQueryPeerTypePM, InlineQueryPeerTypeSameBotPM, InputAppEvent, InputBotAppID, InputBotAppShortName, InputBotInlineMessageGame, InputBotInlineMessageID, InputBotInlineMessageID64, InputBotInlineMessageMediaAuto, InputBotInlineMessageMediaContact, InputBotInlineMessageMediaGeo, InputBotInlineMessageMediaInvoice, InputBotInlineMessageMediaVenue, InputBotInlineMessageMediaWebPage, InputBotInlineMessageText, InputBotInlineResult, InputBotInlineResultDocument, InputBotInlineResultGame, InputBotInlineResultPhoto, InputBusinessAwayMessage, InputBusinessBotRecipients, InputBusinessChatLink, InputBusinessGreetingMessage, InputBusinessIntro, InputBusinessRecipients, InputChannel, InputChannelEmpty, InputChannelFromMessage, InputChatPhoto, InputChatPhotoEmpty, InputChatUploadedPhoto, InputChatlistDialogFilter, InputCheckPasswordEmpty, InputCheckPasswordSRP, InputClientProxy, InputCollectiblePhone, InputCollectibleUsername, InputDialogPeer, InputDialogPeerFolder, InputDocument, InputDocumentEmpty, InputDocumentFileLocation, InputEmojiStatusCollectible, InputEncryptedChat, InputEncryptedFile, InputEncryptedFileBigUploaded, InputEncryptedFileEmpty, InputEncryptedFileLocation, InputEncryptedFileUploaded, InputFile, InputFileBig, InputFileLocation, InputFileStoryDocument, InputFolderPeer, InputGameID, InputGameShortName, InputGeoPoint, InputGeoPointEmpty, InputGroupCall, InputGroupCallStream, InputInvoiceChatInviteSubscription, InputInvoiceMessage, InputInvoicePremiumGiftCode, InputInvoicePremiumGiftStars, InputInvoiceSlug, InputInvoiceStarGift, InputInvoiceStarGiftTransfer, InputInvoiceStarGiftUpgrade, InputInvoiceStars, InputKeyboardButtonRequestPeer, InputKeyboardButtonUrlAuth, InputKeyboardButtonUserProfile, InputMediaAreaChannelPost, InputMediaAreaVenue, InputMediaContact, InputMediaDice, InputMediaDocument, InputMediaDocumentExternal, InputMediaEmpty, InputMediaGame, InputMediaGeoLive, InputMediaGeoPoint, InputMediaInvoice, InputMediaPaidMedia, InputMediaPhoto, InputMediaPhotoExternal, InputMediaPoll, InputMediaStory, InputMediaUploadedDocument, InputMediaUploadedPhoto, InputMediaVenue, InputMediaWebPage, InputMessageCallbackQuery, InputMessageEntityMentionName, InputMessageID, InputMessagePinned, InputMessageReplyTo, InputMessagesFilterChatPhotos, InputMessagesFilterContacts, InputMessagesFilterDocument, InputMessagesFilterEmpty, InputMessagesFilterGeo, InputMessagesFilterGif, InputMessagesFilterMusic, InputMessagesFilterMyMentions, InputMessagesFilterPhoneCalls, InputMessagesFilterPhotoVideo, InputMessagesFilterPhotos, InputMessagesFilterPinned, InputMessagesFilterRoundVideo, InputMessagesFilterRoundVoice, InputMessagesFilterUrl, InputMessagesFilterVideo, InputMessagesFilterVoice, InputNotifyBroadcasts, InputNotifyChats, InputNotifyForumTopic, InputNotifyPeer, InputNotifyUsers, InputPaymentCredentials, InputPaymentCredentialsApplePay, InputPaymentCredentialsGooglePay, InputPaymentCredentialsSaved, InputPeerChannel, InputPeerChannelFromMessage, InputPeerChat, InputPeerEmpty, InputPeerNotifySettings, InputPeerPhotoFileLocation, InputPeerSelf, InputPeerUser, InputPeerUserFromMessage, InputPhoneCall, InputPhoneContact, InputPhoto, InputPhotoEmpty, InputPhotoFileLocation, InputPhotoLegacyFileLocation, InputPrivacyKeyAbout, InputPrivacyKeyAddedByPhone, InputPrivacyKeyBirthday, InputPrivacyKeyChatInvite, InputPrivacyKeyForwards, InputPrivacyKeyNoPaidMessages, InputPrivacyKeyPhoneCall, InputPrivacyKeyPhoneNumber, InputPrivacyKeyPhoneP2P, InputPrivacyKeyProfilePhoto, InputPrivacyKeyStarGiftsAutoSave, InputPrivacyKeyStatusTimestamp, InputPrivacyKeyVoiceMessages, InputPrivacyValueAllowAll, InputPrivacyValueAllowBots, InputPrivacyValueAllowChatParticipants, InputPrivacyValueAllowCloseFriends, InputPrivacyValueAllowContacts, InputPrivacyValueAllowPremium, InputPrivacyValueAllowUsers, InputPrivacyValueDisallowAll, InputPrivacyValueDisallowBots, InputPrivacyValueDisallowChatParticipants, InputPrivacyValueDisallowContacts, InputPrivacyValueDisallowUsers, InputQuickReplyShortcut, InputQuickReplyShortcutId, InputReplyToMessage, InputReplyToStory, InputReportReasonChildAbuse, InputReportReasonCopyright, InputReportReasonFake, InputReportReasonGeoIrrelevant, InputReportReasonIllegalDrugs, InputReportReasonOther, InputReportReasonPersonalDetails, InputReportReasonPornography, InputReportReasonSpam, InputReportReasonViolence, InputSavedStarGiftChat, InputSavedStarGiftUser, InputSecureFile, InputSecureFileLocation, InputSecureFileUploaded, InputSecureValue, InputSingleMedia, InputStarsTransaction, InputStickerSetAnimatedEmoji, InputStickerSetAnimatedEmojiAnimations, InputStickerSetDice, InputStickerSetEmojiChannelDefaultStatuses, InputStickerSetEmojiDefaultStatuses, InputStickerSetEmojiDefaultTopicIcons, InputStickerSetEmojiGenericAnimations, InputStickerSetEmpty, InputStickerSetID, InputStickerSetItem, InputStickerSetPremiumGifts, InputStickerSetShortName, InputStickerSetThumb, InputStickeredMediaDocument, InputStickeredMediaPhoto, InputStorePaymentGiftPremium, InputStorePaymentPremiumGiftCode, InputStorePaymentPremiumGiveaway, InputStorePaymentPremiumSubscription, InputStorePaymentStarsGift, InputStorePaymentStarsGiveaway, InputStorePaymentStarsTopup, InputTakeoutFileLocation, InputTheme, InputThemeSettings, InputThemeSlug, InputUser, InputUserEmpty, InputUserFromMessage, InputUserSelf, InputWallPaper, InputWallPaperNoFile, InputWallPaperSlug, InputWebDocument, InputWebFileAudioAlbumThumbLocation, InputWebFileGeoPointLocation, InputWebFileLocation, Invoice, IpPort, IpPortSecret, JsonArray, JsonBool, JsonNull, JsonNumber, JsonObject, JsonObjectValue, JsonString, KeyboardButton, KeyboardButtonBuy, KeyboardButtonCallback, KeyboardButtonCopy, KeyboardButtonGame, KeyboardButtonRequestGeoLocation, KeyboardButtonRequestPeer, KeyboardButtonRequestPhone, KeyboardButtonRequestPoll, KeyboardButtonRow, KeyboardButtonSimpleWebView, KeyboardButtonSwitchInline, KeyboardButtonUrl, KeyboardButtonUrlAuth, KeyboardButtonUserProfile, KeyboardButtonWebView, LabeledPrice, LangPackDifference, LangPackLanguage, LangPackString, LangPackStringDeleted, LangPackStringPluralized, MaskCoords, MediaAreaChannelPost, MediaAreaCoordinates, MediaAreaGeoPoint, MediaAreaStarGift, MediaAreaSuggestedReaction, MediaAreaUrl, MediaAreaVenue, MediaAreaWeather, Message, MessageActionBoostApply, MessageActionBotAllowed, MessageActionChannelCreate, MessageActionChannelMigrateFrom, MessageActionChatAddUser, MessageActionChatCreate, MessageActionChatDeletePhoto, MessageActionChatDeleteUser, MessageActionChatEditPhoto, MessageActionChatEditTitle, MessageActionChatJoinedByLink, MessageActionChatJoinedByRequest, MessageActionChatMigrateTo, MessageActionContactSignUp, MessageActionCustomAction, MessageActionEmpty, MessageActionGameScore, MessageActionGeoProximityReached, MessageActionGiftCode, MessageActionGiftPremium, MessageActionGiftStars, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionGroupCall, MessageActionGroupCallScheduled, MessageActionHistoryClear, MessageActionInviteToGroupCall, MessageActionPaymentRefunded, MessageActionPaymentSent, MessageActionPaymentSentMe, MessageActionPhoneCall, MessageActionPinMessage, MessageActionPrizeStars, MessageActionRequestedPeer, MessageActionRequestedPeerSentMe, MessageActionScreenshotTaken, MessageActionSecureValuesSent, MessageActionSecureValuesSentMe, MessageActionSetChatTheme, MessageActionSetChatWallPaper, MessageActionSetMessagesTTL, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionSuggestProfilePhoto, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionWebViewDataSent, MessageActionWebViewDataSentMe, MessageEmpty, MessageEntityBankCard, MessageEntityBlockquote, MessageEntityBold, MessageEntityBotCommand, MessageEntityCashtag, MessageEntityCode, MessageEntityCustomEmoji, MessageEntityEmail, MessageEntityHashtag, MessageEntityItalic, MessageEntityMention, MessageEntityMentionName, MessageEntityPhone, MessageEntityPre, MessageEntitySpoiler, MessageEntityStrike, MessageEntityTextUrl, MessageEntityUnderline, MessageEntityUnknown, MessageEntityUrl, MessageExtendedMedia, MessageExtendedMediaPreview, MessageFwdHeader, MessageMediaContact, MessageMediaDice, MessageMediaDocument, MessageMediaEmpty, MessageMediaGame, MessageMediaGeo, MessageMediaGeoLive, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaInvoice, MessageMediaPaidMedia, MessageMediaPhoto, MessageMediaPoll, MessageMediaStory, MessageMediaUnsupported, MessageMediaVenue, MessageMediaWebPage, MessagePeerReaction, MessagePeerVote, MessagePeerVoteInputOption, MessagePeerVoteMultiple, MessageRange, MessageReactions, MessageReactor, MessageReplies, MessageReplyHeader, MessageReplyStoryHeader, MessageReportOption, MessageService, MessageViews, MissingInvitee, MsgDetailedInfo, MsgNewDetailedInfo, MsgResendReq, MsgsAck, MsgsAllInfo, MsgsStateInfo, MsgsStateReq, MyBoost, NearestDc, NewSessionCreated, NotificationSoundDefault, NotificationSoundLocal, NotificationSoundNone, NotificationSoundRingtone, NotifyBroadcasts, NotifyChats, NotifyForumTopic, NotifyPeer, NotifyUsers, OutboxReadDate, PQInnerData, PQInnerDataDc, PQInnerDataTemp, PQInnerDataTempDc, Page, PageBlockAnchor, PageBlockAudio, PageBlockAuthorDate, PageBlockBlockquote, PageBlockChannel, PageBlockCollage, PageBlockCover, PageBlockDetails, PageBlockDivider, PageBlockEmbed, PageBlockEmbedPost, PageBlockFooter, PageBlockHeader, PageBlockKicker, PageBlockList, PageBlockMap, PageBlockOrderedList, PageBlockParagraph, PageBlockPhoto, PageBlockPreformatted, PageBlockPullquote, PageBlockRelatedArticles, PageBlockSlideshow, PageBlockSubheader, PageBlockSubtitle, PageBlockTable, PageBlockTitle, PageBlockUnsupported, PageBlockVideo, PageCaption, PageListItemBlocks, PageListItemText, PageListOrderedItemBlocks, PageListOrderedItemText, PageRelatedArticle, PageTableCell, PageTableRow, PaidReactionPrivacyAnonymous, PaidReactionPrivacyDefault, PaidReactionPrivacyPeer, PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow, PasswordKdfAlgoUnknown, PaymentCharge, PaymentFormMethod, PaymentRequestedInfo, PaymentSavedCredentialsCard, PeerBlocked, PeerChannel, PeerChat, PeerColor, PeerLocated, PeerNotifySettings, PeerSelfLocated, PeerSettings, PeerStories, PeerUser, PhoneCall, PhoneCallAccepted, PhoneCallDiscardReasonAllowGroupCall, PhoneCallDiscardReasonBusy, PhoneCallDiscardReasonDisconnect, PhoneCallDiscardReasonHangup, PhoneCallDiscardReasonMissed, PhoneCallDiscarded, PhoneCallEmpty, PhoneCallProtocol, PhoneCallRequested, PhoneCallWaiting, PhoneConnection, PhoneConnectionWebrtc, Photo, PhotoCachedSize, PhotoEmpty, PhotoPathSize, PhotoSize, PhotoSizeEmpty, PhotoSizeProgressive, PhotoStrippedSize, Poll, PollAnswer, PollAnswerVoters, PollResults, Pong, PopularContact, PostAddress, PostInteractionCountersMessage, PostInteractionCountersStory, PremiumGiftCodeOption, PremiumSubscriptionOption, PrepaidGiveaway, PrepaidStarsGiveaway, PrivacyKeyAbout, PrivacyKeyAddedByPhone, PrivacyKeyBirthday, PrivacyKeyChatInvite, PrivacyKeyForwards, PrivacyKeyNoPaidMessages, PrivacyKeyPhoneCall, PrivacyKeyPhoneNumber, PrivacyKeyPhoneP2P, PrivacyKeyProfilePhoto, PrivacyKeyStarGiftsAutoSave, PrivacyKeyStatusTimestamp, PrivacyKeyVoiceMessages, PrivacyValueAllowAll, PrivacyValueAllowBots, PrivacyValueAllowChatParticipants, PrivacyValueAllowCloseFriends, PrivacyValueAllowContacts, PrivacyValueAllowPremium, PrivacyValueAllowUsers, PrivacyValueDisallowAll, PrivacyValueDisallowBots, PrivacyValueDisallowChatParticipants, PrivacyValueDisallowContacts, PrivacyValueDisallowUsers, PublicForwardMessage, PublicForwardStory, QuickReply, ReactionCount, ReactionCustomEmoji, ReactionEmoji, ReactionEmpty, ReactionNotificationsFromAll, ReactionNotificationsFromContacts, ReactionPaid, ReactionsNotifySettings, ReadParticipantDate, ReceivedNotifyMessage, RecentMeUrlChat, RecentMeUrlChatInvite, RecentMeUrlStickerSet, RecentMeUrlUnknown, RecentMeUrlUser, ReplyInlineMarkup, ReplyKeyboardForceReply, ReplyKeyboardHide, ReplyKeyboardMarkup, ReportResultAddComment, ReportResultChooseOption, ReportResultReported, RequestPeerTypeBroadcast, RequestPeerTypeChat, RequestPeerTypeUser, RequestedPeerChannel, RequestedPeerChat, RequestedPeerUser, RequirementToContactEmpty, RequirementToContactPaidMessages, RequirementToContactPremium, ResPQ, RestrictionReason, RpcAnswerDropped, RpcAnswerDroppedRunning, RpcAnswerUnknown, RpcError, SavedDialog, SavedPhoneContact, SavedReactionTag, SavedStarGift, SearchResultPosition, SearchResultsCalendarPeriod, SecureCredentialsEncrypted, SecureData, SecureFile, SecureFileEmpty, SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000, SecurePasswordKdfAlgoSHA512, SecurePasswordKdfAlgoUnknown, SecurePlainEmail, SecurePlainPhone, SecureRequiredType, SecureRequiredTypeOneOf, SecureSecretSettings, SecureValue, SecureValueError, SecureValueErrorData, SecureValueErrorFile, SecureValueErrorFiles, SecureValueErrorFrontSide, SecureValueErrorReverseSide, SecureValueErrorSelfie, SecureValueErrorTranslationFile, SecureValueErrorTranslationFiles, SecureValueHash, SecureValueTypeAddress, SecureValueTypeBankStatement, SecureValueTypeDriverLicense, SecureValueTypeEmail, SecureValueTypeIdentityCard, SecureValueTypeInternalPassport, SecureValueTypePassport, SecureValueTypePassportRegistration, SecureValueTypePersonalDetails, SecureValueTypePhone, SecureValueTypeRentalAgreement, SecureValueTypeTemporaryRegistration, SecureValueTypeUtilityBill, SendAsPeer, SendMessageCancelAction, SendMessageChooseContactAction, SendMessageChooseStickerAction, SendMessageEmojiInteraction, SendMessageEmojiInteractionSeen, SendMessageGamePlayAction, SendMessageGeoLocationAction, SendMessageHistoryImportAction, SendMessageRecordAudioAction, SendMessageRecordRoundAction, SendMessageRecordVideoAction, SendMessageTypingAction, SendMessageUploadAudioAction, SendMessageUploadDocumentAction, SendMessageUploadPhotoAction, SendMessageUploadRoundAction, SendMessageUploadVideoAction, ServerDHInnerData, ServerDHParamsFail, ServerDHParamsOk, ShippingOption, SmsJob, SpeakingInGroupCallAction, SponsoredMessage, SponsoredMessageReportOption, StarGift, StarGiftAttributeBackdrop, StarGiftAttributeModel, StarGiftAttributeOriginalDetails, StarGiftAttributePattern, StarGiftUnique, StarRefProgram, StarsAmount, StarsGiftOption, StarsGiveawayOption, StarsGiveawayWinnersOption, StarsRevenueStatus, StarsSubscription, StarsSubscriptionPricing, StarsTopupOption, StarsTransaction, StarsTransactionPeer, StarsTransactionPeerAPI, StarsTransactionPeerAds, StarsTransactionPeerAppStore, StarsTransactionPeerFragment, StarsTransactionPeerPlayMarket, StarsTransactionPeerPremiumBot, StarsTransactionPeerUnsupported, StatsAbsValueAndPrev, StatsDateRangeDays, StatsGraph, StatsGraphAsync, StatsGraphError, StatsGroupTopAdmin, StatsGroupTopInviter, StatsGroupTopPoster, StatsPercentValue, StatsURL, StickerKeyword, StickerPack, StickerSet, StickerSetCovered, StickerSetFullCovered, StickerSetMultiCovered, StickerSetNoCovered, StoriesStealthMode, StoryFwdHeader, StoryItem, StoryItemDeleted, StoryItemSkipped, StoryReaction, StoryReactionPublicForward, StoryReactionPublicRepost, StoryView, StoryViewPublicForward, StoryViewPublicRepost, StoryViews, TextAnchor, TextBold, TextConcat, TextEmail, TextEmpty, TextFixed, TextImage, TextItalic, TextMarked, TextPhone, TextPlain, TextStrike, TextSubscript, TextSuperscript, TextUnderline, TextUrl, TextWithEntities, Theme, ThemeSettings, Timezone, TlsBlockDomain, TlsBlockGrease, TlsBlockPublicKey, TlsBlockRandom, TlsBlockScope, TlsBlockString, TlsBlockZero, TlsClientHello, TopPeer, TopPeerCategoryBotsApp, TopPeerCategoryBotsInline, TopPeerCategoryBotsPM, TopPeerCategoryChannels, TopPeerCategoryCorrespondents, TopPeerCategoryForwardChats, TopPeerCategoryForwardUsers, TopPeerCategoryGroups, TopPeerCategoryPeers, TopPeerCategoryPhoneCalls, UpdateAttachMenuBots, UpdateAutoSaveSettings, UpdateBotBusinessConnect, UpdateBotCallbackQuery, UpdateBotChatBoost, UpdateBotChatInviteRequester, UpdateBotCommands, UpdateBotDeleteBusinessMessage, UpdateBotEditBusinessMessage, UpdateBotInlineQuery, UpdateBotInlineSend, UpdateBotMenuButton, UpdateBotMessageReaction, UpdateBotMessageReactions, UpdateBotNewBusinessMessage, UpdateBotPrecheckoutQuery, UpdateBotPurchasedPaidMedia, UpdateBotShippingQuery, UpdateBotStopped, UpdateBotWebhookJSON, UpdateBotWebhookJSONQuery, UpdateBroadcastRevenueTransactions, UpdateBusinessBotCallbackQuery, UpdateChannel, UpdateChannelAvailableMessages, UpdateChannelMessageForwards, UpdateChannelMessageViews, UpdateChannelParticipant, UpdateChannelPinnedTopic, UpdateChannelPinnedTopics, UpdateChannelReadMessagesContents, UpdateChannelTooLong, UpdateChannelUserTyping, UpdateChannelViewForumAsMessages, UpdateChannelWebPage, UpdateChat, UpdateChatDefaultBannedRights, UpdateChatParticipant, UpdateChatParticipantAdd, UpdateChatParticipantAdmin, UpdateChatParticipantDelete, UpdateChatParticipants, UpdateChatUserTyping, UpdateConfig, UpdateContactsReset, UpdateDcOptions, UpdateDeleteChannelMessages, UpdateDeleteMessages, UpdateDeleteQuickReply, UpdateDeleteQuickReplyMessages, UpdateDeleteScheduledMessages, UpdateDialogFilter, UpdateDialogFilterOrder, UpdateDialogFilters, UpdateDialogPinned, UpdateDialogUnreadMark, UpdateDraftMessage, UpdateEditChannelMessage, UpdateEditMessage, UpdateEncryptedChatTyping, UpdateEncryptedMessagesRead, UpdateEncryption, UpdateFavedStickers, UpdateFolderPeers, UpdateGeoLiveViewed, UpdateGroupCall, UpdateGroupCallConnection, UpdateGroupCallParticipants, UpdateInlineBotCallbackQuery, UpdateLangPack, UpdateLangPackTooLong, UpdateLoginToken, UpdateMessageExtendedMedia, UpdateMessageID, UpdateMessagePoll, UpdateMessagePollVote, UpdateMessageReactions, UpdateMoveStickerSetToTop, UpdateNewAuthorization, UpdateNewChannelMessage, UpdateNewEncryptedMessage, UpdateNewMessage, UpdateNewQuickReply, UpdateNewScheduledMessage, UpdateNewStickerSet, UpdateNewStoryReaction, UpdateNotifySettings, UpdatePaidReactionPrivacy, UpdatePeerBlocked, UpdatePeerHistoryTTL, UpdatePeerLocated, UpdatePeerSettings, UpdatePeerWallpaper, UpdatePendingJoinRequests, UpdatePhoneCall, UpdatePhoneCallSignalingData, UpdatePinnedChannelMessages, UpdatePinnedDialogs, UpdatePinnedMessages, UpdatePinnedSavedDialogs, UpdatePrivacy, UpdatePtsChanged, UpdateQuickReplies, UpdateQuickReplyMessage, UpdateReadChannelDiscussionInbox, UpdateReadChannelDiscussionOutbox, UpdateReadChannelInbox, UpdateReadChannelOutbox, UpdateReadFeaturedEmojiStickers, UpdateReadFeaturedStickers, UpdateReadHistoryInbox, UpdateReadHistoryOutbox, UpdateReadMessagesContents, UpdateReadStories, UpdateRecentEmojiStatuses, UpdateRecentReactions, UpdateRecentStickers, UpdateSavedDialogPinned, UpdateSavedGifs, UpdateSavedReactionTags, UpdateSavedRingtones, UpdateSentStoryReaction, UpdateServiceNotification, UpdateShort, UpdateShortChatMessage, UpdateShortMessage, UpdateShortSentMessage, UpdateSmsJob, UpdateStarsBalance, UpdateStarsRevenueStatus, UpdateStickerSets, UpdateStickerSetsOrder, UpdateStoriesStealthMode, UpdateStory, UpdateStoryID, UpdateTheme, UpdateTranscribedAudio, UpdateUser, UpdateUserEmojiStatus, UpdateUserName, UpdateUserPhone, UpdateUserStatus, UpdateUserTyping, UpdateWebPage, UpdateWebViewResultSent, Updates, UpdatesCombined, UpdatesTooLong, UrlAuthResultAccepted, UrlAuthResultDefault, UrlAuthResultRequest, User, UserEmpty, UserProfilePhoto, UserProfilePhotoEmpty, UserStatusEmpty, UserStatusLastMonth, UserStatusLastWeek, UserStatusOffline, UserStatusOnline, UserStatusRecently, Username, VideoSize, VideoSizeEmojiMarkup, VideoSizeStickerMarkup, WallPaper, WallPaperNoFile, WallPaperSettings, WebAuthorization, WebDocument, WebDocumentNoProxy, WebPage, WebPageAttributeStickerSet, WebPageAttributeStory, WebPageAttributeTheme, WebPageAttributeUniqueStarGift, WebPageEmpty, WebPageNotModified, WebPagePending, WebViewMessageSent, WebViewResultUrl
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import Typefuture_salt
+    from ...tl.types.auth import TypeSentCode
+
+
+
+class BotBusinessConnection(TLObject):
+    CONSTRUCTOR_ID = 0x8f34b2f5
+    SUBCLASS_OF_ID = 0x9b130546
+
+    __slots__ = ('connection_id', 'user_id', 'dc_id', 'date', 'disabled', 'rights')
+
+    def __init__(self, connection_id: str, user_id: int, dc_id: int, date: Optional[datetime], disabled: Optional[bool]=None, rights: Optional['TypeBusinessBotRights']=None):
+        """
+        Constructor for BotBusinessConnection: Instance of BotBusinessConnection.
+        """
+        self.connection_id = connection_id
+        self.user_id = user_id
+        self.dc_id = dc_id
+        self.date = date
+        self.disabled = disabled
+        self.rights = rights
+
+    def to_dict(self):
+        return {
+            '_': 'BotBusinessConnection',
+            'connection_id': self.connection_id,
+            'user_id': self.user_id,
+            'dc_id': self.dc_id,
+            'date': self.date,
+            'disabled': self.disabled,
+            'rights': self.rights.to_dict() if isinstance(self.rights, TLObject) else self.rights
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf5\xb24\x8f',
+            struct.pack('<I', (0 if self.disabled is None or self.disabled is False else 2) | (0 if self.rights is None or self.rights is False else 4)),
+            self.serialize_bytes(self.connection_id),
+            struct.pack('<q', self.user_id),
+            struct.pack('<i', self.dc_id),
+            self.serialize_datetime(self.date),
+            b'' if self.rights is None or self.rights is False else (self.rights._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _disabled = bool(flags & 2)
+        _connection_id = reader.tgread_string()
+        _user_id = reader.read_long()
+        _dc_id = reader.read_int()
+        _date = reader.tgread_date()
+        if flags & 4:
+            _rights = reader.tgread_object()
+        else:
+            _rights = None
+        return cls(connection_id=_connection_id, user_id=_user_id, dc_id=_dc_id, date=_date, disabled=_disabled, rights=_rights)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        TLObject.skip_bytes(reader)
+        reader.seek(16)
+        if flags & 4:
+            reader.tgskip_object()
+
+
+class BusinessBotRights(TLObject):
+    CONSTRUCTOR_ID = 0xa0624cf7
+    SUBCLASS_OF_ID = 0xb8dc759a
+
+    __slots__ = ('reply', 'read_messages', 'delete_sent_messages', 'delete_received_messages', 'edit_name', 'edit_bio', 'edit_profile_photo', 'edit_username', 'view_gifts', 'sell_gifts', 'change_gift_settings', 'transfer_and_upgrade_gifts', 'transfer_stars', 'manage_stories')
+
+    def __init__(self, reply: Optional[bool]=None, read_messages: Optional[bool]=None, delete_sent_messages: Optional[bool]=None, delete_received_messages: Optional[bool]=None, edit_name: Optional[bool]=None, edit_bio: Optional[bool]=None, edit_profile_photo: Optional[bool]=None, edit_username: Optional[bool]=None, view_gifts: Optional[bool]=None, sell_gifts: Optional[bool]=None, change_gift_settings: Optional[bool]=None, transfer_and_upgrade_gifts: Optional[bool]=None, transfer_stars: Optional[bool]=None, manage_stories: Optional[bool]=None):
+        """
+        Constructor for BusinessBotRights: Instance of BusinessBotRights.
+        """
+        self.reply = reply
+        self.read_messages = read_messages
+        self.delete_sent_messages = delete_sent_messages
+        self.delete_received_messages = delete_received_messages
+        self.edit_name = edit_name
+        self.edit_bio = edit_bio
+        self.edit_profile_photo = edit_profile_photo
+        self.edit_username = edit_username
+        self.view_gifts = view_gifts
+        self.sell_gifts = sell_gifts
+        self.change_gift_settings = change_gift_settings
+        self.transfer_and_upgrade_gifts = transfer_and_upgrade_gifts
+        self.transfer_stars = transfer_stars
+        self.manage_stories = manage_stories
+
+    def to_dict(self):
+        return {
+            '_': 'BusinessBotRights',
+            'reply': self.reply,
+            'read_messages': self.read_messages,
+            'delete_sent_messages': self.delete_sent_messages,
+            'delete_received_messages': self.delete_received_messages,
+            'edit_name': self.edit_name,
+            'edit_bio': self.edit_bio,
+            'edit_profile_photo': self.edit_profile_photo,
+            'edit_username': self.edit_username,
+            'view_gifts': self.view_gifts,
+            'sell_gifts': self.sell_gifts,
+            'change_gift_settings': self.change_gift_settings,
+            'transfer_and_upgrade_gifts': self.transfer_and_upgrade_gifts,
+            'transfer_stars': self.transfer_stars,
+            'manage_stories': self.manage_stories
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf7Lb\xa0',
+            struct.pack('<I', (0 if self.reply is None or self.reply is False else 1) | (0 if self.read_messages is None or self.read_messages is False else 2) | (0 if self.delete_sent_messages is None or self.delete_sent_messages is False else 4) | (0 if self.delete_received_messages is None or self.delete_received_messages is False else 8) | (0 if self.edit_name is None or self.edit_name is False else 16) | (0 if self.edit_bio is None or self.edit_bio is False else 32) | (0 if self.edit_profile_photo is None or self.edit_profile_photo is False else 64) | (0 if self.edit_username is None or self.edit_username is False else 128) | (0 if self.view_gifts is None or self.view_gifts is False else 256) | (0 if self.sell_gifts is None or self.sell_gifts is False else 512) | (0 if self.change_gift_settings is None or self.change_gift_settings is False else 1024) | (0 if self.transfer_and_upgrade_gifts is None or self.transfer_and_upgrade_gifts is False else 2048) | (0 if self.transfer_stars is None or self.transfer_stars is False else 4096) | (0 if self.manage_stories is None or self.manage_stories is False else 8192)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _reply = bool(flags & 1)
+        _read_messages = bool(flags & 2)
+        _delete_sent_messages = bool(flags & 4)
+        _delete_received_messages = bool(flags & 8)
+        _edit_name = bool(flags & 16)
+        _edit_bio = bool(flags & 32)
+        _edit_profile_photo = bool(flags & 64)
+        _edit_username = bool(flags & 128)
+        _view_gifts = bool(flags & 256)
+        _sell_gifts = bool(flags & 512)
+        _change_gift_settings = bool(flags & 1024)
+        _transfer_and_upgrade_gifts = bool(flags & 2048)
+        _transfer_stars = bool(flags & 4096)
+        _manage_stories = bool(flags & 8192)
+        return cls(reply=_reply, read_messages=_read_messages, delete_sent_messages=_delete_sent_messages, delete_received_messages=_delete_received_messages, edit_name=_edit_name, edit_bio=_edit_bio, edit_profile_photo=_edit_profile_photo, edit_username=_edit_username, view_gifts=_view_gifts, sell_gifts=_sell_gifts, change_gift_settings=_change_gift_settings, transfer_and_upgrade_gifts=_transfer_and_upgrade_gifts, transfer_stars=_transfer_stars, manage_stories=_manage_stories)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+
+
+class ConnectedBot(TLObject):
+    CONSTRUCTOR_ID = 0xcd64636c
+    SUBCLASS_OF_ID = 0x35e81b9e
+
+    __slots__ = ('bot_id', 'recipients', 'rights')
+
+    def __init__(self, bot_id: int, recipients: 'TypeBusinessBotRecipients', rights: 'TypeBusinessBotRights'):
+        """
+        Constructor for ConnectedBot: Instance of ConnectedBot.
+        """
+        self.bot_id = bot_id
+        self.recipients = recipients
+        self.rights = rights
+
+    def to_dict(self):
+        return {
+            '_': 'ConnectedBot',
+            'bot_id': self.bot_id,
+            'recipients': self.recipients.to_dict() if isinstance(self.recipients, TLObject) else self.recipients,
+            'rights': self.rights.to_dict() if isinstance(self.rights, TLObject) else self.rights
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'lcd\xcd',
+            b'\0\0\0\0',
+            struct.pack('<q', self.bot_id),
+            self.recipients._bytes(),
+            self.rights._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _bot_id = reader.read_long()
+        _recipients = reader.tgread_object()
+        _rights = reader.tgread_object()
+        return cls(bot_id=_bot_id, recipients=_recipients, rights=_rights)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        reader.seek(8)
+        reader.tgskip_object()
+        reader.tgskip_object()
+
+
+class DisallowedGiftsSettings(TLObject):
+    CONSTRUCTOR_ID = 0x71f276c4
+    SUBCLASS_OF_ID = 0x382e9ab
+
+    __slots__ = ('disallow_unlimited_stargifts', 'disallow_limited_stargifts', 'disallow_unique_stargifts', 'disallow_premium_gifts')
+
+    def __init__(self, disallow_unlimited_stargifts: Optional[bool]=None, disallow_limited_stargifts: Optional[bool]=None, disallow_unique_stargifts: Optional[bool]=None, disallow_premium_gifts: Optional[bool]=None):
+        """
+        Constructor for DisallowedGiftsSettings: Instance of DisallowedGiftsSettings.
+        """
+        self.disallow_unlimited_stargifts = disallow_unlimited_stargifts
+        self.disallow_limited_stargifts = disallow_limited_stargifts
+        self.disallow_unique_stargifts = disallow_unique_stargifts
+        self.disallow_premium_gifts = disallow_premium_gifts
+
+    def to_dict(self):
+        return {
+            '_': 'DisallowedGiftsSettings',
+            'disallow_unlimited_stargifts': self.disallow_unlimited_stargifts,
+            'disallow_limited_stargifts': self.disallow_limited_stargifts,
+            'disallow_unique_stargifts': self.disallow_unique_stargifts,
+            'disallow_premium_gifts': self.disallow_premium_gifts
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc4v\xf2q',
+            struct.pack('<I', (0 if self.disallow_unlimited_stargifts is None or self.disallow_unlimited_stargifts is False else 1) | (0 if self.disallow_limited_stargifts is None or self.disallow_limited_stargifts is False else 2) | (0 if self.disallow_unique_stargifts is None or self.disallow_unique_stargifts is False else 4) | (0 if self.disallow_premium_gifts is None or self.disallow_premium_gifts is False else 8)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _disallow_unlimited_stargifts = bool(flags & 1)
+        _disallow_limited_stargifts = bool(flags & 2)
+        _disallow_unique_stargifts = bool(flags & 4)
+        _disallow_premium_gifts = bool(flags & 8)
+        return cls(disallow_unlimited_stargifts=_disallow_unlimited_stargifts, disallow_limited_stargifts=_disallow_limited_stargifts, disallow_unique_stargifts=_disallow_unique_stargifts, disallow_premium_gifts=_disallow_premium_gifts)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+
+
+class FutureSalts(TLObject):
+    CONSTRUCTOR_ID = 0xae500895
+    SUBCLASS_OF_ID = 0x1090f517
+
+    __slots__ = ('req_msg_id', 'now', 'salts')
+
+    def __init__(self, req_msg_id: int, now: int, salts: List['Typefuture_salt']):
+        """
+        Constructor for FutureSalts: Instance of FutureSalts.
+        """
+        self.req_msg_id = req_msg_id
+        self.now = now
+        self.salts = salts
+
+    def to_dict(self):
+        return {
+            '_': 'FutureSalts',
+            'req_msg_id': self.req_msg_id,
+            'now': self.now,
+            'salts': [] if self.salts is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.salts]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x95\x08P\xae',
+            struct.pack('<q', self.req_msg_id),
+            struct.pack('<i', self.now),
+            struct.pack('<i', len(self.salts)),b''.join(x._bytes()[4:] for x in self.salts),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _req_msg_id = reader.read_long()
+        _now = reader.read_int()
+        _salts = []
+        for _ in range(reader.read_int()):
+            from . import FutureSalt
+            _x = FutureSalt.from_reader(reader)
+            _salts.append(_x)
+
+        return cls(req_msg_id=_req_msg_id, now=_now, salts=_salts)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        reader.seek(12)
+        for _ in range(reader.read_int()):
+            from . import FutureSalt
+            FutureSalt.skip_reader(reader)
+
+
+class GlobalPrivacySettings(TLObject):
+    CONSTRUCTOR_ID = 0xfe41b34f
+    SUBCLASS_OF_ID = 0xc90e5770
+
+    __slots__ = ('archive_and_mute_new_noncontact_peers', 'keep_archived_unmuted', 'keep_archived_folders', 'hide_read_marks', 'new_noncontact_peers_require_premium', 'display_gifts_button', 'noncontact_peers_paid_stars', 'disallowed_gifts')
+
+    def __init__(self, archive_and_mute_new_noncontact_peers: Optional[bool]=None, keep_archived_unmuted: Optional[bool]=None, keep_archived_folders: Optional[bool]=None, hide_read_marks: Optional[bool]=None, new_noncontact_peers_require_premium: Optional[bool]=None, display_gifts_button: Optional[bool]=None, noncontact_peers_paid_stars: Optional[int]=None, disallowed_gifts: Optional['TypeDisallowedGiftsSettings']=None):
+        """
+        Constructor for GlobalPrivacySettings: Instance of GlobalPrivacySettings.
+        """
+        self.archive_and_mute_new_noncontact_peers = archive_and_mute_new_noncontact_peers
+        self.keep_archived_unmuted = keep_archived_unmuted
+        self.keep_archived_folders = keep_archived_folders
+        self.hide_read_marks = hide_read_marks
+        self.new_noncontact_peers_require_premium = new_noncontact_peers_require_premium
+        self.display_gifts_button = display_gifts_button
+        self.noncontact_peers_paid_stars = noncontact_peers_paid_stars
+        self.disallowed_gifts = disallowed_gifts
+
+    def to_dict(self):
+        return {
+            '_': 'GlobalPrivacySettings',
+            'archive_and_mute_new_noncontact_peers': self.archive_and_mute_new_noncontact_peers,
+            'keep_archived_unmuted': self.keep_archived_unmuted,
+            'keep_archived_folders': self.keep_archived_folders,
+            'hide_read_marks': self.hide_read_marks,
+            'new_noncontact_peers_require_premium': self.new_noncontact_peers_require_premium,
+            'display_gifts_button': self.display_gifts_button,
+            'noncontact_peers_paid_stars': self.noncontact_peers_paid_stars,
+            'disallowed_gifts': self.disallowed_gifts.to_dict() if isinstance(self.disallowed_gifts, TLObject) else self.disallowed_gifts
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'O\xb3A\xfe',
+            struct.pack('<I', (0 if self.archive_and_mute_new_noncontact_peers is None or self.archive_and_mute_new_noncontact_peers is False else 1) | (0 if self.keep_archived_unmuted is None or self.keep_archived_unmuted is False else 2) | (0 if self.keep_archived_folders is None or self.keep_archived_folders is False else 4) | (0 if self.hide_read_marks is None or self.hide_read_marks is False else 8) | (0 if self.new_noncontact_peers_require_premium is None or self.new_noncontact_peers_require_premium is False else 16) | (0 if self.display_gifts_button is None or self.display_gifts_button is False else 128) | (0 if self.noncontact_peers_paid_stars is None or self.noncontact_peers_paid_stars is False else 32) | (0 if self.disallowed_gifts is None or self.disallowed_gifts is False else 64)),
+            b'' if self.noncontact_peers_paid_stars is None or self.noncontact_peers_paid_stars is False else (struct.pack('<q', self.noncontact_peers_paid_stars)),
+            b'' if self.disallowed_gifts is None or self.disallowed_gifts is False else (self.disallowed_gifts._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _archive_and_mute_new_noncontact_peers = bool(flags & 1)
+        _keep_archived_unmuted = bool(flags & 2)
+        _keep_archived_folders = bool(flags & 4)
+        _hide_read_marks = bool(flags & 8)
+        _new_noncontact_peers_require_premium = bool(flags & 16)
+        _display_gifts_button = bool(flags & 128)
+        if flags & 32:
+            _noncontact_peers_paid_stars = reader.read_long()
+        else:
+            _noncontact_peers_paid_stars = None
+        if flags & 64:
+            _disallowed_gifts = reader.tgread_object()
+        else:
+            _disallowed_gifts = None
+        return cls(archive_and_mute_new_noncontact_peers=_archive_and_mute_new_noncontact_peers, keep_archived_unmuted=_keep_archived_unmuted, keep_archived_folders=_keep_archived_folders, hide_read_marks=_hide_read_marks, new_noncontact_peers_require_premium=_new_noncontact_peers_require_premium, display_gifts_button=_display_gifts_button, noncontact_peers_paid_stars=_noncontact_peers_paid_stars, disallowed_gifts=_disallowed_gifts)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        if flags & 32:
+            reader.seek(8)
+        if flags & 64:
+            reader.tgskip_object()
+
+
+class InputStorePaymentAuthCode(TLObject):
+    CONSTRUCTOR_ID = 0x9bb2636d
+    SUBCLASS_OF_ID = 0xe7a4174d
+
+    __slots__ = ('phone_number', 'phone_code_hash', 'currency', 'amount', 'restore')
+
+    def __init__(self, phone_number: str, phone_code_hash: str, currency: str, amount: int, restore: Optional[bool]=None):
+        """
+        Constructor for InputStorePaymentPurpose: Instance of either InputStorePaymentPremiumSubscription, InputStorePaymentGiftPremium, InputStorePaymentPremiumGiftCode, InputStorePaymentPremiumGiveaway, InputStorePaymentStarsTopup, InputStorePaymentStarsGift, InputStorePaymentStarsGiveaway, InputStorePaymentAuthCode.
+        """
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+        self.currency = currency
+        self.amount = amount
+        self.restore = restore
+
+    def to_dict(self):
+        return {
+            '_': 'InputStorePaymentAuthCode',
+            'phone_number': self.phone_number,
+            'phone_code_hash': self.phone_code_hash,
+            'currency': self.currency,
+            'amount': self.amount,
+            'restore': self.restore
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'mc\xb2\x9b',
+            struct.pack('<I', (0 if self.restore is None or self.restore is False else 1)),
+            self.serialize_bytes(self.phone_number),
+            self.serialize_bytes(self.phone_code_hash),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.amount),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _restore = bool(flags & 1)
+        _phone_number = reader.tgread_string()
+        _phone_code_hash = reader.tgread_string()
+        _currency = reader.tgread_string()
+        _amount = reader.read_long()
+        return cls(phone_number=_phone_number, phone_code_hash=_phone_code_hash, currency=_currency, amount=_amount, restore=_restore)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        TLObject.skip_bytes(reader)
+        TLObject.skip_bytes(reader)
+        TLObject.skip_bytes(reader)
+        reader.seek(8)
+
+
+class MessageActionPaidMessagesPrice(TLObject):
+    CONSTRUCTOR_ID = 0xbcd71419
+    SUBCLASS_OF_ID = 0x8680d126
+
+    __slots__ = ('stars',)
+
+    def __init__(self, stars: int):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.stars = stars
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionPaidMessagesPrice',
+            'stars': self.stars
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x19\x14\xd7\xbc',
+            struct.pack('<q', self.stars),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _stars = reader.read_long()
+        return cls(stars=_stars)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        reader.seek(8)
+
+
+class MessageActionPaidMessagesRefunded(TLObject):
+    CONSTRUCTOR_ID = 0xac1f1fcd
+    SUBCLASS_OF_ID = 0x8680d126
+
+    __slots__ = ('count', 'stars')
+
+    def __init__(self, count: int, stars: int):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.count = count
+        self.stars = stars
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionPaidMessagesRefunded',
+            'count': self.count,
+            'stars': self.stars
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcd\x1f\x1f\xac',
+            struct.pack('<i', self.count),
+            struct.pack('<q', self.stars),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count = reader.read_int()
+        _stars = reader.read_long()
+        return cls(count=_count, stars=_stars)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        reader.seek(12)
+
+
+class SponsoredPeer(TLObject):
+    CONSTRUCTOR_ID = 0xc69708d3
+    SUBCLASS_OF_ID = 0x3f75800e
+
+    __slots__ = ('peer', 'random_id', 'sponsor_info', 'additional_info')
+
+    def __init__(self, peer: 'TypePeer', random_id: bytes=None, sponsor_info: Optional[str]=None, additional_info: Optional[str]=None):
+        """
+        Constructor for SponsoredPeer: Instance of SponsoredPeer.
+        """
+        self.peer = peer
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(4), 'big', signed=True)
+        self.sponsor_info = sponsor_info
+        self.additional_info = additional_info
+
+    def to_dict(self):
+        return {
+            '_': 'SponsoredPeer',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'random_id': self.random_id,
+            'sponsor_info': self.sponsor_info,
+            'additional_info': self.additional_info
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd3\x08\x97\xc6',
+            struct.pack('<I', (0 if self.sponsor_info is None or self.sponsor_info is False else 1) | (0 if self.additional_info is None or self.additional_info is False else 2)),
+            self.serialize_bytes(self.random_id),
+            self.peer._bytes(),
+            b'' if self.sponsor_info is None or self.sponsor_info is False else (self.serialize_bytes(self.sponsor_info)),
+            b'' if self.additional_info is None or self.additional_info is False else (self.serialize_bytes(self.additional_info)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _random_id = reader.tgread_bytes()
+        _peer = reader.tgread_object()
+        if flags & 1:
+            _sponsor_info = reader.tgread_string()
+        else:
+            _sponsor_info = None
+        if flags & 2:
+            _additional_info = reader.tgread_string()
+        else:
+            _additional_info = None
+        return cls(peer=_peer, random_id=_random_id, sponsor_info=_sponsor_info, additional_info=_additional_info)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        TLObject.skip_bytes(reader)
+        reader.tgskip_object()
+        if flags & 1:
+            TLObject.skip_bytes(reader)
+        if flags & 2:
+            TLObject.skip_bytes(reader)
+
+
+class UpdateSentPhoneCode(TLObject):
+    CONSTRUCTOR_ID = 0x504aa18f
+    SUBCLASS_OF_ID = 0x9f89304e
+
+    __slots__ = ('sent_code',)
+
+    def __init__(self, sent_code: 'TypeSentCode'):
+        """
+        Constructor for Update: Instance of either UpdateNewMessage, UpdateMessageID, UpdateDeleteMessages, UpdateUserTyping, UpdateChatUserTyping, UpdateChatParticipants, UpdateUserStatus, UpdateUserName, UpdateNewAuthorization, UpdateNewEncryptedMessage, UpdateEncryptedChatTyping, UpdateEncryption, UpdateEncryptedMessagesRead, UpdateChatParticipantAdd, UpdateChatParticipantDelete, UpdateDcOptions, UpdateNotifySettings, UpdateServiceNotification, UpdatePrivacy, UpdateUserPhone, UpdateReadHistoryInbox, UpdateReadHistoryOutbox, UpdateWebPage, UpdateReadMessagesContents, UpdateChannelTooLong, UpdateChannel, UpdateNewChannelMessage, UpdateReadChannelInbox, UpdateDeleteChannelMessages, UpdateChannelMessageViews, UpdateChatParticipantAdmin, UpdateNewStickerSet, UpdateStickerSetsOrder, UpdateStickerSets, UpdateSavedGifs, UpdateBotInlineQuery, UpdateBotInlineSend, UpdateEditChannelMessage, UpdateBotCallbackQuery, UpdateEditMessage, UpdateInlineBotCallbackQuery, UpdateReadChannelOutbox, UpdateDraftMessage, UpdateReadFeaturedStickers, UpdateRecentStickers, UpdateConfig, UpdatePtsChanged, UpdateChannelWebPage, UpdateDialogPinned, UpdatePinnedDialogs, UpdateBotWebhookJSON, UpdateBotWebhookJSONQuery, UpdateBotShippingQuery, UpdateBotPrecheckoutQuery, UpdatePhoneCall, UpdateLangPackTooLong, UpdateLangPack, UpdateFavedStickers, UpdateChannelReadMessagesContents, UpdateContactsReset, UpdateChannelAvailableMessages, UpdateDialogUnreadMark, UpdateMessagePoll, UpdateChatDefaultBannedRights, UpdateFolderPeers, UpdatePeerSettings, UpdatePeerLocated, UpdateNewScheduledMessage, UpdateDeleteScheduledMessages, UpdateTheme, UpdateGeoLiveViewed, UpdateLoginToken, UpdateMessagePollVote, UpdateDialogFilter, UpdateDialogFilterOrder, UpdateDialogFilters, UpdatePhoneCallSignalingData, UpdateChannelMessageForwards, UpdateReadChannelDiscussionInbox, UpdateReadChannelDiscussionOutbox, UpdatePeerBlocked, UpdateChannelUserTyping, UpdatePinnedMessages, UpdatePinnedChannelMessages, UpdateChat, UpdateGroupCallParticipants, UpdateGroupCall, UpdatePeerHistoryTTL, UpdateChatParticipant, UpdateChannelParticipant, UpdateBotStopped, UpdateGroupCallConnection, UpdateBotCommands, UpdatePendingJoinRequests, UpdateBotChatInviteRequester, UpdateMessageReactions, UpdateAttachMenuBots, UpdateWebViewResultSent, UpdateBotMenuButton, UpdateSavedRingtones, UpdateTranscribedAudio, UpdateReadFeaturedEmojiStickers, UpdateUserEmojiStatus, UpdateRecentEmojiStatuses, UpdateRecentReactions, UpdateMoveStickerSetToTop, UpdateMessageExtendedMedia, UpdateChannelPinnedTopic, UpdateChannelPinnedTopics, UpdateUser, UpdateAutoSaveSettings, UpdateStory, UpdateReadStories, UpdateStoryID, UpdateStoriesStealthMode, UpdateSentStoryReaction, UpdateBotChatBoost, UpdateChannelViewForumAsMessages, UpdatePeerWallpaper, UpdateBotMessageReaction, UpdateBotMessageReactions, UpdateSavedDialogPinned, UpdatePinnedSavedDialogs, UpdateSavedReactionTags, UpdateSmsJob, UpdateQuickReplies, UpdateNewQuickReply, UpdateDeleteQuickReply, UpdateQuickReplyMessage, UpdateDeleteQuickReplyMessages, UpdateBotBusinessConnect, UpdateBotNewBusinessMessage, UpdateBotEditBusinessMessage, UpdateBotDeleteBusinessMessage, UpdateNewStoryReaction, UpdateBroadcastRevenueTransactions, UpdateStarsBalance, UpdateBusinessBotCallbackQuery, UpdateStarsRevenueStatus, UpdateBotPurchasedPaidMedia, UpdatePaidReactionPrivacy, UpdateSentPhoneCode.
+        """
+        self.sent_code = sent_code
+
+    def to_dict(self):
+        return {
+            '_': 'UpdateSentPhoneCode',
+            'sent_code': self.sent_code.to_dict() if isinstance(self.sent_code, TLObject) else self.sent_code
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8f\xa1JP',
+            self.sent_code._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _sent_code = reader.tgread_object()
+        return cls(sent_code=_sent_code)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        reader.tgskip_object()
+
+
+class UserFull(TLObject):
+    CONSTRUCTOR_ID = 0x99e78045
+    SUBCLASS_OF_ID = 0x1f4661b9
+
+    __slots__ = ('id', 'settings', 'notify_settings', 'common_chats_count', 'blocked', 'phone_calls_available', 'phone_calls_private', 'can_pin_message', 'has_scheduled', 'video_calls_available', 'voice_messages_forbidden', 'translations_disabled', 'stories_pinned_available', 'blocked_my_stories_from', 'wallpaper_overridden', 'contact_require_premium', 'read_dates_private', 'sponsored_enabled', 'can_view_revenue', 'bot_can_manage_emoji_status', 'display_gifts_button', 'about', 'personal_photo', 'profile_photo', 'fallback_photo', 'bot_info', 'pinned_msg_id', 'folder_id', 'ttl_period', 'theme_emoticon', 'private_forward_name', 'bot_group_admin_rights', 'bot_broadcast_admin_rights', 'wallpaper', 'stories', 'business_work_hours', 'business_location', 'business_greeting_message', 'business_away_message', 'business_intro', 'birthday', 'personal_channel_id', 'personal_channel_message', 'stargifts_count', 'starref_program', 'bot_verification', 'send_paid_messages_stars', 'disallowed_gifts')
+
+    def __init__(self, id: int, settings: 'TypePeerSettings', notify_settings: 'TypePeerNotifySettings', common_chats_count: int, blocked: Optional[bool]=None, phone_calls_available: Optional[bool]=None, phone_calls_private: Optional[bool]=None, can_pin_message: Optional[bool]=None, has_scheduled: Optional[bool]=None, video_calls_available: Optional[bool]=None, voice_messages_forbidden: Optional[bool]=None, translations_disabled: Optional[bool]=None, stories_pinned_available: Optional[bool]=None, blocked_my_stories_from: Optional[bool]=None, wallpaper_overridden: Optional[bool]=None, contact_require_premium: Optional[bool]=None, read_dates_private: Optional[bool]=None, sponsored_enabled: Optional[bool]=None, can_view_revenue: Optional[bool]=None, bot_can_manage_emoji_status: Optional[bool]=None, display_gifts_button: Optional[bool]=None, about: Optional[str]=None, personal_photo: Optional['TypePhoto']=None, profile_photo: Optional['TypePhoto']=None, fallback_photo: Optional['TypePhoto']=None, bot_info: Optional['TypeBotInfo']=None, pinned_msg_id: Optional[int]=None, folder_id: Optional[int]=None, ttl_period: Optional[int]=None, theme_emoticon: Optional[str]=None, private_forward_name: Optional[str]=None, bot_group_admin_rights: Optional['TypeChatAdminRights']=None, bot_broadcast_admin_rights: Optional['TypeChatAdminRights']=None, wallpaper: Optional['TypeWallPaper']=None, stories: Optional['TypePeerStories']=None, business_work_hours: Optional['TypeBusinessWorkHours']=None, business_location: Optional['TypeBusinessLocation']=None, business_greeting_message: Optional['TypeBusinessGreetingMessage']=None, business_away_message: Optional['TypeBusinessAwayMessage']=None, business_intro: Optional['TypeBusinessIntro']=None, birthday: Optional['TypeBirthday']=None, personal_channel_id: Optional[int]=None, personal_channel_message: Optional[int]=None, stargifts_count: Optional[int]=None, starref_program: Optional['TypeStarRefProgram']=None, bot_verification: Optional['TypeBotVerification']=None, send_paid_messages_stars: Optional[int]=None, disallowed_gifts: Optional['TypeDisallowedGiftsSettings']=None):
+        """
+        Constructor for UserFull: Instance of UserFull.
+        """
+        self.id = id
+        self.settings = settings
+        self.notify_settings = notify_settings
+        self.common_chats_count = common_chats_count
+        self.blocked = blocked
+        self.phone_calls_available = phone_calls_available
+        self.phone_calls_private = phone_calls_private
+        self.can_pin_message = can_pin_message
+        self.has_scheduled = has_scheduled
+        self.video_calls_available = video_calls_available
+        self.voice_messages_forbidden = voice_messages_forbidden
+        self.translations_disabled = translations_disabled
+        self.stories_pinned_available = stories_pinned_available
+        self.blocked_my_stories_from = blocked_my_stories_from
+        self.wallpaper_overridden = wallpaper_overridden
+        self.contact_require_premium = contact_require_premium
+        self.read_dates_private = read_dates_private
+        self.sponsored_enabled = sponsored_enabled
+        self.can_view_revenue = can_view_revenue
+        self.bot_can_manage_emoji_status = bot_can_manage_emoji_status
+        self.display_gifts_button = display_gifts_button
+        self.about = about
+        self.personal_photo = personal_photo
+        self.profile_photo = profile_photo
+        self.fallback_photo = fallback_photo
+        self.bot_info = bot_info
+        self.pinned_msg_id = pinned_msg_id
+        self.folder_id = folder_id
+        self.ttl_period = ttl_period
+        self.theme_emoticon = theme_emoticon
+        self.private_forward_name = private_forward_name
+        self.bot_group_admin_rights = bot_group_admin_rights
+        self.bot_broadcast_admin_rights = bot_broadcast_admin_rights
+        self.wallpaper = wallpaper
+        self.stories = stories
+        self.business_work_hours = business_work_hours
+        self.business_location = business_location
+        self.business_greeting_message = business_greeting_message
+        self.business_away_message = business_away_message
+        self.business_intro = business_intro
+        self.birthday = birthday
+        self.personal_channel_id = personal_channel_id
+        self.personal_channel_message = personal_channel_message
+        self.stargifts_count = stargifts_count
+        self.starref_program = starref_program
+        self.bot_verification = bot_verification
+        self.send_paid_messages_stars = send_paid_messages_stars
+        self.disallowed_gifts = disallowed_gifts
+
+    def to_dict(self):
+        return {
+            '_': 'UserFull',
+            'id': self.id,
+            'settings': self.settings.to_dict() if isinstance(self.settings, TLObject) else self.settings,
+            'notify_settings': self.notify_settings.to_dict() if isinstance(self.notify_settings, TLObject) else self.notify_settings,
+            'common_chats_count': self.common_chats_count,
+            'blocked': self.blocked,
+            'phone_calls_available': self.phone_calls_available,
+            'phone_calls_private': self.phone_calls_private,
+            'can_pin_message': self.can_pin_message,
+            'has_scheduled': self.has_scheduled,
+            'video_calls_available': self.video_calls_available,
+            'voice_messages_forbidden': self.voice_messages_forbidden,
+            'translations_disabled': self.translations_disabled,
+            'stories_pinned_available': self.stories_pinned_available,
+            'blocked_my_stories_from': self.blocked_my_stories_from,
+            'wallpaper_overridden': self.wallpaper_overridden,
+            'contact_require_premium': self.contact_require_premium,
+            'read_dates_private': self.read_dates_private,
+            'sponsored_enabled': self.sponsored_enabled,
+            'can_view_revenue': self.can_view_revenue,
+            'bot_can_manage_emoji_status': self.bot_can_manage_emoji_status,
+            'display_gifts_button': self.display_gifts_button,
+            'about': self.about,
+            'personal_photo': self.personal_photo.to_dict() if isinstance(self.personal_photo, TLObject) else self.personal_photo,
+            'profile_photo': self.profile_photo.to_dict() if isinstance(self.profile_photo, TLObject) else self.profile_photo,
+            'fallback_photo': self.fallback_photo.to_dict() if isinstance(self.fallback_photo, TLObject) else self.fallback_photo,
+            'bot_info': self.bot_info.to_dict() if isinstance(self.bot_info, TLObject) else self.bot_info,
+            'pinned_msg_id': self.pinned_msg_id,
+            'folder_id': self.folder_id,
+            'ttl_period': self.ttl_period,
+            'theme_emoticon': self.theme_emoticon,
+            'private_forward_name': self.private_forward_name,
+            'bot_group_admin_rights': self.bot_group_admin_rights.to_dict() if isinstance(self.bot_group_admin_rights, TLObject) else self.bot_group_admin_rights,
+            'bot_broadcast_admin_rights': self.bot_broadcast_admin_rights.to_dict() if isinstance(self.bot_broadcast_admin_rights, TLObject) else self.bot_broadcast_admin_rights,
+            'wallpaper': self.wallpaper.to_dict() if isinstance(self.wallpaper, TLObject) else self.wallpaper,
+            'stories': self.stories.to_dict() if isinstance(self.stories, TLObject) else self.stories,
+            'business_work_hours': self.business_work_hours.to_dict() if isinstance(self.business_work_hours, TLObject) else self.business_work_hours,
+            'business_location': self.business_location.to_dict() if isinstance(self.business_location, TLObject) else self.business_location,
+            'business_greeting_message': self.business_greeting_message.to_dict() if isinstance(self.business_greeting_message, TLObject) else self.business_greeting_message,
+            'business_away_message': self.business_away_message.to_dict() if isinstance(self.business_away_message, TLObject) else self.business_away_message,
+            'business_intro': self.business_intro.to_dict() if isinstance(self.business_intro, TLObject) else self.business_intro,
+            'birthday': self.birthday.to_dict() if isinstance(self.birthday, TLObject) else self.birthday,
+            'personal_channel_id': self.personal_channel_id,
+            'personal_channel_message': self.personal_channel_message,
+            'stargifts_count': self.stargifts_count,
+            'starref_program': self.starref_program.to_dict() if isinstance(self.starref_program, TLObject) else self.starref_program,
+            'bot_verification': self.bot_verification.to_dict() if isinstance(self.bot_verification, TLObject) else self.bot_verification,
+            'send_paid_messages_stars': self.send_paid_messages_stars,
+            'disallowed_gifts': self.disallowed_gifts.to_dict() if isinstance(self.disallowed_gifts, TLObject) else self.disallowed_gifts
+        }
+
+    def _bytes(self):
+        assert ((self.personal_channel_id or self.personal_channel_id is not None) and (self.personal_channel_message or self.personal_channel_message is not None)) or ((self.personal_channel_id is None or self.personal_channel_id is False) and (self.personal_channel_message is None or self.personal_channel_message is False)), 'personal_channel_id, personal_channel_message parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'E\x80\xe7\x99',
+            struct.pack('<I', (0 if self.blocked is None or self.blocked is False else 1) | (0 if self.phone_calls_available is None or self.phone_calls_available is False else 16) | (0 if self.phone_calls_private is None or self.phone_calls_private is False else 32) | (0 if self.can_pin_message is None or self.can_pin_message is False else 128) | (0 if self.has_scheduled is None or self.has_scheduled is False else 4096) | (0 if self.video_calls_available is None or self.video_calls_available is False else 8192) | (0 if self.voice_messages_forbidden is None or self.voice_messages_forbidden is False else 1048576) | (0 if self.translations_disabled is None or self.translations_disabled is False else 8388608) | (0 if self.stories_pinned_available is None or self.stories_pinned_available is False else 67108864) | (0 if self.blocked_my_stories_from is None or self.blocked_my_stories_from is False else 134217728) | (0 if self.wallpaper_overridden is None or self.wallpaper_overridden is False else 268435456) | (0 if self.contact_require_premium is None or self.contact_require_premium is False else 536870912) | (0 if self.read_dates_private is None or self.read_dates_private is False else 1073741824) | (0 if self.about is None or self.about is False else 2) | (0 if self.personal_photo is None or self.personal_photo is False else 2097152) | (0 if self.profile_photo is None or self.profile_photo is False else 4) | (0 if self.fallback_photo is None or self.fallback_photo is False else 4194304) | (0 if self.bot_info is None or self.bot_info is False else 8) | (0 if self.pinned_msg_id is None or self.pinned_msg_id is False else 64) | (0 if self.folder_id is None or self.folder_id is False else 2048) | (0 if self.ttl_period is None or self.ttl_period is False else 16384) | (0 if self.theme_emoticon is None or self.theme_emoticon is False else 32768) | (0 if self.private_forward_name is None or self.private_forward_name is False else 65536) | (0 if self.bot_group_admin_rights is None or self.bot_group_admin_rights is False else 131072) | (0 if self.bot_broadcast_admin_rights is None or self.bot_broadcast_admin_rights is False else 262144) | (0 if self.wallpaper is None or self.wallpaper is False else 16777216) | (0 if self.stories is None or self.stories is False else 33554432)),
+            struct.pack('<I', (0 if self.sponsored_enabled is None or self.sponsored_enabled is False else 128) | (0 if self.can_view_revenue is None or self.can_view_revenue is False else 512) | (0 if self.bot_can_manage_emoji_status is None or self.bot_can_manage_emoji_status is False else 1024) | (0 if self.display_gifts_button is None or self.display_gifts_button is False else 65536) | (0 if self.business_work_hours is None or self.business_work_hours is False else 1) | (0 if self.business_location is None or self.business_location is False else 2) | (0 if self.business_greeting_message is None or self.business_greeting_message is False else 4) | (0 if self.business_away_message is None or self.business_away_message is False else 8) | (0 if self.business_intro is None or self.business_intro is False else 16) | (0 if self.birthday is None or self.birthday is False else 32) | (0 if self.personal_channel_id is None or self.personal_channel_id is False else 64) | (0 if self.personal_channel_message is None or self.personal_channel_message is False else 64) | (0 if self.stargifts_count is None or self.stargifts_count is False else 256) | (0 if self.starref_program is None or self.starref_program is False else 2048) | (0 if self.bot_verification is None or self.bot_verification is False else 4096) | (0 if self.send_paid_messages_stars is None or self.send_paid_messages_stars is False else 16384) | (0 if self.disallowed_gifts is None or self.disallowed_gifts is False else 32768)),
+            struct.pack('<q', self.id),
+            b'' if self.about is None or self.about is False else (self.serialize_bytes(self.about)),
+            self.settings._bytes(),
+            b'' if self.personal_photo is None or self.personal_photo is False else (self.personal_photo._bytes()),
+            b'' if self.profile_photo is None or self.profile_photo is False else (self.profile_photo._bytes()),
+            b'' if self.fallback_photo is None or self.fallback_photo is False else (self.fallback_photo._bytes()),
+            self.notify_settings._bytes(),
+            b'' if self.bot_info is None or self.bot_info is False else (self.bot_info._bytes()),
+            b'' if self.pinned_msg_id is None or self.pinned_msg_id is False else (struct.pack('<i', self.pinned_msg_id)),
+            struct.pack('<i', self.common_chats_count),
+            b'' if self.folder_id is None or self.folder_id is False else (struct.pack('<i', self.folder_id)),
+            b'' if self.ttl_period is None or self.ttl_period is False else (struct.pack('<i', self.ttl_period)),
+            b'' if self.theme_emoticon is None or self.theme_emoticon is False else (self.serialize_bytes(self.theme_emoticon)),
+            b'' if self.private_forward_name is None or self.private_forward_name is False else (self.serialize_bytes(self.private_forward_name)),
+            b'' if self.bot_group_admin_rights is None or self.bot_group_admin_rights is False else (self.bot_group_admin_rights._bytes()),
+            b'' if self.bot_broadcast_admin_rights is None or self.bot_broadcast_admin_rights is False else (self.bot_broadcast_admin_rights._bytes()),
+            b'' if self.wallpaper is None or self.wallpaper is False else (self.wallpaper._bytes()),
+            b'' if self.stories is None or self.stories is False else (self.stories._bytes()),
+            b'' if self.business_work_hours is None or self.business_work_hours is False else (self.business_work_hours._bytes()),
+            b'' if self.business_location is None or self.business_location is False else (self.business_location._bytes()),
+            b'' if self.business_greeting_message is None or self.business_greeting_message is False else (self.business_greeting_message._bytes()),
+            b'' if self.business_away_message is None or self.business_away_message is False else (self.business_away_message._bytes()),
+            b'' if self.business_intro is None or self.business_intro is False else (self.business_intro._bytes()),
+            b'' if self.birthday is None or self.birthday is False else (self.birthday._bytes()),
+            b'' if self.personal_channel_id is None or self.personal_channel_id is False else (struct.pack('<q', self.personal_channel_id)),
+            b'' if self.personal_channel_message is None or self.personal_channel_message is False else (struct.pack('<i', self.personal_channel_message)),
+            b'' if self.stargifts_count is None or self.stargifts_count is False else (struct.pack('<i', self.stargifts_count)),
+            b'' if self.starref_program is None or self.starref_program is False else (self.starref_program._bytes()),
+            b'' if self.bot_verification is None or self.bot_verification is False else (self.bot_verification._bytes()),
+            b'' if self.send_paid_messages_stars is None or self.send_paid_messages_stars is False else (struct.pack('<q', self.send_paid_messages_stars)),
+            b'' if self.disallowed_gifts is None or self.disallowed_gifts is False else (self.disallowed_gifts._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _blocked = bool(flags & 1)
+        _phone_calls_available = bool(flags & 16)
+        _phone_calls_private = bool(flags & 32)
+        _can_pin_message = bool(flags & 128)
+        _has_scheduled = bool(flags & 4096)
+        _video_calls_available = bool(flags & 8192)
+        _voice_messages_forbidden = bool(flags & 1048576)
+        _translations_disabled = bool(flags & 8388608)
+        _stories_pinned_available = bool(flags & 67108864)
+        _blocked_my_stories_from = bool(flags & 134217728)
+        _wallpaper_overridden = bool(flags & 268435456)
+        _contact_require_premium = bool(flags & 536870912)
+        _read_dates_private = bool(flags & 1073741824)
+        flags2 = reader.read_int()
+
+        _sponsored_enabled = bool(flags2 & 128)
+        _can_view_revenue = bool(flags2 & 512)
+        _bot_can_manage_emoji_status = bool(flags2 & 1024)
+        _display_gifts_button = bool(flags2 & 65536)
+        _id = reader.read_long()
+        if flags & 2:
+            _about = reader.tgread_string()
+        else:
+            _about = None
+        _settings = reader.tgread_object()
+        if flags & 2097152:
+            _personal_photo = reader.tgread_object()
+        else:
+            _personal_photo = None
+        if flags & 4:
+            _profile_photo = reader.tgread_object()
+        else:
+            _profile_photo = None
+        if flags & 4194304:
+            _fallback_photo = reader.tgread_object()
+        else:
+            _fallback_photo = None
+        _notify_settings = reader.tgread_object()
+        if flags & 8:
+            _bot_info = reader.tgread_object()
+        else:
+            _bot_info = None
+        if flags & 64:
+            _pinned_msg_id = reader.read_int()
+        else:
+            _pinned_msg_id = None
+        _common_chats_count = reader.read_int()
+        if flags & 2048:
+            _folder_id = reader.read_int()
+        else:
+            _folder_id = None
+        if flags & 16384:
+            _ttl_period = reader.read_int()
+        else:
+            _ttl_period = None
+        if flags & 32768:
+            _theme_emoticon = reader.tgread_string()
+        else:
+            _theme_emoticon = None
+        if flags & 65536:
+            _private_forward_name = reader.tgread_string()
+        else:
+            _private_forward_name = None
+        if flags & 131072:
+            _bot_group_admin_rights = reader.tgread_object()
+        else:
+            _bot_group_admin_rights = None
+        if flags & 262144:
+            _bot_broadcast_admin_rights = reader.tgread_object()
+        else:
+            _bot_broadcast_admin_rights = None
+        if flags & 16777216:
+            _wallpaper = reader.tgread_object()
+        else:
+            _wallpaper = None
+        if flags & 33554432:
+            _stories = reader.tgread_object()
+        else:
+            _stories = None
+        if flags2 & 1:
+            _business_work_hours = reader.tgread_object()
+        else:
+            _business_work_hours = None
+        if flags2 & 2:
+            _business_location = reader.tgread_object()
+        else:
+            _business_location = None
+        if flags2 & 4:
+            _business_greeting_message = reader.tgread_object()
+        else:
+            _business_greeting_message = None
+        if flags2 & 8:
+            _business_away_message = reader.tgread_object()
+        else:
+            _business_away_message = None
+        if flags2 & 16:
+            _business_intro = reader.tgread_object()
+        else:
+            _business_intro = None
+        if flags2 & 32:
+            _birthday = reader.tgread_object()
+        else:
+            _birthday = None
+        if flags2 & 64:
+            _personal_channel_id = reader.read_long()
+        else:
+            _personal_channel_id = None
+        if flags2 & 64:
+            _personal_channel_message = reader.read_int()
+        else:
+            _personal_channel_message = None
+        if flags2 & 256:
+            _stargifts_count = reader.read_int()
+        else:
+            _stargifts_count = None
+        if flags2 & 2048:
+            _starref_program = reader.tgread_object()
+        else:
+            _starref_program = None
+        if flags2 & 4096:
+            _bot_verification = reader.tgread_object()
+        else:
+            _bot_verification = None
+        if flags2 & 16384:
+            _send_paid_messages_stars = reader.read_long()
+        else:
+            _send_paid_messages_stars = None
+        if flags2 & 32768:
+            _disallowed_gifts = reader.tgread_object()
+        else:
+            _disallowed_gifts = None
+        return cls(id=_id, settings=_settings, notify_settings=_notify_settings, common_chats_count=_common_chats_count, blocked=_blocked, phone_calls_available=_phone_calls_available, phone_calls_private=_phone_calls_private, can_pin_message=_can_pin_message, has_scheduled=_has_scheduled, video_calls_available=_video_calls_available, voice_messages_forbidden=_voice_messages_forbidden, translations_disabled=_translations_disabled, stories_pinned_available=_stories_pinned_available, blocked_my_stories_from=_blocked_my_stories_from, wallpaper_overridden=_wallpaper_overridden, contact_require_premium=_contact_require_premium, read_dates_private=_read_dates_private, sponsored_enabled=_sponsored_enabled, can_view_revenue=_can_view_revenue, bot_can_manage_emoji_status=_bot_can_manage_emoji_status, display_gifts_button=_display_gifts_button, about=_about, personal_photo=_personal_photo, profile_photo=_profile_photo, fallback_photo=_fallback_photo, bot_info=_bot_info, pinned_msg_id=_pinned_msg_id, folder_id=_folder_id, ttl_period=_ttl_period, theme_emoticon=_theme_emoticon, private_forward_name=_private_forward_name, bot_group_admin_rights=_bot_group_admin_rights, bot_broadcast_admin_rights=_bot_broadcast_admin_rights, wallpaper=_wallpaper, stories=_stories, business_work_hours=_business_work_hours, business_location=_business_location, business_greeting_message=_business_greeting_message, business_away_message=_business_away_message, business_intro=_business_intro, birthday=_birthday, personal_channel_id=_personal_channel_id, personal_channel_message=_personal_channel_message, stargifts_count=_stargifts_count, starref_program=_starref_program, bot_verification=_bot_verification, send_paid_messages_stars=_send_paid_messages_stars, disallowed_gifts=_disallowed_gifts)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        flags = reader.read_int()
+        flags2 = reader.read_int()
+        reader.seek(8)
+        if flags & 2:
+            TLObject.skip_bytes(reader)
+        reader.tgskip_object()
+        if flags & 2097152:
+            reader.tgskip_object()
+        if flags & 4:
+            reader.tgskip_object()
+        if flags & 4194304:
+            reader.tgskip_object()
+        reader.tgskip_object()
+        if flags & 8:
+            reader.tgskip_object()
+        if flags & 64:
+            reader.seek(4)
+        reader.seek(4)
+        if flags & 2048:
+            reader.seek(4)
+        if flags & 16384:
+            reader.seek(4)
+        if flags & 32768:
+            TLObject.skip_bytes(reader)
+        if flags & 65536:
+            TLObject.skip_bytes(reader)
+        if flags & 131072:
+            reader.tgskip_object()
+        if flags & 262144:
+            reader.tgskip_object()
+        if flags & 16777216:
+            reader.tgskip_object()
+        if flags & 33554432:
+            reader.tgskip_object()
+        if flags2 & 1:
+            reader.tgskip_object()
+        if flags2 & 2:
+            reader.tgskip_object()
+        if flags2 & 4:
+            reader.tgskip_object()
+        if flags2 & 8:
+            reader.tgskip_object()
+        if flags2 & 16:
+            reader.tgskip_object()
+        if flags2 & 32:
+            reader.tgskip_object()
+        if flags2 & 64:
+            reader.seek(8)
+        if flags2 & 64:
+            reader.seek(4)
+        if flags2 & 256:
+            reader.seek(4)
+        if flags2 & 2048:
+            reader.tgskip_object()
+        if flags2 & 4096:
+            reader.tgskip_object()
+        if flags2 & 16384:
+            reader.seek(8)
+        if flags2 & 32768:
+            reader.tgskip_object()
+
+TypeAccessPointRule = AccessPointRule
+TypeAccountDaysTTL = AccountDaysTTL
+TypeAttachMenuBot = AttachMenuBot
+TypeAttachMenuBotIcon = AttachMenuBotIcon
+TypeAttachMenuBotIconColor = AttachMenuBotIconColor
+TypeAttachMenuBots = Union[AttachMenuBotsNotModified,AttachMenuBots]
+TypeAttachMenuBotsBot = AttachMenuBotsBot
+TypeAttachMenuPeerType = Union[AttachMenuPeerTypeSameBotPM,AttachMenuPeerTypeBotPM,AttachMenuPeerTypePM,AttachMenuPeerTypeChat,AttachMenuPeerTypeBroadcast]
+TypeAuthorization = Authorization
+TypeAutoDownloadSettings = AutoDownloadSettings
+TypeAutoSaveException = AutoSaveException
+TypeAutoSaveSettings = AutoSaveSettings
+TypeAvailableEffect = AvailableEffect
+TypeAvailableReaction = AvailableReaction
+TypeBadMsgNotification = Union[BadMsgNotification,BadServerSalt]
+TypeBankCardOpenUrl = BankCardOpenUrl
+TypeBaseTheme = Union[BaseThemeClassic,BaseThemeDay,BaseThemeNight,BaseThemeTinted,BaseThemeArctic]
+TypeBindAuthKeyInner = BindAuthKeyInner
+TypeBirthday = Birthday
+TypeBoost = Boost
+TypeBotApp = Union[BotAppNotModified,BotApp]
+TypeBotAppSettings = BotAppSettings
+TypeBotBusinessConnection = BotBusinessConnection
+TypeBotCommand = BotCommand
+TypeBotCommandScope = Union[BotCommandScopeDefault,BotCommandScopeUsers,BotCommandScopeChats,BotCommandScopeChatAdmins,BotCommandScopePeer,BotCommandScopePeerAdmins,BotCommandScopePeerUser]
+TypeBotInfo = BotInfo
+TypeBotInlineResult = Union[BotInlineResult,BotInlineMediaResult]
+TypeBotInlineMessage = Union[BotInlineMessageMediaAuto,BotInlineMessageText,BotInlineMessageMediaGeo,BotInlineMessageMediaVenue,BotInlineMessageMediaContact,BotInlineMessageMediaInvoice,BotInlineMessageMediaWebPage]
+TypeBotMenuButton = Union[BotMenuButtonDefault,BotMenuButtonCommands,BotMenuButton]
+TypeBotPreviewMedia = BotPreviewMedia
+TypeBotVerification = BotVerification
+TypeBotVerifierSettings = BotVerifierSettings
+TypeBroadcastRevenueBalances = BroadcastRevenueBalances
+TypeBroadcastRevenueTransaction = Union[BroadcastRevenueTransactionProceeds,BroadcastRevenueTransactionWithdrawal,BroadcastRevenueTransactionRefund]
+TypeBusinessAwayMessage = BusinessAwayMessage
+TypeBusinessAwayMessageSchedule = Union[BusinessAwayMessageScheduleAlways,BusinessAwayMessageScheduleOutsideWorkHours,BusinessAwayMessageScheduleCustom]
+TypeBusinessBotRecipients = BusinessBotRecipients
+TypeBusinessBotRights = BusinessBotRights
+TypeBusinessChatLink = BusinessChatLink
+TypeBusinessGreetingMessage = BusinessGreetingMessage
+TypeBusinessIntro = BusinessIntro
+TypeBusinessLocation = BusinessLocation
+TypeBusinessRecipients = BusinessRecipients
+TypeBusinessWeeklyOpen = BusinessWeeklyOpen
+TypeBusinessWorkHours = BusinessWorkHours
+TypeCdnConfig = CdnConfig
+TypeCdnPublicKey = CdnPublicKey
+TypeChat = Union[ChatEmpty,Chat,ChatForbidden,Channel,ChannelForbidden]
+TypeChannelAdminLogEvent = ChannelAdminLogEvent
+TypeChannelAdminLogEventAction = Union[ChannelAdminLogEventActionChangeTitle,ChannelAdminLogEventActionChangeAbout,ChannelAdminLogEventActionChangeUsername,ChannelAdminLogEventActionChangePhoto,ChannelAdminLogEventActionToggleInvites,ChannelAdminLogEventActionToggleSignatures,ChannelAdminLogEventActionUpdatePinned,ChannelAdminLogEventActionEditMessage,ChannelAdminLogEventActionDeleteMessage,ChannelAdminLogEventActionParticipantJoin,ChannelAdminLogEventActionParticipantLeave,ChannelAdminLogEventActionParticipantInvite,ChannelAdminLogEventActionParticipantToggleBan,ChannelAdminLogEventActionParticipantToggleAdmin,ChannelAdminLogEventActionChangeStickerSet,ChannelAdminLogEventActionTogglePreHistoryHidden,ChannelAdminLogEventActionDefaultBannedRights,ChannelAdminLogEventActionStopPoll,ChannelAdminLogEventActionChangeLinkedChat,ChannelAdminLogEventActionChangeLocation,ChannelAdminLogEventActionToggleSlowMode,ChannelAdminLogEventActionStartGroupCall,ChannelAdminLogEventActionDiscardGroupCall,ChannelAdminLogEventActionParticipantMute,ChannelAdminLogEventActionParticipantUnmute,ChannelAdminLogEventActionToggleGroupCallSetting,ChannelAdminLogEventActionParticipantJoinByInvite,ChannelAdminLogEventActionExportedInviteDelete,ChannelAdminLogEventActionExportedInviteRevoke,ChannelAdminLogEventActionExportedInviteEdit,ChannelAdminLogEventActionParticipantVolume,ChannelAdminLogEventActionChangeHistoryTTL,ChannelAdminLogEventActionParticipantJoinByRequest,ChannelAdminLogEventActionToggleNoForwards,ChannelAdminLogEventActionSendMessage,ChannelAdminLogEventActionChangeAvailableReactions,ChannelAdminLogEventActionChangeUsernames,ChannelAdminLogEventActionToggleForum,ChannelAdminLogEventActionCreateTopic,ChannelAdminLogEventActionEditTopic,ChannelAdminLogEventActionDeleteTopic,ChannelAdminLogEventActionPinTopic,ChannelAdminLogEventActionToggleAntiSpam,ChannelAdminLogEventActionChangePeerColor,ChannelAdminLogEventActionChangeProfilePeerColor,ChannelAdminLogEventActionChangeWallpaper,ChannelAdminLogEventActionChangeEmojiStatus,ChannelAdminLogEventActionChangeEmojiStickerSet,ChannelAdminLogEventActionToggleSignatureProfiles,ChannelAdminLogEventActionParticipantSubExtend]
+TypeChannelAdminLogEventsFilter = ChannelAdminLogEventsFilter
+TypeChatFull = Union[ChatFull,ChannelFull]
+TypeChannelLocation = Union[ChannelLocationEmpty,ChannelLocation]
+TypeChannelMessagesFilter = Union[ChannelMessagesFilterEmpty,ChannelMessagesFilter]
+TypeChannelParticipant = Union[ChannelParticipant,ChannelParticipantSelf,ChannelParticipantCreator,ChannelParticipantAdmin,ChannelParticipantBanned,ChannelParticipantLeft]
+TypeChannelParticipantsFilter = Union[ChannelParticipantsRecent,ChannelParticipantsAdmins,ChannelParticipantsKicked,ChannelParticipantsBots,ChannelParticipantsBanned,ChannelParticipantsSearch,ChannelParticipantsContacts,ChannelParticipantsMentions]
+TypeChatAdminRights = ChatAdminRights
+TypeChatAdminWithInvites = ChatAdminWithInvites
+TypeChatBannedRights = ChatBannedRights
+TypeChatInvite = Union[ChatInviteAlready,ChatInvite,ChatInvitePeek]
+TypeExportedChatInvite = Union[ChatInviteExported,ChatInvitePublicJoinRequests]
+TypeChatInviteImporter = ChatInviteImporter
+TypeChatOnlines = ChatOnlines
+TypeChatParticipant = Union[ChatParticipant,ChatParticipantCreator,ChatParticipantAdmin]
+TypeChatParticipants = Union[ChatParticipantsForbidden,ChatParticipants]
+TypeChatPhoto = Union[ChatPhotoEmpty,ChatPhoto]
+TypeChatReactions = Union[ChatReactionsNone,ChatReactionsAll,ChatReactionsSome]
+TypeClient_DH_Inner_Data = ClientDHInnerData
+TypeCodeSettings = CodeSettings
+TypeConfig = Config
+TypeConnectedBot = ConnectedBot
+TypeConnectedBotStarRef = ConnectedBotStarRef
+TypeContact = Contact
+TypeContactBirthday = ContactBirthday
+TypeContactStatus = ContactStatus
+TypeDataJSON = DataJSON
+TypeDcOption = DcOption
+TypeDefaultHistoryTTL = DefaultHistoryTTL
+TypeDestroyAuthKeyRes = Union[DestroyAuthKeyOk,DestroyAuthKeyNone,DestroyAuthKeyFail]
+TypeDestroySessionRes = Union[DestroySessionOk,DestroySessionNone]
+TypeSet_client_DH_params_answer = Union[DhGenOk,DhGenRetry,DhGenFail]
+TypeDialog = Union[Dialog,DialogFolder]
+TypeDialogFilter = Union[DialogFilter,DialogFilterDefault,DialogFilterChatlist]
+TypeDialogFilterSuggested = DialogFilterSuggested
+TypeDialogPeer = Union[DialogPeer,DialogPeerFolder]
+TypeDisallowedGiftsSettings = DisallowedGiftsSettings
+TypeDocument = Union[DocumentEmpty,Document]
+TypeDocumentAttribute = Union[DocumentAttributeImageSize,DocumentAttributeAnimated,DocumentAttributeSticker,DocumentAttributeVideo,DocumentAttributeAudio,DocumentAttributeFilename,DocumentAttributeHasStickers,DocumentAttributeCustomEmoji]
+TypeDraftMessage = Union[DraftMessageEmpty,DraftMessage]
+TypeEmailVerification = Union[EmailVerificationCode,EmailVerificationGoogle,EmailVerificationApple]
+TypeEmailVerifyPurpose = Union[EmailVerifyPurposeLoginSetup,EmailVerifyPurposeLoginChange,EmailVerifyPurposePassport]
+TypeEmojiGroup = Union[EmojiGroup,EmojiGroupGreeting,EmojiGroupPremium]
+TypeEmojiKeyword = Union[EmojiKeyword,EmojiKeywordDeleted]
+TypeEmojiKeywordsDifference = EmojiKeywordsDifference
+TypeEmojiLanguage = EmojiLanguage
+TypeEmojiList = Union[EmojiListNotModified,EmojiList]
+TypeEmojiStatus = Union[EmojiStatusEmpty,EmojiStatus,EmojiStatusCollectible,InputEmojiStatusCollectible]
+TypeEmojiURL = EmojiURL
+TypeEncryptedChat = Union[EncryptedChatEmpty,EncryptedChatWaiting,EncryptedChatRequested,EncryptedChat,EncryptedChatDiscarded]
+TypeEncryptedFile = Union[EncryptedFileEmpty,EncryptedFile]
+TypeEncryptedMessage = Union[EncryptedMessage,EncryptedMessageService]
+TypeExportedChatlistInvite = ExportedChatlistInvite
+TypeExportedContactToken = ExportedContactToken
+TypeExportedMessageLink = ExportedMessageLink
+TypeExportedStoryLink = ExportedStoryLink
+TypeFactCheck = FactCheck
+TypeFileHash = FileHash
+TypeFolder = Folder
+TypeFolderPeer = FolderPeer
+TypeForumTopic = Union[ForumTopicDeleted,ForumTopic]
+TypeFoundStory = FoundStory
+TypeFutureSalt = FutureSalt
+TypeFutureSalts = FutureSalts
+TypeGame = Game
+TypeGeoPoint = Union[GeoPointEmpty,GeoPoint]
+TypeGeoPointAddress = GeoPointAddress
+TypeGlobalPrivacySettings = GlobalPrivacySettings
+TypeGroupCall = Union[GroupCallDiscarded,GroupCall]
+TypeGroupCallParticipant = GroupCallParticipant
+TypeGroupCallParticipantVideo = GroupCallParticipantVideo
+TypeGroupCallParticipantVideoSourceGroup = GroupCallParticipantVideoSourceGroup
+TypeGroupCallStreamChannel = GroupCallStreamChannel
+TypeHighScore = HighScore
+TypeHttpWait = HttpWait
+TypeImportedContact = ImportedContact
+TypeInlineBotSwitchPM = InlineBotSwitchPM
+TypeInlineBotWebView = InlineBotWebView
+TypeInlineQueryPeerType = Union[InlineQueryPeerTypeSameBotPM,InlineQueryPeerTypePM,InlineQueryPeerTypeChat,InlineQueryPeerTypeMegagroup,InlineQueryPeerTypeBroadcast,InlineQueryPeerTypeBotPM]
+TypeInputAppEvent = InputAppEvent
+TypeInputBotApp = Union[InputBotAppID,InputBotAppShortName]
+TypeInputBotInlineMessage = Union[InputBotInlineMessageMediaAuto,InputBotInlineMessageText,InputBotInlineMessageMediaGeo,InputBotInlineMessageMediaVenue,InputBotInlineMessageMediaContact,InputBotInlineMessageGame,InputBotInlineMessageMediaInvoice,InputBotInlineMessageMediaWebPage]
+TypeInputBotInlineMessageID = Union[InputBotInlineMessageID,InputBotInlineMessageID64]
+TypeInputBotInlineResult = Union[InputBotInlineResult,InputBotInlineResultPhoto,InputBotInlineResultDocument,InputBotInlineResultGame]
+TypeInputBusinessAwayMessage = InputBusinessAwayMessage
+TypeInputBusinessBotRecipients = InputBusinessBotRecipients
+TypeInputBusinessChatLink = InputBusinessChatLink
+TypeInputBusinessGreetingMessage = InputBusinessGreetingMessage
+TypeInputBusinessIntro = InputBusinessIntro
+TypeInputBusinessRecipients = InputBusinessRecipients
+TypeInputChannel = Union[InputChannelEmpty,InputChannel,InputChannelFromMessage]
+TypeInputChatPhoto = Union[InputChatPhotoEmpty,InputChatUploadedPhoto,InputChatPhoto]
+TypeInputChatlist = InputChatlistDialogFilter
+TypeInputCheckPasswordSRP = Union[InputCheckPasswordEmpty,InputCheckPasswordSRP]
+TypeInputClientProxy = InputClientProxy
+TypeInputCollectible = Union[InputCollectibleUsername,InputCollectiblePhone]
+TypeInputDialogPeer = Union[InputDialogPeer,InputDialogPeerFolder]
+TypeInputDocument = Union[InputDocumentEmpty,InputDocument]
+TypeInputFileLocation = Union[InputFileLocation,InputEncryptedFileLocation,InputDocumentFileLocation,InputSecureFileLocation,InputTakeoutFileLocation,InputPhotoFileLocation,InputPhotoLegacyFileLocation,InputPeerPhotoFileLocation,InputStickerSetThumb,InputGroupCallStream]
+TypeInputEncryptedChat = InputEncryptedChat
+TypeInputEncryptedFile = Union[InputEncryptedFileEmpty,InputEncryptedFileUploaded,InputEncryptedFile,InputEncryptedFileBigUploaded]
+TypeInputFile = Union[InputFile,InputFileBig,InputFileStoryDocument]
+TypeInputFolderPeer = InputFolderPeer
+TypeInputGame = Union[InputGameID,InputGameShortName]
+TypeInputGeoPoint = Union[InputGeoPointEmpty,InputGeoPoint]
+TypeInputGroupCall = InputGroupCall
+TypeInputInvoice = Union[InputInvoiceMessage,InputInvoiceSlug,InputInvoicePremiumGiftCode,InputInvoiceStars,InputInvoiceChatInviteSubscription,InputInvoiceStarGift,InputInvoiceStarGiftUpgrade,InputInvoiceStarGiftTransfer,InputInvoicePremiumGiftStars]
+TypeKeyboardButton = Union[KeyboardButton,KeyboardButtonUrl,KeyboardButtonCallback,KeyboardButtonRequestPhone,KeyboardButtonRequestGeoLocation,KeyboardButtonSwitchInline,KeyboardButtonGame,KeyboardButtonBuy,KeyboardButtonUrlAuth,InputKeyboardButtonUrlAuth,KeyboardButtonRequestPoll,InputKeyboardButtonUserProfile,KeyboardButtonUserProfile,KeyboardButtonWebView,KeyboardButtonSimpleWebView,KeyboardButtonRequestPeer,InputKeyboardButtonRequestPeer,KeyboardButtonCopy]
+TypeMediaArea = Union[MediaAreaVenue,InputMediaAreaVenue,MediaAreaGeoPoint,MediaAreaSuggestedReaction,MediaAreaChannelPost,InputMediaAreaChannelPost,MediaAreaUrl,MediaAreaWeather,MediaAreaStarGift]
+TypeInputMedia = Union[InputMediaEmpty,InputMediaUploadedPhoto,InputMediaPhoto,InputMediaGeoPoint,InputMediaContact,InputMediaUploadedDocument,InputMediaDocument,InputMediaVenue,InputMediaPhotoExternal,InputMediaDocumentExternal,InputMediaGame,InputMediaInvoice,InputMediaGeoLive,InputMediaPoll,InputMediaDice,InputMediaStory,InputMediaWebPage,InputMediaPaidMedia]
+TypeInputMessage = Union[InputMessageID,InputMessageReplyTo,InputMessagePinned,InputMessageCallbackQuery]
+TypeMessageEntity = Union[MessageEntityUnknown,MessageEntityMention,MessageEntityHashtag,MessageEntityBotCommand,MessageEntityUrl,MessageEntityEmail,MessageEntityBold,MessageEntityItalic,MessageEntityCode,MessageEntityPre,MessageEntityTextUrl,MessageEntityMentionName,InputMessageEntityMentionName,MessageEntityPhone,MessageEntityCashtag,MessageEntityUnderline,MessageEntityStrike,MessageEntityBankCard,MessageEntitySpoiler,MessageEntityCustomEmoji,MessageEntityBlockquote]
+TypeMessagesFilter = Union[InputMessagesFilterEmpty,InputMessagesFilterPhotos,InputMessagesFilterVideo,InputMessagesFilterPhotoVideo,InputMessagesFilterDocument,InputMessagesFilterUrl,InputMessagesFilterGif,InputMessagesFilterVoice,InputMessagesFilterMusic,InputMessagesFilterChatPhotos,InputMessagesFilterPhoneCalls,InputMessagesFilterRoundVoice,InputMessagesFilterRoundVideo,InputMessagesFilterMyMentions,InputMessagesFilterGeo,InputMessagesFilterContacts,InputMessagesFilterPinned]
+TypeInputNotifyPeer = Union[InputNotifyPeer,InputNotifyUsers,InputNotifyChats,InputNotifyBroadcasts,InputNotifyForumTopic]
+TypeInputPaymentCredentials = Union[InputPaymentCredentialsSaved,InputPaymentCredentials,InputPaymentCredentialsApplePay,InputPaymentCredentialsGooglePay]
+TypeInputPeer = Union[InputPeerEmpty,InputPeerSelf,InputPeerChat,InputPeerUser,InputPeerChannel,InputPeerUserFromMessage,InputPeerChannelFromMessage]
+TypeInputPeerNotifySettings = InputPeerNotifySettings
+TypeInputPhoneCall = InputPhoneCall
+TypeInputContact = InputPhoneContact
+TypeInputPhoto = Union[InputPhotoEmpty,InputPhoto]
+TypeInputPrivacyKey = Union[InputPrivacyKeyStatusTimestamp,InputPrivacyKeyChatInvite,InputPrivacyKeyPhoneCall,InputPrivacyKeyPhoneP2P,InputPrivacyKeyForwards,InputPrivacyKeyProfilePhoto,InputPrivacyKeyPhoneNumber,InputPrivacyKeyAddedByPhone,InputPrivacyKeyVoiceMessages,InputPrivacyKeyAbout,InputPrivacyKeyBirthday,InputPrivacyKeyStarGiftsAutoSave,InputPrivacyKeyNoPaidMessages]
+TypeInputPrivacyRule = Union[InputPrivacyValueAllowContacts,InputPrivacyValueAllowAll,InputPrivacyValueAllowUsers,InputPrivacyValueDisallowContacts,InputPrivacyValueDisallowAll,InputPrivacyValueDisallowUsers,InputPrivacyValueAllowChatParticipants,InputPrivacyValueDisallowChatParticipants,InputPrivacyValueAllowCloseFriends,InputPrivacyValueAllowPremium,InputPrivacyValueAllowBots,InputPrivacyValueDisallowBots]
+TypeInputQuickReplyShortcut = Union[InputQuickReplyShortcut,InputQuickReplyShortcutId]
+TypeInputReplyTo = Union[InputReplyToMessage,InputReplyToStory]
+TypeReportReason = Union[InputReportReasonSpam,InputReportReasonViolence,InputReportReasonPornography,InputReportReasonChildAbuse,InputReportReasonOther,InputReportReasonCopyright,InputReportReasonGeoIrrelevant,InputReportReasonFake,InputReportReasonIllegalDrugs,InputReportReasonPersonalDetails]
+TypeInputSavedStarGift = Union[InputSavedStarGiftUser,InputSavedStarGiftChat]
+TypeInputSecureFile = Union[InputSecureFileUploaded,InputSecureFile]
+TypeInputSecureValue = InputSecureValue
+TypeInputSingleMedia = InputSingleMedia
+TypeInputStarsTransaction = InputStarsTransaction
+TypeInputStickerSet = Union[InputStickerSetEmpty,InputStickerSetID,InputStickerSetShortName,InputStickerSetAnimatedEmoji,InputStickerSetDice,InputStickerSetAnimatedEmojiAnimations,InputStickerSetPremiumGifts,InputStickerSetEmojiGenericAnimations,InputStickerSetEmojiDefaultStatuses,InputStickerSetEmojiDefaultTopicIcons,InputStickerSetEmojiChannelDefaultStatuses]
+TypeInputStickerSetItem = InputStickerSetItem
+TypeInputStickeredMedia = Union[InputStickeredMediaPhoto,InputStickeredMediaDocument]
+TypeInputStorePaymentPurpose = Union[InputStorePaymentPremiumSubscription,InputStorePaymentGiftPremium,InputStorePaymentPremiumGiftCode,InputStorePaymentPremiumGiveaway,InputStorePaymentStarsTopup,InputStorePaymentStarsGift,InputStorePaymentStarsGiveaway,InputStorePaymentAuthCode]
+TypeInputTheme = Union[InputTheme,InputThemeSlug]
+TypeInputThemeSettings = InputThemeSettings
+TypeInputUser = Union[InputUserEmpty,InputUserSelf,InputUser,InputUserFromMessage]
+TypeInputWallPaper = Union[InputWallPaper,InputWallPaperSlug,InputWallPaperNoFile]
+TypeInputWebDocument = InputWebDocument
+TypeInputWebFileLocation = Union[InputWebFileLocation,InputWebFileGeoPointLocation,InputWebFileAudioAlbumThumbLocation]
+TypeInvoice = Invoice
+TypeIpPort = Union[IpPort,IpPortSecret]
+TypeJSONValue = Union[JsonNull,JsonBool,JsonNumber,JsonString,JsonArray,JsonObject]
+TypeJSONObjectValue = JsonObjectValue
+TypeKeyboardButtonRow = KeyboardButtonRow
+TypeLabeledPrice = LabeledPrice
+TypeLangPackDifference = LangPackDifference
+TypeLangPackLanguage = LangPackLanguage
+TypeLangPackString = Union[LangPackString,LangPackStringPluralized,LangPackStringDeleted]
+TypeMaskCoords = MaskCoords
+TypeMediaAreaCoordinates = MediaAreaCoordinates
+TypeMessage = Union[MessageEmpty,Message,MessageService]
+TypeMessageAction = Union[MessageActionEmpty,MessageActionChatCreate,MessageActionChatEditTitle,MessageActionChatEditPhoto,MessageActionChatDeletePhoto,MessageActionChatAddUser,MessageActionChatDeleteUser,MessageActionChatJoinedByLink,MessageActionChannelCreate,MessageActionChatMigrateTo,MessageActionChannelMigrateFrom,MessageActionPinMessage,MessageActionHistoryClear,MessageActionGameScore,MessageActionPaymentSentMe,MessageActionPaymentSent,MessageActionPhoneCall,MessageActionScreenshotTaken,MessageActionCustomAction,MessageActionBotAllowed,MessageActionSecureValuesSentMe,MessageActionSecureValuesSent,MessageActionContactSignUp,MessageActionGeoProximityReached,MessageActionGroupCall,MessageActionInviteToGroupCall,MessageActionSetMessagesTTL,MessageActionGroupCallScheduled,MessageActionSetChatTheme,MessageActionChatJoinedByRequest,MessageActionWebViewDataSentMe,MessageActionWebViewDataSent,MessageActionGiftPremium,MessageActionTopicCreate,MessageActionTopicEdit,MessageActionSuggestProfilePhoto,MessageActionRequestedPeer,MessageActionSetChatWallPaper,MessageActionGiftCode,MessageActionGiveawayLaunch,MessageActionGiveawayResults,MessageActionBoostApply,MessageActionRequestedPeerSentMe,MessageActionPaymentRefunded,MessageActionGiftStars,MessageActionPrizeStars,MessageActionStarGift,MessageActionStarGiftUnique,MessageActionPaidMessagesRefunded,MessageActionPaidMessagesPrice]
+TypeMessageExtendedMedia = Union[MessageExtendedMediaPreview,MessageExtendedMedia]
+TypeMessageFwdHeader = MessageFwdHeader
+TypeMessageMedia = Union[MessageMediaEmpty,MessageMediaPhoto,MessageMediaGeo,MessageMediaContact,MessageMediaUnsupported,MessageMediaDocument,MessageMediaWebPage,MessageMediaVenue,MessageMediaGame,MessageMediaInvoice,MessageMediaGeoLive,MessageMediaPoll,MessageMediaDice,MessageMediaStory,MessageMediaGiveaway,MessageMediaGiveawayResults,MessageMediaPaidMedia]
+TypeMessagePeerReaction = MessagePeerReaction
+TypeMessagePeerVote = Union[MessagePeerVote,MessagePeerVoteInputOption,MessagePeerVoteMultiple]
+TypeMessageRange = MessageRange
+TypeMessageReactions = MessageReactions
+TypeMessageReactor = MessageReactor
+TypeMessageReplies = MessageReplies
+TypeMessageReplyHeader = Union[MessageReplyHeader,MessageReplyStoryHeader]
+TypeMessageReportOption = MessageReportOption
+TypeMessageViews = MessageViews
+TypeMissingInvitee = MissingInvitee
+TypeMsgDetailedInfo = Union[MsgDetailedInfo,MsgNewDetailedInfo]
+TypeMsgResendReq = MsgResendReq
+TypeMsgsAck = MsgsAck
+TypeMsgsAllInfo = MsgsAllInfo
+TypeMsgsStateInfo = MsgsStateInfo
+TypeMsgsStateReq = MsgsStateReq
+TypeMyBoost = MyBoost
+TypeNearestDc = NearestDc
+TypeNewSession = NewSessionCreated
+TypeNotificationSound = Union[NotificationSoundDefault,NotificationSoundNone,NotificationSoundLocal,NotificationSoundRingtone]
+TypeNotifyPeer = Union[NotifyPeer,NotifyUsers,NotifyChats,NotifyBroadcasts,NotifyForumTopic]
+TypeOutboxReadDate = OutboxReadDate
+TypeP_Q_inner_data = Union[PQInnerData,PQInnerDataDc,PQInnerDataTemp,PQInnerDataTempDc]
+TypePage = Page
+TypePageBlock = Union[PageBlockUnsupported,PageBlockTitle,PageBlockSubtitle,PageBlockAuthorDate,PageBlockHeader,PageBlockSubheader,PageBlockParagraph,PageBlockPreformatted,PageBlockFooter,PageBlockDivider,PageBlockAnchor,PageBlockList,PageBlockBlockquote,PageBlockPullquote,PageBlockPhoto,PageBlockVideo,PageBlockCover,PageBlockEmbed,PageBlockEmbedPost,PageBlockCollage,PageBlockSlideshow,PageBlockChannel,PageBlockAudio,PageBlockKicker,PageBlockTable,PageBlockOrderedList,PageBlockDetails,PageBlockRelatedArticles,PageBlockMap]
+TypePageCaption = PageCaption
+TypePageListItem = Union[PageListItemText,PageListItemBlocks]
+TypePageListOrderedItem = Union[PageListOrderedItemText,PageListOrderedItemBlocks]
+TypePageRelatedArticle = PageRelatedArticle
+TypePageTableCell = PageTableCell
+TypePageTableRow = PageTableRow
+TypePaidReactionPrivacy = Union[PaidReactionPrivacyDefault,PaidReactionPrivacyAnonymous,PaidReactionPrivacyPeer]
+TypePasswordKdfAlgo = Union[PasswordKdfAlgoUnknown,PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow]
+TypePaymentCharge = PaymentCharge
+TypePaymentFormMethod = PaymentFormMethod
+TypePaymentRequestedInfo = PaymentRequestedInfo
+TypePaymentSavedCredentials = PaymentSavedCredentialsCard
+TypePeerBlocked = PeerBlocked
+TypePeer = Union[PeerUser,PeerChat,PeerChannel]
+TypePeerColor = PeerColor
+TypePeerLocated = Union[PeerLocated,PeerSelfLocated]
+TypePeerNotifySettings = PeerNotifySettings
+TypePeerSettings = PeerSettings
+TypePeerStories = PeerStories
+TypePhoneCall = Union[PhoneCallEmpty,PhoneCallWaiting,PhoneCallRequested,PhoneCallAccepted,PhoneCall,PhoneCallDiscarded]
+TypePhoneCallDiscardReason = Union[PhoneCallDiscardReasonMissed,PhoneCallDiscardReasonDisconnect,PhoneCallDiscardReasonHangup,PhoneCallDiscardReasonBusy,PhoneCallDiscardReasonAllowGroupCall]
+TypePhoneCallProtocol = PhoneCallProtocol
+TypePhoneConnection = Union[PhoneConnection,PhoneConnectionWebrtc]
+TypePhoto = Union[PhotoEmpty,Photo]
+TypePhotoSize = Union[PhotoSizeEmpty,PhotoSize,PhotoCachedSize,PhotoStrippedSize,PhotoSizeProgressive,PhotoPathSize]
+TypePoll = Poll
+TypePollAnswer = PollAnswer
+TypePollAnswerVoters = PollAnswerVoters
+TypePollResults = PollResults
+TypePong = Pong
+TypePopularContact = PopularContact
+TypePostAddress = PostAddress
+TypePostInteractionCounters = Union[PostInteractionCountersMessage,PostInteractionCountersStory]
+TypePremiumGiftCodeOption = PremiumGiftCodeOption
+TypePremiumSubscriptionOption = PremiumSubscriptionOption
+TypePrepaidGiveaway = Union[PrepaidGiveaway,PrepaidStarsGiveaway]
+TypePrivacyKey = Union[PrivacyKeyStatusTimestamp,PrivacyKeyChatInvite,PrivacyKeyPhoneCall,PrivacyKeyPhoneP2P,PrivacyKeyForwards,PrivacyKeyProfilePhoto,PrivacyKeyPhoneNumber,PrivacyKeyAddedByPhone,PrivacyKeyVoiceMessages,PrivacyKeyAbout,PrivacyKeyBirthday,PrivacyKeyStarGiftsAutoSave,PrivacyKeyNoPaidMessages]
+TypePrivacyRule = Union[PrivacyValueAllowContacts,PrivacyValueAllowAll,PrivacyValueAllowUsers,PrivacyValueDisallowContacts,PrivacyValueDisallowAll,PrivacyValueDisallowUsers,PrivacyValueAllowChatParticipants,PrivacyValueDisallowChatParticipants,PrivacyValueAllowCloseFriends,PrivacyValueAllowPremium,PrivacyValueAllowBots,PrivacyValueDisallowBots]
+TypePublicForward = Union[PublicForwardMessage,PublicForwardStory]
+TypeQuickReply = QuickReply
+TypeReactionCount = ReactionCount
+TypeReaction = Union[ReactionEmpty,ReactionEmoji,ReactionCustomEmoji,ReactionPaid]
+TypeReactionNotificationsFrom = Union[ReactionNotificationsFromContacts,ReactionNotificationsFromAll]
+TypeReactionsNotifySettings = ReactionsNotifySettings
+TypeReadParticipantDate = ReadParticipantDate
+TypeReceivedNotifyMessage = ReceivedNotifyMessage
+TypeRecentMeUrl = Union[RecentMeUrlUnknown,RecentMeUrlUser,RecentMeUrlChat,RecentMeUrlChatInvite,RecentMeUrlStickerSet]
+TypeReplyMarkup = Union[ReplyKeyboardHide,ReplyKeyboardForceReply,ReplyKeyboardMarkup,ReplyInlineMarkup]
+TypeReportResult = Union[ReportResultChooseOption,ReportResultAddComment,ReportResultReported]
+TypeRequestPeerType = Union[RequestPeerTypeUser,RequestPeerTypeChat,RequestPeerTypeBroadcast]
+TypeRequestedPeer = Union[RequestedPeerUser,RequestedPeerChat,RequestedPeerChannel]
+TypeRequirementToContact = Union[RequirementToContactEmpty,RequirementToContactPremium,RequirementToContactPaidMessages]
+TypeResPQ = ResPQ
+TypeRestrictionReason = RestrictionReason
+TypeRpcDropAnswer = Union[RpcAnswerUnknown,RpcAnswerDroppedRunning,RpcAnswerDropped]
+TypeRpcError = RpcError
+TypeSavedDialog = SavedDialog
+TypeSavedContact = SavedPhoneContact
+TypeSavedReactionTag = SavedReactionTag
+TypeSavedStarGift = SavedStarGift
+TypeSearchResultsPosition = SearchResultPosition
+TypeSearchResultsCalendarPeriod = SearchResultsCalendarPeriod
+TypeSecureCredentialsEncrypted = SecureCredentialsEncrypted
+TypeSecureData = SecureData
+TypeSecureFile = Union[SecureFileEmpty,SecureFile]
+TypeSecurePasswordKdfAlgo = Union[SecurePasswordKdfAlgoUnknown,SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000,SecurePasswordKdfAlgoSHA512]
+TypeSecurePlainData = Union[SecurePlainPhone,SecurePlainEmail]
+TypeSecureRequiredType = Union[SecureRequiredType,SecureRequiredTypeOneOf]
+TypeSecureSecretSettings = SecureSecretSettings
+TypeSecureValue = SecureValue
+TypeSecureValueError = Union[SecureValueErrorData,SecureValueErrorFrontSide,SecureValueErrorReverseSide,SecureValueErrorSelfie,SecureValueErrorFile,SecureValueErrorFiles,SecureValueError,SecureValueErrorTranslationFile,SecureValueErrorTranslationFiles]
+TypeSecureValueHash = SecureValueHash
+TypeSecureValueType = Union[SecureValueTypePersonalDetails,SecureValueTypePassport,SecureValueTypeDriverLicense,SecureValueTypeIdentityCard,SecureValueTypeInternalPassport,SecureValueTypeAddress,SecureValueTypeUtilityBill,SecureValueTypeBankStatement,SecureValueTypeRentalAgreement,SecureValueTypePassportRegistration,SecureValueTypeTemporaryRegistration,SecureValueTypePhone,SecureValueTypeEmail]
+TypeSendAsPeer = SendAsPeer
+TypeSendMessageAction = Union[SendMessageTypingAction,SendMessageCancelAction,SendMessageRecordVideoAction,SendMessageUploadVideoAction,SendMessageRecordAudioAction,SendMessageUploadAudioAction,SendMessageUploadPhotoAction,SendMessageUploadDocumentAction,SendMessageGeoLocationAction,SendMessageChooseContactAction,SendMessageGamePlayAction,SendMessageRecordRoundAction,SendMessageUploadRoundAction,SpeakingInGroupCallAction,SendMessageHistoryImportAction,SendMessageChooseStickerAction,SendMessageEmojiInteraction,SendMessageEmojiInteractionSeen]
+TypeServer_DH_inner_data = ServerDHInnerData
+TypeServer_DH_Params = Union[ServerDHParamsFail,ServerDHParamsOk]
+TypeShippingOption = ShippingOption
+TypeSmsJob = SmsJob
+TypeSponsoredMessage = SponsoredMessage
+TypeSponsoredMessageReportOption = SponsoredMessageReportOption
+TypeSponsoredPeer = SponsoredPeer
+TypeStarGift = Union[StarGift,StarGiftUnique]
+TypeStarGiftAttribute = Union[StarGiftAttributeModel,StarGiftAttributePattern,StarGiftAttributeBackdrop,StarGiftAttributeOriginalDetails]
+TypeStarRefProgram = StarRefProgram
+TypeStarsAmount = StarsAmount
+TypeStarsGiftOption = StarsGiftOption
+TypeStarsGiveawayOption = StarsGiveawayOption
+TypeStarsGiveawayWinnersOption = StarsGiveawayWinnersOption
+TypeStarsRevenueStatus = StarsRevenueStatus
+TypeStarsSubscription = StarsSubscription
+TypeStarsSubscriptionPricing = StarsSubscriptionPricing
+TypeStarsTopupOption = StarsTopupOption
+TypeStarsTransaction = StarsTransaction
+TypeStarsTransactionPeer = Union[StarsTransactionPeerUnsupported,StarsTransactionPeerAppStore,StarsTransactionPeerPlayMarket,StarsTransactionPeerPremiumBot,StarsTransactionPeerFragment,StarsTransactionPeer,StarsTransactionPeerAds,StarsTransactionPeerAPI]
+TypeStatsAbsValueAndPrev = StatsAbsValueAndPrev
+TypeStatsDateRangeDays = StatsDateRangeDays
+TypeStatsGraph = Union[StatsGraphAsync,StatsGraphError,StatsGraph]
+TypeStatsGroupTopAdmin = StatsGroupTopAdmin
+TypeStatsGroupTopInviter = StatsGroupTopInviter
+TypeStatsGroupTopPoster = StatsGroupTopPoster
+TypeStatsPercentValue = StatsPercentValue
+TypeStatsURL = StatsURL
+TypeStickerKeyword = StickerKeyword
+TypeStickerPack = StickerPack
+TypeStickerSet = StickerSet
+TypeStickerSetCovered = Union[StickerSetCovered,StickerSetMultiCovered,StickerSetFullCovered,StickerSetNoCovered]
+TypeStoriesStealthMode = StoriesStealthMode
+TypeStoryFwdHeader = StoryFwdHeader
+TypeStoryItem = Union[StoryItemDeleted,StoryItemSkipped,StoryItem]
+TypeStoryReaction = Union[StoryReaction,StoryReactionPublicForward,StoryReactionPublicRepost]
+TypeStoryView = Union[StoryView,StoryViewPublicForward,StoryViewPublicRepost]
+TypeStoryViews = StoryViews
+TypeRichText = Union[TextEmpty,TextPlain,TextBold,TextItalic,TextUnderline,TextStrike,TextFixed,TextUrl,TextEmail,TextConcat,TextSubscript,TextSuperscript,TextMarked,TextPhone,TextImage,TextAnchor]
+TypeTextWithEntities = TextWithEntities
+TypeTheme = Theme
+TypeThemeSettings = ThemeSettings
+TypeTimezone = Timezone
+TypeTlsBlock = Union[TlsBlockString,TlsBlockRandom,TlsBlockZero,TlsBlockDomain,TlsBlockGrease,TlsBlockPublicKey,TlsBlockScope]
+TypeTlsClientHello = TlsClientHello
+TypeTopPeer = TopPeer
+TypeTopPeerCategory = Union[TopPeerCategoryBotsPM,TopPeerCategoryBotsInline,TopPeerCategoryCorrespondents,TopPeerCategoryGroups,TopPeerCategoryChannels,TopPeerCategoryPhoneCalls,TopPeerCategoryForwardUsers,TopPeerCategoryForwardChats,TopPeerCategoryBotsApp]
+TypeTopPeerCategoryPeers = TopPeerCategoryPeers
+TypeUpdate = Union[UpdateNewMessage,UpdateMessageID,UpdateDeleteMessages,UpdateUserTyping,UpdateChatUserTyping,UpdateChatParticipants,UpdateUserStatus,UpdateUserName,UpdateNewAuthorization,UpdateNewEncryptedMessage,UpdateEncryptedChatTyping,UpdateEncryption,UpdateEncryptedMessagesRead,UpdateChatParticipantAdd,UpdateChatParticipantDelete,UpdateDcOptions,UpdateNotifySettings,UpdateServiceNotification,UpdatePrivacy,UpdateUserPhone,UpdateReadHistoryInbox,UpdateReadHistoryOutbox,UpdateWebPage,UpdateReadMessagesContents,UpdateChannelTooLong,UpdateChannel,UpdateNewChannelMessage,UpdateReadChannelInbox,UpdateDeleteChannelMessages,UpdateChannelMessageViews,UpdateChatParticipantAdmin,UpdateNewStickerSet,UpdateStickerSetsOrder,UpdateStickerSets,UpdateSavedGifs,UpdateBotInlineQuery,UpdateBotInlineSend,UpdateEditChannelMessage,UpdateBotCallbackQuery,UpdateEditMessage,UpdateInlineBotCallbackQuery,UpdateReadChannelOutbox,UpdateDraftMessage,UpdateReadFeaturedStickers,UpdateRecentStickers,UpdateConfig,UpdatePtsChanged,UpdateChannelWebPage,UpdateDialogPinned,UpdatePinnedDialogs,UpdateBotWebhookJSON,UpdateBotWebhookJSONQuery,UpdateBotShippingQuery,UpdateBotPrecheckoutQuery,UpdatePhoneCall,UpdateLangPackTooLong,UpdateLangPack,UpdateFavedStickers,UpdateChannelReadMessagesContents,UpdateContactsReset,UpdateChannelAvailableMessages,UpdateDialogUnreadMark,UpdateMessagePoll,UpdateChatDefaultBannedRights,UpdateFolderPeers,UpdatePeerSettings,UpdatePeerLocated,UpdateNewScheduledMessage,UpdateDeleteScheduledMessages,UpdateTheme,UpdateGeoLiveViewed,UpdateLoginToken,UpdateMessagePollVote,UpdateDialogFilter,UpdateDialogFilterOrder,UpdateDialogFilters,UpdatePhoneCallSignalingData,UpdateChannelMessageForwards,UpdateReadChannelDiscussionInbox,UpdateReadChannelDiscussionOutbox,UpdatePeerBlocked,UpdateChannelUserTyping,UpdatePinnedMessages,UpdatePinnedChannelMessages,UpdateChat,UpdateGroupCallParticipants,UpdateGroupCall,UpdatePeerHistoryTTL,UpdateChatParticipant,UpdateChannelParticipant,UpdateBotStopped,UpdateGroupCallConnection,UpdateBotCommands,UpdatePendingJoinRequests,UpdateBotChatInviteRequester,UpdateMessageReactions,UpdateAttachMenuBots,UpdateWebViewResultSent,UpdateBotMenuButton,UpdateSavedRingtones,UpdateTranscribedAudio,UpdateReadFeaturedEmojiStickers,UpdateUserEmojiStatus,UpdateRecentEmojiStatuses,UpdateRecentReactions,UpdateMoveStickerSetToTop,UpdateMessageExtendedMedia,UpdateChannelPinnedTopic,UpdateChannelPinnedTopics,UpdateUser,UpdateAutoSaveSettings,UpdateStory,UpdateReadStories,UpdateStoryID,UpdateStoriesStealthMode,UpdateSentStoryReaction,UpdateBotChatBoost,UpdateChannelViewForumAsMessages,UpdatePeerWallpaper,UpdateBotMessageReaction,UpdateBotMessageReactions,UpdateSavedDialogPinned,UpdatePinnedSavedDialogs,UpdateSavedReactionTags,UpdateSmsJob,UpdateQuickReplies,UpdateNewQuickReply,UpdateDeleteQuickReply,UpdateQuickReplyMessage,UpdateDeleteQuickReplyMessages,UpdateBotBusinessConnect,UpdateBotNewBusinessMessage,UpdateBotEditBusinessMessage,UpdateBotDeleteBusinessMessage,UpdateNewStoryReaction,UpdateBroadcastRevenueTransactions,UpdateStarsBalance,UpdateBusinessBotCallbackQuery,UpdateStarsRevenueStatus,UpdateBotPurchasedPaidMedia,UpdatePaidReactionPrivacy,UpdateSentPhoneCode]
+TypeUpdates = Union[UpdatesTooLong,UpdateShortMessage,UpdateShortChatMessage,UpdateShort,UpdatesCombined,Updates,UpdateShortSentMessage]
+TypeUrlAuthResult = Union[UrlAuthResultRequest,UrlAuthResultAccepted,UrlAuthResultDefault]
+TypeUser = Union[UserEmpty,User]
+TypeUserFull = UserFull
+TypeUserProfilePhoto = Union[UserProfilePhotoEmpty,UserProfilePhoto]
+TypeUserStatus = Union[UserStatusEmpty,UserStatusOnline,UserStatusOffline,UserStatusRecently,UserStatusLastWeek,UserStatusLastMonth]
+TypeUsername = Username
+TypeVideoSize = Union[VideoSize,VideoSizeEmojiMarkup,VideoSizeStickerMarkup]
+TypeWallPaper = Union[WallPaper,WallPaperNoFile]
+TypeWallPaperSettings = WallPaperSettings
+TypeWebAuthorization = WebAuthorization
+TypeWebDocument = Union[WebDocument,WebDocumentNoProxy]
+TypeWebPage = Union[WebPageEmpty,WebPagePending,WebPage,WebPageNotModified]
+TypeWebPageAttribute = Union[WebPageAttributeTheme,WebPageAttributeStory,WebPageAttributeStickerSet,WebPageAttributeUniqueStarGift]
+TypeWebViewMessageSent = WebViewMessageSent
+TypeWebViewResult = WebViewResultUrl
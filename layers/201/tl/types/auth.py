@@ -0,0 +1,52 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.types.auth import Authorization, AuthorizationSignUpRequired, CodeTypeCall, CodeTypeFlashCall, CodeTypeFragmentSms, CodeTypeMissedCall, CodeTypeSms, ExportedAuthorization, LoggedOut, LoginToken, LoginTokenMigrateTo, LoginTokenSuccess, PasswordRecovery, SentCode, SentCodeSuccess, SentCodeTypeApp, SentCodeTypeCall, SentCodeTypeEmailCode, SentCodeTypeFirebaseSms, SentCodeTypeFlashCall, SentCodeTypeFragmentSms, SentCodeTypeMissedCall, SentCodeTypeSetUpEmailRequired, SentCodeTypeSms, SentCodeTypeSmsPhrase, SentCodeTypeSmsWord
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeUser
+    from ...tl.types.help import TypeTermsOfService
+    from ...tl.types.auth import TypeAuthorization, TypeCodeType, TypeSentCodeType
+
+
+
+class SentCodePaymentRequired(TLObject):
+    CONSTRUCTOR_ID = 0xd7cef980
+    SUBCLASS_OF_ID = 0x6ce87081
+
+    __slots__ = ('store_product', 'phone_code_hash')
+
+    def __init__(self, store_product: str, phone_code_hash: str):
+        """
+        Constructor for auth.SentCode: Instance of either SentCode, SentCodeSuccess, SentCodePaymentRequired.
+        """
+        self.store_product = store_product
+        self.phone_code_hash = phone_code_hash
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodePaymentRequired',
+            'store_product': self.store_product,
+            'phone_code_hash': self.phone_code_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x80\xf9\xce\xd7',
+            self.serialize_bytes(self.store_product),
+            self.serialize_bytes(self.phone_code_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _store_product = reader.tgread_string()
+        _phone_code_hash = reader.tgread_string()
+        return cls(store_product=_store_product, phone_code_hash=_phone_code_hash)
+
+    @classmethod
+    def skip_reader(cls, reader):
+        TLObject.skip_bytes(reader)
+        TLObject.skip_bytes(reader)
+
@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.types.messages import AffectedFoundMessages, AffectedHistory, AffectedMessages, AllStickers, AllStickersNotModified, ArchivedStickers, AvailableEffects, AvailableEffectsNotModified, AvailableReactions, AvailableReactionsNotModified, BotApp, BotCallbackAnswer, BotPreparedInlineMessage, BotResults, ChannelMessages, ChatAdminsWithInvites, ChatFull, ChatInviteImporters, Chats, ChatsSlice, CheckedHistoryImportPeer, DhConfig, DhConfigNotModified, DialogFilters, Dialogs, DialogsNotModified, DialogsSlice, DiscussionMessage, EmojiGroups, EmojiGroupsNotModified, ExportedChatInvite, ExportedChatInviteReplaced, ExportedChatInvites, FavedStickers, FavedStickersNotModified, FeaturedStickers, FeaturedStickersNotModified, ForumTopics, FoundStickerSets, FoundStickerSetsNotModified, FoundStickers, FoundStickersNotModified, HighScores, HistoryImport, HistoryImportParsed, InactiveChats, InvitedUsers, MessageEditData, MessageReactionsList, MessageViews, Messages, MessagesNotModified, MessagesSlice, MyStickers, PeerDialogs, PeerSettings, PreparedInlineMessage, QuickReplies, QuickRepliesNotModified, Reactions, ReactionsNotModified, RecentStickers, RecentStickersNotModified, SavedDialogs, SavedDialogsNotModified, SavedDialogsSlice, SavedGifs, SavedGifsNotModified, SavedReactionTags, SavedReactionTagsNotModified, SearchCounter, SearchResultsCalendar, SearchResultsPositions, SentEncryptedFile, SentEncryptedMessage, SponsoredMessages, SponsoredMessagesEmpty, StickerSet, StickerSetInstallResultArchive, StickerSetInstallResultSuccess, StickerSetNotModified, Stickers, StickersNotModified, TranscribedAudio, TranslateResult, VotesList, WebPage, WebPagePreview
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAvailableEffect, TypeAvailableReaction, TypeBotApp, TypeBotInlineResult, TypeChat, TypeChatAdminWithInvites, TypeChatFull, TypeChatInviteImporter, TypeDialog, TypeDialogFilter, TypeDocument, TypeEmojiGroup, TypeEncryptedFile, TypeExportedChatInvite, TypeForumTopic, TypeHighScore, TypeInlineBotSwitchPM, TypeInlineBotWebView, TypeInlineQueryPeerType, TypeMessage, TypeMessageMedia, TypeMessagePeerReaction, TypeMessagePeerVote, TypeMessageViews, TypeMessagesFilter, TypeMissingInvitee, TypePeerSettings, TypeQuickReply, TypeReaction, TypeSavedDialog, TypeSavedReactionTag, TypeSearchResultsCalendarPeriod, TypeSearchResultsPosition, TypeSponsoredMessage, TypeStickerKeyword, TypeStickerPack, TypeStickerSet, TypeStickerSetCovered, TypeTextWithEntities, TypeUpdates, TypeUser, TypeWebPage
+    from ...tl.types.updates import TypeState
+
+
@@ -0,0 +1,12 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from ....shared.tl.types.upload import CdnFile, CdnFileReuploadNeeded, File, FileCdnRedirect, WebFile
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types.storage import TypeFileType
+    from ...tl.types import TypeFileHash
+
+
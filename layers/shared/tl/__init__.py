@@ -0,0 +1 @@
+from .tlobject import TLObject, TLRequest
@@ -35,6 +35,8 @@ class TLObject:
     CONSTRUCTOR_ID = None
     SUBCLASS_OF_ID = None
 
+    __slots__ = ()
+
     @staticmethod
     def pretty_format(obj, indent=None):
         """
@@ -137,6 +139,22 @@ class TLObject:
         r.append(bytes(padding))
         return b''.join(r)
 
+    @staticmethod
+    def skip_bytes(reader):
+        """Skip bytes written by using Telegram guidelines"""
+        first_byte = reader.read_byte()
+        if first_byte == 254:
+            length = int.from_bytes(reader.read(3), 'little')
+            padding = length % 4
+        else:
+            length = first_byte
+            padding = (length + 1) % 4
+
+        if padding > 0:
+            length += 4 - padding
+
+        reader.seek(length)
+
     @staticmethod
     def serialize_datetime(dt):
         if not dt and not isinstance(dt, timedelta):
@@ -209,11 +227,17 @@ class TLObject:
     def from_reader(cls, reader):
         raise NotImplementedError
 
+    @classmethod
+    def skip_reader(cls, reader):
+        raise NotImplementedError
+
 
 class TLRequest(TLObject):
     """
     Represents a content-related `TLObject` (a request that can be sent).
     """
+    __slots__ = ()
+
     @staticmethod
     def read_result(reader):
         return reader.tgread_object()
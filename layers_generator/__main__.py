@@ -7,7 +7,7 @@ import typing
 from pathlib import Path
 
 from .parsers import find_layer, parse_errors, parse_methods, parse_tl  # type: ignore
-from .generators import generate_tlobjects  # type: ignore
+from .generators import generate_tlobjects, clean_tlobjects  # type: ignore
 
 
 sys.path.insert(0, os.path.dirname(__file__))
@@ -33,10 +33,12 @@ class TempWorkDir:
 
 GENERATOR_DIR = Path(__file__).parent
 GENERATED_LAYERS_DIR = Path(__file__).parent.parent / 'layers'
+GENERATED_SHARED_DIR = GENERATED_LAYERS_DIR / 'shared'
 
 BASE_TLOBJECT_IN_TLS = [GENERATOR_DIR / "data" / "mtproto.tl"]
 GENERATOR_LAYERS_DIRPATH = GENERATOR_DIR / "data" / "layers"
 GENERATOR_TO_COPY_DIRPATH = GENERATOR_DIR / "to_copy"
+GENERATOR_TO_COPY_SHARED_DIRPATH = GENERATOR_DIR / "to_copy_shared"
 
 IMPORT_DEPTH = 2
 
@@ -45,6 +47,9 @@ def main() -> None:
     if not GENERATED_LAYERS_DIR.exists():
         GENERATED_LAYERS_DIR.mkdir()
 
+    layers_tlobjects = {}
+    layers_output_dirs = {}
+
     for layer_dirpath in GENERATOR_LAYERS_DIRPATH.iterdir():
         generated_layer_dir = GENERATED_LAYERS_DIR / layer_dirpath.name
         layer_tlobject_dir = generated_layer_dir / "tl"
@@ -65,14 +70,14 @@ def main() -> None:
         errors = list(parse_errors(layer_errors_in))
         methods = list(parse_methods(layer_methods_in, layer_friendly_in, {e.str_code: e for e in errors}))
 
-        tlobjects = list(itertools.chain(*(parse_tl(file, layer, methods) for file in [  # type: ignore
+        print(f"Parsing TLObjects for layer {layer}...")
+
+        layers_tlobjects[layer] = list(itertools.chain(*(parse_tl(file, layer, methods) for file in [  # type: ignore
             layer_dirpath / "api.tl",
             *BASE_TLOBJECT_IN_TLS
         ])))  # type: ignore
 
-        print(f"Generating TLObjects for layer {layer}...")
-
-        generate_tlobjects(tlobjects, layer, IMPORT_DEPTH, layer_tlobject_dir)
+        layers_output_dirs[layer] = layer_tlobject_dir
 
         shutil.copytree(
             GENERATOR_TO_COPY_DIRPATH,
@@ -85,6 +90,21 @@ def main() -> None:
         # with ERRORS_OUT.open('w') as file:
         #     generate_errors(errors, file)
 
+    shared_tlobject_dir = GENERATED_SHARED_DIR / "tl"
+
+    # Classes removed from the shared modules must not stay there
+    clean_tlobjects(shared_tlobject_dir)
+
+    shutil.copytree(
+        GENERATOR_TO_COPY_SHARED_DIRPATH,
+        GENERATED_SHARED_DIR,
+        dirs_exist_ok = True
+    )
+
+    print(f"Generating TLObjects for layers {', '.join(map(str, sorted(layers_tlobjects)))}...")
+
+    generate_tlobjects(layers_tlobjects, IMPORT_DEPTH, layers_output_dirs, shared_tlobject_dir)
+
     (GENERATED_LAYERS_DIR / "__init__.py").touch()
 
 
@@ -1,4 +1,6 @@
 import functools
+import io
+import json
 import os
 import re
 import shutil
@@ -47,23 +49,42 @@ NAMED_BLACKLIST = {
     'messages.discardEncryption'
 }
 
+# Maps class names to constructor IDs, so the names of the needed objects
+# can be resolved without importing and scanning the whole layer
+CONSTRUCTOR_IDS_FILENAME = 'constructor_ids.json'
+
 BASE_TYPES = ('string', 'bytes', 'int', 'long', 'int128',
               'int256', 'double', 'Bool', 'true', 'date')
 
+# Serialized widths of the fixed-size types, used by skip readers
+SKIP_WIDTHS = {
+    'int': 4,
+    'long': 8,
+    'int128': 16,
+    'int256': 32,
+    'double': 8,
+    'Bool': 4,
+    'date': 4
+}
+
 
 def _write_modules(
-        out_dir, depth, kind, namespace_tlobjects, type_constructors):
+        out_dir, depth, kind, namespace_tlobjects, type_constructors,
+        shared_names=frozenset(), shared=False):
     # namespace_tlobjects: {'namespace', [TLObject]}
+    # shared_names: {(namespace, class_name)} to import from the shared
+    # modules instead of writing them again
+    # shared: whether these are the shared modules themselves, which
+    # don't have all of the constructors to write the type definitions
     out_dir.mkdir(parents=True, exist_ok=True)
     for ns, tlobjects in namespace_tlobjects.items():
         file = out_dir / '{}.py'.format(ns or '__init__')
         with file.open('w') as f, SourceBuilder(f) as builder:
             builder.writeln(AUTO_GEN_NOTICE)
 
-            builder.writeln('from {}.tl.tlobject import TLObject', '.' * depth)
+            builder.writeln('from {}.tl import TLObject', '.' * depth)
             if kind != 'TLObject':
-                builder.writeln(
-                    'from {}.tl.tlobject import {}', '.' * depth, kind)
+                builder.writeln('from {}.tl import {}', '.' * depth, kind)
 
             builder.writeln('from typing import Optional, List, '
                             'Union, TYPE_CHECKING')
@@ -83,6 +104,17 @@ def _write_modules(
             # Import struct for the .__bytes__(self) serialization
             builder.writeln('import struct')
 
+            # Constructors identical to those of other layers
+            imported_names = sorted(
+                t.class_name for t in tlobjects
+                if (t.namespace, t.class_name) in shared_names
+            )
+            if imported_names:
+                builder.writeln('from {}shared.tl.{}{} import {}',
+                                '.' * (depth + 2), out_dir.name,
+                                '.' + ns if ns else '',
+                                ', '.join(imported_names))
+
             # Import datetime for type hinting
             builder.writeln('from datetime import datetime')
 
@@ -150,9 +182,15 @@ def _write_modules(
 
             # Generate the class for every TLObject
             for t in tlobjects:
+                if (t.namespace, t.class_name) in shared_names:
+                    continue
+
                 _write_source_code(t, kind, builder, type_constructors)
                 builder.current_indent = 0
 
+            if shared:
+                continue
+
             # Write the type definitions generated earlier.
             builder.writeln()
             for line in type_defs:
@@ -173,6 +211,7 @@ def _write_source_code(tlobject, kind, builder, type_constructors):
     _write_to_dict(tlobject, builder)
     _write_to_bytes(tlobject, builder)
     _write_from_reader(tlobject, builder)
+    _write_skip_reader(tlobject, builder)
     _write_read_result(tlobject, builder)
 
 
@@ -187,6 +226,11 @@ def _write_class_init(tlobject, kind, type_constructors, builder):
                     crc32(tlobject.result.encode('ascii')))
     builder.writeln()
 
+    # Instances only hold their arguments, so there's no need for __dict__
+    builder.writeln('__slots__ = {}',
+                    repr(tuple(a.name for a in tlobject.real_args)))
+    builder.writeln()
+
     # Convert the args to string parameters, those with flag having =None
     args = ['{}: {}{}'.format(
         a.name, a.type_hint(), '=None' if a.flag or a.can_be_inferred else '')
@@ -201,23 +245,9 @@ def _write_class_init(tlobject, kind, type_constructors, builder):
         builder.writeln('# noinspection PyShadowingBuiltins')
 
     builder.writeln("def __init__({}):", ', '.join(['self'] + args))
-    builder.writeln('"""')
-    if tlobject.is_function:
-        builder.write(':returns {}: ', tlobject.result)
-    else:
-        builder.write('Constructor for {}: ', tlobject.result)
-
-    constructors = type_constructors[tlobject.result]
-    if not constructors:
-        builder.writeln('This type has no constructors.')
-    elif len(constructors) == 1:
-        builder.writeln('Instance of {}.',
-                        constructors[0].class_name)
-    else:
-        builder.writeln('Instance of either {}.', ', '.join(
-            c.class_name for c in constructors))
-
-    builder.writeln('"""')
+    # Without the constructors only the code is written, to compare it
+    if type_constructors is not None:
+        _write_class_init_docstring(tlobject, type_constructors, builder)
 
     # Set the arguments
     for arg in tlobject.real_args:
@@ -251,6 +281,26 @@ def _write_class_init(tlobject, kind, type_constructors, builder):
     builder.end_block()
 
 
+def _write_class_init_docstring(tlobject, type_constructors, builder):
+    builder.writeln('"""')
+    if tlobject.is_function:
+        builder.write(':returns {}: ', tlobject.result)
+    else:
+        builder.write('Constructor for {}: ', tlobject.result)
+
+    constructors = type_constructors[tlobject.result]
+    if not constructors:
+        builder.writeln('This type has no constructors.')
+    elif len(constructors) == 1:
+        builder.writeln('Instance of {}.',
+                        constructors[0].class_name)
+    else:
+        builder.writeln('Instance of either {}.', ', '.join(
+            c.class_name for c in constructors))
+
+    builder.writeln('"""')
+
+
 def _write_resolve(tlobject, builder):
     if tlobject.is_function and any(
             (arg.type in AUTO_CASTS
@@ -368,6 +418,40 @@ def _write_from_reader(tlobject, builder):
         '{0}=_{0}'.format(a.name) for a in tlobject.real_args))
 
 
+def _write_skip_reader(tlobject, builder):
+    """
+    Writes ``skip_reader``, which advances the reader past the object
+    without building it. Consecutive fixed-width arguments outside of
+    flags are skipped with a single seek.
+    """
+    builder.end_block()
+    builder.writeln('@classmethod')
+    builder.writeln('def skip_reader(cls, reader):')
+
+    written = False
+    pending_width = 0
+    for arg in tlobject.args:
+        if arg.generic_definition or 'true' == arg.type:
+            continue  # Nothing is serialized for these
+
+        if not arg.flag and not arg.is_vector and arg.type in SKIP_WIDTHS:
+            pending_width += SKIP_WIDTHS[arg.type]
+            continue
+
+        if pending_width:
+            builder.writeln('reader.seek({})', pending_width)
+            pending_width = 0
+
+        _write_arg_skip_code(builder, arg)
+        written = True
+
+    if pending_width:
+        builder.writeln('reader.seek({})', pending_width)
+
+    elif not written:
+        builder.writeln('pass')
+
+
 def _write_read_result(tlobject, builder):
     # Only requests can have a different response that's not their
     # serialized body, that is, we'll be setting their .result.
@@ -651,6 +735,60 @@ def _write_arg_read_code(builder, arg, tlobject, name):
         arg.flag = old_flag
 
 
+def _write_arg_skip_code(builder, arg):
+    """
+    Writes the code advancing the reader past the given argument,
+    mirroring `_write_arg_read_code` without building any value.
+    """
+    if arg.flag:
+        builder.writeln('if {} & {}:', arg.flag, 1 << arg.flag_index)
+
+    if arg.flag_indicator:
+        # Flags are still needed to know which arguments follow
+        builder.writeln('{} = reader.read_int()', arg.name)
+
+    elif arg.is_vector:
+        if arg.use_vector_id:
+            builder.writeln('reader.seek(4)')
+
+        if arg.type in SKIP_WIDTHS:
+            builder.writeln('reader.seek(reader.read_int() * {})',
+                            SKIP_WIDTHS[arg.type])
+        else:
+            builder.writeln('for _ in range(reader.read_int()):')
+            _write_value_skip_code(builder, arg)
+            builder.current_indent -= 1
+
+    else:
+        _write_value_skip_code(builder, arg)
+
+    if arg.flag:
+        builder.current_indent -= 1
+
+
+def _write_value_skip_code(builder, arg):
+    if arg.type in SKIP_WIDTHS:
+        builder.writeln('reader.seek({})', SKIP_WIDTHS[arg.type])
+
+    elif arg.type in ('string', 'bytes'):
+        builder.writeln('TLObject.skip_bytes(reader)')
+
+    elif not arg.skip_constructor_id:
+        builder.writeln('reader.tgskip_object()')
+
+    else:
+        # Bare type, same inline import as in `_write_arg_read_code`
+        sep_index = arg.type.find('.')
+        if sep_index == -1:
+            ns, t = '.', arg.type
+        else:
+            ns, t = '.' + arg.type[:sep_index], arg.type[sep_index+1:]
+        class_name = snake_to_camel_case(t)
+
+        builder.writeln('from {} import {}', ns, class_name)
+        builder.writeln('{}.skip_reader(reader)', class_name)
+
+
 def _write_all_tlobjects(tlobjects, layer, builder):
     builder.writeln(AUTO_GEN_NOTICE)
     builder.writeln()
@@ -679,9 +817,85 @@ def _write_all_tlobjects(tlobjects, layer, builder):
 
     builder.current_indent -= 1
     builder.writeln('}')
+    builder.writeln()
+
+    # And the one containing constructor_id: class.skip_reader
+    builder.writeln('skip_readers = {')
+    builder.current_indent += 1
+
+    for tlobject in tlobjects:
+        builder.writeln('{:#010x}: tlobjects[{:#010x}].skip_reader,',
+                        tlobject.id, tlobject.id)
+
+    builder.current_indent -= 1
+    builder.writeln('}')
+
+
+def _write_constructor_ids(tlobjects, file):
+    # First class with a given name wins, same as a lookup by name
+    # over the ``tlobjects`` dictionary of alltlobjects.py would
+    constructor_ids = {}
+    for tlobject in tlobjects:
+        constructor_ids.setdefault(tlobject.class_name, tlobject.id)
+
+    json.dump(constructor_ids, file, separators=(',', ':'))
 
 
-def generate_tlobjects(tlobjects, layer, import_depth, output_dir):
+def _get_code(tlobject):
+    """
+    Returns the code of the class without its docstring, which lists
+    the constructors of its type and so may differ between layers.
+    """
+    kind = 'TLRequest' if tlobject.is_function else 'TLObject'
+    with SourceBuilder(io.StringIO()) as builder:
+        _write_source_code(tlobject, kind, builder, None)
+        return str(builder)
+
+
+def _find_shared_tlobjects(layers_tlobjects):
+    """
+    Finds the constructors with the same code in at least two layers.
+
+    Returns ``{layer: {(is_function, namespace, class_name)}}`` with the
+    constructors each layer should import, and the newest version of every
+    shared constructor to write into the shared modules.
+
+    Only one version of a class can be shared, the one used by the most
+    layers (and then by the newest ones), the rest keep their own copies.
+    """
+    # {(is_function, namespace, class_name): {code: [(layer, TLObject)]}}
+    versions = defaultdict(lambda: defaultdict(list))
+    for layer, tlobjects in sorted(layers_tlobjects.items()):
+        for tlobject in tlobjects:
+            # Bare arguments are read by importing their class from
+            # the same module, which may be a different one per layer
+            if any(a.skip_constructor_id and a.type not in BASE_TYPES
+                   for a in tlobject.args):
+                continue
+
+            key = (tlobject.is_function, tlobject.namespace,
+                   tlobject.class_name)
+            versions[key][_get_code(tlobject)].append((layer, tlobject))
+
+    layers_shared_keys = defaultdict(set)
+    shared_tlobjects = []
+    for key, code_versions in versions.items():
+        layer_tlobjects = max(
+            code_versions.values(),
+            key=lambda x: (len(x), x[-1][0])
+        )
+        if len(layer_tlobjects) < 2:
+            continue
+
+        for layer, _ in layer_tlobjects:
+            layers_shared_keys[layer].add(key)
+
+        shared_tlobjects.append(layer_tlobjects[-1][1])
+
+    return layers_shared_keys, shared_tlobjects
+
+
+def _group_tlobjects(tlobjects):
     # Group everything by {namespace: [tlobjects]} to generate __init__.py
     namespace_functions = defaultdict(list)
     namespace_types = defaultdict(list)
@@ -695,15 +909,59 @@ def generate_tlobjects(tlobjects, layer, import_depth, output_dir):
             namespace_types[tlobject.namespace].append(tlobject)
             type_constructors[tlobject.result].append(tlobject)
 
-    _write_modules(output_dir / 'functions', import_depth, 'TLRequest',
-                   namespace_functions, type_constructors)
-    _write_modules(output_dir / 'types', import_depth, 'TLObject',
-                   namespace_types, type_constructors)
+    return namespace_functions, namespace_types, type_constructors
 
-    filename = output_dir / 'alltlobjects.py'
-    with filename.open('w') as file:
-        with SourceBuilder(file) as builder:
-            _write_all_tlobjects(tlobjects, layer, builder)
+
+def generate_tlobjects(layers_tlobjects, import_depth, layers_output_dirs,
+                       shared_output_dir):
+    """
+    Generates the TLObjects of every layer. Constructors with the same
+    code in several layers are written once into ``shared_output_dir``
+    and imported by the modules of those layers.
+    """
+    layers_shared_keys, shared_tlobjects = \
+        _find_shared_tlobjects(layers_tlobjects)
+
+    # Documentation of the shared classes comes from the newest layer
+    # having their type
+    shared_type_constructors = defaultdict(list)
+    for layer, tlobjects in sorted(layers_tlobjects.items()):
+        shared_type_constructors.update(_group_tlobjects(tlobjects)[2])
+
+    namespace_functions, namespace_types, _ = \
+        _group_tlobjects(shared_tlobjects)
+
+    _write_modules(shared_output_dir / 'functions', import_depth,
+                   'TLRequest', namespace_functions,
+                   shared_type_constructors, shared=True)
+    _write_modules(shared_output_dir / 'types', import_depth, 'TLObject',
+                   namespace_types, shared_type_constructors, shared=True)
+
+    for layer, tlobjects in layers_tlobjects.items():
+        output_dir = layers_output_dirs[layer]
+        shared_keys = layers_shared_keys[layer]
+
+        namespace_functions, namespace_types, type_constructors = \
+            _group_tlobjects(tlobjects)
+
+        _write_modules(output_dir / 'functions', import_depth, 'TLRequest',
+                       namespace_functions, type_constructors,
+                       {(ns, name) for is_function, ns, name in shared_keys
+                        if is_function})
+        _write_modules(output_dir / 'types', import_depth, 'TLObject',
+                       namespace_types, type_constructors,
+                       {(ns, name) for is_function, ns, name in shared_keys
+                        if not is_function})
+
+        filename = output_dir / 'alltlobjects.py'
+        with filename.open('w') as file:
+            with SourceBuilder(file) as builder:
+                _write_all_tlobjects(tlobjects, layer, builder)
+
+        # Sorted by name while writing alltlobjects.py
+        filename = output_dir / CONSTRUCTOR_IDS_FILENAME
+        with filename.open('w') as file:
+            _write_constructor_ids(tlobjects, file)
 
 
 def clean_tlobjects(output_dir):
@@ -712,6 +970,7 @@ def clean_tlobjects(output_dir):
         if d.is_dir():
             shutil.rmtree(str(d))
 
-    tl = output_dir / 'alltlobjects.py'
-    if tl.is_file():
-        tl.unlink()
+    for name in ('alltlobjects.py', CONSTRUCTOR_IDS_FILENAME):
+        tl = output_dir / name
+        if tl.is_file():
+            tl.unlink()
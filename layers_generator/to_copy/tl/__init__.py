@@ -1 +1 @@
-from .tlobject import TLObject, TLRequest
+from ...shared.tl import TLObject, TLRequest
@@ -7,6 +7,8 @@ from .. import TLObject
 class GzipPacked(TLObject):
     CONSTRUCTOR_ID = 0x3072cfa1
 
+    __slots__ = ('data',)
+
     def __init__(self, data):
         self.data = data
 
@@ -1,5 +1,5 @@
 from .tlmessage import TLMessage
-from ..tlobject import TLObject
+from .. import TLObject
 
 
 class MessageContainer(TLObject):
@@ -20,6 +20,8 @@ class MessageContainer(TLObject):
     # other factors like size per request, but we cannot know this.
     MAXIMUM_LENGTH = 100
 
+    __slots__ = ('messages',)
+
     def __init__(self, messages):
         self.messages = messages
 
@@ -6,6 +6,8 @@ from ..types import RpcError
 class RpcResult(TLObject):
     CONSTRUCTOR_ID = 0xf35c6d01
 
+    __slots__ = ('req_msg_id', 'body', 'error')
+
     def __init__(self, req_msg_id, body, error):
         self.req_msg_id = req_msg_id
         self.body = body
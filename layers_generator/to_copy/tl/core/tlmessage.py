@@ -20,6 +20,8 @@ class TLMessage(TLObject):
     """
     SIZE_OVERHEAD = 12
 
+    __slots__ = ('msg_id', 'seq_no', 'obj')
+
     def __init__(self, msg_id, seq_no, obj):
         self.msg_id = msg_id
         self.seq_no = seq_no
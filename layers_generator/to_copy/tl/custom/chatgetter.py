@@ -10,6 +10,9 @@ class ChatGetter(abc.ABC):
     and `chat_id` properties and `get_chat` and `get_input_chat`
     methods.
     """
+    # Storage is left to subclasses, see `Message.STATE_ATTRIBUTES`
+    __slots__ = ()
+
     def __init__(self, chat_peer=None, *, input_chat=None, chat=None, broadcast=None):
         self._chat_peer = chat_peer
         self._input_chat = input_chat
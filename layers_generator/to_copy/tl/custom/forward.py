@@ -27,7 +27,8 @@ class Forward(ChatGetter, SenderGetter):
         # Copy all the fields, not reference! It would cause memory cycles:
         #   self.original_fwd.original_fwd.original_fwd.original_fwd
         # ...would be valid if we referenced.
-        self.__dict__.update(original.__dict__)
+        for name in original.__slots__:
+            setattr(self, name, getattr(original, name))
         self.original_fwd = original
 
         sender_id = sender = input_sender = peer = chat = input_chat = None
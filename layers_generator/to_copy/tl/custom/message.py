@@ -170,6 +170,20 @@ class Message(ChatGetter, SenderGetter, TLObject):
         saved_peer_id (:tl:`Peer`)
     """
 
+    # Storage is given by the patched classes combining this one with the
+    # generated ones, since only one base may have non-empty slots
+    __slots__ = ()
+
+    # Attributes used as convenient storage for custom functions,
+    # including the ones of `ChatGetter` and `SenderGetter`
+    STATE_ATTRIBUTES = (
+        '_client', '_text', '_file', '_reply_message', '_buttons',
+        '_buttons_flat', '_buttons_count', '_via_bot', '_via_input_bot',
+        '_action_entities', '_linked_chat', '_forward', '_reply_to_chat',
+        '_reply_to_sender', '_chat_peer', '_input_chat', '_chat',
+        '_broadcast', '_sender_id', '_sender', '_input_sender'
+    )
+
     # region Initialization
 
     def __init__(
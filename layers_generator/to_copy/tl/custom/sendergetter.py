@@ -9,6 +9,9 @@ class SenderGetter(abc.ABC):
     and `sender_id` properties and `get_sender` and `get_input_sender`
     methods.
     """
+    # Storage is left to subclasses, see `Message.STATE_ATTRIBUTES`
+    __slots__ = ()
+
     def __init__(self, sender_id=None, *, sender=None, input_sender=None):
         self._sender_id = sender_id
         self._sender = sender
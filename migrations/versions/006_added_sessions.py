@@ -0,0 +1,63 @@
+"""Added sessions
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 15:11:52.870416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sessions',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('auth_key_hash', sa.LargeBinary(), nullable=False),
+    sa.Column('auth_key', sa.LargeBinary(), nullable=False),
+    sa.Column('session_id', sa.LargeBinary(), nullable=False),
+    sa.Column('inserted_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('auth_key_hash', 'session_id', name='uq_auth_key_hash_session_id')
+    )
+    op.add_column('messages', sa.Column('used_session_row_id', sa.Integer(), nullable=True))
+
+    op.execute(
+        "INSERT INTO sessions (auth_key_hash, auth_key, session_id) "
+        "SELECT DISTINCT sha256(used_auth_key), used_auth_key, used_session_id FROM messages"
+    )
+    op.execute(
+        "UPDATE messages SET used_session_row_id = sessions.id FROM sessions "
+        "WHERE sessions.auth_key_hash = sha256(messages.used_auth_key) AND sessions.session_id = messages.used_session_id"
+    )
+
+    op.alter_column('messages', 'used_session_row_id', nullable=False)
+    op.create_foreign_key(None, 'messages', 'sessions', ['used_session_row_id'], ['id'])
+    op.drop_column('messages', 'used_session_id')
+    op.drop_column('messages', 'used_auth_key')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('messages', sa.Column('used_auth_key', sa.LargeBinary(), nullable=True))
+    op.add_column('messages', sa.Column('used_session_id', sa.LargeBinary(), nullable=True))
+
+    op.execute(
+        "UPDATE messages SET used_auth_key = sessions.auth_key, used_session_id = sessions.session_id FROM sessions "
+        "WHERE sessions.id = messages.used_session_row_id"
+    )
+
+    op.alter_column('messages', 'used_auth_key', nullable=False)
+    op.alter_column('messages', 'used_session_id', nullable=False)
+    op.drop_constraint('messages_used_session_row_id_fkey', 'messages', type_='foreignkey')
+    op.drop_column('messages', 'used_session_row_id')
+    op.drop_table('sessions')
@@ -0,0 +1,60 @@
+"""Added packets
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 16:20:38.245761
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('packets',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('packet_hash', sa.LargeBinary(), nullable=False),
+    sa.Column('packet', sa.LargeBinary(), nullable=False),
+    sa.Column('inserted_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_packets_packet_hash'), 'packets', ['packet_hash'], unique=True)
+    op.add_column('messages', sa.Column('packet_row_id', sa.Integer(), nullable=True))
+
+    op.execute(
+        "INSERT INTO packets (packet_hash, packet) "
+        "SELECT DISTINCT ON (sha256(packet)) sha256(packet), packet FROM messages"
+    )
+    op.execute(
+        "UPDATE messages SET packet_row_id = packets.id FROM packets "
+        "WHERE packets.packet_hash = sha256(messages.packet)"
+    )
+
+    op.alter_column('messages', 'packet_row_id', nullable=False)
+    op.create_foreign_key(None, 'messages', 'packets', ['packet_row_id'], ['id'])
+    op.drop_column('messages', 'packet')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('messages', sa.Column('packet', sa.LargeBinary(), nullable=True))
+
+    op.execute(
+        "UPDATE messages SET packet = packets.packet FROM packets "
+        "WHERE packets.id = messages.packet_row_id"
+    )
+
+    op.alter_column('messages', 'packet', nullable=False)
+    op.drop_constraint('messages_packet_row_id_fkey', 'messages', type_='foreignkey')
+    op.drop_column('messages', 'packet_row_id')
+    op.drop_index(op.f('ix_packets_packet_hash'), table_name='packets')
+    op.drop_table('packets')
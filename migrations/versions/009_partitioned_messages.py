@@ -0,0 +1,118 @@
+"""Partitioned messages
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18 19:05:44.712358
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Timestamps were written through the session time zone, the app pins it to UTC from now on,
+# the migration session has the server default one the existing rows were written with
+TO_UTC = "{} AT TIME ZONE current_setting('TimeZone') AT TIME ZONE 'UTC'"
+FROM_UTC = "{} AT TIME ZONE 'UTC' AT TIME ZONE current_setting('TimeZone')"
+
+COLUMNS = [
+    'id',
+    'tg_chat_id',
+    'tg_user_id',
+    'tg_message_id',
+    'reply_to_tg_message_id',
+    'md_text',
+    'text',
+    'entities',
+    'used_session_row_id',
+    'packet_row_id',
+]
+TIMESTAMP_COLUMNS = ['sent_at', 'inserted_at']
+
+
+def _copy_messages(source_table: str, timestamp_expression: str) -> None:
+    op.execute(
+        f"INSERT INTO messages ({', '.join(COLUMNS + TIMESTAMP_COLUMNS)}) "
+        f"SELECT {', '.join(COLUMNS + [timestamp_expression.format(column) for column in TIMESTAMP_COLUMNS])} "
+        f"FROM {source_table}"
+    )
+
+
+def _create_constraints_and_indexes(unique_columns: list[str], primary_key_columns: list[str]) -> None:
+    op.create_primary_key('messages_pkey', 'messages', primary_key_columns)
+    op.create_unique_constraint('uq_tg_chat_id_tg_message_id', 'messages', unique_columns)
+    op.create_foreign_key(None, 'messages', 'chats', ['tg_chat_id'], ['tg_chat_id'])
+    op.create_foreign_key(None, 'messages', 'users', ['tg_user_id'], ['tg_user_id'])
+    op.create_foreign_key(None, 'messages', 'sessions', ['used_session_row_id'], ['id'])
+    op.create_foreign_key(None, 'messages', 'packets', ['packet_row_id'], ['id'])
+    op.create_index(op.f('ix_messages_tg_message_id'), 'messages', ['tg_message_id'], unique=False)
+    op.create_index(op.f('ix_messages_reply_to_tg_message_id'), 'messages', ['reply_to_tg_message_id'], unique=False)
+    op.create_index('ix_messages_sent_at_id', 'messages', ['sent_at', 'id'], unique=False)
+    op.create_index('ix_messages_tg_chat_id_sent_at_id', 'messages', ['tg_chat_id', 'sent_at', 'id'], unique=False)
+    op.create_index('ix_messages_tg_user_id_sent_at_id', 'messages', ['tg_user_id', 'sent_at', 'id'], unique=False)
+    op.create_index('ix_messages_md_text_pending', 'messages', ['id'], unique=False, postgresql_where=sa.text('md_text IS NULL AND text IS NOT NULL'))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A table can not be turned into a partitioned one, the rows are copied
+    op.rename_table('messages', 'messages_unpartitioned')
+    op.execute("CREATE TABLE messages (LIKE messages_unpartitioned INCLUDING DEFAULTS) PARTITION BY RANGE (sent_at)")
+    op.execute("ALTER SEQUENCE messages_id_seq OWNED BY messages.id")
+
+    # Every month from the first message up to the current one, in UTC.
+    # Months ahead are created by `MessagesPartitioner` of the app as configured
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', coalesce(min({TO_UTC.format('sent_at')}), now() AT TIME ZONE 'UTC')),
+                    date_trunc('month', greatest(max({TO_UTC.format('sent_at')}), now() AT TIME ZONE 'UTC')),
+                    interval '1 month'
+                )::date
+                FROM messages_unpartitioned
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF messages FOR VALUES FROM (%L) TO (%L)',
+                    'messages_' || to_char(month, 'YYYY_MM'),
+                    month,
+                    (month + interval '1 month')::date
+                );
+            END LOOP;
+        END
+        $$
+    """)
+
+    _copy_messages('messages_unpartitioned', TO_UTC)
+    op.drop_table('messages_unpartitioned')
+
+    _create_constraints_and_indexes(
+        unique_columns = ['tg_chat_id', 'tg_message_id', 'sent_at'],
+        primary_key_columns = ['id', 'sent_at']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.rename_table('messages', 'messages_partitioned')
+    op.execute("CREATE TABLE messages (LIKE messages_partitioned INCLUDING DEFAULTS)")
+    op.execute("ALTER SEQUENCE messages_id_seq OWNED BY messages.id")
+    _copy_messages('messages_partitioned', FROM_UTC)
+    # Drops the partitions too
+    op.drop_table('messages_partitioned')
+
+    _create_constraints_and_indexes(
+        unique_columns = ['tg_chat_id', 'tg_message_id'],
+        primary_key_columns = ['id']
+    )
@@ -0,0 +1,29 @@
+"""Dropped rendered md_text sources
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18 22:14:51.604283
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Sources of messages rendered before they were dropped on rendering
+    op.execute("UPDATE messages SET text = NULL, entities = NULL WHERE md_text IS NOT NULL AND text IS NOT NULL")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Dropped sources are not needed by the previous revision
+    pass
@@ -2,59 +2,33 @@ from fastapi import FastAPI, Request, HTTPException, status
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.ext.asyncio import create_async_engine as create_db_engine
-from telethon.tl.tlobject import TLObject
+from contextlib import asynccontextmanager
 
 import logging
 import typing
 
-from src import db, utils, exceptions, constants
+from src import db, enums, utils, exceptions, constants
 from src.global_variables import GlobalVariables
 from src.config import config
+from src.layers_registry import register_layers, get_layer
 
 
-def _find_tlobject_by_name(tlobjects: dict[int, TLObject], name: str) -> TLObject:
-    for tlobject in tlobjects.values():
-        if tlobject.__name__ == name:  # type: ignore
-            return tlobject
+register_layers()
 
-    raise ValueError(f"TLObject with name {name} not found in layer")
+for layer in config.preload_layers:
+    if layer not in GlobalVariables.layers_dirpaths:
+        raise RuntimeError(f"Preloaded layer {layer} not found in the {constants.LAYERS_DIRPATH.resolve().as_posix()} directory.")
 
-for layer_dirpath in constants.LAYERS_DIRPATH.iterdir():
-    if not layer_dirpath.name.isdigit():
-        continue
-
-    layer = int(layer_dirpath.name)
-
-    GlobalVariables.layers_tlobjects[layer] = __import__(f"layers.{layer_dirpath.name}.tl.alltlobjects", fromlist=['tlobjects']).tlobjects
-    GlobalVariables.layers_coreobjects[layer] = __import__(f"layers.{layer_dirpath.name}.tl.core", fromlist=['core_objects']).core_objects
-
-if not GlobalVariables.layers_tlobjects:
-    raise RuntimeError(f"No layers found. Please check the {constants.LAYERS_DIRPATH.resolve().as_posix()} directory.")
-
-NEEDED_LAYERS_TLOBJECTS: dict[int, dict[str, TLObject]] = {
-    layer: {
-        tlobject_name: _find_tlobject_by_name(
-            utils.merge_dicts(
-                tlobjects,
-                GlobalVariables.layers_coreobjects[layer]
-            ),
-            tlobject_name
-        )
-        for tlobject_name in constants.NEEDED_LAYERS_TLOBJECT_NAMES
-    }
-    for layer, tlobjects in GlobalVariables.layers_tlobjects.items()
-}
-
-GlobalVariables.needed_layers_tlobjects_constructor_ids = {
-    layer: {
-        tlobject_name: typing.cast(int, tlobject.CONSTRUCTOR_ID)
-        for tlobject_name, tlobject in tlobjects.items()
-    }
-    for layer, tlobjects in NEEDED_LAYERS_TLOBJECTS.items()
-}
+    get_layer(layer)
 
 
 from .api import api_router  # noqa
+from .ingest_queue import IngestQueue  # noqa
+from .md_text_backfill import MdTextBackfill  # noqa
+from .packet_store import LocalPacketStore  # noqa
+from .packet_archiver import PacketArchiver  # noqa
+from .messages_partitions import MessagesPartitioner  # noqa
+from .tg_packet_ingester import create_tg_packet_parser_executor  # noqa
 
 
 logging.getLogger("sqlalchemy.engine.Engine").disabled = True
@@ -72,7 +46,11 @@ GlobalVariables.logger = logger
 
 db_engine = create_db_engine(
     url = config.db_url,
-    echo = True
+    echo = True,
+    # Timestamps are stored in UTC without time zone, `now()` defaults too
+    connect_args = {
+        "options": "-c timezone=UTC"
+    }
 )
 
 db_sessionmaker = db.DBSessionMaker(
@@ -84,6 +62,89 @@ db_sessionmaker = db.DBSessionMaker(
 GlobalVariables.db_sessionmaker = db_sessionmaker
 
 
+GlobalVariables.known_tg_chat_ids = utils.LRUCache(config.known_tg_ids_cache_size)
+GlobalVariables.known_tg_user_ids = utils.LRUCache(config.known_tg_ids_cache_size)
+GlobalVariables.known_tg_sessions = utils.LRUCache(config.known_tg_sessions_cache_size)
+
+
+GlobalVariables.tg_packet_parser_executor = create_tg_packet_parser_executor(
+    kind = config.tg_packet_parser_executor,
+    workers = config.tg_packet_parser_workers
+)
+
+
+if config.ingest_queue_enabled:
+    GlobalVariables.ingest_queue = IngestQueue(
+        max_size = config.ingest_queue_max_size,
+        workers = config.ingest_queue_workers,
+        batch_size = config.ingest_queue_batch_size,
+        overflow_policy = config.ingest_queue_overflow_policy,
+        wait_timeout = config.ingest_queue_wait_timeout,
+        max_attempts = config.ingest_queue_max_attempts,
+        spill_dirpath = constants.INGEST_QUEUE_SPILL_DIRPATH
+    )
+
+
+if config.md_text_rendering == enums.MdTextRendering.BACKFILL:
+    GlobalVariables.md_text_backfill = MdTextBackfill(
+        batch_size = config.md_text_backfill_batch_size,
+        interval = config.md_text_backfill_interval
+    )
+
+
+GlobalVariables.messages_partitioner = MessagesPartitioner(
+    months_ahead = config.messages_partitions_ahead,
+    interval = config.messages_partitions_interval
+)
+
+
+GlobalVariables.packet_store = LocalPacketStore(
+    dirpath = constants.PACKET_SEGMENTS_DIRPATH,
+    segment_max_size = config.packet_segment_max_size,
+    zstd_level = config.packet_segment_zstd_level,
+    mmaps_cache_size = config.packet_segment_mmaps_cache_size
+)
+
+if config.packet_cold_storage_enabled:
+    GlobalVariables.packet_archiver = PacketArchiver(
+        after = config.packet_cold_storage_after,
+        batch_size = config.packet_cold_storage_batch_size,
+        interval = config.packet_cold_storage_interval
+    )
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> typing.AsyncIterator[None]:
+    GlobalVariables.messages_partitioner.start()
+
+    if GlobalVariables.ingest_queue:
+        GlobalVariables.ingest_queue.start()
+
+    if GlobalVariables.md_text_backfill:
+        GlobalVariables.md_text_backfill.start()
+
+    if GlobalVariables.packet_archiver:
+        GlobalVariables.packet_archiver.start()
+
+    yield
+
+    if GlobalVariables.packet_archiver:
+        await GlobalVariables.packet_archiver.stop()
+
+    if GlobalVariables.md_text_backfill:
+        await GlobalVariables.md_text_backfill.stop()
+
+    if GlobalVariables.ingest_queue:
+        await GlobalVariables.ingest_queue.stop()
+
+    await GlobalVariables.messages_partitioner.stop()
+
+    if GlobalVariables.tg_packet_parser_executor:
+        GlobalVariables.tg_packet_parser_executor.shutdown()
+
+    GlobalVariables.packet_store.close()
+
+
 web_app = FastAPI(
     title = "Telegram Archiver {}API".format(
         "Test "
@@ -98,7 +159,8 @@ web_app = FastAPI(
         else
         None
     ),
-    debug = config.debug
+    debug = config.debug,
+    lifespan = lifespan
 )
 
 
@@ -0,0 +1,43 @@
+from fastapi import Request
+from datetime import datetime
+
+import base64
+
+from src import utils, exceptions
+
+
+def get_naive_datetime_utc(timestamp: int) -> datetime:
+    return utils.get_naive_datetime_utc(utils.get_datetime_utc_from_timestamp(timestamp))
+
+
+def encode_messages_cursor(sent_at: datetime, message_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{sent_at.isoformat()},{message_id}".encode()).decode().rstrip("=")
+
+
+def decode_messages_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        sent_at, message_id = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().split(",")
+
+        return datetime.fromisoformat(sent_at), int(message_id)
+
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+async def read_limited_body(request: Request, max_size: int) -> bytes:
+    """Rejects the body by its ``Content-Length`` before reading it and while streaming it."""
+
+    content_length = request.headers.get("content-length")
+
+    if content_length is not None and content_length.isdigit() and int(content_length) > max_size:
+        raise exceptions.RequestBodyTooLargeError
+
+    body = bytearray()
+
+    async for chunk in request.stream():
+        body += chunk
+
+        if len(body) > max_size:
+            raise exceptions.RequestBodyTooLargeError
+
+    return bytes(body)
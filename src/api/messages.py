@@ -1,17 +1,38 @@
 from fastapi import APIRouter, Query
 from fastapi.exceptions import RequestValidationError
+from sqlalchemy import orm
 
 import sqlalchemy as sa
 import typing
 
 from src import db, schemas, exceptions
-from src.api import _dependencies
+from src.api import _dependencies, _utils
+from src.md_text_backfill import load_md_text_sources, render_md_texts
+from src.packet_archiver import read_packets
 
 
 api_messages_router = APIRouter()
 
 
 PAGINATION_LIMIT = 100
+# 9999-12-31 23:59:59 UTC, the last one `datetime` can hold
+MAX_TIMESTAMP = 253402300799
+
+MESSAGE_COLUMNS = (
+    db.Message.id,
+    db.Message.tg_chat_id,
+    db.Message.tg_user_id,
+    db.Message.tg_message_id,
+    db.Message.reply_to_tg_message_id,
+    db.Message.md_text,
+    db.Message.sent_at,
+    db.Message.inserted_at,
+)
+
+RAW_MESSAGE_COLUMNS = (
+    db.Message.used_session_row_id,
+    db.Message.packet_row_id,
+)
 
 
 @api_messages_router.get(
@@ -20,6 +41,7 @@ PAGINATION_LIMIT = 100
     responses = exceptions.combine(
         # exceptions.ConcurrentRequestsError,
         # exceptions.InvalidParametersError,
+        exceptions.PacketUnavailableError,
     )
 )
 # @_dependencies.block_concurrent_requests()
@@ -48,16 +70,50 @@ async def api_get_messages_handler(
         default = None,
         description = "Telegram message ID to end with"
     ),
+    sent_after: int | None = Query(
+        default = None,
+        ge = 0,
+        le = MAX_TIMESTAMP,
+        description = "Only messages sent after the timestamp (UTC), exclusive",
+        examples = [1735689601]
+    ),
+    sent_before: int | None = Query(
+        default = None,
+        ge = 0,
+        le = MAX_TIMESTAMP,
+        description = "Only messages sent before the timestamp (UTC), exclusive",
+        examples = [1735689601]
+    ),
+    inserted_after: int | None = Query(
+        default = None,
+        ge = 0,
+        le = MAX_TIMESTAMP,
+        description = (
+            "Only messages inserted into the database after the timestamp (UTC), exclusive, for incremental sync. "
+            "`inserted_at` is the start of the inserting transaction, which becomes visible only on its commit, "
+            "so a batch may appear with `inserted_at` up to its write time in the past. "
+            "Sync from the latest seen `inserted_at` minus a margin of a few seconds and skip already seen messages"
+        ),
+        examples = [1735689601]
+    ),
+    cursor: str | None = Query(
+        default = None,
+        description = "`next_cursor` of the previous page"
+    ),
     offset: int = Query(
         default = 0,
         ge = 0,
-        description = "Offset for pagination"
+        description = "Offset for pagination, deep pages are slow, use `cursor` instead"
     ),
     limit: int = Query(
         default = PAGINATION_LIMIT,
         ge = 1,
         le = PAGINATION_LIMIT,
         description = "Limit for pagination"
+    ),
+    include_raw: bool = Query(
+        default = False,
+        description = "Include `used_auth_key`, `used_session_id` and `packet`"
     )
 ) -> schemas.ListMessages:
     db_query_filters: set[sa.ColumnElement[typing.Any]] = set()
@@ -98,19 +154,119 @@ async def api_get_messages_handler(
 
         db_query_filters.add(db.Message.tg_message_id.between(tg_message_ids_start, tg_message_ids_end))
 
-    db_messages = (await db_session.execute(
-        sa.select(db.Message)
+    if sent_after is not None and sent_before is not None and sent_after >= sent_before:
+        raise RequestValidationError(
+            errors = [
+                {
+                    "loc": ["query", "sent_after", "sent_before"],
+                    "msg": "sent_after must be less than sent_before",
+                    "type": "value_error"
+                }
+            ]
+        )
+
+    # Plain comparisons with naive UTC datetimes, like the stored ones, so partitions are pruned
+    if sent_after is not None:
+        db_query_filters.add(db.Message.sent_at > _utils.get_naive_datetime_utc(sent_after))
+    if sent_before is not None:
+        db_query_filters.add(db.Message.sent_at < _utils.get_naive_datetime_utc(sent_before))
+    if inserted_after is not None:
+        db_query_filters.add(db.Message.inserted_at > _utils.get_naive_datetime_utc(inserted_after))
+
+    if cursor is not None:
+        if offset:
+            raise RequestValidationError(
+                errors = [
+                    {
+                        "loc": ["query", "cursor", "offset"],
+                        "msg": "cursor and offset cannot be used together",
+                        "type": "value_error"
+                    }
+                ]
+            )
+
+        try:
+            cursor_sent_at, cursor_id = _utils.decode_messages_cursor(cursor)
+
+        except ValueError:
+            raise RequestValidationError(
+                errors = [
+                    {
+                        "loc": ["query", "cursor"],
+                        "msg": "Invalid cursor",
+                        "type": "value_error"
+                    }
+                ]
+            )
+
+        # Matches the order, served by the (sent_at, id) index
+        db_query_filters.add(sa.tuple_(db.Message.sent_at, db.Message.id) < sa.tuple_(cursor_sent_at, cursor_id))
+        # Redundant, but partitions are pruned by plain comparisons only
+        db_query_filters.add(db.Message.sent_at <= cursor_sent_at)
+
+    db_rows = list((await db_session.execute(
+        # Tells messages stored with deferred rendering from ones without text, like media only ones
+        sa.select(db.Message, db.Message.text.is_not(None))
+        .options(
+            orm.load_only(
+                *MESSAGE_COLUMNS,
+                *(
+                    RAW_MESSAGE_COLUMNS
+                    if include_raw
+                    else
+                    ()
+                )
+            ),
+            *(
+                [
+                    orm.joinedload(db.Message.used_session).load_only(db.Session.auth_key, db.Session.session_id),
+                    orm.joinedload(db.Message.packet).load_only(db.Packet.packet, db.Packet.segment, db.Packet.segment_offset, db.Packet.segment_length)
+                ]
+                if include_raw
+                else
+                []
+            )
+        )
         .where(*db_query_filters)
-        .order_by(db.Message.sent_at.desc())
+        .order_by(db.Message.sent_at.desc(), db.Message.id.desc())
         .offset(offset)
-        # .limit(limit + 1)
-        .limit(limit)
-    )).scalars().all()
+        .limit(limit + 1)
+    )).tuples().all())
+
+    has_next = len(db_rows) > limit
+
+    if has_next:
+        db_rows.pop()
+
+    db_messages = [
+        db_message
+        for db_message, _ in db_rows
+    ]
 
-    # has_next = len(db_messages) > limit
+    pending_db_messages = [
+        db_message
+        for db_message, has_text in db_rows
+        if has_text and db_message.md_text is None
+    ]
 
-    # if has_next:
-    #     db_messages.pop()
+    await load_md_text_sources(db_session, pending_db_messages)
+
+    # Messages stored with deferred rendering keep the result
+    if render_md_texts(pending_db_messages):
+        await db_session.commit()
+
+    packets = dict(zip(
+        (
+            db_message.id
+            for db_message in db_messages
+            if db_message.packet
+        ),
+        await read_packets([
+            db_message.packet
+            for db_message in db_messages
+            if db_message.packet
+        ])
+    ))
 
     return schemas.ListMessages(
         messages = [
@@ -122,12 +278,18 @@ async def api_get_messages_handler(
                 reply_to_tg_message_id = db_message.reply_to_tg_message_id,
                 md_text = db_message.md_text,
                 sent_at = db_message.sent_at,
-                used_auth_key = db_message.used_auth_key.hex(),
-                used_session_id = db_message.used_session_id.hex(),
-                packet = db_message.packet.hex(),
+                used_auth_key = db_message.used_session.auth_key.hex() if db_message.used_session else None,
+                used_session_id = db_message.used_session.session_id.hex() if db_message.used_session else None,
+                packet = packets[db_message.id].hex() if db_message.id in packets else None,
                 inserted_at = db_message.inserted_at
             )
             for db_message in db_messages
         ],
-        # has_next = has_next
+        has_next = has_next,
+        next_cursor = (
+            _utils.encode_messages_cursor(db_messages[-1].sent_at, db_messages[-1].id)
+            if has_next
+            else
+            None
+        )
     )
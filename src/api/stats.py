@@ -0,0 +1,62 @@
+from fastapi import APIRouter
+
+import typing
+
+from src import schemas, utils
+from src.global_variables import GlobalVariables
+from src.tg_packet_parser import auth_keys_data_cache
+
+
+api_stats_router = APIRouter()
+
+
+def _get_cache_stats(cache: utils.LRUCache[typing.Any, typing.Any]) -> schemas.CacheStats:
+    return schemas.CacheStats(
+        size = len(cache),
+        max_size = cache.max_size,
+        hits = cache.hits,
+        misses = cache.misses
+    )
+
+
+@api_stats_router.get(
+    path = "/stats",
+    summary = "Get ingestion stats"
+)
+async def api_stats_handler() -> schemas.StatsResponse:
+    ingest_queue = GlobalVariables.ingest_queue
+
+    return schemas.StatsResponse(
+        known_tg_chat_ids = _get_cache_stats(GlobalVariables.known_tg_chat_ids),
+        known_tg_user_ids = _get_cache_stats(GlobalVariables.known_tg_user_ids),
+        known_tg_sessions = _get_cache_stats(GlobalVariables.known_tg_sessions),
+        auth_keys_data = _get_cache_stats(auth_keys_data_cache),
+        ingest_queue = (
+            schemas.IngestQueueStats(
+                depth = ingest_queue.depth,
+                max_size = ingest_queue.max_size,
+                lag = ingest_queue.lag,
+                processed = ingest_queue.processed,
+                failed = ingest_queue.failed,
+                retried = ingest_queue.retried,
+                rejected = ingest_queue.rejected,
+                spilled = ingest_queue.spilled,
+                restored = ingest_queue.restored
+            )
+            if ingest_queue
+            else
+            None
+        ),
+        md_text_backfill_rendered = (
+            GlobalVariables.md_text_backfill.rendered
+            if GlobalVariables.md_text_backfill
+            else
+            None
+        ),
+        packet_archiver_moved = (
+            GlobalVariables.packet_archiver.moved
+            if GlobalVariables.packet_archiver
+            else
+            None
+        )
+    )
@@ -1,13 +1,13 @@
 from fastapi import APIRouter
 
-from src import schemas
+from src import enums, schemas
 from src.global_variables import GlobalVariables
 
 
 api_supported_layers_router = APIRouter()
 
 
-supported_layers = sorted(GlobalVariables.layers_tlobjects.keys(), reverse=True)
+supported_layers = sorted(GlobalVariables.layers_dirpaths.keys(), reverse=True)
 
 
 @api_supported_layers_router.get(
@@ -16,5 +16,6 @@ supported_layers = sorted(GlobalVariables.layers_tlobjects.keys(), reverse=True)
 )
 async def api_supported_layers_handler() -> schemas.SupportedLayersResponse:
     return schemas.SupportedLayersResponse(
-        supported_layers = supported_layers
+        supported_layers = supported_layers,
+        supported_upload_formats = list(enums.TgPacketUploadFormat)
     )
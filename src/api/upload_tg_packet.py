@@ -1,44 +1,40 @@
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from telethon.tl import types as tl_types
-from telethon.tl.tlobject import TLObject
-from telethon.tl.core import TLMessage
-from functools import partial
-
-import sqlalchemy as sa
-import typing
 
 from src import db, schemas, exceptions
-from src.api import _dependencies
+from src.api import _dependencies, _utils
+from src.config import config
 from src.global_variables import GlobalVariables
-from src.tg_packet_parser import parse_tg_packet, BinaryReader, tgread_object
-from src.markdown_utils import unparse_markdown
+from src.tg_packet_frames import TG_PACKET_FRAMES_MEDIA_TYPE, TgPacketFrame, unpack_tg_packet_frames
+from src.tg_packet_parser import get_auth_key_data
+from src.messages_partitions import get_messages_months
+from src.tg_packet_ingester import is_layer_supported, get_tg_packet_hash, get_stored_tg_packet_hashes, extract_tg_message_records_async, store_tg_session, store_tg_message_records, remember_tg_message_records, remember_tg_session, ingest_tg_packet_frames
 
 
 api_upload_tg_packet_router = APIRouter()
 
 
-def _is_tlobject_same_by_constructor_id(tlobject: TLObject, name: str, needed_layers_tlobject_constructor_ids: dict[str, int]) -> bool:
-    return tlobject and typing.cast(int, tlobject.CONSTRUCTOR_ID) == needed_layers_tlobject_constructor_ids[name]
-
-
-dummy_cte = sa.select(sa.literal(1).label("dummy")).cte("dummy")
-
-
 @api_upload_tg_packet_router.post(
     path = "/upload_tg_packet",
     summary = "Upload Telegram raw packet",
+    description = (
+        "When the ingest queue is enabled the packet is only checked against its auth key, "
+        "queued and answered with 202, it is written to the database by background workers."
+    ),
     responses = exceptions.combine(
         # exceptions.InvalidLayerError,
+        exceptions.IngestQueueFullError,
+        exceptions.DuplicateTgPacketError,
     )
 )
 async def api_upload_tg_packet_handler(
+    response: Response,
     db_session: db.DBSession = _dependencies.get_db_session,
     request_obj: schemas.UploadTgPacketRequest = Body()
 ) -> schemas.OKResponse:
     layer = request_obj.layer
 
-    if layer not in GlobalVariables.layers_tlobjects:
+    if not is_layer_supported(layer):
         raise RequestValidationError(
             errors = [
                 {
@@ -63,15 +59,40 @@ async def api_upload_tg_packet_handler(
             ]
         )
 
-    tl_message = parse_tg_packet(
-        packet = packet,
+    if GlobalVariables.ingest_queue:
+        if packet[:8] != get_auth_key_data(auth_key).auth_key_id:
+            raise RequestValidationError(
+                errors = [
+                    {
+                        "loc": ["body", "packet"],
+                        "msg": "Packet contains an invalid auth key",
+                        "type": "value_error"
+                    }
+                ]
+            )
+
+        await GlobalVariables.ingest_queue.put(TgPacketFrame(
+            layer = layer,
+            auth_key = auth_key,
+            session_id = session_id,
+            packet = packet
+        ))
+
+        response.status_code = status.HTTP_202_ACCEPTED
+
+        return schemas.OKResponse()
+
+    if await get_stored_tg_packet_hashes(db_session, [get_tg_packet_hash(packet)]):
+        raise exceptions.DuplicateTgPacketError
+
+    records = await extract_tg_message_records_async(
+        layer = layer,
         auth_key = auth_key,
         session_id = session_id,
-        tlobjects = GlobalVariables.layers_tlobjects[layer],
-        core_objects = GlobalVariables.layers_coreobjects[layer]
+        packet = packet
     )
 
-    if tl_message is None:
+    if records is None:
         raise RequestValidationError(
             errors = [
                 {
@@ -82,149 +103,140 @@ async def api_upload_tg_packet_handler(
             ]
         )
 
-    is_tlobject_same_by_constructor_id = partial(
-        _is_tlobject_same_by_constructor_id,
-        needed_layers_tlobject_constructor_ids = GlobalVariables.needed_layers_tlobjects_constructor_ids[layer]
-    )
+    await GlobalVariables.messages_partitioner.ensure_months(get_messages_months(
+        record.sent_at
+        for record in records
+    ))
 
-    tg_obj = tl_message.obj  # type: ignore
-    tg_objs: list[TLMessage]
-
-    if is_tlobject_same_by_constructor_id(tg_obj, "MessageContainer"):  # type: ignore
-        tg_objs = [  # type: ignore
-            tl_message.obj  # type: ignore
-            for tl_message in tg_obj.messages  # type: ignore
-        ]
-
-    else:
-        tg_objs = [tg_obj]  # type: ignore
-
-    for tg_obj in tg_objs:
-        if is_tlobject_same_by_constructor_id(tg_obj, "GzipPacked"):  # type: ignore
-            with BinaryReader(tg_obj.data) as reader:  # type: ignore
-                tlobjects = GlobalVariables.layers_tlobjects[layer]
-                core_objects = GlobalVariables.layers_coreobjects[layer]
+    session_row_id = await store_tg_session(
+        db_session = db_session,
+        auth_key = auth_key,
+        session_id = session_id
+    )
 
-                reader.tgread_object = partial(  # type: ignore
-                    tgread_object,
-                    reader = reader,
-                    tlobjects = tlobjects,
-                    core_objects = core_objects
-                )
+    added_messages = await store_tg_message_records(
+        db_session = db_session,
+        records = records,
+        session_row_id = session_row_id,
+        packet = packet
+    )
 
-                tg_obj = reader.tgread_object()  # type: ignore
-
-        tg_messages: list[tl_types.TypeMessage] = []
-        # chats: list[tl_types.TypeChat] = []
-        tg_users: list[tl_types.TypeUser] = []
-
-        if is_tlobject_same_by_constructor_id(tg_obj, "Updates"):  # type: ignore
-            for update in tg_obj.updates:  # type: ignore
-                if is_tlobject_same_by_constructor_id(update, "UpdateNewChannelMessage"):  # type: ignore
-                    tg_messages.append(update.message)  # type: ignore
-
-            # chats.extend(tg_obj.chats)  # type: ignore
-            tg_users.extend(tg_obj.users)  # type: ignore
-
-        elif is_tlobject_same_by_constructor_id(tg_obj, "ChannelDifference") or is_tlobject_same_by_constructor_id(tg_obj, "ChannelDifferenceTooLong"):  # type: ignore
-            tg_messages.extend(getattr(tg_obj, "new_messages", getattr(tg_obj, "messages")))  # type: ignore
-            # chats.extend(tg_obj.chats)  # type: ignore
-            tg_users.extend(tg_obj.users)  # type: ignore
-
-        for message in tg_messages:
-            if is_tlobject_same_by_constructor_id(message, "Message"):  # type: ignore
-                if is_tlobject_same_by_constructor_id(message.peer_id, "PeerChannel") and is_tlobject_same_by_constructor_id(message.from_id, "PeerUser"):  # type: ignore
-                    # tg_chat_obj = None  # type: ignore
-
-                    # for tg_chat_obj_ in tg_chats:  # type: ignore
-                    #     if is_tlobject_same_by_constructor_id(tg_chat_obj_, "Channel") and tg_chat_obj_.id == message.peer_id.channel_id:  # type: ignore
-                    #         tg_chat_obj = tg_chat_obj_  # type: ignore
-                    #         break
-
-                    tg_user_obj = None
-
-                    for tg_user_obj_ in tg_users:  # type: ignore
-                        if is_tlobject_same_by_constructor_id(tg_user_obj_, "User") and tg_user_obj_.id == message.from_id.user_id:  # type: ignore
-                            tg_user_obj = tg_user_obj_  # type: ignore
-                            break
-
-                    if tg_user_obj and tg_user_obj.bot:  # type: ignore
-                        continue
-
-                    tg_user_id = typing.cast(int, message.from_id.user_id)  # type: ignore
-                    tg_chat_id = -1 * (typing.cast(int, message.peer_id.channel_id) + 1_000_000_000_000)  # type: ignore
-                    tg_message_id = typing.cast(int, message.id)  # type: ignore
-                    chat_or_user_added = False
-
-                    db_result = (await db_session.execute(
-                        sa.select(db.Chat, db.User)
-                        .select_from(dummy_cte)
-                        .outerjoin(db.Chat, db.Chat.tg_chat_id == tg_chat_id)
-                        .outerjoin(db.User, db.User.tg_user_id == tg_user_id)
-                    )).first()
-
-                    db_chat, db_user = (
-                        db_result.tuple()
-                        if db_result
-                        else
-                        (None, None)
-                    )
-
-                    if not db_chat:
-                        db_chat = db.Chat(
-                            tg_chat_id = tg_chat_id
-                        )
-
-                        db_session.add(db_chat)
-
-                        chat_or_user_added = True
-
-                    if not db_user:
-                        db_user = db.User(
-                            tg_user_id = tg_user_id
-                        )
-
-                        db_session.add(db_user)
-
-                        chat_or_user_added = True
-
-                    if not await db_session.scalar(
-                        sa.select(sa.exists().where(
-                            db.Message.tg_chat_id == tg_chat_id,
-                            db.Message.tg_message_id == tg_message_id
-                        ))
-                    ):
-                        reply_to_tg_message_id = None
-
-                        if is_tlobject_same_by_constructor_id(message.reply_to, "MessageReplyHeader") and not message.reply_to.reply_to_peer_id:  # type: ignore
-                            reply_to_tg_message_id = typing.cast(int, message.reply_to.reply_to_msg_id)  # type: ignore
-
-                        if chat_or_user_added:
-                            await db_session.flush()
-
-                        message_text = typing.cast(str | None, message.message)  # type: ignore
-
-                        md_text: str | None
-
-                        if message_text:
-                            md_text = unparse_markdown(message_text, message.entities or [])  # type: ignore
-                        else:
-                            md_text = None
-
-                        db_session.add(db.Message(
-                            tg_chat_id = tg_chat_id,
-                            tg_user_id = tg_user_id,
-                            tg_message_id = tg_message_id,
-                            reply_to_tg_message_id = reply_to_tg_message_id,
-                            md_text = md_text,
-                            sent_at = message.date,  # type: ignore
-                            used_auth_key = auth_key,
-                            used_session_id = session_id,
-                            packet = packet,
-                            chat = db_chat,
-                            user = db_user
-                        ))
+    # Stored concurrently since the check
+    if added_messages is None:
+        raise exceptions.DuplicateTgPacketError
 
     await db_session.commit()
 
+    remember_tg_message_records(records)
+    remember_tg_session(auth_key, session_id, session_row_id)
+
     return schemas.OKResponse()
+
+
+@api_upload_tg_packet_router.post(
+    path = "/upload_tg_packets",
+    summary = "Upload many Telegram raw packets at once"
+)
+async def api_upload_tg_packets_handler(
+    db_session: db.DBSession = _dependencies.get_db_session,
+    request_obj: schemas.UploadTgPacketsRequest = Body()
+) -> schemas.UploadTgPacketsResponse:
+    frames: list[TgPacketFrame | str] = []
+
+    for item in request_obj.packets:
+        try:
+            item_request_obj = request_obj.get_item_request(item)
+
+        except ValueError:
+            frames.append("layer, auth_key and session_id must be set either per packet or shared")
+            continue
+
+        try:
+            auth_key, session_id, packet = item_request_obj.get_bytes()
+
+        except ValueError:
+            frames.append("Not hex-encoded bytes")
+            continue
+
+        frames.append(TgPacketFrame(
+            layer = item_request_obj.layer,
+            auth_key = auth_key,
+            session_id = session_id,
+            packet = packet
+        ))
+
+    return schemas.UploadTgPacketsResponse(
+        results = await ingest_tg_packet_frames(
+            db_session = db_session,
+            frames = frames
+        )
+    )
+
+
+@api_upload_tg_packet_router.post(
+    path = "/upload_tg_packet_frames",
+    summary = "Upload many Telegram raw packets as length-prefixed binary frames",
+    description = (
+        "Body is a sequence of frames, each one is a little-endian header "
+        "`layer:uint32 auth_key_length:uint16 session_id_length:uint16 packet_length:uint32` "
+        "followed by the raw `auth_key`, `session_id` and `packet` bytes. "
+        "Zero `auth_key_length`/`session_id_length` reuses the values of the previous frame."
+    ),
+    responses = exceptions.combine(
+        exceptions.UnsupportedMediaTypeError,
+        exceptions.RequestBodyTooLargeError,
+    ),
+    openapi_extra = {
+        "requestBody": {
+            "required": True,
+            "content": {
+                TG_PACKET_FRAMES_MEDIA_TYPE: {
+                    "schema": {
+                        "type": "string",
+                        "format": "binary"
+                    }
+                }
+            }
+        }
+    }
+)
+async def api_upload_tg_packet_frames_handler(
+    request: Request,
+    db_session: db.DBSession = _dependencies.get_db_session
+) -> schemas.UploadTgPacketsResponse:
+    if request.headers.get("content-type", "").split(";")[0].strip() != TG_PACKET_FRAMES_MEDIA_TYPE:
+        raise exceptions.UnsupportedMediaTypeError
+
+    body = await _utils.read_limited_body(request, config.upload_tg_packet_frames_max_body_size)
+
+    try:
+        frames = unpack_tg_packet_frames(body)
+
+    except ValueError as ex:
+        raise RequestValidationError(
+            errors = [
+                {
+                    "loc": ["body"],
+                    "msg": str(ex),
+                    "type": "value_error"
+                }
+            ]
+        )
+
+    if not 1 <= len(frames) <= schemas.UPLOAD_TG_PACKETS_LIMIT:
+        raise RequestValidationError(
+            errors = [
+                {
+                    "loc": ["body"],
+                    "msg": f"Amount of frames must be between 1 and {schemas.UPLOAD_TG_PACKETS_LIMIT}",
+                    "type": "value_error"
+                }
+            ]
+        )
+
+    return schemas.UploadTgPacketsResponse(
+        results = await ingest_tg_packet_frames(
+            db_session = db_session,
+            frames = list(frames)
+        )
+    )
@@ -37,6 +37,32 @@ class Config(BaseModel):
     db_url: str
     host: str
     port: int
+    upload_tg_packet_frames_max_body_size: int = 64 * 1024 * 1024
+    known_tg_ids_cache_size: int = 100_000
+    known_tg_sessions_cache_size: int = 10_000
+    ingest_queue_enabled: bool = False
+    ingest_queue_max_size: int = 10_000
+    ingest_queue_workers: int = 4
+    ingest_queue_batch_size: int = 100
+    ingest_queue_overflow_policy: enums.IngestQueueOverflowPolicy = enums.IngestQueueOverflowPolicy.REJECT
+    ingest_queue_wait_timeout: float = 5.0
+    ingest_queue_max_attempts: int = 5
+    tg_packet_parser_executor: enums.TgPacketParserExecutor = enums.TgPacketParserExecutor.INLINE
+    tg_packet_parser_workers: int | None = None
+    tg_packet_selective_decoding: bool = False
+    preload_layers: list[int] = []
+    md_text_rendering: enums.MdTextRendering = enums.MdTextRendering.INGEST
+    md_text_backfill_batch_size: int = 500
+    md_text_backfill_interval: float = 5.0
+    packet_cold_storage_enabled: bool = False
+    packet_cold_storage_after: float = 7 * 24 * 60 * 60
+    packet_cold_storage_batch_size: int = 1_000
+    packet_cold_storage_interval: float = 60.0
+    packet_segment_max_size: int = 256 * 1024 * 1024
+    packet_segment_zstd_level: int = 3
+    packet_segment_mmaps_cache_size: int = 64
+    messages_partitions_ahead: int = 3
+    messages_partitions_interval: float = 60 * 60
 
     @classmethod
     def load(cls) -> Self:
@@ -14,6 +14,7 @@ NEEDED_LAYERS_TLOBJECT_NAMES = [
     "Message",
     "PeerChannel",
     "PeerUser",
+    "PeerChat",
 
     "GzipPacked",
     "User",
@@ -64,8 +65,11 @@ NEEDED_LAYERS_TLOBJECT_NAMES = [
 PARENT_DIRPATH = Path(__file__).parent.parent
 LOGS_DIRPATH = PARENT_DIRPATH / "logs"
 LAYERS_DIRPATH = PARENT_DIRPATH / "layers"
+INGEST_QUEUE_SPILL_DIRPATH = PARENT_DIRPATH / "ingest_spill"
+PACKET_SEGMENTS_DIRPATH = PARENT_DIRPATH / "packet_segments"
 
 LOG_FILENAME = "log.txt"
+LAYER_CONSTRUCTOR_IDS_FILENAME = "constructor_ids.json"
 
 
 if not LOGS_DIRPATH.exists():
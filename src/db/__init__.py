@@ -6,6 +6,8 @@ from .base import BaseModel
 from .models import (
     User,
     Chat,
+    Session,
+    Packet,
     Message
 )
 
@@ -20,5 +22,7 @@ __all__ = (
     "BaseModel",
     "User",
     "Chat",
+    "Session",
+    "Packet",
     "Message",
 )
@@ -1,4 +1,5 @@
 from sqlalchemy import BigInteger, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime
 
@@ -30,22 +31,69 @@ class User(BaseModel):
     messages: Mapped[list["Message"]] = relationship(default_factory=list, back_populates="user", lazy="noload")
 
 
+class Session(BaseModel):
+    __tablename__ = "sessions"
+    __table_args__ = (
+        sa.UniqueConstraint("auth_key_hash", "session_id", name="uq_auth_key_hash_session_id"),
+    )
+
+    id: Mapped[t_idpk] = mapped_column(init=False)
+    auth_key_hash: Mapped[bytes] = mapped_column(nullable=False)  # SHA-256
+    auth_key: Mapped[bytes] = mapped_column(nullable=False)
+    session_id: Mapped[bytes] = mapped_column(nullable=False)
+
+
+class Packet(BaseModel):
+    __tablename__ = "packets"
+    __table_args__ = (
+        sa.Index("ix_packets_hot", "id", postgresql_where=sa.text("packet IS NOT NULL")),
+    )
+
+    id: Mapped[t_idpk] = mapped_column(init=False)
+    packet_hash: Mapped[bytes] = mapped_column(index=True, unique=True, nullable=False)  # SHA-256
+    # Null once moved to the packet store, and for packets without messages,
+    # those are kept only to reject their re-uploads
+    packet: Mapped[bytes | None] = mapped_column(nullable=True)
+    segment: Mapped[str | None] = mapped_column(default=None, nullable=True)
+    segment_offset: Mapped[int | None] = mapped_column(BigInteger, default=None, nullable=True)
+    segment_length: Mapped[int | None] = mapped_column(default=None, nullable=True)
+
+
 class Message(BaseModel):
     __tablename__ = "messages"
     __table_args__ = (
-        sa.UniqueConstraint("tg_chat_id", "tg_message_id", name="uq_tg_chat_id_tg_message_id"),
+        # Unique constraints of a partitioned table must include the partition key,
+        # so messages are deduplicated by the exact sent_at too. Telegram never changes
+        # the date of a message, and it is stored as naive UTC on connections pinned
+        # to UTC, so the same message always gets the same sent_at. A sent_at stored
+        # any other way is not deduplicated against, unlike with a per-chat key
+        sa.UniqueConstraint("tg_chat_id", "tg_message_id", "sent_at", name="uq_tg_chat_id_tg_message_id"),
+        # Scanned backwards for `ORDER BY sent_at DESC, id DESC`,
+        # the unique constraint covers lookups by tg_chat_id alone
+        sa.Index("ix_messages_sent_at_id", "sent_at", "id"),
+        sa.Index("ix_messages_tg_chat_id_sent_at_id", "tg_chat_id", "sent_at", "id"),
+        sa.Index("ix_messages_tg_user_id_sent_at_id", "tg_user_id", "sent_at", "id"),
+        sa.Index("ix_messages_inserted_at", "inserted_at"),
+        sa.Index("ix_messages_md_text_pending", "sent_at", "id", postgresql_where=sa.text("md_text IS NULL AND text IS NOT NULL")),
+        # Monthly partitions are created by `MessagesPartitioner`
+        {"postgresql_partition_by": "RANGE (sent_at)"},
     )
 
     id: Mapped[t_idpk] = mapped_column(init=False)
-    tg_chat_id: Mapped[int] = mapped_column(tg_id_type, ForeignKey("chats.tg_chat_id"), index=True, nullable=False)
-    tg_user_id: Mapped[int | None] = mapped_column(tg_id_type, ForeignKey("users.tg_user_id"), index=True, nullable=True)
+    tg_chat_id: Mapped[int] = mapped_column(tg_id_type, ForeignKey("chats.tg_chat_id"), nullable=False)
+    tg_user_id: Mapped[int | None] = mapped_column(tg_id_type, ForeignKey("users.tg_user_id"), nullable=True)
     tg_message_id: Mapped[int] = mapped_column(tg_id_type, index=True, nullable=False)
     reply_to_tg_message_id: Mapped[int | None] = mapped_column(tg_id_type, index=True, nullable=True)
     md_text: Mapped[str | None] = mapped_column(nullable=True)
-    sent_at: Mapped[datetime] = mapped_column(nullable=False)
-    used_auth_key: Mapped[bytes] = mapped_column(nullable=False)
-    used_session_id: Mapped[bytes] = mapped_column(nullable=False)
-    packet: Mapped[bytes] = mapped_column(nullable=False)
+    # Kept only until `md_text` is rendered, when rendering is deferred
+    text: Mapped[str | None] = mapped_column(nullable=True)
+    entities: Mapped[list[dict[str, typing.Any]] | None] = mapped_column(JSONB, nullable=True)
+    sent_at: Mapped[datetime] = mapped_column(primary_key=True, nullable=False)
+    used_session_row_id: Mapped[int] = mapped_column(ForeignKey("sessions.id"), nullable=False)
+    # Shared by all messages of the packet
+    packet_row_id: Mapped[int] = mapped_column(ForeignKey("packets.id"), nullable=False)
 
     chat: Mapped[typing.Optional["Chat"]] = relationship(default=None, back_populates="messages", lazy="noload")
     user: Mapped[typing.Optional["User"]] = relationship(default=None, back_populates="messages", lazy="noload")
+    used_session: Mapped[typing.Optional["Session"]] = relationship(default=None, lazy="noload")
+    packet: Mapped[typing.Optional["Packet"]] = relationship(default=None, lazy="noload")
@@ -0,0 +1,23 @@
+from datetime import date, datetime
+
+
+def get_month_start(value: date | datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def get_next_month_start(month: date) -> date:
+    if month.month == 12:
+        return date(month.year + 1, 1, 1)
+
+    return date(month.year, month.month + 1, 1)
+
+
+def get_messages_partition_name(month: date) -> str:
+    return f"messages_{month:%Y_%m}"
+
+
+def get_messages_partition_ddl(month: date) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {get_messages_partition_name(month)} PARTITION OF messages "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{get_next_month_start(month).isoformat()}')"
+    )
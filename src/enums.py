@@ -5,3 +5,26 @@ class BaseEnum(str, _Enum):
     @staticmethod
     def _generate_next_value_(name: str, start: int, count: int, last_values: list[str]) -> str:
         return name.lower()
+
+
+class TgPacketUploadFormat(BaseEnum):
+    JSON = enum_auto()
+    FRAMES = enum_auto()
+
+
+class IngestQueueOverflowPolicy(BaseEnum):
+    REJECT = enum_auto()
+    WAIT = enum_auto()
+    SPILL = enum_auto()
+
+
+class TgPacketParserExecutor(BaseEnum):
+    INLINE = enum_auto()
+    THREAD = enum_auto()
+    PROCESS = enum_auto()
+
+
+class MdTextRendering(BaseEnum):
+    INGEST = enum_auto()
+    READ = enum_auto()
+    BACKFILL = enum_auto()
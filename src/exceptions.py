@@ -61,6 +61,36 @@ class ConcurrentRequestsError(BaseError):
     description: str = "Too many concurrent requests"
 
 
+@_dataclass
+class UnsupportedMediaTypeError(BaseError):
+    status_code: int = status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+    description: str = "Unsupported media type"
+
+
+@_dataclass
+class RequestBodyTooLargeError(BaseError):
+    status_code: int = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    description: str = "Request body is too large"
+
+
+@_dataclass
+class IngestQueueFullError(BaseError):
+    status_code: int = status.HTTP_503_SERVICE_UNAVAILABLE
+    description: str = "Ingest queue is full, retry later"
+
+
+@_dataclass
+class DuplicateTgPacketError(BaseError):
+    status_code: int = status.HTTP_409_CONFLICT
+    description: str = "Packet is already stored"
+
+
+@_dataclass
+class PacketUnavailableError(BaseError):
+    status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+    description: str = "Packet can not be read from the packet store"
+
+
 @_dataclass
 class InternalError(BaseError):
     status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -1,11 +1,30 @@
-from telethon.tl.tlobject import TLObject
+from concurrent.futures import Executor
+from pathlib import Path
+
+import typing
 
 from src import db, utils
 
+if typing.TYPE_CHECKING:
+    from src.ingest_queue import IngestQueue
+    from src.md_text_backfill import MdTextBackfill
+    from src.packet_store import PacketStore
+    from src.packet_archiver import PacketArchiver
+    from src.messages_partitions import MessagesPartitioner
+    from src.layers_registry import LoadedLayer
+
 
 class GlobalVariables:
     logger: utils.logging.Logger
     db_sessionmaker: db.DBSessionMaker
-    layers_tlobjects: dict[int, dict[int, TLObject]] = {}  # {layer: {constructor_id: TLObject}}
-    layers_coreobjects: dict[int, dict[int, TLObject]] = {}  # {layer: {constructor_id: TLObject}}
-    needed_layers_tlobjects_constructor_ids: dict[int, dict[str, int]] = {}  # {layer: {tlobject_name: constructor_id}}
+    known_tg_chat_ids: utils.LRUCache[int, bool]
+    known_tg_user_ids: utils.LRUCache[int, bool]
+    known_tg_sessions: utils.LRUCache[tuple[bytes, bytes], int]  # {(auth_key, session_id): session_row_id}
+    ingest_queue: "IngestQueue | None" = None
+    md_text_backfill: "MdTextBackfill | None" = None
+    packet_store: "PacketStore"
+    packet_archiver: "PacketArchiver | None" = None
+    messages_partitioner: "MessagesPartitioner"
+    tg_packet_parser_executor: Executor | None = None
+    layers_dirpaths: dict[int, Path] = {}  # {layer: layer_dirpath}
+    loaded_layers: dict[int, "LoadedLayer"] = {}  # {layer: LoadedLayer}
@@ -0,0 +1,307 @@
+from pathlib import Path
+
+import asyncio
+import typing
+import os
+
+from src import enums, exceptions, utils
+from src.global_variables import GlobalVariables
+from src.tg_packet_frames import TgPacketFrame, pack_tg_packet_frames, unpack_tg_packet_frames
+from src.tg_packet_ingester import STORE_FAILED_DESCRIPTION, ingest_tg_packet_frames
+
+
+SPILL_FILENAME_SUFFIX = ".frames"
+SPILL_CHECK_INTERVAL = 1.0
+CURRENT_SPILL_FILENAME_STEM = "current"
+FAILED_BATCH_RETRY_DELAY = 1.0
+
+
+class QueuedTgPacket(typing.NamedTuple):
+    frame: TgPacketFrame
+    enqueued_at: float
+    attempts: int = 0
+
+
+class IngestQueue:
+    def __init__(
+        self,
+        max_size: int,
+        workers: int,
+        batch_size: int,
+        overflow_policy: enums.IngestQueueOverflowPolicy,
+        wait_timeout: float,
+        max_attempts: int,
+        spill_dirpath: Path
+    ) -> None:
+        self.max_size = max_size
+        self.workers = workers
+        self.batch_size = batch_size
+        self.overflow_policy = overflow_policy
+        self.wait_timeout = wait_timeout
+        self.max_attempts = max_attempts
+        self.spill_dirpath = spill_dirpath
+
+        self.processed = 0
+        self.failed = 0
+        self.retried = 0
+        self.rejected = 0
+        self.spilled = 0
+        self.restored = 0
+
+        self._queue: asyncio.Queue[QueuedTgPacket] = asyncio.Queue(maxsize=max_size)
+        self._tasks: list[asyncio.Task[None]] = []
+        self._spill_lock = asyncio.Lock()
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def lag(self) -> float:
+        """Seconds the oldest packet waiting in memory has been queued for."""
+
+        # FIFO, the head is the oldest one
+        queued_tg_packets: typing.Deque[QueuedTgPacket] = self._queue._queue  # type: ignore
+
+        if not queued_tg_packets:
+            return 0.0
+
+        return max(utils.get_float_timestamp() - queued_tg_packets[0].enqueued_at, 0.0)
+
+    @property
+    def spill_filepath(self) -> Path:
+        return self._get_spill_filepath(CURRENT_SPILL_FILENAME_STEM)
+
+    def _get_spill_filepath(self, stem: str) -> Path:
+        # Every spill file is owned by a single process sharing the directory,
+        # files of processes that are gone are taken over by the others
+        return self.spill_dirpath / f"{stem}-{os.getpid()}{SPILL_FILENAME_SUFFIX}"
+
+    def start(self) -> None:
+        # Failed batches are spilled too when the queue is full, whatever the policy
+        self.spill_dirpath.mkdir(parents=True, exist_ok=True)
+
+        self._tasks.append(asyncio.create_task(self._spill_loop()))
+
+        for _ in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker_loop()))
+
+    async def stop(self) -> None:
+        # Spilled packets not restored yet stay on disk for the next start
+        await self._queue.join()
+
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        self._tasks.clear()
+
+    async def put(self, frame: TgPacketFrame) -> None:
+        queued_tg_packet = QueuedTgPacket(
+            frame = frame,
+            enqueued_at = utils.get_float_timestamp()
+        )
+
+        try:
+            self._queue.put_nowait(queued_tg_packet)
+            return
+
+        except asyncio.QueueFull:
+            pass
+
+        if self.overflow_policy == enums.IngestQueueOverflowPolicy.WAIT:
+            try:
+                await asyncio.wait_for(self._queue.put(queued_tg_packet), timeout=self.wait_timeout)
+                return
+
+            except asyncio.TimeoutError:
+                pass
+
+        elif self.overflow_policy == enums.IngestQueueOverflowPolicy.SPILL:
+            await self._spill([frame])
+            return
+
+        self.rejected += 1
+
+        raise exceptions.IngestQueueFullError
+
+    async def _spill(self, frames: list[TgPacketFrame]) -> None:
+        data = pack_tg_packet_frames(frames)
+
+        async with self._spill_lock:
+            # The packet is answered as accepted once this returns
+            await asyncio.to_thread(_append_file, self.spill_filepath, data)
+
+        self.spilled += len(frames)
+
+    async def _spill_loop(self) -> None:
+        while True:
+            await asyncio.sleep(SPILL_CHECK_INTERVAL)
+
+            if self._queue.qsize() > self.max_size // 2:
+                continue
+
+            try:
+                await self._restore_spilled()
+
+            except Exception as ex:
+                GlobalVariables.logger.exception(
+                    msg = "failed to restore spilled packets",
+                    exc_info = ex
+                )
+
+    def _take_spill_filepaths(self) -> list[Path]:
+        spill_filepaths: list[Path] = []
+
+        for spill_filepath in sorted(self.spill_dirpath.glob(f"*{SPILL_FILENAME_SUFFIX}")):
+            stem, _, pid = spill_filepath.stem.rpartition("-")
+
+            if not pid.isdigit():
+                continue
+
+            if int(pid) != os.getpid():
+                if _is_process_alive(int(pid)):
+                    continue
+
+                # Renaming is atomic, only one of the processes takes the file over
+                try:
+                    spill_filepath = spill_filepath.rename(self._get_spill_filepath(f"{stem}.{utils.get_float_timestamp()}"))
+
+                except FileNotFoundError:
+                    continue
+
+            elif spill_filepath == self.spill_filepath:
+                continue
+
+            spill_filepaths.append(spill_filepath)
+
+        return spill_filepaths
+
+    async def _restore_spilled(self) -> None:
+        async with self._spill_lock:
+            if self.spill_filepath.exists():
+                self.spill_filepath.rename(self._get_spill_filepath(str(utils.get_float_timestamp())))
+
+        for spill_filepath in self._take_spill_filepaths():
+            data = await asyncio.to_thread(spill_filepath.read_bytes)
+
+            try:
+                frames = unpack_tg_packet_frames(data)
+
+            except ValueError as ex:
+                GlobalVariables.logger.exception(
+                    msg = f"corrupted spill file {spill_filepath.as_posix()}",
+                    exc_info = ex
+                )
+
+                spill_filepath.rename(spill_filepath.with_suffix(".corrupted"))
+                continue
+
+            enqueued_at = utils.get_float_timestamp()
+
+            for frame in frames:
+                await self._queue.put(QueuedTgPacket(
+                    frame = frame,
+                    enqueued_at = enqueued_at
+                ))
+
+            spill_filepath.unlink()
+
+            self.restored += len(frames)
+
+    async def _retry(self, queued_tg_packets: list[QueuedTgPacket]) -> None:
+        """Packets were already answered as accepted, they are dropped only after `max_attempts`."""
+
+        spilled_frames: list[TgPacketFrame] = []
+
+        for queued_tg_packet in queued_tg_packets:
+            if queued_tg_packet.attempts + 1 >= self.max_attempts:
+                self.failed += 1
+
+                GlobalVariables.logger.error(f"queued packet dropped after {self.max_attempts} attempts")
+                continue
+
+            self.retried += 1
+
+            try:
+                self._queue.put_nowait(queued_tg_packet._replace(
+                    attempts = queued_tg_packet.attempts + 1
+                ))
+
+            # Restored as a new packet, the attempts are not kept on disk
+            except asyncio.QueueFull:
+                spilled_frames.append(queued_tg_packet.frame)
+
+        if spilled_frames:
+            await self._spill(spilled_frames)
+
+    async def _worker_loop(self) -> None:
+        while True:
+            queued_tg_packets = [await self._queue.get()]
+
+            while len(queued_tg_packets) < self.batch_size and not self._queue.empty():
+                queued_tg_packets.append(self._queue.get_nowait())
+
+            failed_tg_packets: list[QueuedTgPacket] = []
+
+            try:
+                async with GlobalVariables.db_sessionmaker() as db_session:
+                    results = await ingest_tg_packet_frames(
+                        db_session = db_session,
+                        frames = [
+                            queued_tg_packet.frame
+                            for queued_tg_packet in queued_tg_packets
+                        ]
+                    )
+
+                for queued_tg_packet, result in zip(queued_tg_packets, results):
+                    if result.ok:
+                        self.processed += 1
+
+                    elif result.description == STORE_FAILED_DESCRIPTION:
+                        failed_tg_packets.append(queued_tg_packet)
+
+                    else:
+                        self.failed += 1
+
+                        GlobalVariables.logger.warning(f"queued packet rejected: {result.description}")
+
+            except Exception as ex:
+                failed_tg_packets = queued_tg_packets
+
+                GlobalVariables.logger.exception(
+                    msg = "failed to write queued packets",
+                    exc_info = ex
+                )
+
+            try:
+                if failed_tg_packets:
+                    await self._retry(failed_tg_packets)
+
+                    # Lets the database recover instead of spinning on the same packets
+                    await asyncio.sleep(FAILED_BATCH_RETRY_DELAY)
+
+            finally:
+                for _ in queued_tg_packets:
+                    self._queue.task_done()
+
+
+def _append_file(filepath: Path, data: bytes) -> None:
+    with filepath.open("ab") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def _is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+
+    except ProcessLookupError:
+        return False
+
+    except PermissionError:
+        pass
+
+    return True
@@ -0,0 +1,98 @@
+from telethon.tl.tlobject import TLObject
+from threading import Lock
+from pathlib import Path
+
+import json
+import typing
+
+from src import constants
+from src.global_variables import GlobalVariables
+from src.tg_packet_parser import SKIP_READER_T
+
+
+class LoadedLayer(typing.NamedTuple):
+    tlobjects: dict[int, TLObject]  # {constructor_id: TLObject}
+    core_objects: dict[int, TLObject]  # {constructor_id: TLObject}
+    needed_tlobjects_constructor_ids: dict[str, int]  # {tlobject_name: constructor_id}
+    selective_skip_readers: dict[int, SKIP_READER_T]  # {not needed constructor_id: skip_reader}
+
+
+_load_lock = Lock()
+
+
+def _get_constructor_ids_filepath(layer_dirpath: Path) -> Path:
+    return layer_dirpath / "tl" / constants.LAYER_CONSTRUCTOR_IDS_FILENAME
+
+
+def register_layers() -> None:
+    """
+    Only finds generated layers, they are imported by `get_layer`.
+    """
+
+    for layer_dirpath in constants.LAYERS_DIRPATH.iterdir():
+        if not layer_dirpath.name.isdigit():
+            continue
+
+        if not _get_constructor_ids_filepath(layer_dirpath).exists():
+            raise RuntimeError(f"Layer {layer_dirpath.name} has no {constants.LAYER_CONSTRUCTOR_IDS_FILENAME}, please regenerate layers.")
+
+        GlobalVariables.layers_dirpaths[int(layer_dirpath.name)] = layer_dirpath
+
+    if not GlobalVariables.layers_dirpaths:
+        raise RuntimeError(f"No layers found. Please check the {constants.LAYERS_DIRPATH.resolve().as_posix()} directory.")
+
+
+def _load_layer(layer: int) -> LoadedLayer:
+    layer_dirpath = GlobalVariables.layers_dirpaths[layer]
+
+    alltlobjects_module = __import__(f"layers.{layer_dirpath.name}.tl.alltlobjects", fromlist=["tlobjects", "skip_readers"])
+
+    tlobjects: dict[int, TLObject] = alltlobjects_module.tlobjects
+    core_objects: dict[int, TLObject] = __import__(f"layers.{layer_dirpath.name}.tl.core", fromlist=["core_objects"]).core_objects
+
+    with _get_constructor_ids_filepath(layer_dirpath).open("r", encoding=constants.ENCODING) as file:
+        constructor_ids: dict[str, int] = json.load(file)
+
+    for core_object in core_objects.values():
+        constructor_ids.setdefault(core_object.__name__, typing.cast(int, core_object.CONSTRUCTOR_ID))  # type: ignore
+
+    needed_tlobjects_constructor_ids: dict[str, int] = {}
+
+    for tlobject_name in constants.NEEDED_LAYERS_TLOBJECT_NAMES:
+        if tlobject_name not in constructor_ids:
+            raise ValueError(f"TLObject with name {tlobject_name} not found in layer {layer}")
+
+        needed_tlobjects_constructor_ids[tlobject_name] = constructor_ids[tlobject_name]
+
+    needed_constructor_ids = set(needed_tlobjects_constructor_ids.values())
+
+    return LoadedLayer(
+        tlobjects = tlobjects,
+        core_objects = core_objects,
+        needed_tlobjects_constructor_ids = needed_tlobjects_constructor_ids,
+        selective_skip_readers = {
+            constructor_id: skip_reader
+            for constructor_id, skip_reader in alltlobjects_module.skip_readers.items()
+            if constructor_id not in needed_constructor_ids
+        }
+    )
+
+
+def get_layer(layer: int) -> LoadedLayer:
+    """
+    Imports the layer and builds its lookup tables on first use.
+    """
+
+    loaded_layer = GlobalVariables.loaded_layers.get(layer)
+
+    if loaded_layer is None:
+        # Parsing may run in executor threads
+        with _load_lock:
+            loaded_layer = GlobalVariables.loaded_layers.get(layer)
+
+            if loaded_layer is None:
+                loaded_layer = _load_layer(layer)
+
+                GlobalVariables.loaded_layers[layer] = loaded_layer
+
+    return loaded_layer
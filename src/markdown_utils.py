@@ -1,37 +1,16 @@
 from telethon.tl import types
 from telethon.tl.types import TypeMessageEntity
 from enum import Enum
-from struct import unpack
+from bisect import bisect_left, bisect_right
+from inspect import signature
 
 import re
+import typing
 
 
 SMP_RE = re.compile(r"[\U00010000-\U0010FFFF]")
 
 
-def add_surrogates(text: str) -> str:
-    return SMP_RE.sub(
-        lambda match: "".join(chr(i) for i in unpack("<HH", match.group().encode("utf-16le"))),
-        text
-    )
-
-def remove_surrogates(text: str) -> str:
-    return text.encode("utf-16", "surrogatepass").decode("utf-16")
-
-def replace_once(source: str, old: str, new: str, start: int) -> str:
-    return source[:start] + source[start:].replace(old, new, 1)
-
-def within_surrogate(text: str, index: int, *, length: int | None=None) -> bool:
-    if length is None:
-        length = len(text)
-
-    return (
-        1 < index < len(text) and
-        '\ud800' <= text[index - 1] <= '\udbff' and
-        '\ud800' <= text[index] <= '\udfff'
-    )
-
-
 BOLD_DELIM = "**"
 ITALIC_DELIM = "__"
 UNDERLINE_DELIM = "--"
@@ -115,31 +94,101 @@ def get_entity_type(entity: TypeMessageEntity) -> MessageEntityType | None:
     return MESSAGE_ENTITY_TYPE_NAMES.get(type(entity).__name__, None)
 
 
+def _get_blockquotes_max_ends(blockquote_entities: list[TypeMessageEntity]) -> tuple[list[int], list[int], list[int]]:
+    """
+    Returns blockquote offsets in ascending order along with the max end of
+    the blockquotes up to each of them, of all and of collapsed ones.
+    """
+
+    offsets: list[int] = []
+    max_ends: list[int] = []
+    collapsed_max_ends: list[int] = []
+
+    max_end = collapsed_max_end = -1
+
+    for entity in sorted(blockquote_entities, key=lambda entity: entity.offset):  # type: ignore
+        end = entity.offset + entity.length  # type: ignore
+
+        max_end = max(max_end, end)
+
+        if entity.collapsed:  # type: ignore
+            collapsed_max_end = max(collapsed_max_end, end)
+
+        offsets.append(entity.offset)  # type: ignore
+        max_ends.append(max_end)
+        collapsed_max_ends.append(collapsed_max_end)
+
+    return offsets, max_ends, collapsed_max_ends
+
+
+def _get_astral_offsets(text: str) -> list[int]:
+    """
+    Returns UTF-16 offsets of the characters outside of the BMP, each of them
+    takes two UTF-16 code units (a surrogate pair) but a single Python character.
+    """
+
+    if text.isascii() or max(text) <= "\uffff":
+        return []
+
+    return [
+        match.start() + i
+        for i, match in enumerate(SMP_RE.finditer(text))
+    ]
+
+
+def _get_index(astral_offsets: list[int], offset: int) -> tuple[int, bool]:
+    """
+    Maps UTF-16 offset to the index of the Python string, also tells
+    whether the offset is in the middle of a surrogate pair,
+    the index of the character of that pair is returned then.
+    """
+
+    astral_count = bisect_left(astral_offsets, offset)
+
+    return (
+        offset - astral_count,
+        astral_count > 0 and astral_offsets[astral_count - 1] == offset - 1
+    )
+
+
+def _get_utf16_length(text: str) -> int:
+    if text.isascii():
+        return len(text)
+
+    return len(text.encode("utf-16-le")) // 2
+
+
 def unparse_markdown(text: str, entities: list[TypeMessageEntity]) -> str:
-    text = add_surrogates(text)
+    # Entity offsets and lengths are in UTF-16 code units
+    astral_offsets = _get_astral_offsets(text)
+    utf16_length = len(text) + len(astral_offsets)
+
+    entity_types = [
+        get_entity_type(entity)  # type: ignore
+        for entity in entities
+    ]
+
+    blockquote_offsets, blockquote_max_ends, collapsed_blockquote_max_ends = _get_blockquotes_max_ends([
+        entity
+        for entity, entity_type in zip(entities, entity_types)
+        if entity_type == MessageEntityType.BLOCKQUOTE
+    ])
 
     insert_at: list[tuple[int, int, str]] = []
 
-    for i, entity in enumerate(entities):
+    for i, (entity, entity_type) in enumerate(zip(entities, entity_types)):
         s = entity.offset
         e = entity.offset + entity.length
-        entity_type = get_entity_type(entity)  # type: ignore
         delimiter = DELIMITERS.get(entity_type, None) if entity_type is not None else None
         if delimiter:
             if entity_type == MessageEntityType.PRE:
-                inside_blockquote = any(
-                    blk_entity.offset <= s < blk_entity.offset + blk_entity.length and
-                    blk_entity.offset < e <= blk_entity.offset + blk_entity.length
-                    for blk_entity in entities
-                    if get_entity_type(blk_entity) == MessageEntityType.BLOCKQUOTE
-                )
-                is_expandable = any(
-                    blk_entity.offset <= s < blk_entity.offset + blk_entity.length and
-                    blk_entity.offset < e <= blk_entity.offset + blk_entity.length and
-                    blk_entity.collapsed  # type: ignore
-                    for blk_entity in entities
-                    if get_entity_type(blk_entity) == MessageEntityType.BLOCKQUOTE
-                )
+                # Blockquote containing the entity, offset <= s < end and offset < e <= end
+                blockquotes_count = bisect_right(blockquote_offsets, min(s, e - 1))
+                min_end = max(s + 1, e)
+
+                inside_blockquote = blockquotes_count > 0 and blockquote_max_ends[blockquotes_count - 1] >= min_end
+                is_expandable = blockquotes_count > 0 and collapsed_blockquote_max_ends[blockquotes_count - 1] >= min_end
+
                 if inside_blockquote:
                     if is_expandable:
                         if entity.language:  # type: ignore
@@ -165,14 +214,27 @@ def unparse_markdown(text: str, entities: list[TypeMessageEntity]) -> str:
                 insert_at.append((e, -i, close_delimiter))
             else:
                 # Handle multiline blockquotes
-                text_subset = text[s:e]
-                lines = text_subset.splitlines()
-                for line_num, _ in enumerate(lines):
-                    line_start = s + sum(len(ll) + 1 for ll in lines[:line_num])
-                    if entity.collapsed:  # type: ignore
-                        insert_at.append((line_start, i, BLOCKQUOTE_EXPANDABLE_DELIM))
-                    else:
-                        insert_at.append((line_start, i, BLOCKQUOTE_DELIM))
+                blockquote_delimiter = (
+                    BLOCKQUOTE_EXPANDABLE_DELIM
+                    if entity.collapsed  # type: ignore
+                    else
+                    BLOCKQUOTE_DELIM
+                )
+                if s >= e:
+                    continue
+                s_index, s_in_surrogate_pair = _get_index(astral_offsets, s)
+                e_index, e_in_surrogate_pair = _get_index(astral_offsets, e)
+                # A cut surrogate pair still makes a line
+                if e_in_surrogate_pair:
+                    e_index += 1
+                line_start = s
+                # The first line starts inside of the pair's character
+                next_line_start = s - 1 if s_in_surrogate_pair else s
+                for line in text[s_index:e_index].splitlines():
+                    insert_at.append((line_start, i, blockquote_delimiter))
+                    # Every line break is counted as a single character
+                    next_line_start += _get_utf16_length(line) + 1
+                    line_start = next_line_start
                 # No closing delimiter for blockquotes
         else:
             url = None
@@ -192,16 +254,64 @@ def unparse_markdown(text: str, entities: list[TypeMessageEntity]) -> str:
                 insert_at.append((e, -i, f']({url})'))
 
     insert_at.sort(key=lambda t: (t[0], t[1]))
-    while insert_at:
-        at, _, what = insert_at.pop()
 
-        # If we are in the middle of a surrogate nudge the position by -1.
-        # Otherwise we would end up with malformed text and fail to encode.
+    pieces: list[str] = []
+    position = 0
+
+    for at, _, what in insert_at:
+        # Entities are within the text, clamp anything else to its bounds
+        at, in_surrogate_pair = _get_index(astral_offsets, min(max(at, 0), utf16_length))
+
+        # If we are in the middle of a surrogate pair nudge the position past it.
+        # Otherwise we would split the character.
         # For example of bad input: "Hi \ud83d\ude1c"
         # https://en.wikipedia.org/wiki/UTF-16#U+010000_to_U+10FFFF
-        while within_surrogate(text, at):
+        if in_surrogate_pair:
             at += 1
 
-        text = text[:at] + what + text[at:]
+        at = max(at, position)
+
+        pieces.append(text[position:at])
+        pieces.append(what)
+
+        position = at
+
+    pieces.append(text[position:])
+
+    return "".join(pieces)
+
+
+_MESSAGE_ENTITY_PARAMETER_NAMES = {
+    name: tuple(signature(member.value.__init__).parameters)[1:]
+    for name, member in MESSAGE_ENTITY_TYPE_NAMES.items()
+}
+
+
+def serialize_entities(entities: list[TypeMessageEntity]) -> list[dict[str, typing.Any]]:
+    return [
+        entity.to_dict()  # type: ignore
+        for entity in entities
+    ]
+
+
+def deserialize_entities(serialized_entities: list[dict[str, typing.Any]]) -> list[TypeMessageEntity]:
+    """
+    Entities of types unknown to the renderer are dropped,
+    fields unknown to the renderer are ignored.
+    """
+
+    entities: list[TypeMessageEntity] = []
+
+    for serialized_entity in serialized_entities:
+        name = serialized_entity.get("_")
+        parameter_names = _MESSAGE_ENTITY_PARAMETER_NAMES.get(name)  # type: ignore
+
+        if parameter_names is None:
+            continue
+
+        entities.append(MESSAGE_ENTITY_TYPE_NAMES[name].value(**{  # type: ignore
+            parameter_name: serialized_entity.get(parameter_name)
+            for parameter_name in parameter_names
+        }))
 
-    return remove_surrogates(text)
+    return entities
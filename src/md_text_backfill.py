@@ -0,0 +1,129 @@
+from sqlalchemy import orm
+
+import asyncio
+import sqlalchemy as sa
+import typing
+
+from src import db
+from src.global_variables import GlobalVariables
+from src.markdown_utils import unparse_markdown, deserialize_entities
+
+
+async def load_md_text_sources(db_session: db.DBSession, db_messages: typing.Sequence[db.Message]) -> None:
+    """
+    Loads `text` and `entities` of messages without `md_text`
+    for `render_md_texts`, when they were left out by `load_only`.
+    Messages without text should not be passed, those are never rendered.
+    """
+
+    message_keys = [
+        (db_message.id, db_message.sent_at)
+        for db_message in db_messages
+        if db_message.md_text is None
+    ]
+
+    if message_keys:
+        # Fills the unloaded attributes of the same objects,
+        # the whole primary key and sent_at bounds prune the partitions
+        (await db_session.execute(
+            sa.select(db.Message)
+            .options(orm.load_only(db.Message.text, db.Message.entities))
+            .where(
+                sa.tuple_(db.Message.id, db.Message.sent_at).in_(message_keys),
+                db.Message.sent_at.between(
+                    min(sent_at for _, sent_at in message_keys),
+                    max(sent_at for _, sent_at in message_keys)
+                )
+            )
+        )).scalars().all()
+
+
+def render_md_texts(db_messages: typing.Iterable[db.Message]) -> int:
+    """
+    Renders `md_text` of messages stored with deferred rendering,
+    the rows are updated on the next flush of their session.
+    `text` and `entities` are dropped once rendered.
+    """
+
+    rendered = 0
+
+    for db_message in db_messages:
+        if db_message.md_text is None and db_message.text is not None:
+            db_message.md_text = unparse_markdown(
+                db_message.text,
+                deserialize_entities(db_message.entities or [])
+            )
+
+            db_message.text = None
+            db_message.entities = None
+
+            rendered += 1
+
+    return rendered
+
+
+class MdTextBackfill:
+    def __init__(
+        self,
+        batch_size: int,
+        interval: float
+    ) -> None:
+        self.batch_size = batch_size
+        self.interval = interval
+
+        self.rendered = 0
+
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._backfill_loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        await asyncio.gather(self._task, return_exceptions=True)
+
+        self._task = None
+
+    async def _backfill_batch(self) -> int:
+        async with GlobalVariables.db_sessionmaker() as db_session:
+            db_messages = (await db_session.execute(
+                sa.select(db.Message)
+                .options(orm.load_only(db.Message.id, db.Message.sent_at, db.Message.md_text, db.Message.text, db.Message.entities))
+                .where(
+                    db.Message.md_text.is_(None),
+                    db.Message.text.is_not(None)
+                )
+                # Served by the pending index, partition by partition from the oldest
+                .order_by(db.Message.sent_at, db.Message.id)
+                .limit(self.batch_size)
+                # Lets several instances backfill at once
+                .with_for_update(skip_locked=True)
+            )).scalars().all()
+
+            rendered = render_md_texts(db_messages)
+
+            await db_session.commit()
+
+        return rendered
+
+    async def _backfill_loop(self) -> None:
+        while True:
+            try:
+                rendered = await self._backfill_batch()
+
+            except Exception as ex:
+                rendered = 0
+
+                GlobalVariables.logger.exception(
+                    msg = "failed to backfill md_text",
+                    exc_info = ex
+                )
+
+            self.rendered += rendered
+
+            if rendered < self.batch_size:
+                await asyncio.sleep(self.interval)
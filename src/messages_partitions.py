@@ -0,0 +1,94 @@
+from datetime import date, datetime
+
+import asyncio
+import sqlalchemy as sa
+import typing
+
+from src import db, utils
+from src.global_variables import GlobalVariables
+
+
+# Serializes partition creation between instances
+PARTITIONS_LOCK_ID = 0x6d657373
+
+
+def get_messages_months(sent_ats: typing.Iterable[datetime]) -> set[date]:
+    """Months whose partitions must exist to store messages sent at naive UTC ``sent_ats``."""
+
+    return {
+        db.utils.get_month_start(sent_at)
+        for sent_at in sent_ats
+    }
+
+
+class MessagesPartitioner:
+    """Creates monthly partitions of `messages`, `months_ahead` months ahead and on demand."""
+
+    def __init__(
+        self,
+        months_ahead: int,
+        interval: float
+    ) -> None:
+        self.months_ahead = months_ahead
+        self.interval = interval
+
+        self._known_months: set[date] = set()
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._partitions_loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        await asyncio.gather(self._task, return_exceptions=True)
+
+        self._task = None
+
+    async def ensure_months(self, months: typing.Iterable[date]) -> None:
+        """Runs in its own transaction, must be called before the messages are inserted."""
+
+        months = set(months)
+
+        if months <= self._known_months:
+            return
+
+        async with self._lock:
+            missing_months = months - self._known_months
+
+            if not missing_months:
+                return
+
+            async with GlobalVariables.db_sessionmaker() as db_session:
+                await db_session.execute(sa.select(sa.func.pg_advisory_xact_lock(PARTITIONS_LOCK_ID)))
+
+                for month in sorted(missing_months):
+                    await db_session.execute(sa.text(db.utils.get_messages_partition_ddl(month)))
+
+                await db_session.commit()
+
+            self._known_months.update(missing_months)
+
+    async def _partitions_loop(self) -> None:
+        while True:
+            month = db.utils.get_month_start(utils.get_datetime_utcnow())
+            months = [month]
+
+            for _ in range(self.months_ahead):
+                month = db.utils.get_next_month_start(month)
+                months.append(month)
+
+            try:
+                await self.ensure_months(months)
+
+            except Exception as ex:
+                GlobalVariables.logger.exception(
+                    msg = "failed to create messages partitions",
+                    exc_info = ex
+                )
+
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,138 @@
+from sqlalchemy import orm
+from datetime import timedelta
+
+import asyncio
+import sqlalchemy as sa
+import typing
+import zstandard
+
+from src import db, exceptions
+from src.global_variables import GlobalVariables
+from src.packet_store import PacketLocation
+
+
+async def read_packets(db_packets: list[db.Packet]) -> list[bytes]:
+    """Packets moved to the packet store are read in a single thread call."""
+
+    archived_indexes = [
+        index
+        for index, db_packet in enumerate(db_packets)
+        if db_packet.packet is None
+    ]
+
+    packets = [
+        db_packet.packet
+        for db_packet in db_packets
+    ]
+
+    if archived_indexes:
+        try:
+            archived_packets = await asyncio.to_thread(
+                GlobalVariables.packet_store.read_many,
+                [
+                    PacketLocation(
+                        segment = db_packets[index].segment,  # type: ignore
+                        offset = db_packets[index].segment_offset,  # type: ignore
+                        length = db_packets[index].segment_length  # type: ignore
+                    )
+                    for index in archived_indexes
+                ]
+            )
+
+        except (OSError, ValueError, zstandard.ZstdError) as ex:
+            GlobalVariables.logger.exception(
+                msg = "failed to read packets from the packet store",
+                exc_info = ex
+            )
+
+            raise exceptions.PacketUnavailableError
+
+        for index, packet in zip(archived_indexes, archived_packets):
+            packets[index] = packet
+
+    return typing.cast(list[bytes], packets)
+
+
+class PacketArchiver:
+    """Moves packets older than `after` seconds from the database to the packet store."""
+
+    def __init__(
+        self,
+        after: float,
+        batch_size: int,
+        interval: float
+    ) -> None:
+        self.after = after
+        self.batch_size = batch_size
+        self.interval = interval
+
+        self.moved = 0
+
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._archive_loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        await asyncio.gather(self._task, return_exceptions=True)
+
+        self._task = None
+
+    async def _archive_batch(self) -> int:
+        async with GlobalVariables.db_sessionmaker() as db_session:
+            db_packets = (await db_session.execute(
+                sa.select(db.Packet)
+                .options(orm.load_only(db.Packet.id, db.Packet.packet))
+                .where(
+                    db.Packet.packet.is_not(None),
+                    db.Packet.inserted_at < sa.func.now() - timedelta(seconds=self.after)
+                )
+                .order_by(db.Packet.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )).scalars().all()
+
+            if not db_packets:
+                return 0
+
+            # Written before the rows are updated, a failed commit only leaves unreferenced bytes in the segment
+            locations = await asyncio.to_thread(
+                GlobalVariables.packet_store.append,
+                [
+                    typing.cast(bytes, db_packet.packet)
+                    for db_packet in db_packets
+                ]
+            )
+
+            for db_packet, location in zip(db_packets, locations):
+                db_packet.packet = None
+                db_packet.segment = location.segment
+                db_packet.segment_offset = location.offset
+                db_packet.segment_length = location.length
+
+            await db_session.commit()
+
+        return len(db_packets)
+
+    async def _archive_loop(self) -> None:
+        while True:
+            try:
+                moved = await self._archive_batch()
+
+            except Exception as ex:
+                moved = 0
+
+                GlobalVariables.logger.exception(
+                    msg = "failed to move packets to the packet store",
+                    exc_info = ex
+                )
+
+            self.moved += moved
+
+            if moved < self.batch_size:
+                await asyncio.sleep(self.interval)
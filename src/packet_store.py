@@ -0,0 +1,134 @@
+from abc import ABC, abstractmethod
+from threading import Lock
+from pathlib import Path
+
+import mmap
+import os
+import typing
+import zstandard
+
+from src import utils
+
+
+SEGMENT_FILENAME_SUFFIX = ".zst"
+
+
+class PacketLocation(typing.NamedTuple):
+    segment: str
+    offset: int
+    length: int
+
+
+class PacketStore(ABC):
+    """
+    Append-only storage of raw packets moved out of the database,
+    every packet is a separate zstd frame so it can be read alone.
+    """
+
+    def __init__(self, zstd_level: int) -> None:
+        self.zstd_level = zstd_level
+
+    # Blocking, zstd contexts are not thread-safe so every call has its own
+
+    def append(self, packets: list[bytes]) -> list[PacketLocation]:
+        """Packets are durable once it returns."""
+
+        compressor = zstandard.ZstdCompressor(level=self.zstd_level)
+
+        frames = [
+            compressor.compress(packet)
+            for packet in packets
+        ]
+
+        return self._append_frames(frames)
+
+    def read_many(self, locations: list[PacketLocation]) -> list[bytes]:
+        decompressor = zstandard.ZstdDecompressor()
+
+        return [
+            decompressor.decompress(self._read_frame(location))
+            for location in locations
+        ]
+
+    @abstractmethod
+    def _append_frames(self, frames: list[bytes]) -> list[PacketLocation]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _read_frame(self, location: PacketLocation) -> bytes:
+        raise NotImplementedError
+
+
+class LocalPacketStore(PacketStore):
+    def __init__(self, dirpath: Path, segment_max_size: int, zstd_level: int, mmaps_cache_size: int) -> None:
+        super().__init__(zstd_level)
+
+        self.dirpath = dirpath
+        self.segment_max_size = segment_max_size
+
+        self._lock = Lock()
+        self._segment: str | None = None
+        self._segment_size = 0
+        # Reads do not wait for appends, those fsync holding `_lock`
+        self._mmaps_lock = Lock()
+        # Every mapping keeps a file descriptor open
+        self._mmaps: utils.LRUCache[str, mmap.mmap] = utils.LRUCache(mmaps_cache_size)
+
+    def _get_new_segment(self) -> str:
+        # Unique between processes sharing the directory, segments are never appended to by two writers
+        return f"{utils.get_int_timestamp()}-{os.getpid()}-{os.urandom(4).hex()}{SEGMENT_FILENAME_SUFFIX}"
+
+    def _append_frames(self, frames: list[bytes]) -> list[PacketLocation]:
+        locations: list[PacketLocation] = []
+
+        with self._lock:
+            if self._segment is None or self._segment_size >= self.segment_max_size:
+                self.dirpath.mkdir(parents=True, exist_ok=True)
+
+                self._segment = self._get_new_segment()
+                self._segment_size = 0
+
+            with (self.dirpath / self._segment).open("ab") as file:
+                for frame in frames:
+                    locations.append(PacketLocation(
+                        segment = self._segment,
+                        offset = self._segment_size,
+                        length = len(frame)
+                    ))
+
+                    file.write(frame)
+
+                    self._segment_size += len(frame)
+
+                file.flush()
+                os.fsync(file.fileno())
+
+        return locations
+
+    def _read_frame(self, location: PacketLocation) -> bytes:
+        end = location.offset + location.length
+
+        # Held while slicing too, so no mapping is closed in the middle of a read
+        with self._mmaps_lock:
+            segment_mmap = self._mmaps.get(location.segment)
+
+            # The current segment grows after it was mapped
+            if segment_mmap is None or len(segment_mmap) < end:
+                if segment_mmap is not None:
+                    segment_mmap.close()
+
+                with (self.dirpath / location.segment).open("rb") as file:
+                    segment_mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+                for evicted_mmap in self._mmaps.set(location.segment, segment_mmap):
+                    evicted_mmap.close()
+
+            if len(segment_mmap) < end:
+                raise ValueError(f"Packet is out of the segment {location.segment}")
+
+            return segment_mmap[location.offset:end]
+
+    def close(self) -> None:
+        with self._mmaps_lock:
+            for segment_mmap in self._mmaps.clear():
+                segment_mmap.close()
@@ -4,7 +4,9 @@ from functools import partial
 
 import typing
 
+from src import enums
 # from . import admin  # type: ignore
+from ._constants import UPLOAD_TG_PACKETS_LIMIT
 from .base import BaseModel, BaseRequest, BaseResponse, Timestamp
 
 
@@ -27,6 +29,11 @@ class SupportedLayersResponse(BaseResponse):
         examples = [LAYER_EXAMPLES]
     )
 
+    supported_upload_formats: list[enums.TgPacketUploadFormat] = Field(
+        default_factory = list,
+        description = "List of supported packet upload formats"
+    )
+
 
 class UploadTgPacketRequest(BaseRequest):
     layer: int = Field(
@@ -62,6 +69,93 @@ class UploadTgPacketRequest(BaseRequest):
             raise ValueError("Invalid hex string")
 
 
+class UploadTgPacketsItem(BaseRequest):
+    layer: int | None = Field(
+        default = None,
+        description = "Telegram MTProto layer, overrides the shared one",
+        examples = LAYER_EXAMPLES
+    )
+
+    auth_key: str | None = Field(
+        default = None,
+        description = "Auth key used to get the packet (hex), overrides the shared one"
+    )
+
+    session_id: str | None = Field(
+        default = None,
+        description = "Session ID used to get the packet (hex), overrides the shared one"
+    )
+
+    packet: str = Field(
+        ...,
+        description = "Packet data (hex)"
+    )
+
+
+class UploadTgPacketsRequest(BaseRequest):
+    layer: int | None = Field(
+        default = None,
+        description = "Telegram MTProto layer shared by all packets",
+        examples = LAYER_EXAMPLES
+    )
+
+    auth_key: str | None = Field(
+        default = None,
+        description = "Auth key shared by all packets (hex)"
+    )
+
+    session_id: str | None = Field(
+        default = None,
+        description = "Session ID shared by all packets (hex)"
+    )
+
+    packets: list[UploadTgPacketsItem] = Field(
+        ...,
+        min_length = 1,
+        max_length = UPLOAD_TG_PACKETS_LIMIT,
+        description = "Packets to upload"
+    )
+
+    def get_item_request(self, item: UploadTgPacketsItem) -> UploadTgPacketRequest:
+        layer = item.layer if item.layer is not None else self.layer
+        auth_key = item.auth_key if item.auth_key is not None else self.auth_key
+        session_id = item.session_id if item.session_id is not None else self.session_id
+
+        if layer is None or auth_key is None or session_id is None:
+            raise ValueError("layer, auth_key and session_id must be set either per packet or shared")
+
+        return UploadTgPacketRequest(
+            layer = layer,
+            auth_key = auth_key,
+            session_id = session_id,
+            packet = item.packet
+        )
+
+
+class UploadTgPacketResult(BaseModel):
+    ok: bool = Field(
+        ...,
+        description = "True if the packet was processed"
+    )
+
+    description: str | None = Field(
+        default = None,
+        description = "Reason the packet was rejected"
+    )
+
+    added_messages: int = Field(
+        default = 0,
+        description = "Amount of new messages stored from the packet"
+    )
+
+
+class UploadTgPacketsResponse(BaseResponse):
+    results: list[UploadTgPacketResult] = Field(
+        ...,
+        description = "Per-packet results, in the order of the request"
+    )
+
+
 class Message(BaseModel):
     id: int = Field(
         ...,
@@ -98,19 +192,19 @@ class Message(BaseModel):
         description = "Datetime when the message was sent (UTC)"
     )
 
-    used_auth_key: str = Field(
-        ...,
-        description = "Auth key used to get the packet (hex)"
+    used_auth_key: str | None = Field(
+        default = None,
+        description = "Auth key used to get the packet (hex), only with `include_raw`"
     )
 
-    used_session_id: str = Field(
-        ...,
-        description = "Session ID used to get the packet (hex)"
+    used_session_id: str | None = Field(
+        default = None,
+        description = "Session ID used to get the packet (hex), only with `include_raw`"
     )
 
-    packet: str = Field(
-        ...,
-        description = "Packet data (hex)"
+    packet: str | None = Field(
+        default = None,
+        description = "Packet data (hex), only with `include_raw`"
     )
 
     inserted_at: MODEL_TIMESTAMP_T = Field_timestamp(
@@ -130,7 +224,118 @@ class ListMessages(BaseResponse):
         description = "List of messages"
     )
 
-    # has_next: bool = Field(
-    #     ...,
-    #     description = "True if there are more messages to fetch"
-    # )
+    has_next: bool = Field(
+        ...,
+        description = "True if there are more messages to fetch"
+    )
+
+    next_cursor: str | None = Field(
+        default = None,
+        description = "Cursor of the next page, null if there are no more messages"
+    )
+
+
+class CacheStats(BaseModel):
+    size: int = Field(
+        ...,
+        description = "Amount of cached entries"
+    )
+
+    max_size: int = Field(
+        ...,
+        description = "Maximum amount of cached entries"
+    )
+
+    hits: int = Field(
+        ...,
+        description = "Amount of lookups answered by the cache"
+    )
+
+    misses: int = Field(
+        ...,
+        description = "Amount of lookups not answered by the cache"
+    )
+
+
+class IngestQueueStats(BaseModel):
+    depth: int = Field(
+        ...,
+        description = "Amount of packets waiting in memory"
+    )
+
+    max_size: int = Field(
+        ...,
+        description = "Maximum amount of packets kept in memory"
+    )
+
+    lag: float = Field(
+        ...,
+        description = "Seconds the oldest packet waiting in memory has been queued for, 0 if there is none"
+    )
+
+    processed: int = Field(
+        ...,
+        description = "Amount of written packets"
+    )
+
+    failed: int = Field(
+        ...,
+        description = "Amount of packets rejected on writing or dropped after all attempts"
+    )
+
+    retried: int = Field(
+        ...,
+        description = "Amount of write attempts of packets repeated after a failure"
+    )
+
+    rejected: int = Field(
+        ...,
+        description = "Amount of packets rejected because the queue was full"
+    )
+
+    spilled: int = Field(
+        ...,
+        description = "Amount of packets spilled to disk because the queue was full"
+    )
+
+    restored: int = Field(
+        ...,
+        description = "Amount of spilled packets moved back to the queue"
+    )
+
+
+class StatsResponse(BaseResponse):
+    known_tg_chat_ids: CacheStats = Field(
+        ...,
+        description = "Cache of Telegram chat IDs known to exist in the database"
+    )
+
+    known_tg_user_ids: CacheStats = Field(
+        ...,
+        description = "Cache of Telegram user IDs known to exist in the database"
+    )
+
+    known_tg_sessions: CacheStats = Field(
+        ...,
+        description = "Cache of row IDs of auth key and session ID pairs stored in the database"
+    )
+
+    auth_keys_data: CacheStats = Field(
+        ...,
+        description = "Cache of auth key IDs and key derivation parts, in-process parsing only"
+    )
+
+    ingest_queue: IngestQueueStats | None = Field(
+        default = None,
+        description = "Ingest queue state, null if the queue is disabled"
+    )
+
+    md_text_backfill_rendered: int | None = Field(
+        default = None,
+        description = "Amount of markdown texts rendered by the backfill job, null if the job is disabled"
+    )
+
+    packet_archiver_moved: int | None = Field(
+        default = None,
+        description = "Amount of packets moved to the packet store, null if cold storage is disabled"
+    )
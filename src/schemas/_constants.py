@@ -0,0 +1 @@
+UPLOAD_TG_PACKETS_LIMIT = 1000
@@ -0,0 +1,87 @@
+import struct
+import typing
+
+
+TG_PACKET_FRAMES_MEDIA_TYPE = "application/octet-stream"
+
+# layer, auth_key length, session_id length, packet length
+FRAME_HEADER = struct.Struct("<IHHI")
+
+# Far above any MTProto packet, bounds a single frame of a malformed body
+MAX_PACKET_LENGTH = 16 * 1024 * 1024
+
+
+class TgPacketFrame(typing.NamedTuple):
+    layer: int
+    auth_key: bytes
+    session_id: bytes
+    packet: bytes
+
+
+def pack_tg_packet_frames(frames: typing.Iterable[TgPacketFrame]) -> bytes:
+    """
+    Empty ``auth_key``/``session_id`` are written for frames that reuse
+    the values of the previous frame.
+    """
+    chunks: list[bytes] = []
+
+    previous_auth_key: bytes | None = None
+    previous_session_id: bytes | None = None
+
+    for frame in frames:
+        auth_key = b"" if frame.auth_key == previous_auth_key else frame.auth_key
+        session_id = b"" if frame.session_id == previous_session_id else frame.session_id
+
+        chunks.append(FRAME_HEADER.pack(frame.layer, len(auth_key), len(session_id), len(frame.packet)))
+        chunks.append(auth_key)
+        chunks.append(session_id)
+        chunks.append(frame.packet)
+
+        previous_auth_key = frame.auth_key
+        previous_session_id = frame.session_id
+
+    return b"".join(chunks)
+
+
+def unpack_tg_packet_frames(data: bytes | bytearray | memoryview) -> list[TgPacketFrame]:
+    view = memoryview(data)
+    position = 0
+    frames: list[TgPacketFrame] = []
+
+    auth_key: bytes | None = None
+    session_id: bytes | None = None
+
+    while position < len(view):
+        if position + FRAME_HEADER.size > len(view):
+            raise ValueError(f"Truncated frame header at offset {position}")
+
+        layer, auth_key_length, session_id_length, packet_length = FRAME_HEADER.unpack_from(view, position)
+        position += FRAME_HEADER.size
+
+        if packet_length > MAX_PACKET_LENGTH:
+            raise ValueError(f"Packet of the frame at offset {position - FRAME_HEADER.size} is longer than {MAX_PACKET_LENGTH} bytes")
+
+        if position + auth_key_length + session_id_length + packet_length > len(view):
+            raise ValueError(f"Truncated frame body at offset {position}")
+
+        if auth_key_length:
+            auth_key = bytes(view[position:position + auth_key_length])
+            position += auth_key_length
+
+        if session_id_length:
+            session_id = bytes(view[position:position + session_id_length])
+            position += session_id_length
+
+        if auth_key is None or session_id is None:
+            raise ValueError("First frame must contain auth_key and session_id")
+
+        frames.append(TgPacketFrame(
+            layer = layer,
+            auth_key = auth_key,
+            session_id = session_id,
+            packet = bytes(view[position:position + packet_length])
+        ))
+
+        position += packet_length
+
+    return frames
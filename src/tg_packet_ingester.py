@@ -0,0 +1,564 @@
+from telethon.tl import types as tl_types
+from telethon.tl.tlobject import TLObject
+from telethon.tl.core import TLMessage
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from functools import partial
+
+import asyncio
+import hashlib
+import sqlalchemy as sa
+import typing
+
+from src import db, enums, schemas, utils
+from src.config import config
+from src.global_variables import GlobalVariables
+from src.layers_registry import get_layer
+from src.messages_partitions import get_messages_months
+from src.tg_packet_frames import TgPacketFrame
+from src.tg_packet_parser import parse_tg_packet, BinaryReader, attach_tg_readers
+from src.markdown_utils import unparse_markdown, serialize_entities
+
+
+# Result description of a packet that may be stored on a retry
+STORE_FAILED_DESCRIPTION = "Failed to store packet"
+
+
+class TgMessageRecord(typing.NamedTuple):
+    tg_chat_id: int
+    tg_user_id: int
+    tg_message_id: int
+    reply_to_tg_message_id: int | None
+    md_text: str | None
+    text: str | None
+    entities: list[dict[str, typing.Any]] | None
+    sent_at: datetime
+
+
+def _is_tlobject_same_by_constructor_id(tlobject: TLObject, name: str, needed_layers_tlobject_constructor_ids: dict[str, int]) -> bool:
+    return tlobject and typing.cast(int, tlobject.CONSTRUCTOR_ID) == needed_layers_tlobject_constructor_ids[name]
+
+
+def is_layer_supported(layer: int) -> bool:
+    return layer in GlobalVariables.layers_dirpaths
+
+
+def extract_tg_message_records(layer: int, auth_key: bytes, session_id: bytes, packet: bytes) -> list[TgMessageRecord] | None:
+    loaded_layer = get_layer(layer)
+
+    tlobjects = loaded_layer.tlobjects
+    core_objects = loaded_layer.core_objects
+
+    skip_readers = (
+        loaded_layer.selective_skip_readers
+        if config.tg_packet_selective_decoding
+        else
+        None
+    )
+
+    tl_message = parse_tg_packet(
+        packet = packet,
+        auth_key = auth_key,
+        session_id = session_id,
+        tlobjects = tlobjects,
+        core_objects = core_objects,
+        skip_readers = skip_readers
+    )
+
+    if tl_message is None:
+        return None
+
+    is_tlobject_same_by_constructor_id = partial(
+        _is_tlobject_same_by_constructor_id,
+        needed_layers_tlobject_constructor_ids = loaded_layer.needed_tlobjects_constructor_ids
+    )
+
+    # Rendered later by `render_md_texts`
+    defer_md_text = config.md_text_rendering != enums.MdTextRendering.INGEST
+
+    records: list[TgMessageRecord] = []
+
+    tg_obj = tl_message.obj  # type: ignore
+    tg_objs: list[TLMessage]
+
+    if is_tlobject_same_by_constructor_id(tg_obj, "MessageContainer"):  # type: ignore
+        tg_objs = [  # type: ignore
+            tl_message.obj  # type: ignore
+            for tl_message in tg_obj.messages  # type: ignore
+        ]
+
+    else:
+        tg_objs = [tg_obj]  # type: ignore
+
+    for tg_obj in tg_objs:
+        if is_tlobject_same_by_constructor_id(tg_obj, "GzipPacked"):  # type: ignore
+            with BinaryReader(tg_obj.data) as reader:  # type: ignore
+                attach_tg_readers(
+                    reader = reader,
+                    tlobjects = tlobjects,
+                    core_objects = core_objects,
+                    skip_readers = skip_readers
+                )
+
+                tg_obj = reader.tgread_object()  # type: ignore
+
+        tg_messages: list[tl_types.TypeMessage] = []
+        # chats: list[tl_types.TypeChat] = []
+        tg_users: list[tl_types.TypeUser] = []
+
+        if is_tlobject_same_by_constructor_id(tg_obj, "Updates"):  # type: ignore
+            for update in tg_obj.updates:  # type: ignore
+                if is_tlobject_same_by_constructor_id(update, "UpdateNewChannelMessage"):  # type: ignore
+                    tg_messages.append(update.message)  # type: ignore
+
+            # chats.extend(tg_obj.chats)  # type: ignore
+            tg_users.extend(tg_obj.users)  # type: ignore
+
+        elif is_tlobject_same_by_constructor_id(tg_obj, "ChannelDifference"):  # type: ignore
+            tg_messages.extend(tg_obj.new_messages)  # type: ignore
+            # chats.extend(tg_obj.chats)  # type: ignore
+            tg_users.extend(tg_obj.users)  # type: ignore
+
+        elif is_tlobject_same_by_constructor_id(tg_obj, "ChannelDifferenceTooLong"):  # type: ignore
+            tg_messages.extend(tg_obj.messages)  # type: ignore
+            # chats.extend(tg_obj.chats)  # type: ignore
+            tg_users.extend(tg_obj.users)  # type: ignore
+
+        tg_users_by_id: dict[int, tl_types.User] = {
+            tg_user_obj.id: tg_user_obj  # type: ignore
+            for tg_user_obj in reversed(tg_users)
+            if is_tlobject_same_by_constructor_id(tg_user_obj, "User")  # type: ignore
+        }
+
+        for message in tg_messages:
+            if is_tlobject_same_by_constructor_id(message, "Message"):  # type: ignore
+                if is_tlobject_same_by_constructor_id(message.peer_id, "PeerChannel") and is_tlobject_same_by_constructor_id(message.from_id, "PeerUser"):  # type: ignore
+                    # tg_chat_obj = None  # type: ignore
+
+                    # for tg_chat_obj_ in tg_chats:  # type: ignore
+                    #     if is_tlobject_same_by_constructor_id(tg_chat_obj_, "Channel") and tg_chat_obj_.id == message.peer_id.channel_id:  # type: ignore
+                    #         tg_chat_obj = tg_chat_obj_  # type: ignore
+                    #         break
+
+                    tg_user_obj = tg_users_by_id.get(message.from_id.user_id)  # type: ignore
+
+                    if tg_user_obj and tg_user_obj.bot:  # type: ignore
+                        continue
+
+                    reply_to_tg_message_id = None
+
+                    if is_tlobject_same_by_constructor_id(message.reply_to, "MessageReplyHeader") and not message.reply_to.reply_to_peer_id:  # type: ignore
+                        reply_to_tg_message_id = typing.cast(int, message.reply_to.reply_to_msg_id)  # type: ignore
+
+                    message_text = typing.cast(str | None, message.message)  # type: ignore
+
+                    md_text: str | None = None
+                    text: str | None = None
+                    entities: list[dict[str, typing.Any]] | None = None
+
+                    if message_text:
+                        message_entities = [
+                            # Skipped by selective decoding
+                            entity
+                            for entity in message.entities or []  # type: ignore
+                            if entity is not None
+                        ]
+
+                        if defer_md_text:
+                            text = message_text
+                            entities = serialize_entities(message_entities)
+                        else:
+                            md_text = unparse_markdown(message_text, message_entities)
+
+                    records.append(TgMessageRecord(
+                        tg_chat_id = -1 * (typing.cast(int, message.peer_id.channel_id) + 1_000_000_000_000),  # type: ignore
+                        tg_user_id = typing.cast(int, message.from_id.user_id),  # type: ignore
+                        tg_message_id = typing.cast(int, message.id),  # type: ignore
+                        reply_to_tg_message_id = reply_to_tg_message_id,
+                        md_text = md_text,
+                        text = text,
+                        entities = entities,
+                        # Stored as is, not shifted by the session time zone, it is a part of the dedup key
+                        sent_at = utils.get_naive_datetime_utc(message.date)  # type: ignore
+                    ))
+
+    return records
+
+
+def create_tg_packet_parser_executor(kind: enums.TgPacketParserExecutor, workers: int | None) -> Executor | None:
+    if kind == enums.TgPacketParserExecutor.THREAD:
+        return ThreadPoolExecutor(
+            max_workers = workers,
+            thread_name_prefix = "tg_packet_parser"
+        )
+
+    elif kind == enums.TgPacketParserExecutor.PROCESS:
+        return ProcessPoolExecutor(
+            max_workers = workers
+        )
+
+    return None
+
+
+def _extract_tg_message_records_in_executor(layer: int, auth_key: bytes, session_id: bytes, packet: bytes) -> list[TgMessageRecord] | None:
+    """
+    Exceptions are replaced with plain ones, those of Telethon like `TypeNotFoundError`
+    can not be unpickled and would break the whole process pool.
+    """
+
+    try:
+        return extract_tg_message_records(
+            layer = layer,
+            auth_key = auth_key,
+            session_id = session_id,
+            packet = packet
+        )
+
+    except ValueError as ex:
+        raise ValueError(str(ex)) from None
+
+    except Exception as ex:
+        raise RuntimeError(f"{type(ex).__name__}: {ex}") from None
+
+
+async def extract_tg_message_records_async(layer: int, auth_key: bytes, session_id: bytes, packet: bytes) -> list[TgMessageRecord] | None:
+    """Runs `extract_tg_message_records` in the configured parser executor, inline if there is none."""
+
+    executor = GlobalVariables.tg_packet_parser_executor
+
+    if executor is None:
+        return extract_tg_message_records(
+            layer = layer,
+            auth_key = auth_key,
+            session_id = session_id,
+            packet = packet
+        )
+
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            _extract_tg_message_records_in_executor,
+            layer,
+            auth_key,
+            session_id,
+            packet
+        )
+
+    except BrokenProcessPool:
+        # Every pending packet of the pool fails with it, the first one replaces the pool
+        if GlobalVariables.tg_packet_parser_executor is executor:
+            GlobalVariables.logger.error("packet parser process pool is broken, recreating it")
+
+            GlobalVariables.tg_packet_parser_executor = create_tg_packet_parser_executor(
+                kind = config.tg_packet_parser_executor,
+                workers = config.tg_packet_parser_workers
+            )
+
+            executor.shutdown(wait=False)
+
+        raise
+
+
+def get_tg_packet_hash(packet: bytes) -> bytes:
+    return hashlib.sha256(packet).digest()
+
+
+async def get_stored_tg_packet_hashes(db_session: db.DBSession, packet_hashes: typing.Iterable[bytes]) -> set[bytes]:
+    """Cheap enough to reject already stored packets before decryption."""
+
+    packet_hashes = set(packet_hashes)
+
+    if not packet_hashes:
+        return set()
+
+    return set((await db_session.execute(
+        sa.select(db.Packet.packet_hash)
+        .where(db.Packet.packet_hash.in_(packet_hashes))
+    )).scalars().all())
+
+
+async def store_tg_session(db_session: db.DBSession, auth_key: bytes, session_id: bytes) -> int:
+    """Returns ID of the row of the auth key and session ID pair, inserts it if needed."""
+
+    session_row_id = GlobalVariables.known_tg_sessions.get((auth_key, session_id))
+
+    if session_row_id is not None:
+        return session_row_id
+
+    insert_query = pg_insert(db.Session).values(
+        auth_key_hash = hashlib.sha256(auth_key).digest(),
+        auth_key = auth_key,
+        session_id = session_id
+    )
+
+    # No-op update, so the ID of an existing row is returned too
+    return (await db_session.execute(
+        insert_query
+        .on_conflict_do_update(
+            index_elements = [db.Session.auth_key_hash, db.Session.session_id],
+            set_ = {
+                "auth_key": insert_query.excluded.auth_key
+            }
+        )
+        .returning(db.Session.id)
+    )).scalar_one()
+
+
+async def store_tg_message_records(db_session: db.DBSession, records: list[TgMessageRecord], session_row_id: int, packet: bytes) -> int | None:
+    """Returns amount of new messages, `None` if the packet is already stored."""
+
+    # Only the hash of a packet without messages is kept, so its
+    # re-uploads are rejected before decryption too
+    packet_row_id = (await db_session.execute(
+        pg_insert(db.Packet)
+        .values(
+            packet_hash = get_tg_packet_hash(packet),
+            packet = packet if records else None
+        )
+        .on_conflict_do_nothing(
+            index_elements = [db.Packet.packet_hash]
+        )
+        .returning(db.Packet.id)
+    )).scalar_one_or_none()
+
+    if packet_row_id is None:
+        return None
+
+    if not records:
+        return 0
+
+    # Sorted to keep the row lock order stable between concurrent uploads
+    new_tg_chat_ids = sorted(
+        tg_chat_id
+        for tg_chat_id in {record.tg_chat_id for record in records}
+        if not GlobalVariables.known_tg_chat_ids.get(tg_chat_id)
+    )
+
+    new_tg_user_ids = sorted(
+        tg_user_id
+        for tg_user_id in {record.tg_user_id for record in records}
+        if not GlobalVariables.known_tg_user_ids.get(tg_user_id)
+    )
+
+    if new_tg_chat_ids:
+        await db_session.execute(
+            pg_insert(db.Chat)
+            .values([
+                {
+                    "tg_chat_id": tg_chat_id
+                }
+                for tg_chat_id in new_tg_chat_ids
+            ])
+            .on_conflict_do_nothing(
+                index_elements = [db.Chat.tg_chat_id]
+            )
+        )
+
+    if new_tg_user_ids:
+        await db_session.execute(
+            pg_insert(db.User)
+            .values([
+                {
+                    "tg_user_id": tg_user_id
+                }
+                for tg_user_id in new_tg_user_ids
+            ])
+            .on_conflict_do_nothing(
+                index_elements = [db.User.tg_user_id]
+            )
+        )
+
+    unique_records = {
+        (record.tg_chat_id, record.tg_message_id): record
+        for record in reversed(records)
+    }
+
+    db_result = await db_session.execute(
+        pg_insert(db.Message)
+        .values([
+            {
+                "tg_chat_id": record.tg_chat_id,
+                "tg_user_id": record.tg_user_id,
+                "tg_message_id": record.tg_message_id,
+                "reply_to_tg_message_id": record.reply_to_tg_message_id,
+                "md_text": record.md_text,
+                "text": record.text,
+                "entities": record.entities,
+                "sent_at": record.sent_at,
+                "used_session_row_id": session_row_id,
+                "packet_row_id": packet_row_id
+            }
+            for _, record in sorted(unique_records.items())
+        ])
+        .on_conflict_do_nothing(
+            index_elements = [db.Message.tg_chat_id, db.Message.tg_message_id, db.Message.sent_at]
+        )
+        .returning(db.Message.id)
+    )
+
+    return len(db_result.all())
+
+
+def remember_tg_message_records(records: list[TgMessageRecord]) -> None:
+    """Must be called only after the transaction that stored ``records`` is committed."""
+
+    for record in records:
+        GlobalVariables.known_tg_chat_ids.set(record.tg_chat_id, True)
+        GlobalVariables.known_tg_user_ids.set(record.tg_user_id, True)
+
+
+def remember_tg_session(auth_key: bytes, session_id: bytes, session_row_id: int) -> None:
+    """Must be called only after the transaction that stored the session is committed."""
+
+    GlobalVariables.known_tg_sessions.set((auth_key, session_id), session_row_id)
+
+
+async def ingest_tg_packet_frames(db_session: db.DBSession, frames: list[TgPacketFrame | str]) -> list[schemas.UploadTgPacketResult]:
+    """
+    ``str`` items are rejected up front with themselves as the description.
+    Every packet is stored inside its own savepoint, so a failing packet
+    does not abort the rest, and everything is committed at once.
+    """
+
+    results = [
+        schemas.UploadTgPacketResult(
+            ok = False,
+            description = (
+                frame
+                if isinstance(frame, str)
+                else
+                None
+            )
+        )
+        for frame in frames
+    ]
+
+    parsed_packets: list[tuple[int, list[TgMessageRecord], TgPacketFrame]] = []
+    parsing_indexes: list[int] = []
+
+    packet_hashes = {
+        index: get_tg_packet_hash(frame.packet)
+        for index, frame in enumerate(frames)
+        if not isinstance(frame, str)
+    }
+
+    # Also the ones repeated within the batch
+    seen_packet_hashes = await get_stored_tg_packet_hashes(db_session, packet_hashes.values())
+
+    for index, frame in enumerate(frames):
+        if isinstance(frame, str):
+            continue
+
+        if not is_layer_supported(frame.layer):
+            results[index].description = f"Layer {frame.layer} is not supported"
+            continue
+
+        if packet_hashes[index] in seen_packet_hashes:
+            results[index].description = "Duplicate packet"
+            continue
+
+        seen_packet_hashes.add(packet_hashes[index])
+
+        parsing_indexes.append(index)
+
+    parsing_results = await asyncio.gather(
+        *[
+            extract_tg_message_records_async(
+                layer = frame.layer,
+                auth_key = frame.auth_key,
+                session_id = frame.session_id,
+                packet = frame.packet
+            )
+            for frame in (
+                typing.cast(TgPacketFrame, frames[index])
+                for index in parsing_indexes
+            )
+        ],
+        return_exceptions = True
+    )
+
+    for index, records in zip(parsing_indexes, parsing_results):
+        result = results[index]
+
+        if isinstance(records, ValueError):
+            result.description = f"Invalid packet content: {records}"
+            continue
+
+        elif isinstance(records, BaseException):
+            GlobalVariables.logger.exception(
+                msg = "failed to parse packet",
+                exc_info = records
+            )
+
+            result.description = "Invalid packet content"
+            continue
+
+        elif records is None:
+            result.description = "Invalid packet content"
+            continue
+
+        parsed_packets.append((index, records, typing.cast(TgPacketFrame, frames[index])))
+
+    await GlobalVariables.messages_partitioner.ensure_months(get_messages_months(
+        record.sent_at
+        for _, records, _ in parsed_packets
+        for record in records
+    ))
+
+    # Sessions stored by the savepoints that succeeded
+    session_row_ids: dict[tuple[bytes, bytes], int] = {}
+
+    for index, records, frame in parsed_packets:
+        result = results[index]
+
+        session_key = (frame.auth_key, frame.session_id)
+
+        try:
+            async with db_session.begin_nested():
+                session_row_id = session_row_ids.get(session_key)
+
+                if session_row_id is None:
+                    session_row_id = await store_tg_session(
+                        db_session = db_session,
+                        auth_key = frame.auth_key,
+                        session_id = frame.session_id
+                    )
+
+                added_messages = await store_tg_message_records(
+                    db_session = db_session,
+                    records = records,
+                    session_row_id = session_row_id,
+                    packet = frame.packet
+                )
+
+        except Exception as ex:
+            GlobalVariables.logger.exception(
+                msg = "failed to store packet",
+                exc_info = ex
+            )
+
+            result.description = STORE_FAILED_DESCRIPTION
+            continue
+
+        session_row_ids[session_key] = session_row_id
+
+        # Stored concurrently since the check
+        if added_messages is None:
+            result.description = "Duplicate packet"
+            continue
+
+        result.ok = True
+        result.added_messages = added_messages
+
+    await db_session.commit()
+
+    for index, records, _ in parsed_packets:
+        if results[index].ok:
+            remember_tg_message_records(records)
+
+    for (auth_key, session_id), session_row_id in session_row_ids.items():
+        remember_tg_session(auth_key, session_id, session_row_id)
+
+    return results
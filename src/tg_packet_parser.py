@@ -9,11 +9,44 @@ from functools import partial
 import struct
 import typing
 
+from src import utils
 
-def _calc_key(auth_key: bytes, msg_key: bytes) -> tuple[bytes, bytes]:
-    x = 8
-    sha256a = sha256(msg_key + auth_key[x: x + 36]).digest()
-    sha256b = sha256(auth_key[x + 40:x + 76] + msg_key).digest()
+
+AUTH_KEYS_DATA_CACHE_SIZE = 1_024
+
+
+class AuthKeyData(typing.NamedTuple):
+    auth_key_id: bytes
+    aes_key_a_part: bytes  # auth_key[8:44]
+    aes_key_b_part: bytes  # auth_key[48:84]
+    msg_key_part: bytes  # auth_key[96:128]
+
+
+auth_keys_data_cache: utils.LRUCache[bytes, AuthKeyData] = utils.LRUCache(AUTH_KEYS_DATA_CACHE_SIZE)
+
+
+def get_auth_key_data(auth_key: bytes) -> AuthKeyData:
+    auth_key_data = auth_keys_data_cache.get(auth_key)
+
+    if auth_key_data is None:
+        # x = 8 for messages sent by the server
+        x = 8
+
+        auth_key_data = AuthKeyData(
+            auth_key_id = sha1(auth_key).digest()[-8:],
+            aes_key_a_part = auth_key[x:x + 36],
+            aes_key_b_part = auth_key[x + 40:x + 76],
+            msg_key_part = auth_key[88 + x:88 + x + 32]
+        )
+
+        auth_keys_data_cache.set(auth_key, auth_key_data)
+
+    return auth_key_data
+
+
+def _calc_key(auth_key_data: AuthKeyData, msg_key: bytes) -> tuple[bytes, bytes]:
+    sha256a = sha256(msg_key + auth_key_data.aes_key_a_part).digest()
+    sha256b = sha256(auth_key_data.aes_key_b_part + msg_key).digest()
 
     aes_key = sha256a[:8] + sha256b[8:24] + sha256a[24:32]
     aes_iv = sha256b[:8] + sha256a[8:24] + sha256b[24:32]
@@ -22,9 +55,23 @@ def _calc_key(auth_key: bytes, msg_key: bytes) -> tuple[bytes, bytes]:
 
 
 POSSIBLE_READ_RESSULT_T = TLObject | bool | list["POSSIBLE_READ_RESSULT_T"] | None
+SKIP_READER_T = typing.Callable[[BinaryReader], None]
+
+def tgread_object(reader: BinaryReader, tlobjects: dict[int, TLObject], core_objects: dict[int, TLObject], skip_readers: dict[int, SKIP_READER_T] | None=None) -> POSSIBLE_READ_RESSULT_T:
+    """
+    Objects with constructor IDs found in ``skip_readers`` are skipped
+    without being built and read as ``None``.
+    """
 
-def tgread_object(reader: BinaryReader, tlobjects: dict[int, TLObject], core_objects: dict[int, TLObject]) -> POSSIBLE_READ_RESSULT_T:
     constructor_id = reader.read_int(signed=False)
+
+    if skip_readers is not None:
+        skip_reader = skip_readers.get(constructor_id, None)
+
+        if skip_reader is not None:
+            skip_reader(reader)
+            return None
+
     clazz = tlobjects.get(constructor_id, None)
 
     if clazz is None:
@@ -36,7 +83,7 @@ def tgread_object(reader: BinaryReader, tlobjects: dict[int, TLObject], core_obj
 
         elif constructor_id == 0x1cb5c415:  # Vector
             return [
-                tgread_object(reader, tlobjects, core_objects)
+                tgread_object(reader, tlobjects, core_objects, skip_readers)
                 for _ in range(reader.read_int())
             ]
 
@@ -52,19 +99,64 @@ def tgread_object(reader: BinaryReader, tlobjects: dict[int, TLObject], core_obj
     return clazz.from_reader(reader)  # type: ignore
 
 
-def decrypt_message_data(body: bytes, auth_key: bytes, auth_key_id: bytes, session_id: bytes, tlobjects: dict[int, TLObject], core_objects: dict[int, TLObject]) -> TLMessage:
+def tgskip_object(reader: BinaryReader, tlobjects: dict[int, TLObject], core_objects: dict[int, TLObject]) -> None:
+    """
+    Advances the reader past a boxed object, used by generated ``skip_reader``
+    for nested objects.
+    """
+
+    constructor_id = reader.read_int(signed=False)
+
+    if constructor_id in (0x997275b5, 0xbc799737):  # boolTrue, boolFalse
+        return
+
+    elif constructor_id == 0x1cb5c415:  # Vector
+        for _ in range(reader.read_int()):
+            tgskip_object(reader, tlobjects, core_objects)
+
+        return
+
+    clazz = tlobjects.get(constructor_id, None)
+
+    if clazz is None:
+        # Core objects have no generated skip reader
+        reader.seek(-4)  # type: ignore
+        tgread_object(reader, tlobjects, core_objects)
+        return
+
+    clazz.skip_reader(reader)  # type: ignore
+
+
+def attach_tg_readers(reader: BinaryReader, tlobjects: dict[int, TLObject], core_objects: dict[int, TLObject], skip_readers: dict[int, SKIP_READER_T] | None=None) -> None:
+    reader.tgread_object = partial(  # type: ignore
+        tgread_object,
+        reader = reader,
+        tlobjects = tlobjects,
+        core_objects = core_objects,
+        skip_readers = skip_readers
+    )
+
+    reader.tgskip_object = partial(  # type: ignore
+        tgskip_object,
+        reader = reader,
+        tlobjects = tlobjects,
+        core_objects = core_objects
+    )
+
+
+def decrypt_message_data(body: bytes, auth_key_data: AuthKeyData, session_id: bytes, tlobjects: dict[int, TLObject], core_objects: dict[int, TLObject], skip_readers: dict[int, SKIP_READER_T] | None=None) -> TLMessage:
     if len(body) < 8:
         raise ValueError("Body is too short")
 
     # TODO Check salt, session_id and sequence_number
-    if body[:8] != auth_key_id:
+    if body[:8] != auth_key_data.auth_key_id:
         raise ValueError('Packet contains an invalid auth key')
 
     msg_key = body[8:24]
-    aes_key, aes_iv = _calc_key(auth_key, msg_key)
+    aes_key, aes_iv = _calc_key(auth_key_data, msg_key)
     body = typing.cast(bytes, AES.decrypt_ige(body[24:], aes_key, aes_iv))  # type: ignore
 
-    our_key = sha256(auth_key[96:96 + 32] + body)
+    our_key = sha256(auth_key_data.msg_key_part + body)
 
     if msg_key != our_key.digest()[8:24]:
         raise ValueError("Packet's msg_key doesn't match with expected one")
@@ -83,11 +175,11 @@ def decrypt_message_data(body: bytes, auth_key: bytes, auth_key_id: bytes, sessi
     remote_sequence = reader.read_int()
     reader.read_int()  # msg_len for the inner object, padding ignored
 
-    reader.tgread_object = partial(  # type: ignore
-        tgread_object,
+    attach_tg_readers(
         reader = reader,
         tlobjects = tlobjects,
-        core_objects = core_objects
+        core_objects = core_objects,
+        skip_readers = skip_readers
     )
 
     try:
@@ -98,17 +190,15 @@ def decrypt_message_data(body: bytes, auth_key: bytes, auth_key_id: bytes, sessi
     return TLMessage(remote_msg_id, remote_sequence, obj)  # type: ignore
 
 
-def parse_tg_packet(packet: bytes, auth_key: bytes, session_id: bytes, tlobjects: dict[int, TLObject], core_objects: dict[int, TLObject]) -> TLMessage | None:
-    auth_key_id = sha1(auth_key).digest()[-8:]
-
+def parse_tg_packet(packet: bytes, auth_key: bytes, session_id: bytes, tlobjects: dict[int, TLObject], core_objects: dict[int, TLObject], skip_readers: dict[int, SKIP_READER_T] | None=None) -> TLMessage | None:
     # try:
     return decrypt_message_data(
         body = packet,
-        auth_key = auth_key,
-        auth_key_id = auth_key_id,
+        auth_key_data = get_auth_key_data(auth_key),
         session_id = session_id,
         tlobjects = tlobjects,
-        core_objects = core_objects
+        core_objects = core_objects,
+        skip_readers = skip_readers
     )
 
     # except Exception:
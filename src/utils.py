@@ -1,4 +1,6 @@
 from time import time
+from collections import OrderedDict
+from threading import Lock
 from datetime import datetime, timezone
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
@@ -28,6 +30,9 @@ def get_datetime_utcnow() -> datetime:
 def get_datetime_utc_from_timestamp(timestamp: int) -> datetime:
     return datetime.fromtimestamp(timestamp, tz=UTC_TIMEZONE)
 
+def get_naive_datetime_utc(value: datetime) -> datetime:
+    return value.astimezone(UTC_TIMEZONE).replace(tzinfo=None)
+
 
 def get_logger(name: str, filepath: Path, file_level: int | str, console_level: int | str) -> logging.Logger:
     logger = logging.getLogger(name)
@@ -63,3 +68,54 @@ def merge_dicts(*dicts: dict[K, V]) -> dict[K, V]:
         result.update(dict_)
 
     return result
+
+
+class LRUCache(typing.Generic[K, V]):
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            try:
+                value = self._data[key]
+
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    def set(self, key: K, value: V) -> list[V]:
+        """Returns the evicted values."""
+
+        evicted_values: list[V] = []
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_size:
+                evicted_values.append(self._data.popitem(last=False)[1])
+
+        return evicted_values
+
+    def clear(self) -> list[V]:
+        """Returns the removed values."""
+
+        with self._lock:
+            values = list(self._data.values())
+
+            self._data.clear()
+
+        return values
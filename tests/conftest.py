@@ -0,0 +1,4 @@
+import os
+
+
+os.environ.setdefault("TG_ARCHIVE_BACKEND_CFG", "tests/config.yml")
@@ -0,0 +1,126 @@
+"""
+Frozen copy of ``unparse_markdown`` before it was reworked,
+the reference of the differential tests. Do not change it.
+"""
+
+from telethon.tl.types import TypeMessageEntity
+from struct import unpack
+
+import re
+
+from src.markdown_utils import MessageEntityType, DELIMITERS, BLOCKQUOTE_DELIM, BLOCKQUOTE_EXPANDABLE_DELIM, get_entity_type
+
+
+SMP_RE = re.compile(r"[\U00010000-\U0010FFFF]")
+
+
+def add_surrogates(text: str) -> str:
+    return SMP_RE.sub(
+        lambda match: "".join(chr(i) for i in unpack("<HH", match.group().encode("utf-16le"))),
+        text
+    )
+
+def remove_surrogates(text: str) -> str:
+    return text.encode("utf-16", "surrogatepass").decode("utf-16")
+
+def within_surrogate(text: str, index: int, *, length: int | None=None) -> bool:
+    if length is None:
+        length = len(text)
+
+    return (
+        1 < index < len(text) and
+        '\ud800' <= text[index - 1] <= '\udbff' and
+        '\ud800' <= text[index] <= '\udfff'
+    )
+
+
+def unparse_markdown(text: str, entities: list[TypeMessageEntity]) -> str:
+    text = add_surrogates(text)
+
+    insert_at: list[tuple[int, int, str]] = []
+
+    for i, entity in enumerate(entities):
+        s = entity.offset
+        e = entity.offset + entity.length
+        entity_type = get_entity_type(entity)  # type: ignore
+        delimiter = DELIMITERS.get(entity_type, None) if entity_type is not None else None
+        if delimiter:
+            if entity_type == MessageEntityType.PRE:
+                inside_blockquote = any(
+                    blk_entity.offset <= s < blk_entity.offset + blk_entity.length and
+                    blk_entity.offset < e <= blk_entity.offset + blk_entity.length
+                    for blk_entity in entities
+                    if get_entity_type(blk_entity) == MessageEntityType.BLOCKQUOTE
+                )
+                is_expandable = any(
+                    blk_entity.offset <= s < blk_entity.offset + blk_entity.length and
+                    blk_entity.offset < e <= blk_entity.offset + blk_entity.length and
+                    blk_entity.collapsed  # type: ignore
+                    for blk_entity in entities
+                    if get_entity_type(blk_entity) == MessageEntityType.BLOCKQUOTE
+                )
+                if inside_blockquote:
+                    if is_expandable:
+                        if entity.language:  # type: ignore
+                            open_delimiter = f"{delimiter}{entity.language}\n**>"  # type: ignore
+                        else:
+                            open_delimiter = f"{delimiter}\n**>"
+                        close_delimiter = f"\n**>{delimiter}"
+                    else:
+                        if entity.language:  # type: ignore
+                            open_delimiter = f"{delimiter}{entity.language}\n>"  # type: ignore
+                        else:
+                            open_delimiter = f"{delimiter}\n>"
+                        close_delimiter = f"\n>{delimiter}"
+                else:
+                    open_delimiter = delimiter
+                    close_delimiter = delimiter
+                insert_at.append((s, i, open_delimiter))
+                insert_at.append((e, -i, close_delimiter))
+            elif entity_type != MessageEntityType.BLOCKQUOTE and entity_type != MessageEntityType.EXPANDABLE_BLOCKQUOTE:
+                open_delimiter = delimiter
+                close_delimiter = delimiter
+                insert_at.append((s, i, open_delimiter))
+                insert_at.append((e, -i, close_delimiter))
+            else:
+                # Handle multiline blockquotes
+                text_subset = text[s:e]
+                lines = text_subset.splitlines()
+                for line_num, _ in enumerate(lines):
+                    line_start = s + sum(len(ll) + 1 for ll in lines[:line_num])
+                    if entity.collapsed:  # type: ignore
+                        insert_at.append((line_start, i, BLOCKQUOTE_EXPANDABLE_DELIM))
+                    else:
+                        insert_at.append((line_start, i, BLOCKQUOTE_DELIM))
+                # No closing delimiter for blockquotes
+        else:
+            url = None
+            is_emoji = False
+            if entity_type == MessageEntityType.TEXT_LINK:
+                url = entity.url  # type: ignore
+            elif entity_type == MessageEntityType.TEXT_MENTION:
+                url = f'tg://user?id={entity.user_id}'  # type: ignore
+            elif entity_type == MessageEntityType.CUSTOM_EMOJI:
+                url = f"tg://emoji?id={entity.document_id}"  # type: ignore
+                is_emoji = True
+            if url:
+                if is_emoji:
+                    insert_at.append((s, i, '!['))
+                else:
+                    insert_at.append((s, i, '['))
+                insert_at.append((e, -i, f']({url})'))
+
+    insert_at.sort(key=lambda t: (t[0], t[1]))
+    while insert_at:
+        at, _, what = insert_at.pop()
+
+        # If we are in the middle of a surrogate nudge the position by -1.
+        # Otherwise we would end up with malformed text and fail to encode.
+        # For example of bad input: "Hi \ud83d\ude1c"
+        # https://en.wikipedia.org/wiki/UTF-16#U+010000_to_U+10FFFF
+        while within_surrogate(text, at):
+            at += 1
+
+        text = text[:at] + what + text[at:]
+
+    return remove_surrogates(text)
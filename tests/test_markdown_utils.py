@@ -0,0 +1,93 @@
+from telethon.tl import types
+from telethon.tl.types import TypeMessageEntity
+
+import random
+import pytest
+
+from src.markdown_utils import unparse_markdown
+from tests import legacy_markdown_utils
+
+
+SEEDS = range(20)
+CASES_PER_SEED = 1_000
+
+# Surrogate pairs, line breaks of every kind and markdown delimiters
+ALPHABET = ["a", "b", " ", "\n", "\r\n", "\x85", " ", "é", "👍", "𝔘", "*", "_", "`", ">", "|", "~"]
+LANGUAGES = ["", "python"]
+
+
+def _get_utf16_length(text: str) -> int:
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _generate_entity(rng: random.Random, text_length: int) -> TypeMessageEntity:
+    # Offsets inside of surrogate pairs too, entities of malformed messages
+    offset = rng.randint(0, text_length)
+    length = rng.randint(0, text_length - offset)
+
+    return rng.choice([
+        lambda: types.MessageEntityBold(offset, length),
+        lambda: types.MessageEntityItalic(offset, length),
+        lambda: types.MessageEntityUnderline(offset, length),
+        lambda: types.MessageEntityStrike(offset, length),
+        lambda: types.MessageEntitySpoiler(offset, length),
+        lambda: types.MessageEntityCode(offset, length),
+        lambda: types.MessageEntityPre(offset, length, rng.choice(LANGUAGES)),
+        lambda: types.MessageEntityBlockquote(offset, length, collapsed=rng.random() < 0.5),
+        lambda: types.MessageEntityTextUrl(offset, length, "https://example.com"),
+        lambda: types.MessageEntityMentionName(offset, length, 42),
+        lambda: types.MessageEntityCustomEmoji(offset, length, 7),
+        lambda: types.MessageEntityUrl(offset, length),
+        lambda: types.MessageEntityMention(offset, length),
+        lambda: types.MessageEntityHashtag(offset, length),
+    ])()
+
+
+def _generate_case(rng: random.Random) -> tuple[str, list[TypeMessageEntity]]:
+    text = "".join(
+        rng.choice(ALPHABET)
+        for _ in range(rng.randint(0, 40))
+    )
+
+    text_length = _get_utf16_length(text)
+
+    entities = [
+        _generate_entity(rng, text_length)
+        for _ in range(rng.randint(0, 12))
+    ]
+
+    # Pre blocks inside of blockquotes
+    if entities and rng.random() < 0.3:
+        entities.append(types.MessageEntityPre(entities[0].offset, entities[0].length, rng.choice(LANGUAGES)))  # type: ignore
+
+    return text, entities
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_unparse_markdown_matches_legacy(seed: int) -> None:
+    rng = random.Random(seed)
+
+    for _ in range(CASES_PER_SEED):
+        text, entities = _generate_case(rng)
+
+        try:
+            expected = legacy_markdown_utils.unparse_markdown(text, entities)
+
+        # The legacy renderer fails on an offset inside of a leading surrogate pair
+        except UnicodeDecodeError:
+            continue
+
+        assert unparse_markdown(text, entities) == expected, (text, entities)
+
+
+@pytest.mark.parametrize(
+    ("text", "entities"),
+    [
+        ("", [types.MessageEntityBold(0, 0)]),
+        ("Hi 😜 there", [types.MessageEntityBold(3, 2), types.MessageEntityItalic(4, 1)]),
+        ("a\nb\nc", [types.MessageEntityBlockquote(0, 5, collapsed=True), types.MessageEntityPre(2, 1, "python")]),
+        ("👍\n👍\n", [types.MessageEntityBlockquote(0, 6), types.MessageEntityCustomEmoji(3, 2, 7)]),
+    ]
+)
+def test_unparse_markdown_matches_legacy_on_examples(text: str, entities: list[TypeMessageEntity]) -> None:
+    assert unparse_markdown(text, entities) == legacy_markdown_utils.unparse_markdown(text, entities)
@@ -0,0 +1,163 @@
+from telethon.crypto import AES
+from telethon.tl.tlobject import TLObject
+from telethon.tl.core import GzipPacked, MessageContainer
+from hashlib import sha256
+
+import importlib
+import os
+import pytest
+import struct
+
+from src.config import config
+from src.global_variables import GlobalVariables
+from src.tg_packet_ingester import extract_tg_message_records
+from src.tg_packet_parser import get_auth_key_data, _calc_key
+from tests.tlobjects_builder import TLObjectsBuilder, get_tlobjects_builder
+
+
+LAYERS = sorted(GlobalVariables.layers_dirpaths)
+
+CHANNEL_ID = 555
+BOT_USER_ID = 1
+USER_ID = 2
+UNKNOWN_USER_ID = 3
+
+
+def _encrypt_tg_packet(auth_key: bytes, session_id: bytes, data: bytes) -> bytes:
+    """Reverse of `decrypt_message_data`, as if sent by the server."""
+
+    auth_key_data = get_auth_key_data(auth_key)
+
+    body = os.urandom(8) + session_id + struct.pack("<qii", 12_345 * 4 + 1, 1, len(data)) + data
+    body += os.urandom(-(len(body) + 12) % 16 + 12)
+
+    msg_key = sha256(auth_key_data.msg_key_part + body).digest()[8:24]
+    aes_key, aes_iv = _calc_key(auth_key_data, msg_key)
+
+    return auth_key_data.auth_key_id + msg_key + AES.encrypt_ige(body, aes_key, aes_iv)
+
+
+def _pack_message_container(objs: list[bytes]) -> bytes:
+    data = struct.pack("<Ii", MessageContainer.CONSTRUCTOR_ID, len(objs))
+
+    for i, obj in enumerate(objs):
+        data += struct.pack("<qii", (i + 1) * 4 + 1, i, len(obj)) + obj
+
+    return data
+
+
+def _build_by_name(builder: TLObjectsBuilder, name: str, full: bool) -> TLObject:
+    return builder.build(builder.constructors_by_name[name], full = full)
+
+
+def _build_messages(builder: TLObjectsBuilder) -> list[TLObject]:
+    types = importlib.import_module(f"layers.{builder.layer}.tl.types")
+
+    # Every entity kind, most of them are skipped by selective decoding
+    entities = [
+        builder.build(schema_tlobject, full = True)
+        for schema_tlobject in builder.constructors_by_type["MessageEntity"]
+    ]
+
+    for entity in entities:
+        entity.offset = 3  # type: ignore
+        entity.length = 2  # type: ignore
+
+    messages: list[TLObject] = []
+
+    for i, (user_id, reply_to) in enumerate([
+        (USER_ID, _build_by_name(builder, "messageReplyHeader", full = True)),
+        (USER_ID, types.MessageReplyHeader(reply_to_msg_id = 7)),
+        (BOT_USER_ID, None),
+        (UNKNOWN_USER_ID, None)
+    ]):
+        # Media, markup, reactions and the rest of the optional fields are set
+        message = _build_by_name(builder, "message", full = True)
+
+        message.id = 100 + i  # type: ignore
+        message.peer_id = types.PeerChannel(channel_id = CHANNEL_ID)  # type: ignore
+        message.from_id = types.PeerUser(user_id = user_id)  # type: ignore
+        message.message = "hi 👍 there"  # type: ignore
+        message.entities = entities  # type: ignore
+        message.reply_to = reply_to  # type: ignore
+
+        messages.append(message)
+
+    messages.append(_build_by_name(builder, "messageService", full = True))
+    messages.append(_build_by_name(builder, "messageEmpty", full = True))
+
+    return messages
+
+
+def _build_tg_packet_data(builder: TLObjectsBuilder) -> bytes:
+    types = importlib.import_module(f"layers.{builder.layer}.tl.types")
+    updates_types = importlib.import_module(f"layers.{builder.layer}.tl.types.updates")
+
+    messages = _build_messages(builder)
+
+    users = [
+        _build_by_name(builder, "user", full = True),
+        _build_by_name(builder, "user", full = False),
+        _build_by_name(builder, "userEmpty", full = True)
+    ]
+
+    users[0].id = BOT_USER_ID  # type: ignore
+    users[1].id = USER_ID  # type: ignore
+
+    chats = [
+        builder.build(schema_tlobject, full = True)
+        for schema_tlobject in builder.constructors_by_type["Chat"]
+    ]
+
+    # Every other update kind
+    other_updates = [
+        builder.build(schema_tlobject, full = True)
+        for schema_tlobject in builder.constructors_by_type["Update"]
+        if schema_tlobject.fullname != "updateNewChannelMessage"
+    ]
+
+    updates = types.Updates(
+        updates = [
+            types.UpdateNewChannelMessage(message = message, pts = 1, pts_count = 1)
+            for message in messages
+        ] + other_updates,
+        users = users,
+        chats = chats,
+        date = None,
+        seq = 1
+    )
+
+    channel_difference = updates_types.ChannelDifference(
+        pts = 1,
+        new_messages = messages,
+        other_updates = other_updates,
+        chats = chats,
+        users = users
+    )
+
+    return _pack_message_container([
+        bytes(updates),
+        bytes(GzipPacked(bytes(channel_difference)))
+    ])
+
+
+@pytest.mark.parametrize("layer", LAYERS)
+def test_selective_decoding_extracts_same_records(layer: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    auth_key = os.urandom(256)
+    session_id = os.urandom(8)
+
+    packet = _encrypt_tg_packet(auth_key, session_id, _build_tg_packet_data(get_tlobjects_builder(layer)))
+
+    monkeypatch.setattr(config, "tg_packet_selective_decoding", False)
+    records = extract_tg_message_records(layer, auth_key, session_id, packet)
+
+    monkeypatch.setattr(config, "tg_packet_selective_decoding", True)
+    selective_records = extract_tg_message_records(layer, auth_key, session_id, packet)
+
+    assert records is not None
+
+    # Bot messages are dropped, from both of the updates and the channel difference
+    assert [record.tg_user_id for record in records] == [USER_ID, USER_ID, UNKNOWN_USER_ID] * 2
+    assert [record.reply_to_tg_message_id for record in records] == [None, 7, None] * 2
+
+    assert selective_records == records
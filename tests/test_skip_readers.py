@@ -0,0 +1,33 @@
+import pytest
+
+from src.global_variables import GlobalVariables
+from src.layers_registry import get_layer
+from src.tg_packet_parser import BinaryReader, attach_tg_readers
+from tests.tlobjects_builder import get_tlobjects_builder
+
+
+LAYERS = sorted(GlobalVariables.layers_dirpaths)
+
+
+@pytest.mark.parametrize("full", [False, True])
+@pytest.mark.parametrize("layer", LAYERS)
+def test_skip_reader_advances_by_serialized_length(layer: int, full: bool) -> None:
+    builder = get_tlobjects_builder(layer)
+    loaded_layer = get_layer(layer)
+
+    for schema_tlobject in builder.constructors:
+        tlobject = builder.build(schema_tlobject, full = full)
+        data = bytes(tlobject)
+
+        with BinaryReader(data) as reader:
+            attach_tg_readers(
+                reader = reader,
+                tlobjects = loaded_layer.tlobjects,
+                core_objects = loaded_layer.core_objects
+            )
+
+            assert reader.read_int(signed = False) == schema_tlobject.id
+
+            type(tlobject).skip_reader(reader)  # type: ignore
+
+            assert reader.tell_position() == len(data), schema_tlobject.fullname
@@ -0,0 +1,106 @@
+import random
+import pytest
+
+from src.tg_packet_frames import FRAME_HEADER, MAX_PACKET_LENGTH, TgPacketFrame, pack_tg_packet_frames, unpack_tg_packet_frames
+
+
+SEEDS = range(20)
+
+AUTH_KEY = bytes(range(256))
+SESSION_ID = b"\x01" * 8
+
+
+def _generate_frames(rng: random.Random) -> list[TgPacketFrame]:
+    auth_keys = [rng.randbytes(256) for _ in range(2)]
+    session_ids = [rng.randbytes(8) for _ in range(2)]
+
+    return [
+        TgPacketFrame(
+            layer = rng.choice([199, 200, 201]),
+            auth_key = rng.choice(auth_keys),
+            session_id = rng.choice(session_ids),
+            # Empty packets too
+            packet = rng.randbytes(rng.randint(0, 300))
+        )
+        for _ in range(rng.randint(0, 12))
+    ]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_unpack_tg_packet_frames_reverses_pack(seed: int) -> None:
+    frames = _generate_frames(random.Random(seed))
+
+    data = pack_tg_packet_frames(frames)
+
+    assert unpack_tg_packet_frames(data) == frames
+    assert unpack_tg_packet_frames(memoryview(bytearray(data))) == frames
+
+
+def test_pack_tg_packet_frames_reuses_previous_keys() -> None:
+    other_session_id = b"\x02" * 8
+
+    data = pack_tg_packet_frames([
+        TgPacketFrame(201, AUTH_KEY, SESSION_ID, b"a"),
+        TgPacketFrame(201, AUTH_KEY, SESSION_ID, b"b"),
+        TgPacketFrame(201, AUTH_KEY, other_session_id, b"c")
+    ])
+
+    assert data == b"".join([
+        FRAME_HEADER.pack(201, len(AUTH_KEY), len(SESSION_ID), 1), AUTH_KEY, SESSION_ID, b"a",
+        FRAME_HEADER.pack(201, 0, 0, 1), b"b",
+        FRAME_HEADER.pack(201, 0, len(other_session_id), 1), other_session_id, b"c"
+    ])
+
+
+def test_unpack_tg_packet_frames_reuses_previous_keys() -> None:
+    data = (
+        FRAME_HEADER.pack(200, len(AUTH_KEY), len(SESSION_ID), 1) + AUTH_KEY + SESSION_ID + b"a"
+        + FRAME_HEADER.pack(201, 0, 0, 2) + b"bc"
+    )
+
+    assert unpack_tg_packet_frames(data) == [
+        TgPacketFrame(200, AUTH_KEY, SESSION_ID, b"a"),
+        TgPacketFrame(201, AUTH_KEY, SESSION_ID, b"bc")
+    ]
+
+
+def test_unpack_tg_packet_frames_empty() -> None:
+    assert unpack_tg_packet_frames(b"") == []
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        (
+            FRAME_HEADER.pack(201, 0, 0, 0)[:-1],
+            "Truncated frame header at offset 0"
+        ),
+        (
+            pack_tg_packet_frames([TgPacketFrame(201, AUTH_KEY, SESSION_ID, b"a")]) + b"\x00",
+            f"Truncated frame header at offset {FRAME_HEADER.size + len(AUTH_KEY) + len(SESSION_ID) + 1}"
+        ),
+        (
+            pack_tg_packet_frames([TgPacketFrame(201, AUTH_KEY, SESSION_ID, b"abc")])[:-1],
+            f"Truncated frame body at offset {FRAME_HEADER.size}"
+        ),
+        (
+            FRAME_HEADER.pack(201, len(AUTH_KEY), len(SESSION_ID), 0) + AUTH_KEY,
+            f"Truncated frame body at offset {FRAME_HEADER.size}"
+        ),
+        (
+            FRAME_HEADER.pack(201, len(AUTH_KEY), len(SESSION_ID), MAX_PACKET_LENGTH + 1) + AUTH_KEY + SESSION_ID,
+            f"Packet of the frame at offset 0 is longer than {MAX_PACKET_LENGTH} bytes"
+        ),
+        (
+            FRAME_HEADER.pack(201, 0, len(SESSION_ID), 1) + SESSION_ID + b"a",
+            "First frame must contain auth_key and session_id"
+        ),
+        (
+            FRAME_HEADER.pack(201, len(AUTH_KEY), 0, 1) + AUTH_KEY + b"a",
+            "First frame must contain auth_key and session_id"
+        )
+    ]
+)
+def test_unpack_tg_packet_frames_malformed(data: bytes, message: str) -> None:
+    with pytest.raises(ValueError, match = f"^{message}$"):
+        unpack_tg_packet_frames(data)
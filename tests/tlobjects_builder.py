@@ -0,0 +1,152 @@
+from telethon.tl.tlobject import TLObject
+from datetime import datetime, timezone
+from functools import cache
+from pathlib import Path
+
+import importlib
+import itertools
+import typing
+
+from layers_generator.parsers import TLObject as SchemaTLObject, parse_tl  # type: ignore
+from layers_generator.parsers.tlobject import TLArg as SchemaTLArg  # type: ignore
+
+
+GENERATOR_DATA_DIRPATH = Path(__file__).parent.parent / "layers_generator" / "data"
+
+# Nested objects deeper than that are built without their optional fields
+FULL_DEPTH = 2
+MAX_DEPTH = 24
+
+DATE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+PRIMITIVE_VALUES: dict[str, tuple[typing.Any, typing.Any]] = {  # {type: (minimal, full)}
+    "int": (0, -7),
+    "long": (0, -(2 ** 62)),
+    "double": (0.0, 1.5),
+    "int128": (0, -(2 ** 100)),
+    "int256": (0, -(2 ** 200)),
+    # Full ones are longer than 253 bytes, which changes the length prefix
+    "string": ("", "x" * 300 + "👍"),
+    "bytes": (b"", bytes(range(256)) + b"\x00" * 10),
+    "Bool": (False, True),
+    "true": (True, True),
+    "date": (DATE, DATE)
+}
+
+
+class UnsupportedTypeError(Exception):
+    """Generic `Object`, `!X` and `%Message` types are not built."""
+
+
+class TLObjectsBuilder:
+    """Builds generated TLObjects of a layer from its .tl schema."""
+
+    def __init__(self, layer: int):
+        self.layer = layer
+
+        self.schema_tlobjects: list[SchemaTLObject] = list(itertools.chain(*(  # type: ignore
+            parse_tl(filepath, layer)  # type: ignore
+            for filepath in [
+                GENERATOR_DATA_DIRPATH / "layers" / str(layer) / "api.tl",
+                GENERATOR_DATA_DIRPATH / "mtproto.tl"
+            ]
+        )))
+
+        self.constructors: list[SchemaTLObject] = [
+            schema_tlobject
+            for schema_tlobject in self.schema_tlobjects
+            if not schema_tlobject.is_function
+        ]
+
+        self.constructors_by_type: dict[str, list[SchemaTLObject]] = {}
+        self.constructors_by_name: dict[str, SchemaTLObject] = {}
+
+        for schema_tlobject in self.constructors:
+            self.constructors_by_type.setdefault(schema_tlobject.result, []).append(schema_tlobject)
+            self.constructors_by_name[schema_tlobject.fullname] = schema_tlobject
+
+        self.tlobjects: dict[int, type[TLObject]] = importlib.import_module(f"layers.{layer}.tl.alltlobjects").tlobjects
+
+    def build(self, schema_tlobject: SchemaTLObject, full: bool, depth: int=0) -> TLObject:
+        """Raises `UnsupportedTypeError` if one of the required fields can not be built."""
+
+        if depth > MAX_DEPTH:
+            raise UnsupportedTypeError(f"{schema_tlobject.fullname} is too deep")
+
+        kwargs: dict[str, typing.Any] = {}
+
+        for arg in schema_tlobject.real_args:
+            if arg.flag and not full:
+                kwargs[arg.name] = None
+                continue
+
+            try:
+                kwargs[arg.name] = self._build_arg(arg, full, depth + 1)
+
+            except UnsupportedTypeError:
+                if not arg.flag:
+                    raise
+
+                kwargs[arg.name] = None
+
+        return self.tlobjects[schema_tlobject.id](**kwargs)  # type: ignore
+
+    def _build_arg(self, arg: SchemaTLArg, full: bool, depth: int) -> typing.Any:
+        if not arg.is_vector:
+            return self._build_value(arg, full, depth)
+
+        if not full:
+            return []
+
+        return [
+            self._build_value(arg, full, depth)
+            for _ in range(2)
+        ]
+
+    def _build_value(self, arg: SchemaTLArg, full: bool, depth: int) -> typing.Any:
+        if arg.is_generic or arg.type == "Object" or arg.type.startswith("%"):
+            raise UnsupportedTypeError(arg.type)
+
+        if arg.type in PRIMITIVE_VALUES:
+            minimal_value, full_value = PRIMITIVE_VALUES[arg.type]
+            return full_value if full else minimal_value
+
+        if arg.skip_constructor_id:
+            if arg.type not in self.constructors_by_name:
+                raise UnsupportedTypeError(arg.type)
+
+            schema_tlobjects = [self.constructors_by_name[arg.type]]
+
+        else:
+            schema_tlobjects = self._get_sorted_constructors(arg.type, full = depth < FULL_DEPTH)
+
+        for schema_tlobject in schema_tlobjects:
+            try:
+                return self.build(schema_tlobject, full = depth < FULL_DEPTH, depth = depth)
+            except UnsupportedTypeError:
+                continue
+
+        raise UnsupportedTypeError(arg.type)
+
+    def _get_sorted_constructors(self, type_name: str, full: bool) -> list[SchemaTLObject]:
+        """The richest constructors first for full objects, the ones with the least required fields first otherwise."""
+
+        schema_tlobjects = self.constructors_by_type.get(type_name, [])
+
+        if full:
+            return sorted(schema_tlobjects, key=lambda x: -len(x.real_args))
+
+        return sorted(schema_tlobjects, key=lambda x: (_count_required_objects(x), len(x.real_args)))
+
+
+def _count_required_objects(schema_tlobject: SchemaTLObject) -> int:
+    return sum(
+        1
+        for arg in schema_tlobject.real_args
+        if not arg.flag and not arg.is_vector and arg.type not in PRIMITIVE_VALUES
+    )
+
+
+@cache
+def get_tlobjects_builder(layer: int) -> TLObjectsBuilder:
+    return TLObjectsBuilder(layer)